@@ -2,7 +2,19 @@ from __future__ import annotations
 
 import datetime as dt
 import json
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, TypedDict, Union, cast
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TypedDict,
+    Union,
+    cast,
+)
 
 import great_expectations.exceptions as gx_exceptions
 from great_expectations._docs_decorators import public_api
@@ -18,6 +30,7 @@ from great_expectations.checkpoint.actions import (
     UpdateDataDocsAction,
 )
 from great_expectations.compatibility.pydantic import BaseModel, Field, root_validator, validator
+from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.expectation_validation_result import (
     ExpectationSuiteValidationResult,  # noqa: TCH001
 )
@@ -34,6 +47,11 @@ from great_expectations.render.renderer.renderer import Renderer
 if TYPE_CHECKING:
     from typing_extensions import TypeAlias
 
+    from great_expectations.compatibility.pydantic.typing import (
+        AbstractSetIntStr,
+        MappingIntStrAny,
+        TupleGenerator,
+    )
     from great_expectations.data_context.store.validation_definition_store import (
         ValidationDefinitionStore,
     )
@@ -49,6 +67,37 @@ CheckpointAction: TypeAlias = Union[
     UpdateDataDocsAction,
 ]
 
+# Actions, whose results later actions read from "ActionContext" (e.g., notifications link to
+# stored results and Data Docs); they act as barriers when actions are dispatched concurrently.
+ACTION_CONTEXT_PRODUCER_ACTION_TYPES: Tuple[type, ...] = (
+    StoreValidationResultAction,
+    UpdateDataDocsAction,
+)
+
+
+class CheckpointConcurrencyConfig(BaseModel):
+    """
+    Configuration of concurrent execution of Checkpoint validation definitions and actions (in a
+    thread pool).
+
+    Validation definitions of same data source share its execution engine (and loaded batches),
+    which is not safe to use from several threads; hence, validation definitions of one data source
+    run one after another, while different data sources are validated in parallel.  Results are
+    always keyed in order of validation definitions, regardless of completion order.
+
+    Args:
+        max_workers: Maximum number of data sources (or actions) processed at the same time.
+        max_workers_per_data_source: Maximum number of concurrently running validation definitions
+            of one data source; must be 1 while execution engines are shared.
+        concurrent_actions: If True, consecutive actions, which do not contribute results to
+            subsequent actions (e.g., notifications), are dispatched concurrently; actions storing
+            validation results or updating Data Docs always run by themselves, in configured order.
+    """
+
+    max_workers: int = Field(default=4, ge=1)
+    max_workers_per_data_source: int = Field(default=1, ge=1, le=1)
+    concurrent_actions: bool = True
+
 
 class Checkpoint(BaseModel):
     """
@@ -63,6 +112,7 @@ class Checkpoint(BaseModel):
         actions: List of actions to be taken after the validation definitions are run.
         result_format: The format in which to return the results of the validation definitions. Default is ResultFormat.SUMMARY.
         id: An optional unique identifier for the checkpoint.
+        concurrency: An optional configuration for running validation definitions and actions concurrently. Default is None (sequential execution).
 
     """  # noqa: E501
 
@@ -71,6 +121,7 @@ class Checkpoint(BaseModel):
     actions: List[CheckpointAction] = Field(default_factory=list)
     result_format: ResultFormat = ResultFormat.SUMMARY
     id: Union[str, None] = None
+    concurrency: Union[CheckpointConcurrencyConfig, None] = None
 
     class Config:
         """
@@ -156,6 +207,24 @@ class Checkpoint(BaseModel):
 
         return validation_definitions
 
+    @override
+    def _iter(
+        self,
+        *args: Any,
+        exclude: Optional[Union[AbstractSetIntStr, MappingIntStrAny]] = None,
+        **kwargs: Any,
+    ) -> TupleGenerator:
+        # Both "dict()" and "json()" export fields through "_iter()"; unconfigured "concurrency" is
+        # omitted, so that serialized Checkpoints, which run sequentially, remain unchanged.
+        if self.concurrency is None:
+            exclude = (
+                {**exclude, "concurrency": True}
+                if isinstance(exclude, Mapping)
+                else {*(exclude or ()), "concurrency"}
+            )
+
+        return super()._iter(*args, exclude=exclude, **kwargs)
+
     @public_api
     def run(
         self,
@@ -187,12 +256,28 @@ class Checkpoint(BaseModel):
         run_id: RunIdentifier,
     ) -> Dict[ValidationResultIdentifier, ExpectationSuiteValidationResult]:
         run_results: Dict[ValidationResultIdentifier, ExpectationSuiteValidationResult] = {}
-        for validation_definition in self.validation_definitions:
-            validation_result = validation_definition.run(
+        validation_results: List[ExpectationSuiteValidationResult]
+        if self.concurrency is None or len(self.validation_definitions) == 1:
+            validation_results = [
+                validation_definition.run(
+                    batch_parameters=batch_parameters,
+                    evaluation_parameters=expectation_parameters,
+                    result_format=result_format,
+                )
+                for validation_definition in self.validation_definitions
+            ]
+        else:
+            validation_results = self._run_validation_definitions_concurrently(
                 batch_parameters=batch_parameters,
-                evaluation_parameters=expectation_parameters,
+                expectation_parameters=expectation_parameters,
                 result_format=result_format,
+                concurrency=self.concurrency,
             )
+
+        # Keys are inserted in order of validation definitions (independent of completion order).
+        for validation_definition, validation_result in zip(
+            self.validation_definitions, validation_results
+        ):
             key = self._build_result_key(
                 validation_definition=validation_definition,
                 run_id=run_id,
@@ -202,6 +287,52 @@ class Checkpoint(BaseModel):
 
         return run_results
 
+    def _run_validation_definitions_concurrently(
+        self,
+        batch_parameters: Dict[str, Any] | None,
+        expectation_parameters: Dict[str, Any] | None,
+        result_format: ResultFormat,
+        concurrency: CheckpointConcurrencyConfig,
+    ) -> List[ExpectationSuiteValidationResult]:
+        # Validation definitions are queued by data source before any work is submitted, so that
+        # workers never wait on busy data source while validation definitions of others are ready.
+        data_source_queues: Dict[str, List[int]] = {}
+        for idx, validation_definition in enumerate(self.validation_definitions):
+            data_source_queues.setdefault(
+                self._get_data_source_name(validation_definition=validation_definition), []
+            ).append(idx)
+
+        def _run_data_source_queue(
+            queue: List[int],
+        ) -> List[ExpectationSuiteValidationResult]:
+            return [
+                self.validation_definitions[idx].run(
+                    batch_parameters=batch_parameters,
+                    evaluation_parameters=expectation_parameters,
+                    result_format=result_format,
+                )
+                for idx in queue
+            ]
+
+        validation_results: Dict[int, ExpectationSuiteValidationResult] = {}
+        with ThreadPoolExecutor(
+            max_workers=min(concurrency.max_workers, len(data_source_queues))
+        ) as executor:
+            futures: List[Tuple[List[int], Future[List[ExpectationSuiteValidationResult]]]] = [
+                (queue, executor.submit(_run_data_source_queue, queue))
+                for queue in data_source_queues.values()
+            ]
+            # Exception of earliest failing data source (in configured order) is raised.
+            for queue, future in futures:
+                for idx, validation_result in zip(queue, future.result()):
+                    validation_results[idx] = validation_result
+
+        return [validation_results[idx] for idx in range(len(self.validation_definitions))]
+
+    @staticmethod
+    def _get_data_source_name(validation_definition: ValidationDefinition) -> str:
+        return validation_definition.data_source.name
+
     def _build_result_key(
         self,
         validation_definition: ValidationDefinition,
@@ -221,12 +352,52 @@ class Checkpoint(BaseModel):
         checkpoint_result: CheckpointResult,
     ) -> None:
         action_context = ActionContext()
+        if self.concurrency is None or not self.concurrency.concurrent_actions:
+            for action in self.actions:
+                action_result = action.v1_run(
+                    checkpoint_result=checkpoint_result,
+                    action_context=action_context,
+                )
+                action_context.update(action=action, action_result=action_result)
+
+            return
+
+        with ThreadPoolExecutor(max_workers=self.concurrency.max_workers) as executor:
+            for action_group in self._group_independent_actions():
+                futures: List[Future[dict]] = [
+                    executor.submit(
+                        action.v1_run,
+                        checkpoint_result=checkpoint_result,
+                        action_context=action_context,
+                    )
+                    for action in action_group
+                ]
+                # Results of each group are added to context only after whole group finished (in configured order).  # noqa: E501
+                action_results: List[dict] = [future.result() for future in futures]
+                for action, action_result in zip(action_group, action_results):
+                    action_context.update(action=action, action_result=action_result)
+
+    def _group_independent_actions(self) -> List[List[CheckpointAction]]:
+        """
+        Partitions actions into consecutive groups, which can run concurrently; actions, whose results are consumed by
+        subsequent actions through "ActionContext", form groups by themselves.
+        """  # noqa: E501
+        action_groups: List[List[CheckpointAction]] = []
+        action_group: List[CheckpointAction] = []
         for action in self.actions:
-            action_result = action.v1_run(
-                checkpoint_result=checkpoint_result,
-                action_context=action_context,
-            )
-            action_context.update(action=action, action_result=action_result)
+            if isinstance(action, ACTION_CONTEXT_PRODUCER_ACTION_TYPES):
+                if action_group:
+                    action_groups.append(action_group)
+                    action_group = []
+
+                action_groups.append([action])
+            else:
+                action_group.append(action)
+
+        if action_group:
+            action_groups.append(action_group)
+
+        return action_groups
 
     @public_api
     def save(self) -> None:
@@ -134,6 +134,11 @@ try:
 except (ImportError, AttributeError):
     functions = SQLALCHEMY_NOT_IMPORTED
 
+try:
+    from sqlalchemy.sql import visitors
+except (ImportError, AttributeError):
+    visitors = SQLALCHEMY_NOT_IMPORTED
+
 try:
     from sqlalchemy.sql import Insert
 except (ImportError, AttributeError):
@@ -224,6 +229,21 @@ try:
 except (ImportError, AttributeError):
     WithinGroup = SQLALCHEMY_NOT_IMPORTED
 
+try:
+    from sqlalchemy.sql.expression import FunctionFilter
+except (ImportError, AttributeError):
+    FunctionFilter = SQLALCHEMY_NOT_IMPORTED
+
+try:
+    from sqlalchemy.sql.expression import Over
+except (ImportError, AttributeError):
+    Over = SQLALCHEMY_NOT_IMPORTED
+
+try:
+    from sqlalchemy.sql.expression import UnaryExpression
+except (ImportError, AttributeError):
+    UnaryExpression = SQLALCHEMY_NOT_IMPORTED
+
 try:
     from sqlalchemy.sql.operators import custom_op
 except (ImportError, AttributeError):
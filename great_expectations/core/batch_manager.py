@@ -39,6 +39,8 @@ class BatchManager:
 
         self._batch_cache: Dict[str, AnyBatch] = OrderedDict()
         self._batch_data_cache: Dict[str, BatchDataUnion] = {}
+        # Number of holders (e.g., Validator objects) of loaded Batch (see "acquire_batches()").
+        self._batch_references: Dict[str, int] = {}
 
         if batch_list:
             self.load_batch_list(batch_list=batch_list)
@@ -137,8 +139,9 @@ class BatchManager:
         return self.active_batch.batch_definition
 
     def reset_batch_cache(self) -> None:
-        """Clears Batch cache"""
+        """Clears Batch cache (and references of holders of Batches, which are no longer cached)"""
         self._batch_cache = OrderedDict()
+        self._batch_references = {}
         self._active_batch_id = None
 
     def load_batch_list(self, batch_list: Sequence[AnyBatch]) -> None:
@@ -161,6 +164,46 @@ class BatchManager:
             # that has been loaded.  Hence, the final active_batch_id will be that of the final BatchData loaded.  # noqa: E501
             self._active_batch_id = batch.id
 
+    def acquire_batches(self, batch_ids: Sequence[str]) -> None:
+        """Registers holder of loaded Batches, which are then kept loaded until every holder
+        releases them."""
+        batch_id: str
+        for batch_id in batch_ids:
+            self._batch_references[batch_id] = self._batch_references.get(batch_id, 0) + 1
+
+    def release_batches(self, batch_ids: Sequence[str]) -> None:
+        """Releases Batches, acquired by holder (see "acquire_batches()").
+
+        Batches, which are no longer acquired by any holder, are removed from cache, and
+        ExecutionEngine frees resources held for their BatchData (e.g., unpersists Spark
+        DataFrames).  Releasing Batch, which is not acquired, has no effect (so Batches, loaded
+        without being acquired, are never evicted this way).
+        """
+        batch_id: str
+        references: int
+        for batch_id in batch_ids:
+            references = self._batch_references.get(batch_id, 0)
+            if references <= 0:
+                logger.warning(f'Batch "{batch_id}" is released without being acquired; ignoring.')
+                continue
+
+            if references > 1:
+                self._batch_references[batch_id] = references - 1
+                continue
+
+            del self._batch_references[batch_id]
+            self._batch_cache.pop(batch_id, None)
+            if self._batch_data_cache.pop(batch_id, None) is None:
+                continue
+
+            if self._active_batch_id == batch_id:
+                self._active_batch_id = None
+
+            if self._active_batch_data_id == batch_id:
+                self._active_batch_data_id = None
+
+            self._execution_engine.release_batch_data(batch_id=batch_id)
+
     def save_batch_data(self, batch_id: str, batch_data: BatchDataUnion) -> None:
         """
         Updates the data for the specified Batch in the cache
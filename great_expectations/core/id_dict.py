@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import hashlib
 import json
-from typing import Any, Set, TypeVar, Union
+from typing import Any, Final, Set, Tuple, TypeVar, Union
 
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.util import convert_to_json_serializable
@@ -10,23 +10,57 @@ from great_expectations.core.util import convert_to_json_serializable
 T = TypeVar("T")
 
 
+# Value types, which cannot be mutated in place (so that ID of "IDDict" holding only them changes
+# only with "IDDict").
+_IMMUTABLE_SCALAR_TYPES: Final[Tuple[type, ...]] = (str, int, float, bool, type(None))
+
+# Value types, which "convert_to_json_serializable()" returns unchanged (so that conversion can be
+# skipped).
+_JSON_NATIVE_TYPES: Final[Tuple[type, ...]] = (str, int, bool, type(None))
+
+
 class IDDict(dict):
     _id_ignore_keys: Set[str] = set()
 
+    # Default ID ("to_id()" with no arguments) is memoized, as long as all values are immutable, and
+    # invalidated by every mutating "dict" method.  Subclasses, whose items can be set bypassing
+    # these methods, must disable it.
+    _id_cache_enabled: bool = True
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # "DotDict" mixins assign attributes directly via "dict.__setitem__()", which cannot
+        # invalidate memoized ID.
+        if cls.__setattr__ is dict.__setitem__:  # type: ignore[comparison-overlap]
+            cls._id_cache_enabled = False
+
     def to_id(self, id_keys=None, id_ignore_keys=None):
+        use_id_cache: bool = self._id_cache_enabled and id_keys is None and id_ignore_keys is None
+        if use_id_cache and "_id_cache" in self.__dict__:
+            return self.__dict__["_id_cache"]
+
         if id_keys is None:
             id_keys = self.keys()
         if id_ignore_keys is None:
             id_ignore_keys = self._id_ignore_keys
         id_keys = set(id_keys) - set(id_ignore_keys)
         if len(id_keys) == 0:
-            return tuple()
+            _id = tuple()
         elif len(id_keys) == 1:
             key = list(id_keys)[0]
-            return f"{key}={self[key]!s}"
+            _id = f"{key}={self[key]!s}"
+        else:
+            _id_dict = {k: self[k] for k in id_keys}
+            if not all(
+                type(k) is str and type(v) in _JSON_NATIVE_TYPES for k, v in _id_dict.items()
+            ):
+                _id_dict = convert_to_json_serializable(data=_id_dict)
+            _id = hashlib.md5(json.dumps(_id_dict, sort_keys=True).encode("utf-8")).hexdigest()
+
+        if use_id_cache and all(_is_immutable(value) for value in self.values()):
+            self.__dict__["_id_cache"] = _id
 
-        _id_dict = convert_to_json_serializable(data={k: self[k] for k in id_keys})
-        return hashlib.md5(json.dumps(_id_dict, sort_keys=True).encode("utf-8")).hexdigest()
+        return _id
 
     @override
     def __hash__(self) -> int:  # type: ignore[override]
@@ -34,6 +68,58 @@ class IDDict(dict):
         _result_hash: int = hash(self.to_id())
         return _result_hash
 
+    def _invalidate_id_cache(self) -> None:
+        self.__dict__.pop("_id_cache", None)
+
+    @override
+    def __setitem__(self, key, value) -> None:
+        self._invalidate_id_cache()
+        super().__setitem__(key, value)
+
+    @override
+    def __delitem__(self, key) -> None:
+        self._invalidate_id_cache()
+        super().__delitem__(key)
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    @override
+    def update(self, *args, **kwargs) -> None:
+        self._invalidate_id_cache()
+        super().update(*args, **kwargs)
+
+    @override
+    def setdefault(self, key, default=None):
+        self._invalidate_id_cache()
+        return super().setdefault(key, default)
+
+    @override
+    def pop(self, *args):
+        self._invalidate_id_cache()
+        return super().pop(*args)
+
+    @override
+    def popitem(self):
+        self._invalidate_id_cache()
+        return super().popitem()
+
+    @override
+    def clear(self) -> None:
+        self._invalidate_id_cache()
+        super().clear()
+
+
+def _is_immutable(value: Any) -> bool:
+    if type(value) in _IMMUTABLE_SCALAR_TYPES:
+        return True
+
+    if type(value) in (tuple, frozenset):
+        return all(_is_immutable(element) for element in value)
+
+    return False
+
 
 def deep_convert_properties_iterable_to_id_dict(
     source: Union[T, dict],
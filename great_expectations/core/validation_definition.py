@@ -207,12 +207,16 @@ class ValidationDefinition(BaseModel):
             batch_parameters=batch_parameters,
             result_format=result_format,
         )
-        results = validator.validate_expectation_suite(self.suite, evaluation_parameters)
-
-        (
-            expectation_suite_identifier,
-            validation_result_id,
-        ) = self._get_expectation_suite_and_validation_result_ids(validator)
+        try:
+            results = validator.validate_expectation_suite(self.suite, evaluation_parameters)
+
+            (
+                expectation_suite_identifier,
+                validation_result_id,
+            ) = self._get_expectation_suite_and_validation_result_ids(validator)
+        finally:
+            # Batch data (e.g., persisted Spark DataFrame) is not needed once validation finishes.
+            validator.release_batches()
 
         ref = self._validation_results_store.store_validation_results(
             suite_validation_result=results,
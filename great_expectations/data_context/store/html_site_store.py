@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import logging
 import os
 import pathlib
@@ -26,7 +27,11 @@ from great_expectations.data_context.util import (
     instantiate_class_from_config,
     load_class,
 )
-from great_expectations.exceptions import ClassInstantiationError, DataContextError
+from great_expectations.exceptions import (
+    ClassInstantiationError,
+    DataContextError,
+    InvalidKeyError,
+)
 from great_expectations.util import (
     filter_properties_dict,
     verify_dynamic_loading_support,
@@ -106,6 +111,9 @@ class HtmlSiteStore:
 
     _key_class = SiteSectionIdentifier
 
+    # Key of manifest of rendered pages in static assets backend (see "SiteBuilder.build()").
+    RENDERED_PAGES_MANIFEST_KEY = (".ge_rendered_pages_manifest.json",)
+
     def __init__(  # noqa: C901 - 11
         self, store_backend=None, runtime_environment=None
     ) -> None:
@@ -362,6 +370,28 @@ class HtmlSiteStore:
             content_type="text/html; " "charset=utf-8",
         )
 
+    def get_rendered_pages_manifest(self) -> dict:
+        """Returns manifest of rendered pages (empty, if site has none, or if it cannot be read)."""
+        try:
+            manifest = json.loads(
+                self.store_backends["static_assets"].get(self.RENDERED_PAGES_MANIFEST_KEY)
+            )
+        except (InvalidKeyError, TypeError, ValueError):
+            return {}
+        except Exception as e:
+            logger.debug(f"Manifest of rendered pages could not be read ({e}).")
+            return {}
+
+        return manifest if isinstance(manifest, dict) else {}
+
+    def set_rendered_pages_manifest(self, manifest: dict) -> None:
+        self.store_backends["static_assets"].set(
+            self.RENDERED_PAGES_MANIFEST_KEY,
+            json.dumps(manifest),
+            content_encoding="utf-8",
+            content_type="application/json",
+        )
+
     def clean_site(self) -> None:
         for _, target_store_backend in self.store_backends.items():
             keys = target_store_backend.list_keys()
@@ -1,15 +1,20 @@
 # PYTHON 2 - py2 - update to ABC direct use rather than __metaclass__ once we drop py2 support
 from __future__ import annotations
 
+import bisect
+import concurrent.futures
 import functools
+import json
 import logging
 import os
 import pathlib
 import random
 import re
 import shutil
+import threading
+import time
 from abc import ABCMeta
-from typing import Any, List, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from great_expectations.compatibility import aws
 from great_expectations.compatibility.typing_extensions import override
@@ -19,6 +24,13 @@ from great_expectations.util import filter_properties_dict
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of objects, downloaded at the same time by "_get_all()" of cloud storage backends.
+DEFAULT_GET_ALL_MAX_CONCURRENCY = 16
+
+# Number of attempts to download object (transient failures are retried with exponential backoff).
+GET_ALL_MAX_ATTEMPTS = 3
+GET_ALL_RETRY_BACKOFF_SECONDS = 0.5
+
 
 class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
     r"""
@@ -207,6 +219,37 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
     def config(self) -> dict:
         return self._config  # type: ignore[attr-defined]
 
+    @staticmethod
+    def _get_all_concurrently(
+        get_fn: Callable[[Any], Any], keys: Sequence[Any], max_concurrency: int
+    ) -> list[Any]:
+        """Returns values of "keys" (in order of keys), downloaded by "get_fn" in up to "max_concurrency" threads.
+
+        Transient failures are retried (with exponential backoff); missing keys ("InvalidKeyError") are not.
+        """  # noqa: E501
+
+        def _get_with_retries(key: Any) -> Any:
+            attempt: int
+            for attempt in range(1, GET_ALL_MAX_ATTEMPTS + 1):
+                try:
+                    return get_fn(key)
+                except InvalidKeyError:
+                    raise
+                except Exception as e:
+                    if attempt == GET_ALL_MAX_ATTEMPTS:
+                        raise
+
+                    logger.debug(f"Attempt {attempt} to get {key} failed ({e}); retrying.")
+                    time.sleep(GET_ALL_RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1) * random.random())
+
+        if len(keys) <= 1 or max_concurrency <= 1:
+            return [_get_with_retries(key) for key in keys]
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(max_concurrency, len(keys))
+        ) as executor:
+            return list(executor.map(_get_with_retries, keys))
+
 
 class TupleFilesystemStoreBackend(TupleStoreBackend):
     """Uses a local filepath as a store.
@@ -214,8 +257,20 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
     The key to this StoreBackend must be a tuple with fixed length based on the filepath_template,
     or a variable-length tuple may be used and returned with an optional filepath_suffix (to be) added.
     The filepath_template is a string template used to convert the key to a filepath.
+
+    If use_key_index is True, keys are listed from index file (journal of added and removed keys,
+    maintained as keys are set, moved, and removed), rather than by walking directory tree and
+    parsing every filepath.  Index is built on first use; if files are changed by other means than
+    this StoreBackend, call "rebuild_key_index()".
+
+    Journal is only ever appended to (by single writes), so that StoreBackends of several processes
+    can share it; it is rewritten (compacted) only by "rebuild_key_index()", which must not run
+    while other processes write to the same store.
     """  # noqa: E501
 
+    # Journal of keys, stored in base directory (one JSON line per added or removed filepath).
+    KEY_INDEX_FILE_NAME = ".ge_store_key_index"
+
     def __init__(  # noqa: PLR0913
         self,
         base_directory,
@@ -230,6 +285,7 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
         manually_initialize_store_backend_id: str = "",
         base_public_path=None,
         store_name=None,
+        use_key_index: bool = False,
     ) -> None:
         super().__init__(
             filepath_template=filepath_template,
@@ -243,6 +299,13 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
             base_public_path=base_public_path,
             store_name=store_name,
         )
+        self._use_key_index = use_key_index
+        # In-memory copy of key index (filepath to key), valid while index file is unchanged.
+        self._key_index: Optional[Dict[str, Tuple]] = None
+        self._key_index_sorted_filepaths: Optional[List[str]] = None
+        self._key_index_stat: Optional[Tuple[int, int]] = None
+        self._key_index_lock = threading.RLock()
+
         if os.path.isabs(base_directory):  # noqa: PTH117
             self.full_base_directory = base_directory
         else:  # noqa: PLR5501
@@ -282,11 +345,22 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
             "manually_initialize_store_backend_id": manually_initialize_store_backend_id,
             "base_public_path": base_public_path,
             "store_name": store_name,
+            "use_key_index": use_key_index,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
         filter_properties_dict(properties=self._config, clean_falsy=True, inplace=True)
 
+    def __getstate__(self) -> dict:
+        state: dict = self.__dict__.copy()
+        # Lock cannot be pickled (or deep-copied).
+        del state["_key_index_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._key_index_lock = threading.RLock()
+
     def _get(self, key):
         filepath: str = os.path.join(  # noqa: PTH118
             self.full_base_directory, self._convert_key_to_filepath(key)
@@ -320,6 +394,10 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
                 outfile.write(value.encode("utf-8"))
             else:
                 outfile.write(value)
+
+        if self._use_key_index:
+            self._update_key_index(added_filepaths=[filepath])
+
         return filepath
 
     def _move(self, source_key, dest_key, **kwargs):
@@ -335,13 +413,23 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
         if os.path.exists(source_path):  # noqa: PTH110
             os.makedirs(dest_dir, exist_ok=True)  # noqa: PTH103
             shutil.move(source_path, dest_path)
+            if self._use_key_index:
+                self._update_key_index(added_filepaths=[dest_path], removed_filepaths=[source_path])
+
             return dest_key
 
         return False
 
     @override
     def list_keys(self, prefix: Tuple = ()) -> List[Tuple]:
-        key_list = []
+        if self._use_key_index:
+            return self._list_keys_from_key_index(prefix=prefix)
+
+        return [key for _, key in self._walk_keys(prefix=prefix)]
+
+    def _walk_keys(self, prefix: Tuple = ()) -> List[Tuple[str, Tuple]]:
+        """Returns (filepath, key) pairs of files under "prefix" directory (filepaths are relative to base directory)."""  # noqa: E501
+        filepaths_and_keys: List[Tuple[str, Tuple]] = []
         for root, dirs, files in os.walk(
             os.path.join(self.full_base_directory, *prefix)  # noqa: PTH118
         ):
@@ -354,19 +442,152 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
                     self.full_base_directory,
                 )
                 if relative_path == ".":
+                    if file_name == self.KEY_INDEX_FILE_NAME:
+                        continue
+
                     filepath = file_name
                 else:
                     filepath = os.path.join(relative_path, file_name)  # noqa: PTH118
 
-                if self.filepath_prefix and not filepath.startswith(self.filepath_prefix):
-                    continue
-                elif self.filepath_suffix and not filepath.endswith(self.filepath_suffix):
-                    continue
-                key = self._convert_filepath_to_key(filepath)
-                if key and not self.is_ignored_key(key):
-                    key_list.append(key)
+                key = self._get_key_for_filepath(filepath)
+                if key:
+                    filepaths_and_keys.append((filepath, key))
 
-        return key_list
+        return filepaths_and_keys
+
+    def _get_key_for_filepath(self, filepath: str) -> Optional[Tuple]:
+        if self.filepath_prefix and not filepath.startswith(self.filepath_prefix):
+            return None
+        elif self.filepath_suffix and not filepath.endswith(self.filepath_suffix):
+            return None
+        key = self._convert_filepath_to_key(filepath)
+        if key and not self.is_ignored_key(key):
+            return key
+
+        return None
+
+    @property
+    def key_index_path(self) -> str:
+        return os.path.join(self.full_base_directory, self.KEY_INDEX_FILE_NAME)  # noqa: PTH118
+
+    def rebuild_key_index(self) -> None:
+        """Rebuilds key index from files in base directory (needed if files were changed by other
+        means); also compacts journal."""
+        with self._key_index_lock:
+            self._write_key_index(key_index={filepath: key for filepath, key in self._walk_keys()})
+
+    def _list_keys_from_key_index(self, prefix: Tuple = ()) -> List[Tuple]:
+        with self._key_index_lock:
+            key_index: Dict[str, Tuple] = self._load_key_index()
+            if self._key_index_sorted_filepaths is None:
+                self._key_index_sorted_filepaths = sorted(key_index)
+
+            sorted_filepaths: List[str] = self._key_index_sorted_filepaths
+            if not prefix:
+                return [key_index[filepath] for filepath in sorted_filepaths]
+
+            # Filepaths under "prefix" directory are contiguous in sorted order.
+            directory: str = os.path.join(*prefix) + os.sep  # noqa: PTH118
+            start: int = bisect.bisect_left(sorted_filepaths, directory)
+            end: int = bisect.bisect_left(sorted_filepaths, directory[:-1] + chr(ord(os.sep) + 1))
+            return [key_index[filepath] for filepath in sorted_filepaths[start:end]]
+
+    def _load_key_index(self) -> Dict[str, Tuple]:
+        """Returns key index (filepath to key), read from index file, if it changed since last read
+        (built if absent)."""
+        try:
+            stat_result: os.stat_result = os.stat(self.key_index_path)  # noqa: PTH116
+        except FileNotFoundError:
+            self.rebuild_key_index()
+            return self._key_index  # type: ignore[return-value]
+
+        if self._key_index is not None and self._key_index_stat == (
+            stat_result.st_size,
+            stat_result.st_mtime_ns,
+        ):
+            return self._key_index
+
+        key_index: Dict[str, Tuple] = {}
+        with open(self.key_index_path) as infile:
+            contents: str = infile.read()
+
+        for line in contents.splitlines():
+            try:
+                entry: list = json.loads(line)
+            except json.JSONDecodeError:
+                # Line may be incomplete, if other process is appending it.
+                continue
+
+            if entry[0] == "+":
+                key_index[entry[1]] = tuple(entry[2])
+            else:
+                key_index.pop(entry[1], None)
+
+        self._set_key_index(key_index=key_index)
+        return key_index
+
+    def _update_key_index(
+        self,
+        added_filepaths: Sequence[str] = (),
+        removed_filepaths: Sequence[str] = (),
+    ) -> None:
+        """Records added and removed files (given by absolute paths) in key index, by appending to
+        index file."""
+        with self._key_index_lock:
+            key_index: Dict[str, Tuple] = self._load_key_index()
+
+            lines: List[str] = []
+            relative_path: str
+            for relative_path in self._get_relative_paths(removed_filepaths):
+                if key_index.pop(relative_path, None) is not None:
+                    lines.append(json.dumps(["-", relative_path]))
+
+            key: Optional[Tuple]
+            for relative_path in self._get_relative_paths(added_filepaths):
+                key = self._get_key_for_filepath(relative_path)
+                if key and key_index.get(relative_path) != key:
+                    key_index[relative_path] = key
+                    lines.append(json.dumps(["+", relative_path, list(key)]))
+
+            if not lines:
+                return
+
+            contents: bytes = "".join(f"{line}\n" for line in lines).encode("utf-8")
+            previous_size: int = self._key_index_stat[0] if self._key_index_stat else -1
+            with open(self.key_index_path, "ab") as outfile:
+                # Single write in append mode keeps lines of concurrent writers intact.
+                outfile.write(contents)
+                size: int = outfile.tell()
+
+            if size == previous_size + len(contents):
+                self._set_key_index(key_index=key_index)
+            else:
+                # Other process appended to journal since it was read; reread it on next use.
+                self._key_index = None
+
+    def _get_relative_paths(self, filepaths: Sequence[str]) -> List[str]:
+        return [os.path.relpath(filepath, self.full_base_directory) for filepath in filepaths]
+
+    def _write_key_index(self, key_index: Dict[str, Tuple]) -> None:
+        """Writes key index (only current keys), replacing index file atomically."""
+        os.makedirs(self.full_base_directory, exist_ok=True)  # noqa: PTH103
+        temp_path: str = f"{self.key_index_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "w") as outfile:
+            outfile.write(
+                "".join(
+                    f"{json.dumps(['+', filepath, list(key)])}\n"
+                    for filepath, key in key_index.items()
+                )
+            )
+
+        pathlib.Path(temp_path).replace(self.key_index_path)
+        self._set_key_index(key_index=key_index)
+
+    def _set_key_index(self, key_index: Dict[str, Tuple]) -> None:
+        stat_result: os.stat_result = os.stat(self.key_index_path)  # noqa: PTH116
+        self._key_index = key_index
+        self._key_index_sorted_filepaths = None
+        self._key_index_stat = (stat_result.st_size, stat_result.st_mtime_ns)
 
     def rrmdir(self, mroot, curpath) -> None:
         """
@@ -396,6 +617,9 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
             d_path = os.path.dirname(filepath)  # noqa: PTH120
             os.remove(filepath)  # noqa: PTH107
             self.rrmdir(self.full_base_directory, d_path)
+            if self._use_key_index:
+                self._update_key_index(removed_filepaths=[filepath])
+
             return True
         return False
 
@@ -459,6 +683,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
         base_public_path=None,
         endpoint_url=None,
         store_name=None,
+        get_all_max_concurrency: Optional[int] = None,
     ) -> None:
         super().__init__(
             filepath_template=filepath_template,
@@ -488,6 +713,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
             s3_put_options = {}
         self.s3_put_options = s3_put_options
         self.endpoint_url = endpoint_url
+        self.get_all_max_concurrency = get_all_max_concurrency or DEFAULT_GET_ALL_MAX_CONCURRENCY
         # Initialize with store_backend_id if not part of an HTMLSiteStore
         if not self._suppress_store_backend_id:
             _ = self.store_backend_id
@@ -510,6 +736,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
             "base_public_path = None": base_public_path,
             "endpoint_url": endpoint_url,
             "store_name": store_name,
+            "get_all_max_concurrency": get_all_max_concurrency,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -538,15 +765,20 @@ class TupleS3StoreBackend(TupleStoreBackend):
     @override
     def _get_all(self) -> list[Any]:
         """Get all objects from the store.
-        NOTE: This is non-performant because we download each object separately.
+        NOTE: S3 has no bulk download, so objects are downloaded separately, but concurrently (up to
+        "get_all_max_concurrency" at a time), over connections pooled by one (thread-safe) client.
         See https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/s3/bucket/objects.html#objects
         for the docs.
         """
-        client = self._create_client()
+        client = self._create_client(max_pool_connections=self.get_all_max_concurrency)
         keys = self.list_keys()
         keys = [k for k in keys if k != StoreBackend.STORE_BACKEND_ID_KEY]
         s3_object_keys = [self._build_s3_object_key(key) for key in keys]
-        return [self._get_by_s3_object_key(client, key) for key in s3_object_keys]
+        return self._get_all_concurrently(
+            get_fn=functools.partial(self._get_by_s3_object_key, client),
+            keys=s3_object_keys,
+            max_concurrency=self.get_all_max_concurrency,
+        )
 
     def _get_by_s3_object_key(self, s3_client, s3_object_key):
         try:
@@ -718,8 +950,15 @@ class TupleS3StoreBackend(TupleStoreBackend):
 
         return result
 
-    def _create_client(self):
-        return aws.boto3.client("s3", **self.boto3_options)
+    def _create_client(self, max_pool_connections: Optional[int] = None):
+        boto3_options: dict = self.boto3_options
+        if max_pool_connections:
+            # Connection pool must be as large as number of threads, sharing client (default is 10).
+            pool_config = aws.Config(max_pool_connections=max_pool_connections)
+            config = boto3_options.get("config")
+            boto3_options["config"] = config.merge(pool_config) if config else pool_config
+
+        return aws.boto3.client("s3", **boto3_options)
 
     def _create_resource(self):
         return aws.boto3.resource("s3", **self.boto3_options)
@@ -756,6 +995,7 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         public_urls=True,
         base_public_path=None,
         store_name=None,
+        get_all_max_concurrency: Optional[int] = None,
     ) -> None:
         super().__init__(
             filepath_template=filepath_template,
@@ -773,6 +1013,7 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         self.prefix = prefix
         self.project = project
         self._public_urls = public_urls
+        self.get_all_max_concurrency = get_all_max_concurrency or DEFAULT_GET_ALL_MAX_CONCURRENCY
         # Initialize with store_backend_id if not part of an HTMLSiteStore
         if not self._suppress_store_backend_id:
             _ = self.store_backend_id
@@ -794,6 +1035,7 @@ class TupleGCSStoreBackend(TupleStoreBackend):
             "public_urls": public_urls,
             "base_public_path": base_public_path,
             "store_name": store_name,
+            "get_all_max_concurrency": get_all_max_concurrency,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -825,13 +1067,22 @@ class TupleGCSStoreBackend(TupleStoreBackend):
     def _get_all(self) -> list[Any]:
         from great_expectations.compatibility import google
 
-        gcs = google.storage.Client(project=self.project)
-        bucket = gcs.bucket(self.bucket)
-
         keys = self.list_keys()
         keys = [k for k in keys if k != StoreBackend.STORE_BACKEND_ID_KEY]
 
-        return [self._get_by_gcs_object_key(bucket, key) for key in keys]
+        # Every thread reuses connections of its own client (clients may not be thread-safe).
+        thread_local = threading.local()
+
+        def _get_by_key(key):
+            if not hasattr(thread_local, "bucket"):
+                gcs = google.storage.Client(project=self.project)
+                thread_local.bucket = gcs.bucket(self.bucket)
+
+            return self._get_by_gcs_object_key(thread_local.bucket, key)
+
+        return self._get_all_concurrently(
+            get_fn=_get_by_key, keys=keys, max_concurrency=self.get_all_max_concurrency
+        )
 
     def _get_by_gcs_object_key(self, bucket, key):
         gcs_object_key = self._build_gcs_object_key(key)
@@ -989,6 +1240,7 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
         suppress_store_backend_id=False,
         manually_initialize_store_backend_id: str = "",
         store_name=None,
+        get_all_max_concurrency: Optional[int] = None,
     ) -> None:
         super().__init__(
             filepath_template=filepath_template,
@@ -1001,6 +1253,7 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
             manually_initialize_store_backend_id=manually_initialize_store_backend_id,
             store_name=store_name,
         )
+        self.get_all_max_concurrency = get_all_max_concurrency or DEFAULT_GET_ALL_MAX_CONCURRENCY
         self.connection_string = connection_string or os.environ.get(  # noqa: TID251
             "AZURE_STORAGE_CONNECTION_STRING"
         )
@@ -1058,8 +1311,11 @@ class TupleAzureBlobStoreBackend(TupleStoreBackend):
 
     @override
     def _get_all(self) -> list[Any]:
+        # Container client is thread-safe, so that all threads share its connection pool.
         keys = self.list_keys()
-        return [self._get(key) for key in keys]
+        return self._get_all_concurrently(
+            get_fn=self._get, keys=keys, max_concurrency=self.get_all_max_concurrency
+        )
 
     def _set(self, key, value, content_encoding="utf-8", **kwargs):
         from great_expectations.compatibility.azure import ContentSettings
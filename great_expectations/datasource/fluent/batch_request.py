@@ -7,6 +7,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    List,
     Mapping,
     Optional,
     Union,
@@ -61,6 +62,8 @@ class BatchRequest(pydantic.BaseModel):
             calling DataAsset.get_batch_parameters_keys(...).
         batch_slice: A python slice that can be used to filter the sorted batches by index.
             e.g. `batch_slice = "[-5:]"` will request only the last 5 batches after the options filter is applied.
+        columns: An optional list of columns to load; if specified, readers supporting column projection (e.g., CSV and
+            Parquet) load only these columns.  It does not change which batches are returned and is not serialized.
 
     Returns:
         BatchRequest
@@ -89,13 +92,18 @@ class BatchRequest(pydantic.BaseModel):
     _batch_slice_input: Optional[BatchSlice] = pydantic.PrivateAttr(
         default=None,
     )
+    _columns: Optional[List[str]] = pydantic.PrivateAttr(
+        default=None,
+    )
 
     def __init__(self, **kwargs) -> None:
         _batch_slice_input: Optional[BatchSlice] = None
         if "batch_slice" in kwargs:
             _batch_slice_input = kwargs.pop("batch_slice")
+        _columns: Optional[List[str]] = kwargs.pop("columns", None)
         super().__init__(**kwargs)
         self._batch_slice_input = _batch_slice_input
+        self.update_columns(_columns)
 
     @property
     def batch_slice(self) -> slice:
@@ -118,9 +126,29 @@ class BatchRequest(pydantic.BaseModel):
             raise ValueError(f"Failed to parse BatchSlice to slice: {e}")  # noqa: TRY003
         self._batch_slice_input = value
 
+    @property
+    def columns(self) -> Optional[List[str]]:
+        """Columns to load (all columns, if None)."""
+        return self._columns
+
+    def update_columns(self, value: Optional[List[str]] = None) -> None:
+        """Updates the columns (to load) on this BatchRequest.
+
+        Args:
+            value: The new list of column names (or None, in order to load all columns).
+
+        Returns:
+            None
+        """
+        if value is not None and (
+            isinstance(value, str) or not all(isinstance(column, str) for column in value)
+        ):
+            raise TypeError("BatchRequest columns must be a list of strings.")  # noqa: TRY003
+        self._columns = None if value is None else list(value)
+
     class Config:
         extra = pydantic.Extra.forbid
-        property_set_methods = {"batch_slice": "update_batch_slice"}
+        property_set_methods = {"batch_slice": "update_batch_slice", "columns": "update_columns"}
         validate_assignment = True
 
     def __setattr__(self, key, val):
@@ -1,5 +1,5 @@
 import re
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from typing_extensions import TypeAlias
 
@@ -25,6 +25,7 @@ class BatchRequest(pydantic.BaseModel):
         batch_slice: Optional[BatchSlice] = None,
         partitioner: Optional[Partitioner] = None,
         batching_regex: Optional[re.Pattern] = None,
+        columns: Optional[List[str]] = None,
     ) -> None: ...
     @property
     def batch_slice(self) -> slice: ...
@@ -35,3 +36,8 @@ class BatchRequest(pydantic.BaseModel):
     @batch_slice.setter
     def batch_slice(self, value: Optional[BatchSlice]) -> None: ...
     def update_batch_slice(self, value: Optional[BatchSlice] = None) -> None: ...
+    @property
+    def columns(self) -> Optional[List[str]]: ...
+    @columns.setter
+    def columns(self, value: Optional[List[str]]) -> None: ...
+    def update_columns(self, value: Optional[List[str]] = None) -> None: ...
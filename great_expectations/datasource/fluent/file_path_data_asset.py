@@ -286,7 +286,8 @@ class _FilePathDataAsset(DataAsset):
             batch_spec_options = self._batch_spec_options_from_batch_request(batch_request)
             batch_spec.update(batch_spec_options)
 
-            batch_data, batch_markers = execution_engine.get_batch_data_and_markers(
+            # Data is read only when metric first needs it (if execution engine supports it).
+            batch_data, batch_markers = execution_engine.get_lazy_batch_data_and_markers(
                 batch_spec=batch_spec
             )
 
@@ -381,6 +382,15 @@ class _FilePathDataAsset(DataAsset):
             )
             batch_spec_options["partitioner_kwargs"] = partitioner_kwargs
 
+        if batch_request.columns is not None:
+            # Columns, by which batch is partitioned, must be loaded, even if not referenced.
+            columns: set[str] = set(batch_request.columns)
+            partitioner_kwargs = batch_spec_options.get("partitioner_kwargs", {})
+            if "column_name" in partitioner_kwargs:
+                columns.add(partitioner_kwargs["column_name"])
+            columns.update(partitioner_kwargs.get("column_names", []))
+            batch_spec_options["columns"] = sorted(columns)
+
         return batch_spec_options
 
     @override
@@ -135,6 +135,8 @@ work-around, until "type" naming convention and method for obtaining 'reader_met
                 config_provider=self._datasource._config_provider,
             ),
         )
+        if batch_request.columns is not None:
+            batch_spec["columns"] = sorted(batch_request.columns)
         execution_engine: PandasExecutionEngine = self.datasource.get_execution_engine()
         data, markers = execution_engine.get_batch_data_and_markers(batch_spec=batch_spec)
 
@@ -14,6 +14,9 @@ from great_expectations.core.batch import Batch, BatchMarkers
 from great_expectations.core.util import S3Url
 from great_expectations.datasource.datasource import LegacyDatasource
 from great_expectations.exceptions import BatchKwargsError
+from great_expectations.execution_engine.data_fingerprint import (
+    fingerprint_pandas_dataframe,
+)
 from great_expectations.execution_engine.pandas_execution_engine import (
     hash_pandas_dataframe,
 )
@@ -252,6 +255,8 @@ class PandasDatasource(LegacyDatasource):
 
         if df.memory_usage().sum() < HASH_THRESHOLD:
             batch_markers["pandas_data_fingerprint"] = hash_pandas_dataframe(df)
+        else:
+            batch_markers["pandas_data_fingerprint"] = fingerprint_pandas_dataframe(df)
 
         return Batch(
             datasource_name=self.name,
@@ -0,0 +1,165 @@
+"""Fingerprints of Batch data, which identify its contents (or its source) cheaply enough for
+Batches of any size.
+
+DataFrame fingerprint hashes every column (and index) separately, by blocks of rows, so that memory
+overhead is bounded by block size (rather than by size of DataFrame) and columns are hashed in
+parallel.  Source fingerprint identifies file (or cloud storage object) by its metadata (size and
+modification time, ETag, Parquet footer), without reading its data, together with options of
+BatchSpec, which determine data read from it.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import hashlib
+import json
+import logging
+import os
+import pickle
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+import pandas as pd
+
+from great_expectations.compatibility import pyarrow
+
+if TYPE_CHECKING:
+    from great_expectations.core.id_dict import BatchSpec
+
+logger = logging.getLogger(__name__)
+
+# Number of rows hashed at once (bounds memory of row hashes of "hash_pandas_object()").
+DEFAULT_FINGERPRINT_BLOCK_ROWS = 1_000_000
+
+DEFAULT_FINGERPRINT_MAX_WORKERS = 8
+
+# BatchSpec entries, which do not determine data read from source.
+_NON_DATA_BATCH_SPEC_KEYS = ("batch_data",)
+
+
+def fingerprint_pandas_dataframe(
+    df: pd.DataFrame,
+    block_rows: int = DEFAULT_FINGERPRINT_BLOCK_ROWS,
+    max_workers: int = DEFAULT_FINGERPRINT_MAX_WORKERS,
+) -> str:
+    """Returns fingerprint of DataFrame contents (column names, dtypes, values, and index), hashed
+    column by column.
+
+    Args:
+        df: DataFrame to fingerprint
+        block_rows: number of rows of column hashed at once
+        max_workers: maximum number of columns hashed at the same time
+
+    Returns:
+        Hexadecimal MD5 digest, which is equal for DataFrames with equal contents
+    """
+    block_rows = max(block_rows, 1)
+    series_list = [pd.Series(df.index, copy=False)] + [
+        df.iloc[:, position] for position in range(df.shape[1])
+    ]
+
+    column_digests: list[str]
+    if len(series_list) == 1 or max_workers <= 1:
+        column_digests = [_hash_series(series, block_rows) for series in series_list]
+    else:
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(max_workers, len(series_list))
+        ) as executor:
+            column_digests = list(
+                executor.map(lambda series: _hash_series(series, block_rows), series_list)
+            )
+
+    fingerprint = hashlib.md5()
+    fingerprint.update(str(len(df)).encode())
+    for column, dtype, column_digest in zip(
+        ["__index__", *df.columns], [df.index.dtype, *df.dtypes], column_digests
+    ):
+        fingerprint.update(f"{column!r}:{dtype}:{column_digest};".encode())
+
+    return fingerprint.hexdigest()
+
+
+def _hash_series(series: pd.Series, block_rows: int) -> str:
+    digest = hashlib.md5()
+    for start in range(0, len(series), block_rows):
+        block: pd.Series = series.iloc[start : start + block_rows]
+        try:
+            digest.update(pd.util.hash_pandas_object(block, index=False).values.tobytes())
+        except TypeError:
+            # In case of facing unhashable objects (like dict), use pickle (value by value, so that
+            # digest does not depend on block boundaries).
+            for value in block.tolist():
+                digest.update(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+
+    return digest.hexdigest()
+
+
+def get_local_file_metadata(path: str, reader_method: Optional[str] = None) -> Optional[dict]:
+    """Returns metadata, which identifies version of local file (None if file cannot be inspected).
+
+    Metadata consists of resolved path, size, and modification time; for Parquet files, summary of
+    their footer (row count, row groups, schema), which is read without reading data, is added.
+    """
+    try:
+        stat_result: os.stat_result = os.stat(path)  # noqa: PTH116
+    except (OSError, TypeError, ValueError):
+        return None
+
+    metadata: Dict[str, Any] = {
+        "path": os.path.realpath(path),
+        "size": stat_result.st_size,
+        "mtime_ns": stat_result.st_mtime_ns,
+    }
+    if reader_method == "read_parquet" or str(path).endswith(".parquet"):
+        parquet_metadata: Optional[dict] = get_parquet_metadata(path)
+        if parquet_metadata is not None:
+            metadata["parquet"] = parquet_metadata
+
+    return metadata
+
+
+def get_parquet_metadata(source: Any) -> Optional[dict]:
+    """Returns summary of Parquet footer of "source" (None if "pyarrow" is unavailable or footer
+    cannot be read)."""
+    if not pyarrow.parquet:
+        return None
+
+    try:
+        file_metadata = pyarrow.parquet.read_metadata(source)
+    except (OSError, ValueError) as e:
+        logger.debug(f"Parquet metadata could not be read ({e}).")
+        return None
+
+    return {
+        "num_rows": file_metadata.num_rows,
+        "num_row_groups": file_metadata.num_row_groups,
+        "serialized_size": file_metadata.serialized_size,
+        "schema": str(file_metadata.schema),
+        "row_group_byte_sizes": [
+            file_metadata.row_group(index).total_byte_size
+            for index in range(file_metadata.num_row_groups)
+        ],
+    }
+
+
+def fingerprint_source(source_metadata: dict, batch_spec: BatchSpec) -> str:
+    """Returns fingerprint of data read from source, identified by "source_metadata", as
+    "batch_spec" specifies.
+
+    Args:
+        source_metadata: metadata, which identifies version of source (e.g., size and modification
+            time, or ETag)
+        batch_spec: BatchSpec, whose options (e.g., reader options, partitioning, sampling)
+            determine data read
+
+    Returns:
+        Hexadecimal MD5 digest, which changes whenever source or BatchSpec changes
+    """
+    batch_spec_options: dict = {
+        key: value for key, value in batch_spec.items() if key not in _NON_DATA_BATCH_SPEC_KEYS
+    }
+    serialized: str = json.dumps(
+        {"source": source_metadata, "batch_spec": batch_spec_options},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.md5(serialized.encode()).hexdigest()
@@ -0,0 +1,181 @@
+"""Bounded cache of filtered domain records, shared by metrics computed over same Batch under same row filters.
+
+Metrics of many Expectations in one Suite are often computed over the same "row_condition" (or "ignore_row_if") of the
+same Batch; "ExecutionEngine.get_domain_records()" would otherwise re-apply identical filters for every one of them.
+"""  # noqa: E501
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Final, Hashable, Optional, Tuple
+
+from great_expectations.core import IDDict
+
+logger = logging.getLogger(__name__)
+
+DomainRecordsCacheKey = Tuple[Optional[str], Hashable]
+
+# Domain keys, which restrict rows of Batch for every Domain type.
+ROW_FILTER_DOMAIN_KEYS: Final[Tuple[str, ...]] = (
+    "row_condition",
+    "condition_parser",
+    "filter_conditions",
+)
+
+# Domain keys, which restrict rows of Batch for "column_pair" and "multicolumn" Domain types ("ignore_row_if" directive).  # noqa: E501
+IGNORE_ROW_IF_DOMAIN_KEYS: Final[Tuple[str, ...]] = (
+    "column_A",
+    "column_B",
+    "column_list",
+    "ignore_row_if",
+)
+
+
+def build_domain_records_cache_key(
+    domain_kwargs: dict, batch_id: Optional[str]
+) -> Optional[DomainRecordsCacheKey]:
+    """Builds cache key from Domain kwargs, which determine filtered records, or returns None if no rows are filtered.
+
+    Args:
+        domain_kwargs: Domain kwargs, passed to "get_domain_records()"
+        batch_id: ID of Batch, whose records are filtered (resolved to active Batch, if absent from Domain kwargs)
+
+    Returns:
+        Tuple of Batch ID and normalized ("IDDict.to_id()") filtering Domain kwargs (None if records are not filtered)
+    """  # noqa: E501
+    filter_kwargs: Dict[str, Any] = {
+        key: domain_kwargs[key] for key in ROW_FILTER_DOMAIN_KEYS if domain_kwargs.get(key)
+    }
+    if "column" not in domain_kwargs and "ignore_row_if" in domain_kwargs:
+        filter_kwargs.update(
+            {key: domain_kwargs[key] for key in IGNORE_ROW_IF_DOMAIN_KEYS if key in domain_kwargs}
+        )
+
+    if not (
+        filter_kwargs.get("row_condition")
+        or filter_kwargs.get("filter_conditions")
+        or "ignore_row_if" in filter_kwargs
+    ):
+        return None
+
+    return batch_id, IDDict(filter_kwargs).to_id()
+
+
+def _get_zero_size(records: Any) -> int:
+    return 0
+
+
+class DomainRecordsCache:
+    """Least-recently-used cache of filtered domain records, bounded by total size and/or by number of entries.
+
+    Args:
+        max_bytes: upper bound on sum of sizes (as reported by "size_fn") of cached records (None means unbounded)
+        max_entries: upper bound on number of cached records (None means unbounded)
+        size_fn: callable returning size of records in bytes (records larger than "max_bytes" are never cached)
+    """  # noqa: E501
+
+    def __init__(
+        self,
+        max_bytes: Optional[int] = None,
+        max_entries: Optional[int] = None,
+        size_fn: Optional[Callable[[Any], int]] = None,
+    ) -> None:
+        self._max_bytes = max_bytes
+        self._max_entries = max_entries
+        self._size_fn = size_fn or _get_zero_size
+
+        self._entries: OrderedDict[DomainRecordsCacheKey, Tuple[Any, int]] = OrderedDict()
+        self._current_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+
+        # Cache may be shared by metrics, resolved concurrently (see "MetricResolutionScheduler").
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        # Lock cannot be pickled (e.g., into "ProcessPoolMetricResolutionScheduler" worker process).
+        state: dict = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_bytes != 0 and self._max_entries != 0
+
+    @property
+    def current_bytes(self) -> int:
+        return self._current_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: DomainRecordsCacheKey) -> bool:
+        return key in self._entries
+
+    def get(self, key: DomainRecordsCacheKey) -> Optional[Any]:
+        """Returns cached records (marking them as most recently used), or None, counting hits and misses."""  # noqa: E501
+        with self._lock:
+            entry: Optional[Tuple[Any, int]] = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: DomainRecordsCacheKey, records: Any) -> None:
+        """Caches records under key, evicting least recently used entries until both bounds are satisfied."""  # noqa: E501
+        if not self.enabled:
+            return
+
+        size: int = self._size_fn(records)
+        if self._max_bytes is not None and size > self._max_bytes:
+            logger.debug(f"Domain records of {size} bytes exceed cache budget; not cached.")
+            return
+
+        with self._lock:
+            self._pop(key)
+            self._entries[key] = (records, size)
+            self._current_bytes += size
+
+            while self._entries and (
+                (self._max_bytes is not None and self._current_bytes > self._max_bytes)
+                or (self._max_entries is not None and len(self._entries) > self._max_entries)
+            ):
+                self._pop(next(iter(self._entries)))
+
+    def invalidate(self, batch_id: Optional[str] = None) -> None:
+        """Removes cached records of given Batch (or of all Batches, if "batch_id" is None)."""
+        with self._lock:
+            if batch_id is None:
+                self._entries.clear()
+                self._current_bytes = 0
+                return
+
+            key: DomainRecordsCacheKey
+            for key in [key for key in self._entries if key[0] == batch_id]:
+                self._pop(key)
+
+    def info(self) -> Dict[str, Optional[int]]:
+        """Returns usage statistics (hits, misses, entries, current and maximum sizes) of cache."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._entries),
+            "current_bytes": self._current_bytes,
+            "max_bytes": self._max_bytes,
+            "max_entries": self._max_entries,
+        }
+
+    def _pop(self, key: DomainRecordsCacheKey) -> None:
+        entry: Optional[Tuple[Any, int]] = self._entries.pop(key, None)
+        if entry is not None:
+            self._current_bytes -= entry[1]
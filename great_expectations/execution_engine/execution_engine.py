@@ -39,12 +39,16 @@ if TYPE_CHECKING:
     from great_expectations.compatibility.pyspark import functions as F
     from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
     from great_expectations.core.batch import (
+        AnyBatch,
         BatchData,
         BatchDataType,
         BatchDataUnion,
         BatchMarkers,
         BatchSpec,
     )
+    from great_expectations.execution_engine.persistent_metric_cache import (
+        PersistentMetricCache,
+    )
     from great_expectations.expectations.metrics.metric_provider import MetricProvider
     from great_expectations.validator.validator import Validator
 
@@ -160,6 +164,9 @@ class ExecutionEngine(ABC):
         else:
             self._metric_cache = NoOpDict()
 
+        # Opt-in on-disk cache of metric values, keyed by Batch fingerprint (see "get_batch_fingerprint()").  # noqa: E501
+        self._persistent_metric_cache: Optional[PersistentMetricCache] = None
+
         if batch_spec_defaults is None:
             batch_spec_defaults = {}
 
@@ -216,6 +223,41 @@ class ExecutionEngine(ABC):
         """Getter for batch_manager"""
         return self._batch_manager
 
+    @property
+    def persistent_metric_cache(self) -> Optional[PersistentMetricCache]:
+        """On-disk cache of metric values, consulted before metrics are resolved (None if disabled)."""  # noqa: E501
+        return self._persistent_metric_cache
+
+    @persistent_metric_cache.setter
+    def persistent_metric_cache(
+        self, persistent_metric_cache: Optional[PersistentMetricCache]
+    ) -> None:
+        self._persistent_metric_cache = persistent_metric_cache
+
+    def get_batch_fingerprint(self, batch_id: Optional[str] = None) -> Optional[str]:
+        """Returns fingerprint, which identifies data of Batch (active Batch by default), or None if it is unknown.
+
+        Fingerprint of source (file or object, together with BatchSpec) is preferred, since it does not require reading
+        data; otherwise, fingerprint of data itself, computed when Batch was read, is used.
+        """  # noqa: E501
+        if batch_id is None:
+            batch_id = self._batch_manager.active_batch_id
+
+        batch: Optional[AnyBatch] = (
+            None if batch_id is None else self._batch_manager.batch_cache.get(batch_id)
+        )
+        batch_markers: Optional[BatchMarkers] = None if batch is None else batch.batch_markers
+        if not batch_markers:
+            return None
+
+        fingerprint: Optional[str] = batch_markers.get("source_fingerprint") or batch_markers.get(
+            "pandas_data_fingerprint"
+        )
+        if fingerprint is None:
+            return None
+
+        return f"{self.__class__.__name__}:{fingerprint}"
+
     def _load_batch_data_from_dict(self, batch_data_dict: Dict[str, BatchDataType]) -> None:
         """
         Loads all data in batch_data_dict using cache_batch_data
@@ -228,6 +270,23 @@ class ExecutionEngine(ABC):
     def load_batch_data(self, batch_id: str, batch_data: BatchDataUnion) -> None:
         self._batch_manager.save_batch_data(batch_id=batch_id, batch_data=batch_data)
 
+    def release_batch_data(self, batch_id: str) -> None:  # noqa: B027 # optional hook
+        """Frees resources, held for BatchData of Batch, which "BatchManager" no longer holds (see
+        "BatchManager.release_batches()")."""
+        pass
+
+    def prepare_domain_records(  # noqa: B027 # optional hook
+        self, metric_configurations: Iterable[MetricConfiguration]
+    ) -> None:
+        """Receives metrics, which are about to be resolved, so that filtered Domains, shared by
+        many of them, can be prepared (e.g., materialized)."""
+        pass
+
+    def release_domain_records(self) -> None:  # noqa: B027 # optional hook
+        """Frees resources, held for filtered Domains since "prepare_domain_records()" was called
+        (e.g., materialized tables)."""
+        pass
+
     def get_batch_data(
         self,
         batch_spec: BatchSpec,
@@ -248,6 +307,13 @@ class ExecutionEngine(ABC):
     def get_batch_data_and_markers(self, batch_spec) -> Tuple[BatchData, BatchMarkers]:
         raise NotImplementedError
 
+    def get_lazy_batch_data_and_markers(self, batch_spec) -> Tuple[BatchData, BatchMarkers]:
+        """Returns BatchData, whose data may be read only when metric first needs it.
+
+        ExecutionEngine, which does not support deferred reads, reads data at once (see "get_batch_data_and_markers()").
+        """  # noqa: E501
+        return self.get_batch_data_and_markers(batch_spec=batch_spec)
+
     def resolve_metrics(
         self,
         metrics_to_resolve: Iterable[MetricConfiguration],
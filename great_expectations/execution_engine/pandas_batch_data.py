@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import threading
+from typing import TYPE_CHECKING, Callable, Iterator, Optional
 
 from great_expectations.core.batch import BatchData
 
@@ -16,3 +17,121 @@ class PandasBatchData(BatchData):
     @property
     def dataframe(self):
         return self._dataframe
+
+
+class PandasChunkedBatchData(PandasBatchData):
+    """Batch of data, which is read as sequence of DataFrame chunks and is never held in memory in its entirety.
+
+    Every pass over data calls "chunk_factory" anew (e.g., "read_csv()" with "chunksize" option).  While "iter_chunks()"
+    is being consumed, "dataframe" is current chunk; otherwise, it is first chunk (e.g., for inspecting column types).
+    """  # noqa: E501
+
+    def __init__(
+        self, execution_engine, chunk_factory: Callable[[], Iterator[pd.DataFrame]]
+    ) -> None:
+        super().__init__(
+            execution_engine=execution_engine,
+            dataframe=None,  # type: ignore[arg-type]
+        )
+        self._chunk_factory = chunk_factory
+        self._current_chunk: Optional[pd.DataFrame] = None
+
+    @property
+    def dataframe(self):
+        if self._current_chunk is not None:
+            return self._current_chunk
+
+        if self._dataframe is None:
+            self._dataframe = self._read_first_chunk()
+
+        return self._dataframe
+
+    def iter_chunks(self) -> Iterator[pd.DataFrame]:
+        """Yields chunks of data in order; each chunk is "dataframe" until next one is read."""
+        chunks: Iterator[pd.DataFrame] = self._chunk_factory()
+        try:
+            chunk: pd.DataFrame
+            for chunk in chunks:
+                self._current_chunk = chunk
+                yield chunk
+        finally:
+            self._current_chunk = None
+            _close_chunks(chunks)
+
+    def _read_first_chunk(self) -> pd.DataFrame:
+        chunks: Iterator[pd.DataFrame] = self._chunk_factory()
+        try:
+            return next(chunks)
+        except StopIteration:
+            import pandas as pd
+
+            return pd.DataFrame()
+        finally:
+            _close_chunks(chunks)
+
+
+class PandasLazyBatchData(PandasBatchData):
+    """Batch of data, which is read only when its "dataframe" is first needed and can be released (and read again) later.
+
+    "loader" reads (partitioned and sampled) DataFrame of Batch; "on_load" (if given) is notified of every load (e.g.,
+    so that ExecutionEngine can release Batches loaded earlier and hold bounded amount of data in memory).
+    """  # noqa: E501
+
+    def __init__(
+        self,
+        execution_engine,
+        loader: Callable[[], pd.DataFrame],
+        on_load: Optional[Callable[[PandasLazyBatchData], None]] = None,
+    ) -> None:
+        super().__init__(
+            execution_engine=execution_engine,
+            dataframe=None,  # type: ignore[arg-type]
+        )
+        self._loader = loader
+        self._on_load = on_load
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> dict:
+        # Lock cannot be pickled (e.g., into "ProcessPoolMetricResolutionScheduler" worker process).
+        state: dict = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def dataframe(self):
+        dataframe: Optional[pd.DataFrame] = self._dataframe
+        if dataframe is not None:
+            return dataframe
+
+        with self._lock:
+            if self._dataframe is None:
+                self._dataframe = self._loader()
+                loaded = True
+            else:
+                loaded = False
+
+            dataframe = self._dataframe
+
+        if loaded and self._on_load is not None:
+            self._on_load(self)
+
+        return dataframe
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._dataframe is not None
+
+    def release(self) -> None:
+        """Drops loaded DataFrame (it is read again, should "dataframe" be needed afterwards)."""
+        with self._lock:
+            self._dataframe = None
+
+
+def _close_chunks(chunks: Iterator[pd.DataFrame]) -> None:
+    close: Optional[Callable[[], None]] = getattr(chunks, "close", None)
+    if close is not None:
+        close()
@@ -4,14 +4,19 @@ import datetime
 import hashlib
 import logging
 import pickle
+import threading
+from collections import OrderedDict
 from functools import partial
 from io import BytesIO
 from typing import (
     TYPE_CHECKING,
     Any,
+    BinaryIO,
     Callable,
     Dict,
     Iterable,
+    Iterator,
+    List,
     Optional,
     Tuple,
     Union,
@@ -19,15 +24,17 @@ from typing import (
     overload,
 )
 
+import numpy as np
 import pandas as pd
 
 import great_expectations.exceptions as gx_exceptions
 from great_expectations._docs_decorators import public_api
-from great_expectations.compatibility import aws, azure, google
+from great_expectations.compatibility import aws, azure, google, pyarrow
 from great_expectations.compatibility.sqlalchemy_and_pandas import (
     execute_pandas_reader_fn,
 )
 from great_expectations.compatibility.typing_extensions import override
+from great_expectations.core import IDDict
 from great_expectations.core.batch import BatchMarkers
 from great_expectations.core.batch_spec import (
     AzureBatchSpec,
@@ -40,30 +47,98 @@ from great_expectations.core.batch_spec import (
     RuntimeDataBatchSpec,
     S3BatchSpec,
 )
-from great_expectations.core.metric_domain_types import (
-    MetricDomainTypes,  # noqa: TCH001
-)
+from great_expectations.core.metric_domain_types import MetricDomainTypes
 from great_expectations.core.util import AzureUrl, GCSUrl, S3Url, sniff_s3_compression
 from great_expectations.execution_engine import ExecutionEngine
+from great_expectations.execution_engine.data_fingerprint import (
+    fingerprint_pandas_dataframe,
+    fingerprint_source,
+    get_local_file_metadata,
+)
+from great_expectations.execution_engine.domain_records_cache import (
+    DomainRecordsCache,
+    DomainRecordsCacheKey,
+    build_domain_records_cache_key,
+)
 from great_expectations.execution_engine.execution_engine import (
-    PartitionDomainKwargs,  # noqa: TCH001
+    MetricComputationConfiguration,
+    PartitionDomainKwargs,
+)
+from great_expectations.execution_engine.pandas_batch_data import (
+    PandasBatchData,
+    PandasChunkedBatchData,
+    PandasLazyBatchData,
 )
-from great_expectations.execution_engine.pandas_batch_data import PandasBatchData
 from great_expectations.execution_engine.partition_and_sample.pandas_data_partitioner import (
     PandasDataPartitioner,
 )
 from great_expectations.execution_engine.partition_and_sample.pandas_data_sampler import (
     PandasDataSampler,
 )
+from great_expectations.execution_engine.persistent_metric_cache import (
+    DEFAULT_PERSISTENT_METRIC_CACHE_MAX_BYTES,
+    PersistentMetricCache,
+)
+from great_expectations.execution_engine.ranged_object_reader import (
+    ReadRangeFn,
+    open_ranged_object,
+)
+from great_expectations.expectations.registry import get_metric_provider
 
 if TYPE_CHECKING:
     from typing_extensions import TypeAlias
 
+    from great_expectations.validator.computed_metric import MetricValue
+    from great_expectations.validator.metric_configuration import MetricConfiguration
+
 logger = logging.getLogger(__name__)
 
 
+# DataFrames smaller than this are fingerprinted by "hash_pandas_dataframe()" (larger, column-wise).
 HASH_THRESHOLD = 1e9
 
+# NumPy dtype kinds (signed/unsigned integer, float), for which DataFrame reductions equal
+# per-column Series reductions.
+VECTORIZED_REDUCTION_DTYPE_KINDS = "iuf"
+
+# "DataFrame.dropna()" modes (None keeps all rows), by value of "ignore_row_if" directive of
+# "column_pair" and "multicolumn" Domains, respectively.
+COLUMN_PAIR_IGNORE_ROW_IF_DROPNA_HOW: Dict[str, Optional[str]] = {
+    "both_values_are_missing": "all",
+    "either_value_is_missing": "any",
+    "neither": None,
+}
+MULTICOLUMN_IGNORE_ROW_IF_DROPNA_HOW: Dict[str, Optional[str]] = {
+    "all_values_are_missing": "all",
+    "any_value_is_missing": "any",
+    "never": None,
+}
+
+# Default memory budget of cached filtered domain records (see "DomainRecordsCache").
+DEFAULT_DOMAIN_RECORDS_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# Cloud storage objects up to this size are downloaded in one request (larger, by ranged requests).
+DEFAULT_OBJECT_STORAGE_BUFFER_MAX_BYTES = 64 * 1024 * 1024
+
+# Lazily read Batches ("PandasLazyBatchData") are released, oldest first, above this total size.
+DEFAULT_LAZY_BATCH_DATA_MAX_BYTES = 1024 * 1024 * 1024
+
+# Keyword arguments, with which Pandas readers load only a subset of columns (column projection).
+PANDAS_READER_COLUMN_PROJECTION_ARGUMENTS: Dict[str, str] = {
+    "read_csv": "usecols",
+    "read_table": "usecols",
+    "read_excel": "usecols",
+    "read_parquet": "columns",
+    "read_feather": "columns",
+    "read_orc": "columns",
+}
+
+# Reader option, with which batch is read in chunks of so many rows (see "PandasChunkedBatchData").
+PANDAS_READER_CHUNKSIZE_OPTION = "chunksize"
+
+# Sampling methods, whose result over whole batch differs from union of their results over chunks.
+CHUNKED_BATCH_UNSUPPORTED_SAMPLING_METHODS = {"sample_using_limit"}
+
 DataFrameFactoryFn: TypeAlias = Callable[..., pd.DataFrame]
 
 
@@ -75,7 +150,12 @@ class PandasExecutionEngine(ExecutionEngine):
 
     Args:
         *args: Positional arguments for configuring PandasExecutionEngine
-        **kwargs: Keyword arguments for configuring PandasExecutionEngine
+        **kwargs: Keyword arguments for configuring PandasExecutionEngine; "domain_records_cache_max_bytes" bounds \
+            memory of filtered ("row_condition", "ignore_row_if") domain records, reused across metrics (0 disables); \
+            S3, Azure, and GCS objects larger than "object_storage_buffer_max_bytes" are streamed by ranged requests; \
+            "lazy_batch_data_max_bytes" bounds memory of lazily read Batches, loaded at the same time; \
+            "persistent_metric_cache_path" enables on-disk cache of metric values (bounded by \
+            "persistent_metric_cache_max_bytes"), reused while fingerprint of Batch is unchanged.
 
     For example:
     ```python
@@ -115,6 +195,26 @@ class PandasExecutionEngine(ExecutionEngine):
         boto3_options: Dict[str, dict] = kwargs.pop("boto3_options", {})
         azure_options: Dict[str, dict] = kwargs.pop("azure_options", {})
         gcs_options: Dict[str, dict] = kwargs.pop("gcs_options", {})
+        domain_records_cache_max_bytes: int = kwargs.pop(
+            "domain_records_cache_max_bytes", DEFAULT_DOMAIN_RECORDS_CACHE_MAX_BYTES
+        )
+        object_storage_buffer_max_bytes: int = kwargs.pop(
+            "object_storage_buffer_max_bytes", DEFAULT_OBJECT_STORAGE_BUFFER_MAX_BYTES
+        )
+        lazy_batch_data_max_bytes: Optional[int] = kwargs.pop(
+            "lazy_batch_data_max_bytes", DEFAULT_LAZY_BATCH_DATA_MAX_BYTES
+        )
+        persistent_metric_cache_path: Optional[str] = kwargs.pop(
+            "persistent_metric_cache_path", None
+        )
+        persistent_metric_cache_max_bytes: int = kwargs.pop(
+            "persistent_metric_cache_max_bytes", DEFAULT_PERSISTENT_METRIC_CACHE_MAX_BYTES
+        )
+
+        self._domain_records_cache = DomainRecordsCache(
+            max_bytes=domain_records_cache_max_bytes,
+            size_fn=_get_dataframe_memory_usage,
+        )
 
         # Instantiate cloud provider clients as None at first.
         # They will be instantiated if/when passed cloud-specific in BatchSpec is passed in
@@ -122,6 +222,14 @@ class PandasExecutionEngine(ExecutionEngine):
         self._azure: azure.BlobServiceClient | None = None
         self._gcs = None
 
+        self._object_storage_buffer_max_bytes = object_storage_buffer_max_bytes
+
+        self._lazy_batch_data_max_bytes = lazy_batch_data_max_bytes
+        self._loaded_lazy_batch_data: OrderedDict[int, Tuple[PandasLazyBatchData, int]] = (
+            OrderedDict()
+        )
+        self._loaded_lazy_batch_data_lock = threading.Lock()
+
         super().__init__(*args, **kwargs)
 
         self._config.update(
@@ -130,12 +238,32 @@ class PandasExecutionEngine(ExecutionEngine):
                 "boto3_options": boto3_options,
                 "azure_options": azure_options,
                 "gcs_options": gcs_options,
+                "domain_records_cache_max_bytes": domain_records_cache_max_bytes,
+                "object_storage_buffer_max_bytes": object_storage_buffer_max_bytes,
+                "lazy_batch_data_max_bytes": lazy_batch_data_max_bytes,
+                "persistent_metric_cache_path": persistent_metric_cache_path,
+                "persistent_metric_cache_max_bytes": persistent_metric_cache_max_bytes,
             }
         )
 
+        if persistent_metric_cache_path:
+            self.persistent_metric_cache = PersistentMetricCache(
+                path=persistent_metric_cache_path, max_bytes=persistent_metric_cache_max_bytes
+            )
+
         self._data_partitioner = PandasDataPartitioner()
         self._data_sampler = PandasDataSampler()
 
+    def __getstate__(self) -> dict:
+        # Lock cannot be pickled (e.g., into "ProcessPoolMetricResolutionScheduler" worker process).
+        state: dict = self.__dict__.copy()
+        del state["_loaded_lazy_batch_data_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._loaded_lazy_batch_data_lock = threading.Lock()
+
     def _instantiate_azure_client(self) -> None:
         self._azure = None
         if azure.BlobServiceClient:  # type: ignore[truthy-function] # False if NotImported
@@ -200,20 +328,27 @@ class PandasExecutionEngine(ExecutionEngine):
                 "PandasExecutionEngine requires batch data that is either a DataFrame or a PandasBatchData object"  # noqa: E501
             )
 
+        self._domain_records_cache.invalidate(batch_id=batch_id)
+
         super().load_batch_data(batch_id=batch_id, batch_data=batch_data)
 
+    @override
+    def release_batch_data(self, batch_id: str) -> None:
+        self._domain_records_cache.invalidate(batch_id=batch_id)
+
+    @property
+    def domain_records_cache(self) -> DomainRecordsCache:
+        """Cache of filtered domain records (exposes hit/miss counters through "info()")."""
+        return self._domain_records_cache
+
     @override
     def get_batch_data_and_markers(  # noqa: C901, PLR0912, PLR0915
         self, batch_spec: BatchSpec | PandasBatchSpecProtocol
     ) -> Tuple[PandasBatchData, BatchMarkers]:  # batch_data
         # We need to build a batch_markers to be used in the dataframe
-        batch_markers = BatchMarkers(
-            {
-                "ge_load_time": datetime.datetime.now(datetime.timezone.utc).strftime(
-                    "%Y%m%dT%H%M%S.%fZ"
-                )
-            }
-        )
+        batch_markers = _build_batch_markers()
+        # Metadata (e.g., ETag, or size and modification time) identifying version of file read.
+        source_metadata: Optional[dict] = None
 
         batch_data: Any
         if isinstance(batch_spec, RuntimeDataBatchSpec):
@@ -235,6 +370,7 @@ class PandasExecutionEngine(ExecutionEngine):
                 )
 
             batch_spec.batch_data = "PandasDataFrame"
+            df = self._apply_partitioning_and_sampling_methods(batch_spec, df)
 
         elif isinstance(batch_spec, S3BatchSpec):
             if self._s3 is None:
@@ -260,9 +396,18 @@ class PandasExecutionEngine(ExecutionEngine):
                 )
             logger.debug(f"Fetching s3 object. Bucket: {s3_url.bucket} Key: {s3_url.key}")
             reader_fn: DataFrameFactoryFn = self._get_reader_fn(reader_method, s3_url.key)
-            buf = BytesIO(s3_object["Body"].read())
-            buf.seek(0)
-            df = reader_fn(buf, **reader_options)
+            source_metadata = _get_object_storage_metadata(
+                path=path, etag=s3_object.get("ETag"), size=s3_object.get("ContentLength")
+            )
+            buf = self._open_object_storage_file(
+                size=s3_object.get("ContentLength"),
+                read_object=s3_object["Body"].read,
+                read_range=partial(
+                    _read_s3_object_range, s3_engine, bucket=s3_url.bucket, key=s3_url.key
+                ),
+                close_object=s3_object["Body"].close,
+            )
+            df = self._read_batch_data(batch_spec, reader_fn, reader_options, source=buf)
 
         elif isinstance(batch_spec, AzureBatchSpec):
             if self._azure is None:
@@ -286,9 +431,17 @@ class PandasExecutionEngine(ExecutionEngine):
                 f"Fetching Azure blob. Container: {azure_url.container} Blob: {azure_url.blob}"
             )
             reader_fn = self._get_reader_fn(reader_method, azure_url.blob)
-            buf = BytesIO(azure_object.readall())
-            buf.seek(0)
-            df = reader_fn(buf, **reader_options)
+            source_metadata = _get_object_storage_metadata(
+                path=path,
+                etag=getattr(getattr(azure_object, "properties", None), "etag", None),
+                size=azure_object.size,
+            )
+            buf = self._open_object_storage_file(
+                size=azure_object.size,
+                read_object=azure_object.readall,
+                read_range=partial(_read_azure_blob_range, blob_client),
+            )
+            df = self._read_batch_data(batch_spec, reader_fn, reader_options, source=buf)
 
         elif isinstance(batch_spec, GCSBatchSpec):
             if self._gcs is None:
@@ -306,6 +459,8 @@ class PandasExecutionEngine(ExecutionEngine):
             try:
                 gcs_bucket = gcs_engine.get_bucket(gcs_url.bucket)
                 gcs_blob = gcs_bucket.blob(gcs_url.blob)
+                # Loads blob metadata (e.g., its size).
+                gcs_blob.reload()
                 logger.debug(f"Fetching GCS blob. Bucket: {gcs_url.bucket} Blob: {gcs_url.blob}")
             except google.GoogleAPIError as error:
                 raise gx_exceptions.ExecutionEngineError(  # noqa: TRY003
@@ -313,9 +468,18 @@ class PandasExecutionEngine(ExecutionEngine):
 Bucket: {error}"""  # noqa: E501
                 )
             reader_fn = self._get_reader_fn(reader_method, gcs_url.blob)
-            buf = BytesIO(gcs_blob.download_as_bytes())
-            buf.seek(0)
-            df = reader_fn(buf, **reader_options)
+            source_metadata = _get_object_storage_metadata(
+                path=batch_spec.path,
+                etag=gcs_blob.etag,
+                size=gcs_blob.size,
+                generation=gcs_blob.generation,
+            )
+            buf = self._open_object_storage_file(
+                size=gcs_blob.size,
+                read_object=gcs_blob.download_as_bytes,
+                read_range=partial(_read_gcs_blob_range, gcs_blob),
+            )
+            df = self._read_batch_data(batch_spec, reader_fn, reader_options, source=buf)
 
         # Experimental datasources will go down this code path
         elif isinstance(batch_spec, PathBatchSpec):
@@ -323,25 +487,14 @@ Bucket: {error}"""  # noqa: E501
             reader_options = batch_spec.reader_options
             path = batch_spec.path
             reader_fn = self._get_reader_fn(reader_method, path)
-            df = reader_fn(path, **reader_options)
+            source_metadata = get_local_file_metadata(path=path, reader_method=reader_method)
+            df = self._read_batch_data(batch_spec, reader_fn, reader_options, source=path)
 
         elif isinstance(batch_spec, PandasBatchSpec):
             reader_method = batch_spec.reader_method
             reader_options = batch_spec.reader_options
             reader_fn = self._get_reader_fn(reader_method)
-            reader_fn_result: pd.DataFrame | list[pd.DataFrame] = execute_pandas_reader_fn(
-                reader_fn, reader_options
-            )
-            if isinstance(reader_fn_result, list):
-                if len(reader_fn_result) > 1:
-                    raise gx_exceptions.ExecutionEngineError(  # noqa: TRY003
-                        "Pandas reader method must return a single DataFrame, "
-                        f'but "{reader_method}" returned {len(reader_fn_result)} DataFrames.'
-                    )
-                else:
-                    df = reader_fn_result[0]
-            else:
-                df = reader_fn_result
+            df = self._read_batch_data(batch_spec, reader_fn, reader_options)
 
         elif isinstance(batch_spec, FabricBatchSpec):
             reader_fn = batch_spec.get_reader_function()
@@ -353,18 +506,105 @@ Bucket: {error}"""  # noqa: E501
 not {batch_spec.__class__.__name__}"""  # noqa: E501
             )
 
-        df = self._apply_partitioning_and_sampling_methods(batch_spec, df)  # type: ignore[arg-type]
+        if source_metadata is not None:
+            batch_markers["source_fingerprint"] = fingerprint_source(source_metadata, batch_spec)
+
+        if isinstance(df, PandasChunkedBatchData):
+            # Chunks are partitioned and sampled as they are read; streamed data is not hashed.
+            return df, batch_markers
+
+        # Data read by Pandas reader is partitioned and sampled as it is read.
         if df.memory_usage().sum() < HASH_THRESHOLD:
             batch_markers["pandas_data_fingerprint"] = hash_pandas_dataframe(df)
+        else:
+            batch_markers["pandas_data_fingerprint"] = fingerprint_pandas_dataframe(df)
 
         typed_batch_data = PandasBatchData(execution_engine=self, dataframe=df)
 
         return typed_batch_data, batch_markers
 
+    @override
+    def get_lazy_batch_data_and_markers(
+        self, batch_spec: BatchSpec | PandasBatchSpecProtocol
+    ) -> Tuple[PandasBatchData, BatchMarkers]:
+        """Like "get_batch_data_and_markers()", but data is read only when metric first needs it.
+
+        Data of Batch, read from file (or cloud storage object), is wrapped in "PandasLazyBatchData"; its batch markers
+        are completed (e.g., by data fingerprint) once data is loaded.  Loaded Batches are released, least recently loaded
+        first, while their total size exceeds "lazy_batch_data_max_bytes", so that many Batches (e.g., of multi-Batch
+        Validator) are not all held in memory at once.  In-memory and chunked Batches are returned as they are.
+
+        Consequently, errors of reading data (e.g., missing file or invalid reader option) are raised when data is first
+        accessed (e.g., by "PandasBatchData.dataframe" or metric computation), rather than when Batch is created.
+        """  # noqa: E501
+        if not isinstance(batch_spec, PathBatchSpec) or (
+            (batch_spec.reader_options or {}).get(PANDAS_READER_CHUNKSIZE_OPTION) is not None
+        ):
+            return self.get_batch_data_and_markers(batch_spec=batch_spec)
+
+        batch_markers: BatchMarkers = _build_batch_markers()
+        if not isinstance(batch_spec, (S3BatchSpec, AzureBatchSpec, GCSBatchSpec)):
+            # Local file is identified without reading it (cloud storage object, once it is read).
+            source_metadata: Optional[dict] = get_local_file_metadata(
+                path=batch_spec.path, reader_method=batch_spec.reader_method
+            )
+            if source_metadata is not None:
+                batch_markers["source_fingerprint"] = fingerprint_source(
+                    source_metadata, batch_spec
+                )
+
+        # Loader is bound method (rather than closure), so that lazy Batch data can be pickled.
+        lazy_batch_data = PandasLazyBatchData(
+            execution_engine=self,
+            loader=partial(
+                self._load_lazy_batch_data, batch_spec=batch_spec, batch_markers=batch_markers
+            ),
+            on_load=self._on_lazy_batch_data_load,
+        )
+        return lazy_batch_data, batch_markers
+
+    def _load_lazy_batch_data(
+        self, batch_spec: PathBatchSpec, batch_markers: BatchMarkers
+    ) -> pd.DataFrame:
+        batch_data: PandasBatchData
+        loaded_batch_markers: BatchMarkers
+        batch_data, loaded_batch_markers = self.get_batch_data_and_markers(batch_spec=batch_spec)
+        batch_markers.update(loaded_batch_markers)
+        return batch_data.dataframe
+
+    def _on_lazy_batch_data_load(self, batch_data: PandasLazyBatchData) -> None:
+        """Releases Batches, loaded least recently, while total size of loaded lazy Batches exceeds its bound."""  # noqa: E501
+        if self._lazy_batch_data_max_bytes is None:
+            return
+
+        size: int = _get_dataframe_memory_usage(batch_data.dataframe)
+        released: List[PandasLazyBatchData] = []
+        with self._loaded_lazy_batch_data_lock:
+            self._loaded_lazy_batch_data.pop(id(batch_data), None)
+            self._loaded_lazy_batch_data[id(batch_data)] = (batch_data, size)
+            total_bytes: int = sum(size for _, size in self._loaded_lazy_batch_data.values())
+            while total_bytes > self._lazy_batch_data_max_bytes and (
+                len(self._loaded_lazy_batch_data) > 1
+            ):
+                _, (least_recent_batch_data, size) = self._loaded_lazy_batch_data.popitem(
+                    last=False
+                )
+                total_bytes -= size
+                released.append(least_recent_batch_data)
+
+        for least_recent_batch_data in released:
+            logger.debug("Releasing lazily read Batch data to bound memory usage.")
+            least_recent_batch_data.release()
+            # Snapshot, since other threads may load Batches into (or reset) BatchManager.
+            for batch_id, loaded_batch_data in list(self.batch_manager.batch_data_cache.items()):
+                if loaded_batch_data is least_recent_batch_data:
+                    self._domain_records_cache.invalidate(batch_id=batch_id)
+
     def _apply_partitioning_and_sampling_methods(
         self,
         batch_spec: BatchSpec | PandasBatchSpecProtocol,
         batch_data: PandasBatchData,
+        apply_sampling: bool = True,
     ):
         # partitioning and sampling not supported for FabricBatchSpec
         if isinstance(batch_spec, BatchSpec):
@@ -377,12 +617,32 @@ not {batch_spec.__class__.__name__}"""  # noqa: E501
                 batch_data = partitioner_fn(batch_data, **partitioner_kwargs)
 
             sampler_method_name: Optional[str] = batch_spec.get("sampling_method")
-            if sampler_method_name:
+            if sampler_method_name and apply_sampling:
                 sampling_fn: Callable = self._data_sampler.get_sampler_method(sampler_method_name)
                 batch_data = sampling_fn(batch_data, batch_spec)
 
         return batch_data
 
+    def iter_batch_data_chunks(self) -> Iterator[pd.DataFrame]:
+        """Makes every chunk of active (chunked) Batch current in turn, so that metrics, resolved while chunk is yielded,
+        are computed over records of this chunk only (Batch, which is not chunked, is yielded as single chunk).
+        """  # noqa: E501
+        batch_id: Optional[str] = self.batch_manager.active_batch_id
+        batch_data: Optional[PandasBatchData] = cast(
+            Optional[PandasBatchData], self.batch_manager.active_batch_data
+        )
+        if not isinstance(batch_data, PandasChunkedBatchData):
+            yield self.dataframe
+            return
+
+        chunk: pd.DataFrame
+        try:
+            for chunk in batch_data.iter_chunks():
+                self._domain_records_cache.invalidate(batch_id=batch_id)
+                yield chunk
+        finally:
+            self._domain_records_cache.invalidate(batch_id=batch_id)
+
     @property
     def dataframe(self) -> pd.DataFrame:
         """Tests whether or not a Batch has been loaded. If the loaded batch does not exist, raises a
@@ -479,14 +739,453 @@ not {batch_spec.__class__.__name__}"""  # noqa: E501
                 f'Unable to find reader_method "{reader_method}" in pandas.'
             )
 
+    @staticmethod
+    def _read_dataframe(
+        reader_fn: DataFrameFactoryFn,
+        reader_options: dict,
+        columns: Optional[List[str]] = None,
+        source: Any = None,
+    ) -> pd.DataFrame | list[pd.DataFrame]:
+        """Reads data from "source" (path or buffer) or, if "source" is None, from location given by "reader_options".
+
+        If "columns" are specified and reader supports column projection (see "PANDAS_READER_COLUMN_PROJECTION_ARGUMENTS"),
+        only these columns are loaded.  Should projected read fail (e.g., because some of requested columns do not exist),
+        data is read in its entirety, so that missing columns are reported by metrics, as usual.
+        """  # noqa: E501
+
+        def _read(options: dict) -> pd.DataFrame | list[pd.DataFrame]:
+            if source is None:
+                return execute_pandas_reader_fn(reader_fn, options)
+
+            return reader_fn(source, **options)
+
+        projected_reader_options: Optional[dict] = _get_column_projection_reader_options(
+            reader_fn=reader_fn, reader_options=reader_options, columns=columns
+        )
+        if projected_reader_options is None:
+            return _read(reader_options)
+
+        try:
+            return _read(projected_reader_options)
+        except (KeyError, ValueError) as e:
+            logger.debug(f"Column projection failed ({e}); reading all columns.")
+            if hasattr(source, "seek"):
+                source.seek(0)
+
+            return _read(reader_options)
+
+    def _open_object_storage_file(
+        self,
+        size: Any,
+        read_object: Callable[[], bytes],
+        read_range: ReadRangeFn,
+        close_object: Optional[Callable[[], None]] = None,
+    ) -> BinaryIO:
+        """Returns cloud storage object as binary file.
+
+        Object, which is not larger than "object_storage_buffer_max_bytes" (or whose size is unknown), is downloaded by
+        "read_object" in its entirety.  Larger object is read by ranged requests as reader consumes it (so that only its
+        needed parts, such as Parquet footer and selected row groups, are fetched), with "close_object" releasing
+        response, from which object would otherwise have been downloaded.
+        """  # noqa: E501
+        if (
+            isinstance(size, int)
+            and self._object_storage_buffer_max_bytes is not None
+            and size > self._object_storage_buffer_max_bytes
+        ):
+            logger.debug(f"Streaming object of {size} bytes by ranged requests.")
+            if close_object is not None:
+                close_object()
+
+            return open_ranged_object(size=size, read_range=read_range)
+
+        buf = BytesIO(read_object())
+        buf.seek(0)
+        return buf
+
+    def _read_batch_data(
+        self,
+        batch_spec: BatchSpec,
+        reader_fn: DataFrameFactoryFn,
+        reader_options: dict,
+        source: Any = None,
+    ) -> pd.DataFrame | PandasChunkedBatchData:
+        """Reads (partitioned and sampled) data, unless "chunksize" reader option requests that it be streamed in chunks."""  # noqa: E501
+        if reader_options.get(PANDAS_READER_CHUNKSIZE_OPTION) is None:
+            return self._read_partitioned_and_sampled_dataframe(
+                batch_spec, reader_fn, reader_options, source=source
+            )
+
+        sampling_method: Optional[str] = batch_spec.get("sampling_method")
+        if sampling_method in CHUNKED_BATCH_UNSUPPORTED_SAMPLING_METHODS:
+            raise gx_exceptions.ExecutionEngineError(  # noqa: TRY003
+                f'Sampling method "{sampling_method}" cannot be applied to batch, read in chunks.'
+            )
+
+        return PandasChunkedBatchData(
+            execution_engine=self,
+            chunk_factory=partial(
+                self._iter_dataframe_chunks,
+                batch_spec=batch_spec,
+                reader_fn=reader_fn,
+                reader_options=reader_options,
+                source=source,
+            ),
+        )
+
+    def _read_partitioned_and_sampled_dataframe(
+        self,
+        batch_spec: BatchSpec,
+        reader_fn: DataFrameFactoryFn,
+        reader_options: dict,
+        source: Any = None,
+    ) -> pd.DataFrame:
+        """Reads data (see "_read_dataframe()"), pushing partitioning and sampling down into reader,
+        where it supports them.
+
+        Sampling, which reader applies itself (e.g., "sample_using_limit" as "nrows" and
+        "sample_using_random" as "skiprows" of "read_csv()"), is not applied again.  Parquet
+        filters, derived from partitioner and sampling methods, let reader skip row groups (and
+        rows), which cannot match, but data read is still partitioned and sampled.  Should reader
+        reject pushed down options, data is read in its entirety and partitioned and sampled
+        afterwards.
+        """
+        pushdown_reader_options: dict
+        is_sampling_pushed_down: bool
+        pushdown_reader_options, is_sampling_pushed_down = self._get_pushdown_reader_options(
+            batch_spec=batch_spec,
+            reader_method_name=_get_reader_fn_name(reader_fn) or "",
+            reader_options=reader_options,
+        )
+
+        columns: Optional[List[str]] = batch_spec.get("columns")
+        df: pd.DataFrame | list[pd.DataFrame]
+        if pushdown_reader_options is reader_options:
+            df = self._read_dataframe(reader_fn, reader_options, columns=columns, source=source)
+        else:
+            try:
+                df = self._read_dataframe(
+                    reader_fn, pushdown_reader_options, columns=columns, source=source
+                )
+            except (KeyError, ValueError, TypeError, NotImplementedError) as e:
+                logger.debug(f"Partitioning and sampling pushdown failed ({e}); reading all rows.")
+                if hasattr(source, "seek"):
+                    source.seek(0)
+
+                is_sampling_pushed_down = False
+                df = self._read_dataframe(reader_fn, reader_options, columns=columns, source=source)
+
+        if isinstance(df, list):
+            if len(df) > 1:
+                raise gx_exceptions.ExecutionEngineError(  # noqa: TRY003
+                    "Pandas reader method must return a single DataFrame, "
+                    f'but "{batch_spec.get("reader_method")}" returned {len(df)} DataFrames.'
+                )
+
+            df = df[0]
+
+        return self._apply_partitioning_and_sampling_methods(
+            batch_spec,
+            df,  # type: ignore[arg-type]
+            apply_sampling=not is_sampling_pushed_down,
+        )
+
+    def _get_pushdown_reader_options(
+        self, batch_spec: BatchSpec, reader_method_name: str, reader_options: dict
+    ) -> Tuple[dict, bool]:
+        """Returns reader options (same "reader_options" object, if nothing is pushed down), and
+        whether reader applies sampling itself."""
+        pushdown_reader_options: dict = reader_options
+        if reader_method_name == "read_parquet" and "filters" not in reader_options:
+            parquet_filters: List[Tuple[str, str, Any]] = self._get_parquet_filters(batch_spec)
+            if parquet_filters:
+                pushdown_reader_options = {**reader_options, "filters": parquet_filters}
+
+        sampling_reader_options: Optional[dict] = self._data_sampler.get_sampling_reader_options(
+            reader_method_name=reader_method_name,
+            reader_options=pushdown_reader_options,
+            batch_spec=batch_spec,
+        )
+        if sampling_reader_options is None:
+            return pushdown_reader_options, False
+
+        return sampling_reader_options, True
+
+    def _get_parquet_filters(self, batch_spec: BatchSpec) -> List[Tuple[str, str, Any]]:
+        """Returns (conjunction of) Parquet filters, implied by partitioner and sampling methods of
+        "batch_spec"."""
+        parquet_filters: List[Tuple[str, str, Any]] = []
+
+        partitioner_method_name: Optional[str] = batch_spec.get("partitioner_method")
+        if partitioner_method_name:
+            parquet_filters.extend(
+                self._data_partitioner.get_parquet_filters(
+                    partitioner_method_name=partitioner_method_name,
+                    partitioner_kwargs=batch_spec.get("partitioner_kwargs") or {},
+                )
+                or []
+            )
+
+        parquet_filters.extend(self._data_sampler.get_parquet_filters(batch_spec) or [])
+        return parquet_filters
+
+    def _iter_dataframe_chunks(
+        self,
+        batch_spec: BatchSpec,
+        reader_fn: DataFrameFactoryFn,
+        reader_options: dict,
+        source: Any = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Reads (partitioned and sampled) chunks of data; every call starts from beginning of
+        "source".
+
+        Parquet files are read by record batches of their row groups (using "pyarrow"); other
+        formats are read by Pandas reader itself (e.g., "read_csv()" or "read_json(lines=True)"),
+        which returns iterator of chunks.
+        """
+        if hasattr(source, "seek"):
+            source.seek(0)
+
+        chunksize: int = int(reader_options[PANDAS_READER_CHUNKSIZE_OPTION])
+        columns: Optional[List[str]] = batch_spec.get("columns")
+
+        chunks: Iterator[pd.DataFrame]
+        if _get_reader_fn_name(reader_fn) == "read_parquet":
+            chunks = _iter_parquet_chunks(
+                source=reader_options.get("path") if source is None else source,
+                reader_options=reader_options,
+                columns=columns,
+                chunksize=chunksize,
+            )
+        else:
+            try:
+                chunks = self._read_dataframe(  # type: ignore[assignment]
+                    reader_fn, reader_options, columns=columns, source=source
+                )
+            except TypeError as e:
+                raise gx_exceptions.ExecutionEngineError(  # noqa: TRY003
+                    f"Pandas reader does not support reading data in chunks: {e}"
+                ) from e
+
+            if isinstance(chunks, (pd.DataFrame, list)):
+                raise gx_exceptions.ExecutionEngineError(  # noqa: TRY003
+                    "Pandas reader does not support reading data in chunks."
+                )
+
+        chunk: pd.DataFrame
+        try:
+            for chunk in chunks:
+                yield self._apply_partitioning_and_sampling_methods(
+                    batch_spec,
+                    chunk,  # type: ignore[arg-type]
+                )
+        finally:
+            close: Optional[Callable[[], None]] = getattr(chunks, "close", None)
+            if close is not None:
+                close()
+
     @override
-    def resolve_metric_bundle(self, metric_fn_bundle) -> Dict[Tuple[str, str, str], Any]:
-        """Resolve a bundle of metrics with the same compute Domain as part of a single trip to the compute engine."""  # noqa: E501
-        return {}  # This is NO-OP for "PandasExecutionEngine" (no bundling for direct execution computational backend).  # noqa: E501
+    def _build_direct_and_bundled_metric_computation_configurations(
+        self,
+        metrics_to_resolve: Iterable[MetricConfiguration],
+        metrics: Optional[Dict[Tuple[str, str, str], MetricValue]] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> Tuple[
+        List[MetricComputationConfiguration],
+        List[MetricComputationConfiguration],
+    ]:
+        """
+        In addition to organization, performed by "ExecutionEngine", moves column aggregates, whose Pandas metric
+        functions declare "vectorized_reduction" (e.g., "column.max"), from direct to bundled configurations.  Bundled
+        configurations carry name of reduction as "metric_fn" and are resolved by "resolve_metric_bundle()" in one pass
+        over every compute Domain.
+
+        Args:
+            metrics_to_resolve: the metrics to evaluate
+            metrics: already-computed metrics currently available to the engine
+            runtime_configuration: runtime configuration information
+
+        Returns:
+            Tuple with two elements: directly-computable and bundled "MetricComputationConfiguration" objects
+        """  # noqa: E501
+        metric_fn_direct_configurations: List[MetricComputationConfiguration]
+        metric_fn_bundle_configurations: List[MetricComputationConfiguration]
+        (
+            metric_fn_direct_configurations,
+            metric_fn_bundle_configurations,
+        ) = super()._build_direct_and_bundled_metric_computation_configurations(
+            metrics_to_resolve=metrics_to_resolve,
+            metrics=metrics,
+            runtime_configuration=runtime_configuration,
+        )
+
+        remaining_direct_configurations: List[MetricComputationConfiguration] = []
+
+        reduction: Optional[str]
+        partition_domain_kwargs: PartitionDomainKwargs
+        metric_computation_configuration: MetricComputationConfiguration
+        for metric_computation_configuration in metric_fn_direct_configurations:
+            reduction = self._get_vectorized_reduction(
+                metric_computation_configuration=metric_computation_configuration
+            )
+            if reduction is None:
+                remaining_direct_configurations.append(metric_computation_configuration)
+                continue
+
+            partition_domain_kwargs = self._partition_domain_kwargs(
+                domain_kwargs=metric_computation_configuration.metric_configuration.metric_domain_kwargs,
+                domain_type=MetricDomainTypes.COLUMN,
+            )
+            metric_fn_bundle_configurations.append(
+                MetricComputationConfiguration(
+                    metric_configuration=metric_computation_configuration.metric_configuration,
+                    metric_fn=reduction,
+                    metric_provider_kwargs=metric_computation_configuration.metric_provider_kwargs,
+                    compute_domain_kwargs=partition_domain_kwargs.compute,
+                    accessor_domain_kwargs=partition_domain_kwargs.accessor,
+                )
+            )
+
+        return (
+            remaining_direct_configurations,
+            metric_fn_bundle_configurations,
+        )
+
+    @staticmethod
+    def _get_vectorized_reduction(
+        metric_computation_configuration: MetricComputationConfiguration,
+    ) -> Optional[str]:
+        """Returns name of Pandas reduction, equivalent to metric function, or None if metric must be computed directly."""  # noqa: E501
+        metric_fn: Callable = metric_computation_configuration.metric_fn
+        reduction: Optional[str] = getattr(metric_fn, "vectorized_reduction", None)
+        if reduction is None:
+            return None
+
+        metric_provider_kwargs: dict = metric_computation_configuration.metric_provider_kwargs
+        filter_column_isnull: Optional[bool] = getattr(metric_fn, "filter_column_isnull", None)
+        if filter_column_isnull is None:
+            filter_column_isnull = getattr(
+                metric_provider_kwargs["cls"], "filter_column_isnull", False
+            )
+
+        if filter_column_isnull:
+            return None
+
+        # Columns, absent from Batch (or needing DBMS-compatible name resolution), keep their original error reporting.  # noqa: E501
+        column_name: Optional[str] = metric_provider_kwargs["metric_domain_kwargs"].get("column")
+        if column_name is None or column_name not in (
+            metric_provider_kwargs["metrics"].get("table.columns") or []
+        ):
+            return None
+
+        return reduction
+
+    @override
+    def resolve_metric_bundle(
+        self,
+        metric_fn_bundle: Iterable[MetricComputationConfiguration],
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """For every compute Domain, computes bundled column aggregates as vectorized reductions over groups of columns.
+
+        Columns sharing compute Domain, reduction, and NumPy numeric dtype are reduced by a single DataFrame call (e.g.,
+        "df[["a", "b"]].max()"); columns of other dtypes (e.g., "object" holding "Decimal" values) are computed by their
+        registered metric functions, so that results are identical to direct computation.
+
+        Args:
+            metric_fn_bundle: "MetricComputationConfiguration" objects, whose "metric_fn" is name of Pandas reduction
+
+        Returns:
+            A dictionary of "MetricConfiguration" IDs and their corresponding now-resolved values.
+        """  # noqa: E501
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+        bundled_metric_configurations_by_domain_id: Dict[
+            Union[str, Tuple[()]], List[MetricComputationConfiguration]
+        ] = {}
+        domain_kwargs_by_domain_id: Dict[Union[str, Tuple[()]], IDDict] = {}
+
+        domain_kwargs: IDDict
+        domain_id: Union[str, Tuple[()]]
+        bundled_metric_configuration: MetricComputationConfiguration
+        for bundled_metric_configuration in metric_fn_bundle:
+            domain_kwargs = IDDict(bundled_metric_configuration.compute_domain_kwargs or {})
+            domain_id = domain_kwargs.to_id()
+            bundled_metric_configurations_by_domain_id.setdefault(domain_id, []).append(
+                bundled_metric_configuration
+            )
+            domain_kwargs_by_domain_id[domain_id] = domain_kwargs
+
+        data: pd.DataFrame
+        bundled_metric_configurations: List[MetricComputationConfiguration]
+        for (
+            domain_id,
+            bundled_metric_configurations,
+        ) in bundled_metric_configurations_by_domain_id.items():
+            data = self.get_domain_records(domain_kwargs=domain_kwargs_by_domain_id[domain_id])
+            resolved_metrics.update(
+                self._resolve_vectorized_reductions(
+                    data=data, bundled_metric_configurations=bundled_metric_configurations
+                )
+            )
+
+        return resolved_metrics
+
+    def _resolve_vectorized_reductions(
+        self,
+        data: pd.DataFrame,
+        bundled_metric_configurations: List[MetricComputationConfiguration],
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+        column_groups: Dict[Tuple[str, np.dtype], List[MetricComputationConfiguration]] = {}
+
+        column_name: str
+        dtype: Any
+        metric_configuration: MetricConfiguration
+        bundled_metric_configuration: MetricComputationConfiguration
+        for bundled_metric_configuration in bundled_metric_configurations:
+            metric_configuration = bundled_metric_configuration.metric_configuration
+            column_name = (bundled_metric_configuration.accessor_domain_kwargs or {})["column"]
+            dtype = data[column_name].dtype if data.columns.is_unique else None
+            if (
+                isinstance(dtype, np.dtype)
+                and dtype.kind in VECTORIZED_REDUCTION_DTYPE_KINDS
+                and isinstance(bundled_metric_configuration.metric_fn, str)
+            ):
+                column_groups.setdefault(
+                    (bundled_metric_configuration.metric_fn, dtype), []
+                ).append(bundled_metric_configuration)
+            else:
+                _, metric_fn = get_metric_provider(
+                    metric_name=metric_configuration.metric_name, execution_engine=self
+                )
+                resolved_metrics[metric_configuration.id] = metric_fn(
+                    **bundled_metric_configuration.metric_provider_kwargs
+                )
+
+        reduction: str
+        column_names: List[str]
+        reduced: pd.Series
+        grouped_metric_configurations: List[MetricComputationConfiguration]
+        for (reduction, _), grouped_metric_configurations in column_groups.items():
+            column_names = list(
+                dict.fromkeys(
+                    (configuration.accessor_domain_kwargs or {})["column"]
+                    for configuration in grouped_metric_configurations
+                )
+            )
+            reduced = getattr(data[column_names], reduction)()
+            for bundled_metric_configuration in grouped_metric_configurations:
+                column_name = (bundled_metric_configuration.accessor_domain_kwargs or {})["column"]
+                resolved_metrics[bundled_metric_configuration.metric_configuration.id] = reduced[
+                    column_name
+                ]
+
+        return resolved_metrics
 
     @public_api
     @override
-    def get_domain_records(  # noqa: C901, PLR0912
+    def get_domain_records(
         self,
         domain_kwargs: dict,
     ) -> pd.DataFrame:
@@ -504,25 +1203,52 @@ not {batch_spec.__class__.__name__}"""  # noqa: E501
                 "PandasExecutionEngine does not currently support multiple named tables."
             )
 
-        batch_id = domain_kwargs.get("batch_id")
+        batch_id: Optional[str] = domain_kwargs.get("batch_id")
+        data: pd.DataFrame = self._get_batch_dataframe(batch_id=batch_id)
+
+        cache_key: Optional[DomainRecordsCacheKey] = None
+        if self._caching and self._domain_records_cache.enabled:
+            cache_key = build_domain_records_cache_key(
+                domain_kwargs=domain_kwargs,
+                batch_id=batch_id or self.batch_manager.active_batch_data_id,
+            )
+
+        if cache_key is None:
+            return self._filter_domain_records(data=data, domain_kwargs=domain_kwargs)
+
+        cached_data: Optional[pd.DataFrame] = self._domain_records_cache.get(cache_key)
+        if cached_data is None:
+            cached_data = self._filter_domain_records(data=data, domain_kwargs=domain_kwargs)
+            self._domain_records_cache.put(cache_key, cached_data)
+
+        # Cached records are shared by all metrics of Domain; every caller obtains its own copy, so
+        # that modifying it does not change records, which other metrics are computed from.
+        return cached_data.copy()
+
+    def _get_batch_dataframe(self, batch_id: Optional[str]) -> pd.DataFrame:
         if batch_id is None:
             # We allow no batch id specified if there is only one batch
             if self.batch_manager.active_batch_data_id is not None:
-                data = cast(PandasBatchData, self.batch_manager.active_batch_data).dataframe
-            else:
-                raise gx_exceptions.ValidationError(  # noqa: TRY003
-                    "No batch is specified, but could not identify a loaded batch."
-                )
-        else:  # noqa: PLR5501
-            if batch_id in self.batch_manager.batch_data_cache:
-                data = cast(
-                    PandasBatchData, self.batch_manager.batch_data_cache[batch_id]
-                ).dataframe
-            else:
-                raise gx_exceptions.ValidationError(  # noqa: TRY003
-                    f"Unable to find batch with batch_id {batch_id}"
-                )
+                return cast(PandasBatchData, self.batch_manager.active_batch_data).dataframe
+
+            raise gx_exceptions.ValidationError(  # noqa: TRY003
+                "No batch is specified, but could not identify a loaded batch."
+            )
+
+        if batch_id in self.batch_manager.batch_data_cache:
+            return cast(PandasBatchData, self.batch_manager.batch_data_cache[batch_id]).dataframe
 
+        raise gx_exceptions.ValidationError(  # noqa: TRY003
+            f"Unable to find batch with batch_id {batch_id}"
+        )
+
+    def _filter_domain_records(
+        self,
+        data: pd.DataFrame,
+        domain_kwargs: dict,
+    ) -> pd.DataFrame:
+        """Applies "row_condition" and "ignore_row_if" directives of Domain kwargs to records of
+        Batch."""
         # Filtering by row condition.
         row_condition = domain_kwargs.get("row_condition", None)
         if row_condition:
@@ -546,53 +1272,38 @@ not {batch_spec.__class__.__name__}"""  # noqa: E501
             and "column_B" in domain_kwargs
             and "ignore_row_if" in domain_kwargs
         ):
-            # noinspection PyPep8Naming
-            column_A_name = domain_kwargs["column_A"]
-            # noinspection PyPep8Naming
-            column_B_name = domain_kwargs["column_B"]
-
-            ignore_row_if = domain_kwargs["ignore_row_if"]
-            if ignore_row_if == "both_values_are_missing":
-                data = data.dropna(
-                    axis=0,
-                    how="all",
-                    subset=[column_A_name, column_B_name],
-                )
-            elif ignore_row_if == "either_value_is_missing":
-                data = data.dropna(
-                    axis=0,
-                    how="any",
-                    subset=[column_A_name, column_B_name],
-                )
-            else:  # noqa: PLR5501
-                if ignore_row_if != "neither":
-                    raise ValueError(f'Unrecognized value of ignore_row_if ("{ignore_row_if}").')  # noqa: TRY003
-
-            return data
+            return self._drop_ignored_rows(
+                data=data,
+                subset=[domain_kwargs["column_A"], domain_kwargs["column_B"]],
+                ignore_row_if=domain_kwargs["ignore_row_if"],
+                dropna_how_by_ignore_row_if=COLUMN_PAIR_IGNORE_ROW_IF_DROPNA_HOW,
+            )
 
         if "column_list" in domain_kwargs and "ignore_row_if" in domain_kwargs:
-            column_list = domain_kwargs["column_list"]
-
-            ignore_row_if = domain_kwargs["ignore_row_if"]
-            if ignore_row_if == "all_values_are_missing":
-                data = data.dropna(
-                    axis=0,
-                    how="all",
-                    subset=column_list,
-                )
-            elif ignore_row_if == "any_value_is_missing":
-                data = data.dropna(
-                    axis=0,
-                    how="any",
-                    subset=column_list,
-                )
-            else:  # noqa: PLR5501
-                if ignore_row_if != "never":
-                    raise ValueError(f'Unrecognized value of ignore_row_if ("{ignore_row_if}").')  # noqa: TRY003
+            return self._drop_ignored_rows(
+                data=data,
+                subset=domain_kwargs["column_list"],
+                ignore_row_if=domain_kwargs["ignore_row_if"],
+                dropna_how_by_ignore_row_if=MULTICOLUMN_IGNORE_ROW_IF_DROPNA_HOW,
+            )
+
+        return data
+
+    @staticmethod
+    def _drop_ignored_rows(
+        data: pd.DataFrame,
+        subset: List[str],
+        ignore_row_if: str,
+        dropna_how_by_ignore_row_if: Dict[str, Optional[str]],
+    ) -> pd.DataFrame:
+        if ignore_row_if not in dropna_how_by_ignore_row_if:
+            raise ValueError(f'Unrecognized value of ignore_row_if ("{ignore_row_if}").')  # noqa: TRY003
 
+        how: Optional[str] = dropna_how_by_ignore_row_if[ignore_row_if]
+        if how is None:
             return data
 
-        return data
+        return data.dropna(axis=0, how=how, subset=subset)
 
     @public_api
     @override
@@ -638,6 +1349,98 @@ not {batch_spec.__class__.__name__}"""  # noqa: E501
         return data, partition_domain_kwargs.compute, partition_domain_kwargs.accessor
 
 
+def _build_batch_markers() -> BatchMarkers:
+    return BatchMarkers(
+        {"ge_load_time": datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M%S.%fZ")}
+    )
+
+
+def _get_object_storage_metadata(
+    path: str, etag: Any, size: Any, generation: Any = None
+) -> Optional[dict]:
+    """Returns metadata identifying version of cloud storage object (None if ETag is unknown)."""
+    if not isinstance(etag, str):
+        return None
+
+    metadata: Dict[str, Any] = {"path": path, "etag": etag}
+    if isinstance(size, int):
+        metadata["size"] = size
+
+    if isinstance(generation, (int, str)):
+        metadata["generation"] = generation
+
+    return metadata
+
+
+def _get_dataframe_memory_usage(df: pd.DataFrame) -> int:
+    return int(df.memory_usage(index=True, deep=False).sum())
+
+
+def _read_s3_object_range(s3_engine, start: int, end: int, bucket: str, key: str) -> bytes:
+    return s3_engine.get_object(Bucket=bucket, Key=key, Range=f"bytes={start}-{end - 1}")[
+        "Body"
+    ].read()
+
+
+def _read_azure_blob_range(blob_client, start: int, end: int) -> bytes:
+    return blob_client.download_blob(offset=start, length=end - start).readall()
+
+
+def _read_gcs_blob_range(gcs_blob, start: int, end: int) -> bytes:
+    return gcs_blob.download_as_bytes(start=start, end=end - 1)
+
+
+def _get_reader_fn_name(reader_fn: DataFrameFactoryFn) -> Optional[str]:
+    return getattr(
+        reader_fn.func if isinstance(reader_fn, partial) else reader_fn, "__name__", None
+    )
+
+
+def _iter_parquet_chunks(
+    source: Any, reader_options: dict, columns: Optional[List[str]], chunksize: int
+) -> Iterator[pd.DataFrame]:
+    """Reads Parquet file by record batches (of at most "chunksize" rows), indexed by their
+    positions in the file."""
+    parquet_file = pyarrow.parquet.ParquetFile(source)
+    projected_columns: Optional[List[str]] = reader_options.get("columns")
+    if projected_columns is None and columns:
+        projected_columns = [
+            column for column in parquet_file.schema_arrow.names if column in set(columns)
+        ] or None
+
+    start: int = 0
+    for record_batch in parquet_file.iter_batches(batch_size=chunksize, columns=projected_columns):
+        chunk: pd.DataFrame = record_batch.to_pandas()
+        chunk.index = pd.RangeIndex(start=start, stop=start + len(chunk))
+        start += len(chunk)
+        yield chunk
+
+
+def _get_column_projection_reader_options(
+    reader_fn: DataFrameFactoryFn, reader_options: dict, columns: Optional[List[str]]
+) -> Optional[dict]:
+    """Returns copy of "reader_options", restricting reader to "columns" (None if projection is not applicable)."""  # noqa: E501
+    if not columns:
+        return None
+
+    projection_argument: Optional[str] = PANDAS_READER_COLUMN_PROJECTION_ARGUMENTS.get(
+        _get_reader_fn_name(reader_fn) or ""
+    )
+    if projection_argument is None or projection_argument in reader_options:
+        return None
+
+    if projection_argument == "usecols":
+        # Without header row, columns are labeled by position (or by "names"), not by name.
+        if reader_options.get("header", "infer") is None and "names" not in reader_options:
+            return None
+
+        # Callable (unlike list of names) does not fail on columns, which do not exist in the file.
+        column_names: frozenset = frozenset(columns)
+        return {**reader_options, projection_argument: lambda name: name in column_names}
+
+    return {**reader_options, projection_argument: list(columns)}
+
+
 def hash_pandas_dataframe(df):
     try:
         obj = pd.util.hash_pandas_object(df, index=True).values
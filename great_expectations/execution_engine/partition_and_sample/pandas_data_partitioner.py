@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import datetime
 import hashlib
-from typing import TYPE_CHECKING, List, Union
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Optional, Tuple, Union
 
 import great_expectations.exceptions as gx_exceptions
 from great_expectations.execution_engine.partition_and_sample.data_partitioner import (
     DataPartitioner,
     DatePart,
+    PartitionerMethod,
 )
 
 if TYPE_CHECKING:
@@ -20,6 +22,98 @@ class PandasDataPartitioner(DataPartitioner):
     date_part e.g. SparkDataPartitioner.date_part.MONTH
     """
 
+    # Partitioner methods, which select contiguous range of datetime values (so that they can be
+    # expressed as Parquet filters), and date parts, which determine that range.
+    _DATE_RANGE_PARTITIONER_METHODS: ClassVar[Dict[str, List[DatePart]]] = {
+        PartitionerMethod.PARTITION_ON_YEAR.value: [DatePart.YEAR],
+        PartitionerMethod.PARTITION_ON_YEAR_AND_MONTH.value: [DatePart.YEAR, DatePart.MONTH],
+        PartitionerMethod.PARTITION_ON_YEAR_AND_MONTH_AND_DAY.value: [
+            DatePart.YEAR,
+            DatePart.MONTH,
+            DatePart.DAY,
+        ],
+    }
+
+    def get_parquet_filters(
+        self, partitioner_method_name: str, partitioner_kwargs: dict
+    ) -> Optional[List[Tuple[str, str, Any]]]:
+        """Get Parquet filters, which skip row groups and rows that partitioner method would not keep.
+
+        Filters let Parquet reader prune row groups by their statistics (and rows by predicate) while reading; data
+        read is still partitioned, as usual, so that filters only need to keep (at least) all matching rows.
+
+        Args:
+            partitioner_method_name: name of partitioner method, with or without preceding `_`.
+            partitioner_kwargs: keyword arguments of partitioner method.
+
+        Returns:
+            List of (column, operator, value) filters, or None if partitioner method cannot be expressed as filters.
+        """  # noqa: E501
+        partitioner_method_name = self._get_partitioner_method_name(partitioner_method_name)
+        batch_identifiers: dict = partitioner_kwargs.get("batch_identifiers") or {}
+
+        if partitioner_method_name == PartitionerMethod.PARTITION_ON_COLUMN_VALUE.value:
+            column_name: Optional[str] = partitioner_kwargs.get("column_name")
+            if column_name is None or column_name not in batch_identifiers:
+                return None
+
+            return [(column_name, "==", batch_identifiers[column_name])]
+
+        if partitioner_method_name == PartitionerMethod.PARTITION_ON_MULTI_COLUMN_VALUES.value:
+            column_names: List[str] = partitioner_kwargs.get("column_names") or []
+            if not column_names or not all(batch_identifiers.get(name) for name in column_names):
+                return None
+
+            return [(name, "==", batch_identifiers[name]) for name in column_names]
+
+        date_parts: Optional[List[DatePart]] = self._DATE_RANGE_PARTITIONER_METHODS.get(
+            partitioner_method_name
+        )
+        if date_parts is not None:
+            return self._get_date_range_parquet_filters(
+                column_name=partitioner_kwargs.get("column_name"),
+                batch_identifiers=batch_identifiers,
+                date_parts=date_parts,
+            )
+
+        return None
+
+    def _get_date_range_parquet_filters(
+        self,
+        column_name: Optional[str],
+        batch_identifiers: dict,
+        date_parts: List[DatePart],
+    ) -> Optional[List[Tuple[str, str, Any]]]:
+        """Get [start, end) filters on column_name, covering year, month, or day partitioned on."""
+        if column_name is None or column_name not in batch_identifiers:
+            return None
+
+        try:
+            date_parts_dict: dict = self._convert_datetime_batch_identifiers_to_date_parts_dict(
+                batch_identifiers[column_name], date_parts
+            )
+            if set(date_parts_dict.keys()) != {date_part.value for date_part in date_parts}:
+                return None
+
+            start = datetime.datetime(
+                year=int(date_parts_dict[DatePart.YEAR.value]),
+                month=int(date_parts_dict.get(DatePart.MONTH.value, 1)),
+                day=int(date_parts_dict.get(DatePart.DAY.value, 1)),
+                # Bounds are as time zone aware as batch identifier (and so, presumably, column) is.
+                tzinfo=getattr(batch_identifiers[column_name], "tzinfo", None),
+            )
+            end: datetime.datetime
+            if DatePart.DAY in date_parts:
+                end = start + datetime.timedelta(days=1)
+            elif DatePart.MONTH in date_parts:
+                end = (start.replace(day=28) + datetime.timedelta(days=4)).replace(day=1)
+            else:
+                end = start.replace(year=start.year + 1)
+        except (gx_exceptions.InvalidConfigError, TypeError, ValueError, OverflowError):
+            return None
+
+        return [(column_name, ">=", start), (column_name, "<", end)]
+
     def partition_on_year(
         self,
         df: pd.DataFrame,
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import hashlib
 import random
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 import great_expectations.exceptions as gx_exceptions
 from great_expectations.execution_engine.partition_and_sample.data_sampler import (
@@ -14,10 +14,150 @@ if TYPE_CHECKING:
 
     from great_expectations.core.id_dict import BatchSpec
 
+# Pandas readers, which can stop reading after given number of rows, and their argument doing so.
+PANDAS_READER_ROW_LIMIT_ARGUMENTS: Dict[str, str] = {
+    "read_csv": "nrows",
+    "read_table": "nrows",
+    "read_fwf": "nrows",
+    "read_excel": "nrows",
+}
+
+# Pandas readers, which can skip rows (by line numbers) before parsing them ("skiprows" callable).
+PANDAS_READER_ROW_SKIPPING_METHODS = ("read_csv", "read_table", "read_fwf")
+
 
 class PandasDataSampler(DataSampler):
     """Methods for sampling a pandas dataframe."""
 
+    def get_sampling_reader_options(
+        self,
+        reader_method_name: str,
+        reader_options: dict,
+        batch_spec: BatchSpec,
+    ) -> Optional[dict]:
+        """Get reader options, with which Pandas reader samples rows as it reads them, instead of
+        loading all of them.
+
+        "sample_using_limit" is pushed down as row limit (e.g., "nrows" of "read_csv()"), unless
+        batch is partitioned (rows are limited after partitioning).  "sample_using_random" is pushed
+        down as "skiprows" callable, which skips every row (except header) with probability 1 - p
+        before it is parsed.  Other sampling methods depend on column values, so they are applied to
+        data read.
+
+        Args:
+            reader_method_name: name of Pandas reader method e.g. "read_csv".
+            reader_options: options passed to Pandas reader method.
+            batch_spec: can contain sampling_method, sampling_kwargs, and partitioner_method.
+
+        Returns:
+            Copy of reader_options, with which reader applies sampling (so that it must not be
+                applied again), or None if sampling cannot be pushed down into reader.
+        """
+        sampling_method_name: Optional[str] = batch_spec.get("sampling_method")
+        if not sampling_method_name:
+            return None
+
+        sampling_method_name = self._get_sampler_method_name(sampling_method_name)
+        if sampling_method_name == "sample_using_limit":
+            return self._get_row_limit_reader_options(
+                reader_method_name=reader_method_name,
+                reader_options=reader_options,
+                batch_spec=batch_spec,
+            )
+
+        if sampling_method_name == "sample_using_random":
+            return self._get_row_skipping_reader_options(
+                reader_method_name=reader_method_name,
+                reader_options=reader_options,
+                batch_spec=batch_spec,
+            )
+
+        return None
+
+    def _get_row_limit_reader_options(
+        self,
+        reader_method_name: str,
+        reader_options: dict,
+        batch_spec: BatchSpec,
+    ) -> Optional[dict]:
+        partitioner_method_name: Optional[str] = batch_spec.get("partitioner_method")
+        if partitioner_method_name and partitioner_method_name.lstrip("_") != (
+            "partition_on_whole_table"
+        ):
+            return None
+
+        row_limit_argument: Optional[str] = PANDAS_READER_ROW_LIMIT_ARGUMENTS.get(
+            reader_method_name
+        )
+        n: Optional[int] = self.get_sampling_kwargs_value_or_default(batch_spec, "n")
+        if (
+            n is None
+            or row_limit_argument is None
+            or row_limit_argument in reader_options
+            or "skipfooter" in reader_options
+        ):
+            return None
+
+        return {**reader_options, row_limit_argument: n}
+
+    def _get_row_skipping_reader_options(
+        self,
+        reader_method_name: str,
+        reader_options: dict,
+        batch_spec: BatchSpec,
+    ) -> Optional[dict]:
+        if (
+            reader_method_name not in PANDAS_READER_ROW_SKIPPING_METHODS
+            or "skiprows" in reader_options
+            or "skipfooter" in reader_options
+            or "comment" in reader_options
+        ):
+            return None
+
+        header: Any = reader_options.get("header", "infer")
+        header_row: int
+        if header == 0 or (header == "infer" and "names" not in reader_options):
+            header_row = 0
+        elif header is None or header == "infer":
+            header_row = -1
+        else:
+            return None
+
+        p: float = self.get_sampling_kwargs_value_or_default(
+            batch_spec=batch_spec, sampling_kwargs_key="p", default_value=0.1
+        )
+        return {
+            **reader_options,
+            "skiprows": lambda row: row > header_row and random.random() >= p,
+        }
+
+    def get_parquet_filters(self, batch_spec: BatchSpec) -> Optional[List[Tuple[str, str, Any]]]:
+        """Get Parquet filters, which skip row groups and rows that sampling would not keep.
+
+        Only "sample_using_a_list" can be expressed as filter (data read is still sampled, as usual).
+
+        Args:
+            batch_spec: can contain sampling_method and sampling_kwargs.
+
+        Returns:
+            List of (column, operator, value) filters, or None if sampling cannot be expressed as filters.
+        """  # noqa: E501
+        sampling_method_name: Optional[str] = batch_spec.get("sampling_method")
+        if (
+            not sampling_method_name
+            or self._get_sampler_method_name(sampling_method_name) != "sample_using_a_list"
+        ):
+            return None
+
+        column_name: Optional[str] = self.get_sampling_kwargs_value_or_default(
+            batch_spec, "column_name"
+        )
+        value_list: Any = self.get_sampling_kwargs_value_or_default(batch_spec, "value_list")
+        if column_name is None or not isinstance(value_list, (list, tuple, set)) or not value_list:
+            return None
+
+        return [(column_name, "in", list(value_list))]
+
     def sample_using_limit(self, df: pd.DataFrame, batch_spec: BatchSpec) -> pd.DataFrame:
         """Sample the first n rows of data.
 
@@ -0,0 +1,123 @@
+"""Bounded registry of persisted Spark Batch DataFrames, which unpersists Batches no longer in use.
+
+"SparkDFExecutionEngine" persists DataFrame of every loaded Batch (so that metrics of many Expectations do not recompute
+it); without bound, long-lived engines, which validate many Batches, accumulate cached DataFrames until executors spill
+to disk or run out of memory.  Unpersisted DataFrames remain usable: Spark recomputes them from their source on demand.
+"""  # noqa: E501
+
+from __future__ import annotations
+
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from great_expectations.compatibility.pyspark import pyspark
+
+logger = logging.getLogger(__name__)
+
+
+class PersistedBatchCache:
+    """Least-recently-used registry of persisted Batch DataFrames, bounded by number of Batches.
+
+    Args:
+        max_entries: upper bound on number of persisted Batches (None means unbounded); most recently persisted Batch
+          is never evicted
+        storage_level: name of "pyspark.StorageLevel" (e.g., "MEMORY_AND_DISK"), at which DataFrames are persisted
+          (Spark default, if None)
+    """  # noqa: E501
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        storage_level: Optional[str] = None,
+    ) -> None:
+        if storage_level is not None and not isinstance(
+            getattr(pyspark.StorageLevel, storage_level, None), pyspark.StorageLevel
+        ):
+            raise ValueError(  # noqa: TRY003
+                f'Unknown Spark storage level "{storage_level}" for persisting Batch DataFrames.'
+            )
+
+        self._max_entries = max_entries
+        self._storage_level = storage_level
+
+        self._entries: OrderedDict[str, pyspark.sql.DataFrame] = OrderedDict()
+
+        self.evictions = 0
+
+    @property
+    def storage_level(self) -> Optional[str]:
+        return self._storage_level
+
+    @property
+    def persisted_batch_ids(self) -> List[str]:
+        """IDs of persisted Batches (from least to most recently used)."""
+        return list(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, batch_id: str) -> bool:
+        return batch_id in self._entries
+
+    def persist(self, batch_id: str, dataframe: pyspark.sql.DataFrame) -> None:
+        """Persists DataFrame of Batch (replacing previously persisted DataFrame of same Batch) and evicts least recently used Batches beyond bound."""  # noqa: E501
+        persisted_dataframe: Optional[pyspark.sql.DataFrame] = self._entries.get(batch_id)
+        if persisted_dataframe is not dataframe:
+            self.unpersist(batch_id=batch_id)
+            if self._storage_level is None:
+                dataframe.persist()
+            else:
+                dataframe.persist(getattr(pyspark.StorageLevel, self._storage_level))
+
+        self._entries[batch_id] = dataframe
+        self._entries.move_to_end(batch_id)
+
+        while self._max_entries is not None and len(self._entries) > max(self._max_entries, 1):
+            evicted_batch_id: str = next(iter(self._entries))
+            logger.debug(f"Unpersisting least recently used Batch {evicted_batch_id}.")
+            self.unpersist(batch_id=evicted_batch_id)
+            self.evictions += 1
+
+    def touch(self, batch_id: Optional[str]) -> None:
+        """Marks Batch as most recently used (if it is persisted)."""
+        if batch_id in self._entries:
+            self._entries.move_to_end(batch_id)  # type: ignore[arg-type]
+
+    def unpersist(self, batch_id: Optional[str] = None) -> None:
+        """Unpersists DataFrame of given Batch (or of all Batches, if "batch_id" is None)."""
+        batch_ids: List[str] = list(self._entries) if batch_id is None else [batch_id]
+        for batch_id_to_unpersist in batch_ids:
+            dataframe: Optional[pyspark.sql.DataFrame] = self._entries.pop(
+                batch_id_to_unpersist, None
+            )
+            if dataframe is not None:
+                dataframe.unpersist()
+
+    def info(self, spark: Optional[pyspark.sql.SparkSession] = None) -> Dict[str, Any]:
+        """Returns usage statistics (persisted Batches, evictions, and bytes cached by Spark, if "spark" is given)."""  # noqa: E501
+        return {
+            "entries": len(self._entries),
+            "max_entries": self._max_entries,
+            "storage_level": self._storage_level,
+            "evictions": self.evictions,
+            "persisted_batch_ids": self.persisted_batch_ids,
+            "cached_bytes": None if spark is None else get_spark_cached_bytes(spark=spark),
+        }
+
+
+def get_spark_cached_bytes(spark: pyspark.sql.SparkSession) -> Optional[int]:
+    """Returns number of bytes (in memory and on disk), which cached data of Spark application occupy.
+
+    Spark does not attribute storage to DataFrames (only to cached plans of its application); hence, total is returned.
+    None is returned, if storage information is unavailable (e.g., when Spark Connect session has no JVM context).
+    """  # noqa: E501
+    try:
+        storage_infos = spark.sparkContext._jsc.sc().getRDDStorageInfo()
+        return sum(
+            int(storage_info.memSize()) + int(storage_info.diskSize())
+            for storage_info in storage_infos
+        )
+    except Exception as e:
+        logger.debug(f"Storage information of Spark application is unavailable ({e}).")
+        return None
@@ -0,0 +1,226 @@
+"""Persistent (on-disk) cache of resolved metrics, which survives across runs (and processes) of validation.
+
+Metric values are stored in local SQLite database, keyed by fingerprint of Batch (see "data_fingerprint"), for which
+metric was computed, and by "MetricConfiguration.id"; hence, cached values are reused only as long as Batch data (or its
+source and BatchSpec) is unchanged.  Total size of stored values is bounded: least recently used entries are evicted.
+"""  # noqa: E501
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Iterable, Iterator, Tuple, Union
+
+if TYPE_CHECKING:
+    from typing_extensions import TypeAlias
+
+logger = logging.getLogger(__name__)
+
+_MetricKey: TypeAlias = Union[Tuple[str, Hashable, Hashable], Tuple[str, str, str]]
+
+DEFAULT_PERSISTENT_METRIC_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# Location of cache database, relative to project root directory (not committed with project).
+PERSISTENT_METRIC_CACHE_FILE_PATH = os.path.join(  # noqa: PTH118
+    "uncommitted", "metric_cache.sqlite"
+)
+
+# Maximum number of SQL parameters per statement (SQLite limit is 999 in older versions).
+_MAX_SQL_PARAMETERS = 500
+
+
+class PersistentMetricCache:
+    """Size-bounded, least-recently-used cache of metric values in local SQLite database.
+
+    Args:
+        path: path of SQLite database file (created, along with its directory, if absent)
+        max_bytes: maximum total size of pickled metric values; least recently used entries are evicted beyond it
+    """  # noqa: E501
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = DEFAULT_PERSISTENT_METRIC_CACHE_MAX_BYTES,
+    ) -> None:
+        self._path = path
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        directory: str = os.path.dirname(os.path.abspath(path))  # noqa: PTH100, PTH120
+        os.makedirs(directory, exist_ok=True)  # noqa: PTH103
+        with self._connect() as connection:
+            connection.execute(
+                """CREATE TABLE IF NOT EXISTS metric_cache (
+                    key TEXT PRIMARY KEY,
+                    fingerprint TEXT NOT NULL,
+                    metric_id TEXT NOT NULL,
+                    value BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    last_access REAL NOT NULL
+                )"""
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS metric_cache_last_access ON metric_cache (last_access)"
+            )
+
+    @classmethod
+    def for_project(
+        cls,
+        project_root_dir: str,
+        max_bytes: int = DEFAULT_PERSISTENT_METRIC_CACHE_MAX_BYTES,
+    ) -> PersistentMetricCache:
+        """Returns cache, stored under "uncommitted" directory of project, rooted at "project_root_dir"."""  # noqa: E501
+        return cls(
+            path=os.path.join(project_root_dir, PERSISTENT_METRIC_CACHE_FILE_PATH),  # noqa: PTH118
+            max_bytes=max_bytes,
+        )
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    def get_many(self, fingerprint: str, metric_ids: Iterable[_MetricKey]) -> Dict[_MetricKey, Any]:
+        """Returns cached values of metrics with given IDs, computed for Batch with given fingerprint (misses are omitted)."""  # noqa: E501
+        keys: Dict[str, _MetricKey] = {
+            _build_key(fingerprint=fingerprint, metric_id=metric_id): metric_id
+            for metric_id in metric_ids
+        }
+        if not keys:
+            return {}
+
+        rows: list = []
+        key_list: list = list(keys)
+        try:
+            with self._lock, self._connect() as connection:
+                for start in range(0, len(key_list), _MAX_SQL_PARAMETERS):
+                    batch_keys: list = key_list[start : start + _MAX_SQL_PARAMETERS]
+                    placeholders: str = ", ".join("?" * len(batch_keys))
+                    rows.extend(
+                        connection.execute(
+                            f"SELECT key, value FROM metric_cache WHERE key IN ({placeholders})",
+                            batch_keys,
+                        ).fetchall()
+                    )
+
+                if rows:
+                    connection.executemany(
+                        "UPDATE metric_cache SET last_access = ? WHERE key = ?",
+                        [(time.time(), key) for key, _ in rows],
+                    )
+        except sqlite3.Error as e:
+            # Cache is an optimization: if it is unavailable, metrics are simply computed.
+            logger.warning(f"Persistent metric cache at {self._path} could not be read ({e}).")
+            return {}
+
+        values: Dict[_MetricKey, Any] = {}
+        key: str
+        value: bytes
+        for key, value in rows:
+            try:
+                values[keys[key]] = pickle.loads(value)
+            except Exception as e:
+                logger.debug(f"Cached value of metric {keys[key]} could not be loaded ({e}).")
+
+        return values
+
+    def set_many(self, fingerprint: str, values: Dict[_MetricKey, Any]) -> None:
+        """Stores metric values, computed for Batch with given fingerprint, and evicts least recently used entries.
+
+        Values, which cannot be pickled, or which alone exceed size limit of cache, are not stored.
+        """  # noqa: E501
+        records: list = []
+        now: float = time.time()
+        metric_id: _MetricKey
+        value: Any
+        for metric_id, value in values.items():
+            try:
+                pickled: bytes = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+            except Exception as e:
+                logger.debug(f"Value of metric {metric_id} could not be pickled ({e}).")
+                continue
+
+            if len(pickled) > self._max_bytes:
+                continue
+
+            records.append(
+                (
+                    _build_key(fingerprint=fingerprint, metric_id=metric_id),
+                    fingerprint,
+                    repr(metric_id),
+                    pickled,
+                    len(pickled),
+                    now,
+                )
+            )
+
+        if not records:
+            return
+
+        try:
+            with self._lock, self._connect() as connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO metric_cache VALUES (?, ?, ?, ?, ?, ?)", records
+                )
+                self._evict(connection=connection)
+        except sqlite3.Error as e:
+            logger.warning(f"Persistent metric cache at {self._path} could not be updated ({e}).")
+
+    def clear(self) -> None:
+        """Removes all entries from cache."""
+        with self._lock, self._connect() as connection:
+            connection.execute("DELETE FROM metric_cache")
+
+    def info(self) -> Dict[str, int]:
+        """Returns number of entries and their total size (in bytes)."""
+        with self._lock, self._connect() as connection:
+            count, size = connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM metric_cache"
+            ).fetchone()
+
+        return {"entries": count, "bytes": size}
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        total_size: int = connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM metric_cache"
+        ).fetchone()[0]
+        if total_size <= self._max_bytes:
+            return
+
+        evicted_keys: list = []
+        key: str
+        size: int
+        for key, size in connection.execute(
+            "SELECT key, size FROM metric_cache ORDER BY last_access"
+        ).fetchall():
+            if total_size <= self._max_bytes:
+                break
+
+            evicted_keys.append((key,))
+            total_size -= size
+
+        connection.executemany("DELETE FROM metric_cache WHERE key = ?", evicted_keys)
+        logger.debug(f"Evicted {len(evicted_keys)} entries from persistent metric cache.")
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        connection: sqlite3.Connection = sqlite3.connect(self._path, timeout=30)
+        try:
+            # Connection, used as context manager, commits (or rolls back) transaction.
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+
+def _build_key(fingerprint: str, metric_id: _MetricKey) -> str:
+    return hashlib.md5(f"{fingerprint}:{metric_id!r}".encode()).hexdigest()
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import concurrent.futures
+import io
+import logging
+from typing import Callable, List, Optional, Tuple
+
+from great_expectations.compatibility.typing_extensions import override
+
+logger = logging.getLogger(__name__)
+
+# Size of ranged request, which refills read buffer (small reads of parsers are served from buffer).
+DEFAULT_RANGED_READ_BUFFER_SIZE = 8 * 1024 * 1024
+
+# Size of parts, into which large reads (e.g., of entire object) are split for concurrent download.
+DEFAULT_RANGED_READ_PART_SIZE = 16 * 1024 * 1024
+
+DEFAULT_RANGED_READ_MAX_CONCURRENCY = 8
+
+# Reads bytes of object between "start" (inclusive) and "end" (exclusive) offsets in one request.
+ReadRangeFn = Callable[[int, int], bytes]
+
+
+class RangedObjectReader(io.RawIOBase):
+    """Read-only, seekable file-like view of (cloud storage) object of known size, fetched by ranged requests on demand.
+
+    Only bytes actually read are downloaded, so that readers, which seek (e.g., "pyarrow" reading Parquet footer and
+    then only row groups and columns it needs), fetch fraction of object, and readers, which stream (e.g., CSV parser),
+    hold bounded number of bytes in memory.  Reads larger than "part_size" are split into parts, which are downloaded
+    concurrently (multipart download) and reassembled in order.
+
+    Args:
+        size: size of object (in bytes)
+        read_range: function, fetching bytes of object between "start" and "end" (exclusive) offsets
+        part_size: size of parts of large reads
+        max_concurrency: maximum number of parts downloaded at the same time
+    """  # noqa: E501
+
+    def __init__(
+        self,
+        size: int,
+        read_range: ReadRangeFn,
+        part_size: int = DEFAULT_RANGED_READ_PART_SIZE,
+        max_concurrency: int = DEFAULT_RANGED_READ_MAX_CONCURRENCY,
+    ) -> None:
+        super().__init__()
+        self._size = size
+        self._read_range = read_range
+        self._part_size = max(part_size, 1)
+        self._max_concurrency = max(max_concurrency, 1)
+        self._position = 0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @override
+    def readable(self) -> bool:
+        return True
+
+    @override
+    def seekable(self) -> bool:
+        return True
+
+    @override
+    def tell(self) -> int:
+        return self._position
+
+    @override
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self._size + offset
+        else:
+            raise ValueError(f"Invalid whence ({whence}).")  # noqa: TRY003
+
+        if position < 0:
+            raise ValueError(f"Negative seek position ({position}).")  # noqa: TRY003
+
+        self._position = position
+        return self._position
+
+    @override
+    def readinto(self, buffer) -> int:
+        view = memoryview(buffer).cast("B")
+        data: bytes = self._read(len(view))
+        view[: len(data)] = data
+        return len(data)
+
+    @override
+    def readall(self) -> bytes:
+        return self._read(self._size - self._position)
+
+    def _read(self, count: int) -> bytes:
+        start: int = self._position
+        end: int = min(start + max(count, 0), self._size)
+        if start >= end:
+            return b""
+
+        data: bytes = self._read_parts(start=start, end=end)
+        self._position = start + len(data)
+        return data
+
+    def _read_parts(self, start: int, end: int) -> bytes:
+        ranges: List[Tuple[int, int]] = [
+            (part_start, min(part_start + self._part_size, end))
+            for part_start in range(start, end, self._part_size)
+        ]
+        if len(ranges) == 1 or self._max_concurrency == 1:
+            return b"".join(
+                self._read_range(part_start, part_end) for part_start, part_end in ranges
+            )
+
+        logger.debug(f"Downloading bytes {start}-{end} of object in {len(ranges)} parts.")
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(self._max_concurrency, len(ranges))
+        ) as executor:
+            return b"".join(executor.map(lambda part_range: self._read_range(*part_range), ranges))
+
+
+def open_ranged_object(
+    size: int,
+    read_range: ReadRangeFn,
+    buffer_size: Optional[int] = None,
+    part_size: int = DEFAULT_RANGED_READ_PART_SIZE,
+    max_concurrency: int = DEFAULT_RANGED_READ_MAX_CONCURRENCY,
+) -> io.BufferedReader:
+    """Returns buffered, seekable binary file over "RangedObjectReader" (see its arguments)."""
+    return io.BufferedReader(
+        RangedObjectReader(
+            size=size,
+            read_range=read_range,
+            part_size=part_size,
+            max_concurrency=max_concurrency,
+        ),
+        buffer_size=buffer_size or DEFAULT_RANGED_READ_BUFFER_SIZE,
+    )
@@ -52,6 +52,13 @@ from great_expectations.exceptions import (
 )
 from great_expectations.exceptions import exceptions as gx_exceptions
 from great_expectations.execution_engine import ExecutionEngine
+from great_expectations.execution_engine.domain_records_cache import (
+    IGNORE_ROW_IF_DOMAIN_KEYS,
+    ROW_FILTER_DOMAIN_KEYS,
+    DomainRecordsCache,
+    DomainRecordsCacheKey,
+    build_domain_records_cache_key,
+)
 from great_expectations.execution_engine.execution_engine import (
     MetricComputationConfiguration,  # noqa: TCH001
     PartitionDomainKwargs,  # noqa: TCH001
@@ -62,6 +69,7 @@ from great_expectations.execution_engine.partition_and_sample.sparkdf_data_parti
 from great_expectations.execution_engine.partition_and_sample.sparkdf_data_sampler import (
     SparkDataSampler,
 )
+from great_expectations.execution_engine.persisted_batch_cache import PersistedBatchCache
 from great_expectations.execution_engine.sparkdf_batch_data import SparkDFBatchData
 from great_expectations.expectations.row_conditions import (
     RowCondition,
@@ -78,6 +86,18 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Default number of cached filtered domain DataFrames (see "DomainRecordsCache").
+DEFAULT_DOMAIN_RECORDS_CACHE_MAX_ENTRIES = 32
+
+# Default number of Batches, whose DataFrames are kept persisted (see "PersistedBatchCache").
+DEFAULT_PERSISTED_BATCHES_MAX_ENTRIES = 8
+
+# Domain keys, which do not affect Batch DataFrame, from which conditional aggregates are computed.
+CONDITIONAL_AGGREGATE_BASE_DOMAIN_KEYS = frozenset({"batch_id"})
+
+# Column, tagging rows of Batch DataFrame with index of compute Domain, whose conditions they meet.
+CONDITIONAL_AGGREGATE_DOMAIN_INDEX_COLUMN_NAME = "__gx_domain_index"
+
 
 def apply_dateutil_parse(column):
     assert len(column.columns) == 1, "Expected DataFrame with 1 column"
@@ -110,6 +130,15 @@ class SparkDFExecutionEngine(ExecutionEngine):
         spark: A PySpark Session used to set the SparkDFExecutionEngine being configured. Will override
           spark_config if provided.
         force_reuse_spark_context: If True then utilize existing SparkSession if it exists and is active
+        domain_records_cache_max_entries: Maximum number of filtered ("row_condition", "ignore_row_if") domain
+          DataFrames, reused across metrics (0 disables).
+        persisted_batches_max_entries: Maximum number of Batches, whose DataFrames are kept persisted (if persist
+          is True); least recently used Batches are unpersisted beyond it (None means unbounded).
+        persist_storage_level: Name of "pyspark.StorageLevel" (e.g., "MEMORY_AND_DISK"), at which Batch DataFrames
+          are persisted (Spark default, if None).
+        bundle_conditional_aggregates: If True, aggregate metrics over compute Domains of the same Batch, which differ
+          only in their row conditions ("row_condition", "filter_conditions", "ignore_row_if"), are computed by one
+          Spark job, rather than by one job per compute Domain.
         **kwargs: Keyword arguments for configuring SparkDFExecutionEngine
 
     For example:
@@ -200,16 +229,30 @@ class SparkDFExecutionEngine(ExecutionEngine):
         "reader_options",
     }
 
-    def __init__(
+    # Keyword arguments mirror keys of ExecutionEngine configuration (see "self._config").
+    def __init__(  # noqa: PLR0913
         self,
         *args,
         persist: bool = True,
         spark_config: Optional[dict] = None,
         spark: Optional[pyspark.SparkSession] = None,
         force_reuse_spark_context: Optional[bool] = None,
+        domain_records_cache_max_entries: int = DEFAULT_DOMAIN_RECORDS_CACHE_MAX_ENTRIES,
+        persisted_batches_max_entries: Optional[int] = DEFAULT_PERSISTED_BATCHES_MAX_ENTRIES,
+        persist_storage_level: Optional[str] = None,
+        bundle_conditional_aggregates: bool = False,
         **kwargs,
     ) -> None:
         self._persist = persist
+        self._bundle_conditional_aggregates = bundle_conditional_aggregates
+        self._persisted_batch_cache = PersistedBatchCache(
+            max_entries=persisted_batches_max_entries, storage_level=persist_storage_level
+        )
+
+        # Spark DataFrames are lazy (their size is unknown until computed); hence, cache is bounded by number of entries.  # noqa: E501
+        self._domain_records_cache = DomainRecordsCache(
+            max_entries=domain_records_cache_max_entries
+        )
 
         spark_config = spark_config or {}
         self.spark: pyspark.SparkSession
@@ -239,6 +282,10 @@ class SparkDFExecutionEngine(ExecutionEngine):
                 "persist": self._persist,
                 "spark_config": spark_config,
                 "azure_options": azure_options,
+                "domain_records_cache_max_entries": domain_records_cache_max_entries,
+                "persisted_batches_max_entries": persisted_batches_max_entries,
+                "persist_storage_level": persist_storage_level,
+                "bundle_conditional_aggregates": bundle_conditional_aggregates,
             }
         )
 
@@ -409,10 +456,31 @@ class SparkDFExecutionEngine(ExecutionEngine):
             )
 
         if self._persist:
-            batch_data.dataframe.persist()
+            self._persisted_batch_cache.persist(batch_id=batch_id, dataframe=batch_data.dataframe)
+
+        self._domain_records_cache.invalidate(batch_id=batch_id)
 
         super().load_batch_data(batch_id=batch_id, batch_data=batch_data)
 
+    @override
+    def release_batch_data(self, batch_id: str) -> None:
+        self._persisted_batch_cache.unpersist(batch_id=batch_id)
+        self._domain_records_cache.invalidate(batch_id=batch_id)
+
+    @property
+    def domain_records_cache(self) -> DomainRecordsCache:
+        """Cache of filtered domain records (exposes hit/miss counters through "info()")."""
+        return self._domain_records_cache
+
+    @property
+    def persisted_batch_cache(self) -> PersistedBatchCache:
+        """Registry of persisted Batch DataFrames (exposes statistics through "info()")."""
+        return self._persisted_batch_cache
+
+    def get_persisted_batches_info(self) -> Dict[str, Any]:
+        """Returns statistics of persisted Batches, including bytes of data cached by Spark application."""  # noqa: E501
+        return self._persisted_batch_cache.info(spark=self.spark)
+
     @override
     def get_batch_data_and_markers(  # noqa: C901, PLR0912, PLR0915
         self, batch_spec: BatchSpec
@@ -533,6 +601,16 @@ illegal.  Please check your config."""  # noqa: E501
             )
 
         batch_data = self._apply_partitioning_and_sampling_methods(batch_spec, batch_data)
+
+        # Selecting only referenced columns lets Spark prune all other columns from the file scan.
+        columns: Optional[List[str]] = batch_spec.get("columns")
+        if columns:
+            existing_columns: List[str] = [
+                column for column in columns if column in batch_data.columns
+            ]
+            if existing_columns:
+                batch_data = batch_data.select(*existing_columns)
+
         typed_batch_data = SparkDFBatchData(execution_engine=self, dataframe=batch_data)
 
         return typed_batch_data, batch_markers
@@ -624,7 +702,7 @@ illegal.  Please check your config."""  # noqa: E501
 
     @public_api
     @override
-    def get_domain_records(  # noqa: C901, PLR0912, PLR0915
+    def get_domain_records(
         self,
         domain_kwargs: dict,
     ) -> "pyspark.DataFrame":  # noqa F821
@@ -647,88 +725,124 @@ illegal.  Please check your config."""  # noqa: E501
                 "SparkDFExecutionEngine does not currently support multiple named tables."
             )
 
-        batch_id = domain_kwargs.get("batch_id")
+        batch_id: Optional[str] = domain_kwargs.get("batch_id")
+        self._persisted_batch_cache.touch(batch_id or self.batch_manager.active_batch_data_id)
+        data: pyspark.DataFrame = self._get_batch_dataframe(batch_id=batch_id)
+
+        cache_key: Optional[DomainRecordsCacheKey] = None
+        if self._caching and self._domain_records_cache.enabled:
+            cache_key = build_domain_records_cache_key(
+                domain_kwargs=domain_kwargs,
+                batch_id=batch_id or self.batch_manager.active_batch_data_id,
+            )
+
+        if cache_key is None:
+            return self._filter_domain_records(data=data, domain_kwargs=domain_kwargs)
+
+        # Spark DataFrames are immutable; hence, cached records are shared by all metrics of Domain.
+        cached_data: Optional[pyspark.DataFrame] = self._domain_records_cache.get(cache_key)
+        if cached_data is None:
+            cached_data = self._filter_domain_records(data=data, domain_kwargs=domain_kwargs)
+            self._domain_records_cache.put(cache_key, cached_data)
+
+        return cached_data
+
+    def _get_batch_dataframe(self, batch_id: Optional[str]) -> pyspark.DataFrame:
         if batch_id is None:
             # We allow no batch id specified if there is only one batch
             if self.batch_manager.active_batch_data:
-                data = cast(SparkDFBatchData, self.batch_manager.active_batch_data).dataframe
-            else:
-                raise ValidationError(  # noqa: TRY003
-                    "No batch is specified, but could not identify a loaded batch."
-                )
-        else:  # noqa: PLR5501
-            if batch_id in self.batch_manager.batch_data_cache:
-                data = cast(
-                    SparkDFBatchData, self.batch_manager.batch_data_cache[batch_id]
-                ).dataframe
-            else:
-                raise ValidationError(f"Unable to find batch with batch_id {batch_id}")  # noqa: TRY003
+                return cast(SparkDFBatchData, self.batch_manager.active_batch_data).dataframe
+
+            raise ValidationError(  # noqa: TRY003
+                "No batch is specified, but could not identify a loaded batch."
+            )
+
+        if batch_id in self.batch_manager.batch_data_cache:
+            return cast(SparkDFBatchData, self.batch_manager.batch_data_cache[batch_id]).dataframe
+
+        raise ValidationError(f"Unable to find batch with batch_id {batch_id}")  # noqa: TRY003
+
+    def _filter_domain_records(
+        self,
+        data: pyspark.DataFrame,
+        domain_kwargs: dict,
+    ) -> pyspark.DataFrame:
+        """Applies "row_condition", "filter_conditions", and "ignore_row_if" directives of Domain kwargs to Batch."""  # noqa: E501
+        condition: pyspark.Column
+        for condition in self._get_domain_records_conditions(domain_kwargs=domain_kwargs):
+            data = data.filter(condition)
+
+        return data
+
+    def _get_domain_records_conditions(
+        self,
+        domain_kwargs: dict,
+    ) -> List[pyspark.Column]:
+        """Returns conditions, which rows of Batch must satisfy in order to belong to records of
+        Domain (in order of application)."""
+        conditions: List[pyspark.Column] = []
 
         # Filtering by row condition.
         row_condition = domain_kwargs.get("row_condition", None)
         if row_condition:
-            condition_parser = domain_kwargs.get("condition_parser", None)
-            if condition_parser == "spark":
-                data = data.filter(row_condition)
-            elif condition_parser == "great_expectations__experimental__":
-                parsed_condition = parse_condition_to_spark(row_condition)
-                data = data.filter(parsed_condition)
-            else:
-                raise GreatExpectationsError(  # noqa: TRY003
-                    f"unrecognized condition_parser {condition_parser!s} for Spark execution engine"
+            conditions.append(
+                self._parse_row_condition(
+                    row_condition=row_condition,
+                    condition_parser=domain_kwargs.get("condition_parser", None),
                 )
+            )
 
         # Filtering by filter_conditions
         filter_conditions: List[RowCondition] = domain_kwargs.get("filter_conditions", [])
         if len(filter_conditions) > 0:
             filter_condition = self._combine_row_conditions(filter_conditions)
-            data = data.filter(filter_condition.condition)
+            conditions.append(F.expr(filter_condition.condition))
 
         if "column" in domain_kwargs:
-            return data
+            return conditions
 
         # Filtering by ignore_row_if directive
-        if (
-            "column_A" in domain_kwargs
-            and "column_B" in domain_kwargs
-            and "ignore_row_if" in domain_kwargs
-        ):
-            # noinspection PyPep8Naming
-            column_A_name = domain_kwargs["column_A"]
-            # noinspection PyPep8Naming
-            column_B_name = domain_kwargs["column_B"]
-
-            ignore_row_if = domain_kwargs["ignore_row_if"]
-            if ignore_row_if == "both_values_are_missing":
-                ignore_condition = F.col(column_A_name).isNull() & F.col(column_B_name).isNull()
-                data = data.filter(~ignore_condition)
-            elif ignore_row_if == "either_value_is_missing":
-                ignore_condition = F.col(column_A_name).isNull() | F.col(column_B_name).isNull()
-                data = data.filter(~ignore_condition)
-            else:  # noqa: PLR5501
-                if ignore_row_if != "neither":
-                    raise ValueError(f'Unrecognized value of ignore_row_if ("{ignore_row_if}").')  # noqa: TRY003
-
-            return data
-
-        if "column_list" in domain_kwargs and "ignore_row_if" in domain_kwargs:
-            column_list = domain_kwargs["column_list"]
-            ignore_row_if = domain_kwargs["ignore_row_if"]
-            if ignore_row_if == "all_values_are_missing":
-                conditions = [F.col(column_name).isNull() for column_name in column_list]
-                ignore_condition = reduce(lambda a, b: a & b, conditions)
-                data = data.filter(~ignore_condition)
-            elif ignore_row_if == "any_value_is_missing":
-                conditions = [F.col(column_name).isNull() for column_name in column_list]
-                ignore_condition = reduce(lambda a, b: a | b, conditions)
-                data = data.filter(~ignore_condition)
-            else:  # noqa: PLR5501
-                if ignore_row_if != "never":
-                    raise ValueError(f'Unrecognized value of ignore_row_if ("{ignore_row_if}").')  # noqa: TRY003
-
-            return data
+        ignore_condition: Optional[pyspark.Column] = self._get_ignore_row_if_condition(
+            domain_kwargs=domain_kwargs
+        )
+        if ignore_condition is not None:
+            conditions.append(~ignore_condition)
 
-        return data
+        return conditions
+
+    @staticmethod
+    def _parse_row_condition(row_condition: str, condition_parser: Optional[str]) -> pyspark.Column:
+        if condition_parser == "spark":
+            return F.expr(row_condition)
+
+        if condition_parser == "great_expectations__experimental__":
+            return parse_condition_to_spark(row_condition)
+
+        raise GreatExpectationsError(  # noqa: TRY003
+            f"unrecognized condition_parser {condition_parser!s} for Spark execution engine"
+        )
+
+    @staticmethod
+    def _get_ignore_row_if_condition(domain_kwargs: dict) -> Optional[pyspark.Column]:
+        """Returns condition, which rows, ignored by "ignore_row_if" directive of "column_pair" and
+        "multicolumn" Domains, satisfy (None, if no rows are ignored)."""
+        if "ignore_row_if" not in domain_kwargs:
+            return None
+
+        ignore_row_if = domain_kwargs["ignore_row_if"]
+        if "column_A" in domain_kwargs and "column_B" in domain_kwargs:
+            return _get_column_pair_ignore_row_if_condition(
+                column_A_name=domain_kwargs["column_A"],
+                column_B_name=domain_kwargs["column_B"],
+                ignore_row_if=ignore_row_if,
+            )
+
+        if "column_list" in domain_kwargs:
+            return _get_multicolumn_ignore_row_if_condition(
+                column_list=domain_kwargs["column_list"], ignore_row_if=ignore_row_if
+            )
+
+        return None
 
     @staticmethod
     def _combine_row_conditions(row_conditions: List[RowCondition]) -> RowCondition:
@@ -892,6 +1006,15 @@ illegal.  Please check your config."""  # noqa: E501
             aggregates[domain_id]["column_aggregates"].append(metric_fn)
             aggregates[domain_id]["metric_ids"].append(metric_to_resolve.id)
 
+        if self._bundle_conditional_aggregates:
+            domain_ids: List[Tuple[str, str, str]]
+            for domain_ids in self._get_conditional_aggregate_domain_groups(aggregates=aggregates):
+                resolved_metrics.update(
+                    self._resolve_conditional_aggregates(
+                        aggregates=[aggregates.pop(domain_id) for domain_id in domain_ids]
+                    )
+                )
+
         for aggregate in aggregates.values():
             domain_kwargs: dict = aggregate["domain_kwargs"]
             df: pyspark.DataFrame = self.get_domain_records(domain_kwargs=domain_kwargs)
@@ -918,6 +1041,163 @@ illegal.  Please check your config."""  # noqa: E501
 
         return resolved_metrics
 
+    def _get_conditional_aggregate_domain_groups(
+        self, aggregates: Dict[Tuple[str, str, str], dict]
+    ) -> List[List[Tuple[str, str, str]]]:
+        """Groups IDs of compute Domains, which differ only in their row conditions (hence, share Batch DataFrame).
+
+        Only groups of more than one compute Domain are returned; compute Domains with other keys (e.g., "column"),
+        whose records are not merely rows of Batch DataFrame, are computed over their own Domains.
+        """  # noqa: E501
+        mergeable_domain_keys: frozenset = (
+            CONDITIONAL_AGGREGATE_BASE_DOMAIN_KEYS
+            | frozenset(ROW_FILTER_DOMAIN_KEYS)
+            | frozenset(IGNORE_ROW_IF_DOMAIN_KEYS)
+        )
+
+        domain_ids_by_base_domain_id: Dict[str, List[Tuple[str, str, str]]] = {}
+        domain_id: Tuple[str, str, str]
+        aggregate: dict
+        for domain_id, aggregate in aggregates.items():
+            domain_kwargs: dict = aggregate["domain_kwargs"]
+            if not set(domain_kwargs.keys()) <= mergeable_domain_keys:
+                continue
+
+            base_domain_kwargs = IDDict(
+                {
+                    key: value
+                    for key, value in domain_kwargs.items()
+                    if key in CONDITIONAL_AGGREGATE_BASE_DOMAIN_KEYS
+                }
+            )
+            domain_ids_by_base_domain_id.setdefault(base_domain_kwargs.to_id(), []).append(
+                domain_id
+            )
+
+        return [
+            domain_ids
+            for domain_ids in domain_ids_by_base_domain_id.values()
+            if len(domain_ids) > 1
+        ]
+
+    def _resolve_conditional_aggregates(
+        self, aggregates: List[dict]
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """Computes aggregates over several compute Domains of the same Batch DataFrame in one Spark job.
+
+        Every row of Batch DataFrame is tagged (by "F.when()" of conditions of each compute Domain) with indices of
+        compute Domains, whose conditions it satisfies; aggregates are then computed for each group of rows, sharing
+        index, so that every aggregate function (including row counts) only considers rows of its compute Domain.
+        Compute Domains without any rows, and all Domains, if conditions cannot be built or grouped aggregation fails,
+        fall back to one aggregation per compute Domain.
+        """  # noqa: E501
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+        aggregate: dict
+        res: List[pyspark.Row]
+        rows_by_domain_index: Dict[int, pyspark.Row]
+        try:
+            domain_index_tags: List[pyspark.Column] = []
+            domain_index: int
+            for domain_index, aggregate in enumerate(aggregates):
+                conditions: List[pyspark.Column] = self._get_domain_records_conditions(
+                    domain_kwargs=aggregate["domain_kwargs"]
+                )
+                domain_index_tags.append(
+                    F.when(reduce(lambda a, b: a & b, conditions), F.lit(domain_index))
+                    if conditions
+                    else F.lit(domain_index)
+                )
+
+            base_domain_kwargs = {
+                key: value
+                for key, value in aggregates[0]["domain_kwargs"].items()
+                if key in CONDITIONAL_AGGREGATE_BASE_DOMAIN_KEYS
+            }
+            df: pyspark.DataFrame = self.get_domain_records(domain_kwargs=base_domain_kwargs)
+            tagged_df: pyspark.DataFrame = df.withColumn(
+                CONDITIONAL_AGGREGATE_DOMAIN_INDEX_COLUMN_NAME,
+                F.explode(F.array(*domain_index_tags)),
+            ).where(F.col(CONDITIONAL_AGGREGATE_DOMAIN_INDEX_COLUMN_NAME).isNotNull())
+
+            column_aggregates: List[pyspark.Column] = [
+                column_aggregate
+                for aggregate in aggregates
+                for column_aggregate in aggregate["column_aggregates"]
+            ]
+            res = (
+                tagged_df.groupBy(CONDITIONAL_AGGREGATE_DOMAIN_INDEX_COLUMN_NAME)
+                .agg(*column_aggregates)
+                .collect()
+            )
+        except Exception as e:
+            logger.debug(
+                f"Conditional aggregates could not be computed in one Spark job ({e}); computing them for each compute Domain."  # noqa: E501
+            )
+            rows_by_domain_index = {}
+        else:
+            rows_by_domain_index = {row[0]: row for row in res}
+            logger.debug(
+                f"SparkDFExecutionEngine computed {len(column_aggregates)} metrics on "
+                f"{len(aggregates)} domains in one Spark job"
+            )
+
+        # Offset of aggregate values of compute Domain in grouped rows (first value is its index).
+        offset: int = 1
+        for domain_index, aggregate in enumerate(aggregates):
+            values: Tuple[Any, ...]
+            row: Optional[pyspark.Row] = rows_by_domain_index.get(domain_index)
+            if row is None:
+                df = self.get_domain_records(domain_kwargs=aggregate["domain_kwargs"])
+                values = tuple(df.agg(*aggregate["column_aggregates"]).collect()[0])
+            else:
+                values = tuple(row[offset : offset + len(aggregate["metric_ids"])])
+
+            offset += len(aggregate["metric_ids"])
+
+            metric_id: Tuple[str, str, str]
+            value: Any
+            for metric_id, value in zip(aggregate["metric_ids"], values):
+                # Converting DataFrame.collect() results into JSON-serializable format produces simple data types,  # noqa: E501
+                # amenable for subsequent post-processing by higher-level "Metric" and "Expectation" layers.  # noqa: E501
+                resolved_metrics[metric_id] = convert_to_json_serializable(data=value)
+
+        return resolved_metrics
+
     def head(self, n=5):
         """Returns dataframe head. Default is 5"""
         return self.dataframe.limit(n).toPandas()
+
+
+# noinspection PyPep8Naming
+def _get_column_pair_ignore_row_if_condition(
+    column_A_name: str, column_B_name: str, ignore_row_if: str
+) -> Optional[pyspark.Column]:
+    if ignore_row_if == "both_values_are_missing":
+        return F.col(column_A_name).isNull() & F.col(column_B_name).isNull()
+
+    if ignore_row_if == "either_value_is_missing":
+        return F.col(column_A_name).isNull() | F.col(column_B_name).isNull()
+
+    if ignore_row_if != "neither":
+        raise ValueError(f'Unrecognized value of ignore_row_if ("{ignore_row_if}").')  # noqa: TRY003
+
+    return None
+
+
+def _get_multicolumn_ignore_row_if_condition(
+    column_list: List[str], ignore_row_if: str
+) -> Optional[pyspark.Column]:
+    null_conditions: List[pyspark.Column] = [
+        F.col(column_name).isNull() for column_name in column_list
+    ]
+    if ignore_row_if == "all_values_are_missing":
+        return reduce(lambda a, b: a & b, null_conditions)
+
+    if ignore_row_if == "any_value_is_missing":
+        return reduce(lambda a, b: a | b, null_conditions)
+
+    if ignore_row_if != "never":
+        raise ValueError(f'Unrecognized value of ignore_row_if ("{ignore_row_if}").')  # noqa: TRY003
+
+    return None
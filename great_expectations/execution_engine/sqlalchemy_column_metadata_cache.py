@@ -0,0 +1,158 @@
+"""Cache of reflected column metadata of tables (and custom queries), shared by metrics of one
+SqlAlchemyExecutionEngine.
+
+Reflection ("Inspector.get_columns()", or "SELECT ... LIMIT 1" fallback) runs whenever
+"table.column_types" (and hence "table.columns") is resolved; on warehouses, whose
+"information_schema" queries take seconds, validating many Suites against the same table would
+otherwise repeat it for every Validator.  Entries expire after time-to-live, and can be invalidated
+explicitly (e.g., after table is altered).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+ColumnMetadataCacheKey = Tuple[Optional[str], Hashable]
+
+DEFAULT_COLUMN_METADATA_CACHE_TTL_SECONDS = 300.0
+
+DEFAULT_COLUMN_METADATA_CACHE_MAX_ENTRIES = 1024
+
+
+def build_column_metadata_cache_key(
+    table_selectable: Any, schema_name: Optional[str] = None
+) -> ColumnMetadataCacheKey:
+    """Builds cache key from schema name and table name (or from hash of SQL text of custom query,
+    or other selectable).
+
+    Args:
+        table_selectable: table name, or selectable (e.g., "TextClause" of custom query), whose
+            columns are reflected
+        schema_name: name of schema of table (None for default schema)
+
+    Returns:
+        Tuple of schema name and table name (or of schema name and tuple holding type and MD5 digest
+        of SQL text)
+    """
+    if isinstance(table_selectable, str):
+        return schema_name, table_selectable
+
+    return schema_name, (
+        type(table_selectable).__name__,
+        hashlib.md5(str(table_selectable).encode()).hexdigest(),
+    )
+
+
+class ColumnMetadataCache:
+    """Least-recently-used cache of column metadata, whose entries expire after time-to-live.
+
+    Args:
+        ttl_seconds: number of seconds, for which cached column metadata is reused (None means
+            entries never expire; 0 disables cache)
+        max_entries: upper bound on number of cached entries (None means unbounded)
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: Optional[float] = DEFAULT_COLUMN_METADATA_CACHE_TTL_SECONDS,
+        max_entries: Optional[int] = DEFAULT_COLUMN_METADATA_CACHE_MAX_ENTRIES,
+    ) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+
+        self._entries: OrderedDict[ColumnMetadataCacheKey, Tuple[Sequence[Any], float]] = (
+            OrderedDict()
+        )
+
+        self.hits = 0
+        self.misses = 0
+
+        # Cache may be shared by metrics, resolved concurrently (see "MetricResolutionScheduler").
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self._ttl_seconds != 0 and self._max_entries != 0
+
+    @property
+    def ttl_seconds(self) -> Optional[float]:
+        return self._ttl_seconds
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: ColumnMetadataCacheKey) -> bool:
+        return key in self._entries
+
+    def get(self, key: ColumnMetadataCacheKey) -> Optional[Sequence[Any]]:
+        """Returns (copy of list of) cached column metadata, or None if it is absent or expired,
+        counting hits and misses."""
+        with self._lock:
+            entry: Optional[Tuple[Sequence[Any], float]] = self._entries.get(key)
+            if entry is not None and self._is_expired(cached_at=entry[1]):
+                del self._entries[key]
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return list(entry[0])
+
+    def put(self, key: ColumnMetadataCacheKey, columns: Sequence[Any]) -> None:
+        """Caches column metadata under key, evicting least recently used entries beyond bound."""
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._entries[key] = (list(columns), time.monotonic())
+            self._entries.move_to_end(key)
+
+            while self._max_entries is not None and len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(
+        self, table_selectable: Optional[Any] = None, schema_name: Optional[str] = None
+    ) -> None:
+        """Removes cached column metadata of given table (or of all tables of schema, if
+        "table_selectable" is None).
+
+        If neither "table_selectable" nor "schema_name" is given, cache is cleared.
+        """
+        with self._lock:
+            if table_selectable is not None:
+                self._entries.pop(
+                    build_column_metadata_cache_key(
+                        table_selectable=table_selectable, schema_name=schema_name
+                    ),
+                    None,
+                )
+            elif schema_name is not None:
+                key: ColumnMetadataCacheKey
+                for key in [key for key in self._entries if key[0] == schema_name]:
+                    del self._entries[key]
+            else:
+                self._entries.clear()
+
+    def info(self) -> Dict[str, Optional[float]]:
+        """Returns usage statistics (hits, misses, entries, time-to-live and maximum entries) of
+        cache."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._entries),
+            "ttl_seconds": self._ttl_seconds,
+            "max_entries": self._max_entries,
+        }
+
+    def _is_expired(self, cached_at: float) -> bool:
+        return self._ttl_seconds is not None and time.monotonic() - cached_at > self._ttl_seconds
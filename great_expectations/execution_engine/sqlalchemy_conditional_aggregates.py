@@ -0,0 +1,244 @@
+"""Helpers for folding row conditions of compute Domains into conditional aggregates of one bundled
+SQL query.
+
+Aggregate metrics over different compute Domains of the same Batch (e.g., "column.max" with and
+without "row_condition") can be computed by a single "SELECT" over the unfiltered Batch selectable,
+provided that every aggregate function only considers rows satisfying the condition of its own
+Domain.  This is expressed with "FILTER (WHERE ...)" clauses, where the dialect supports them, and
+with "CASE WHEN ... THEN ... END" arguments (ignored "NULL" values) otherwise.
+"""
+
+from __future__ import annotations
+
+import enum
+import logging
+from typing import TYPE_CHECKING, Any, Final, FrozenSet, List, Optional
+
+from great_expectations.compatibility import sqlalchemy
+from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
+from great_expectations.core import IDDict
+from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
+from great_expectations.expectations.row_conditions import (
+    RowCondition,
+    RowConditionParserType,
+    parse_condition_to_sqlalchemy,
+)
+
+if TYPE_CHECKING:
+    from great_expectations.compatibility.sqlalchemy import ColumnElement
+
+logger = logging.getLogger(__name__)
+
+# Domain keys, whose values are expressible as row-level conditions over the Batch selectable.
+CONDITION_DOMAIN_KEYS: Final[FrozenSet[str]] = frozenset(
+    {"row_condition", "condition_parser", "filter_conditions"}
+)
+
+# Domain keys, whose presence does not affect the Batch selectable, from which conditional
+# aggregates are computed.
+BASE_DOMAIN_KEYS: Final[FrozenSet[str]] = frozenset({"batch_id", "table"})
+
+# Aggregate functions, which ignore "NULL" arguments (so that "CASE WHEN" without "ELSE" excludes
+# non-matching rows).
+AGGREGATE_FUNCTION_NAMES: Final[FrozenSet[str]] = frozenset(
+    {
+        "avg",
+        "count",
+        "max",
+        "min",
+        "stddev",
+        "stddev_pop",
+        "stddev_samp",
+        "stdev",
+        "stdevp",
+        "sum",
+        "var",
+        "var_pop",
+        "var_samp",
+        "variance",
+        "varp",
+    }
+)
+
+# Scalar functions, which are allowed to wrap aggregate functions (e.g., "SQRT(SUM(...))").
+SCALAR_FUNCTION_NAMES: Final[FrozenSet[str]] = frozenset(
+    {
+        "abs",
+        "ceil",
+        "ceiling",
+        "coalesce",
+        "exp",
+        "floor",
+        "ln",
+        "log",
+        "nullif",
+        "pow",
+        "power",
+        "round",
+        "sqrt",
+    }
+)
+
+# Dialects, known to support standard SQL "FILTER (WHERE ...)" clause for aggregate functions.
+FILTER_CLAUSE_DIALECTS: Final[FrozenSet[GXSqlDialect]] = frozenset({GXSqlDialect.POSTGRESQL})
+
+
+class ConditionalAggregateMode(enum.Enum):
+    """SQL construct used to restrict aggregate function to rows satisfying condition of its compute
+    Domain."""
+
+    FILTER = "filter"
+    CASE = "case"
+
+
+class UnsupportedConditionalAggregateError(ValueError):
+    """Raised when aggregate expression or compute Domain cannot be expressed as conditional
+    aggregate."""
+
+
+def get_conditional_aggregate_mode(dialect_name: str) -> ConditionalAggregateMode:
+    """Returns "FILTER" for dialects, which support "FILTER (WHERE ...)" clause, and "CASE" for all
+    other dialects."""
+    try:
+        dialect = GXSqlDialect(dialect_name)
+    except ValueError:
+        return ConditionalAggregateMode.CASE
+
+    if dialect in FILTER_CLAUSE_DIALECTS:
+        return ConditionalAggregateMode.FILTER
+
+    return ConditionalAggregateMode.CASE
+
+
+def get_base_domain_kwargs(compute_domain_kwargs: dict) -> Optional[IDDict]:
+    """Returns compute Domain kwargs without condition keys, or None, if Domain cannot be expressed
+    by conditions alone.
+
+    Args:
+        compute_domain_kwargs: compute Domain kwargs of bundled aggregate metric
+
+    Returns:
+        "IDDict" of Domain kwargs, identifying unfiltered Batch selectable (None if Domain is not
+        mergeable)
+    """
+    if not set(compute_domain_kwargs.keys()) <= BASE_DOMAIN_KEYS | CONDITION_DOMAIN_KEYS:
+        return None
+
+    if (
+        compute_domain_kwargs.get("row_condition") is not None
+        and compute_domain_kwargs.get("condition_parser") != "great_expectations__experimental__"
+    ):
+        return None
+
+    filter_condition: RowCondition
+    for filter_condition in compute_domain_kwargs.get("filter_conditions") or []:
+        if filter_condition.condition_type != RowConditionParserType.GE:
+            return None
+
+    return IDDict(
+        {
+            key: value
+            for key, value in compute_domain_kwargs.items()
+            if key not in CONDITION_DOMAIN_KEYS
+        }
+    )
+
+
+def build_domain_condition(compute_domain_kwargs: dict) -> Optional[ColumnElement]:
+    """Builds row-level condition equivalent to "row_condition" and "filter_conditions" of compute
+    Domain (if any).
+
+    Args:
+        compute_domain_kwargs: compute Domain kwargs, accepted by "get_base_domain_kwargs()"
+
+    Returns:
+        SQLAlchemy boolean expression (None if Domain is not restricted by any condition)
+    """
+    conditions: List[ColumnElement] = []
+
+    row_condition: Optional[str] = compute_domain_kwargs.get("row_condition")
+    if row_condition is not None:
+        conditions.append(parse_condition_to_sqlalchemy(row_condition))
+
+    filter_condition: RowCondition
+    for filter_condition in compute_domain_kwargs.get("filter_conditions") or []:
+        conditions.append(parse_condition_to_sqlalchemy(filter_condition.condition))
+
+    if not conditions:
+        return None
+
+    if len(conditions) == 1:
+        return conditions[0]
+
+    return sa.and_(*conditions)
+
+
+def apply_condition_to_aggregate(
+    metric_fn: Any,
+    condition: ColumnElement,
+    mode: ConditionalAggregateMode,
+) -> Any:
+    """Rewrites every aggregate function in "metric_fn" so that it only considers rows satisfying
+    "condition".
+
+    Args:
+        metric_fn: SQLAlchemy aggregate expression (e.g., "sa.func.max(column)") of bundled metric
+        condition: row-level condition of compute Domain of bundled metric
+        mode: SQL construct ("FILTER" clause or "CASE WHEN" argument) used to express conditional
+            aggregate
+
+    Returns:
+        Rewritten SQLAlchemy expression
+
+    Raises:
+        UnsupportedConditionalAggregateError: if expression contains functions or constructs that
+            cannot be rewritten
+    """
+
+    def _replace(element: Any) -> Any:
+        if isinstance(
+            element, (sqlalchemy.FunctionFilter, sqlalchemy.Over, sqlalchemy.WithinGroup)
+        ):
+            raise UnsupportedConditionalAggregateError(  # noqa: TRY003
+                f'Expression "{element!s}" cannot be converted to conditional aggregate.'
+            )
+
+        if not isinstance(element, sqlalchemy.functions.FunctionElement):
+            return None
+
+        function_name: str = str(getattr(element, "name", "")).lower()
+        if function_name in AGGREGATE_FUNCTION_NAMES:
+            if mode == ConditionalAggregateMode.FILTER:
+                return element.filter(condition)
+
+            return getattr(sa.func, function_name)(
+                *[
+                    _to_conditional_argument(argument=argument, condition=condition)
+                    for argument in element.clauses.clauses
+                ]
+            )
+
+        if function_name in SCALAR_FUNCTION_NAMES:
+            return None
+
+        raise UnsupportedConditionalAggregateError(  # noqa: TRY003
+            f'Function "{function_name}" cannot be converted to conditional aggregate.'
+        )
+
+    return sqlalchemy.visitors.replacement_traverse(metric_fn, {}, _replace)
+
+
+def _to_conditional_argument(argument: Any, condition: ColumnElement) -> Any:
+    # "COUNT(*)" counts rows; its conditional form counts non-NULL values of
+    # "CASE WHEN <condition> THEN 1 END".
+    if isinstance(argument, sqlalchemy.ColumnClause) and argument.name == "*":
+        return sa.case((condition, sa.literal(1)))
+
+    # "DISTINCT" must remain outermost modifier of aggregate function argument.
+    if (
+        isinstance(argument, sqlalchemy.UnaryExpression)
+        and argument.operator is sa.sql.operators.distinct_op
+    ):
+        return sa.distinct(sa.case((condition, argument.element)))
+
+    return sa.case((condition, argument))
@@ -9,6 +9,7 @@ import os
 import random
 import re
 import string
+import threading
 import traceback
 from contextlib import contextmanager
 from pathlib import Path
@@ -21,6 +22,7 @@ from typing import (
     List,
     MutableMapping,
     Optional,
+    Set,
     Tuple,
     Union,
     cast,
@@ -77,6 +79,18 @@ from great_expectations.execution_engine import ExecutionEngine
 from great_expectations.execution_engine.sqlalchemy_batch_data import (
     SqlAlchemyBatchData,
 )
+from great_expectations.execution_engine.sqlalchemy_column_metadata_cache import (
+    DEFAULT_COLUMN_METADATA_CACHE_TTL_SECONDS,
+    ColumnMetadataCache,
+)
+from great_expectations.execution_engine.sqlalchemy_conditional_aggregates import (
+    ConditionalAggregateMode,
+    UnsupportedConditionalAggregateError,
+    apply_condition_to_aggregate,
+    build_domain_condition,
+    get_base_domain_kwargs,
+    get_conditional_aggregate_mode,
+)
 from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
 from great_expectations.expectations.row_conditions import (
     RowCondition,
@@ -142,6 +156,10 @@ except ImportError:
 if TYPE_CHECKING:
     from sqlalchemy.engine import Engine as SaEngine  # noqa: TID251
 
+    from great_expectations.execution_engine.domain_records_cache import (
+        DomainRecordsCacheKey,
+    )
+
 
 def _get_dialect_type_module(dialect):  # noqa: C901
     """Given a dialect, returns the dialect type, which is defines the engine/system that is used to communicates
@@ -274,6 +292,17 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         url (string): If neither the engines, the credentials, nor the connection_string have been provided, a \
             URL can be used to access the data. This will be overridden by all other configuration options if \
             any are provided.
+        bundle_conditional_aggregates (bool): If True, aggregate metrics over compute Domains of the same Batch, which \
+            differ only in row conditions (e.g., "row_condition"), are computed by one query using conditional \
+            aggregates ("FILTER (WHERE ...)" or "CASE WHEN ... END"), instead of one query per compute Domain.
+        materialize_domain_min_metrics (int or None): If set, Domain of Batch, filtered by "row_condition" (or Batch \
+            defined by custom query, not stored in temporary table), is materialized into temporary table the first \
+            time it is queried, provided that at least this many pending metrics share it; temporary tables are \
+            dropped once metrics are resolved.  Materialization is disabled if None (default).
+        column_metadata_cache_ttl (float or None): Number of seconds, for which reflected column metadata of table \
+            (or of custom query) is reused by metrics (e.g., "table.column_types"), instead of being reflected again \
+            (default is 300 seconds; None means cached metadata never expires; 0 disables caching).  Cached \
+            metadata can be invalidated explicitly using "invalidate_column_metadata()".
         kwargs (dict): These will be passed as optional parameters to the SQLAlchemy engine, **not** the ExecutionEngine
 
     For example:
@@ -293,6 +322,9 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         url: Optional[str] = None,
         batch_data_dict: Optional[dict] = None,
         create_temp_table: bool = True,
+        bundle_conditional_aggregates: bool = False,
+        materialize_domain_min_metrics: Optional[int] = None,
+        column_metadata_cache_ttl: Optional[float] = DEFAULT_COLUMN_METADATA_CACHE_TTL_SECONDS,
         # kwargs will be passed as optional parameters to the SQLAlchemy engine, **not** the ExecutionEngine  # noqa: E501
         **kwargs,
     ) -> None:
@@ -303,6 +335,19 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         self._connection_string = connection_string
         self._url = url
         self._create_temp_table = create_temp_table
+        self._bundle_conditional_aggregates = bundle_conditional_aggregates
+
+        # Numbers of pending metrics by materializable Domain (see "prepare_domain_records()"), and
+        # temporary tables, holding records of Domains materialized so far.
+        self._materialize_domain_min_metrics = materialize_domain_min_metrics
+        self._pending_domain_metric_counts: Dict[DomainRecordsCacheKey, int] = {}
+        self._materialized_domains: Dict[DomainRecordsCacheKey, sqlalchemy.Table] = {}
+        self._unmaterializable_domains: Set[DomainRecordsCacheKey] = set()
+        # Guards creation (and dropping) of temporary tables of materialized Domains, which metrics,
+        # resolved concurrently (see "MetricResolutionScheduler"), may request at the same time.
+        self._materialize_domain_lock = threading.Lock()
+
+        self._column_metadata_cache = ColumnMetadataCache(ttl_seconds=column_metadata_cache_ttl)
         os.environ["SF_PARTNER"] = "great_expectations_oss"  # noqa: TID251
 
         # sqlite/mssql temp tables only persist within a connection, so we need to keep the connection alive by  # noqa: E501
@@ -426,6 +471,9 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             "connection_string": connection_string,
             "url": url,
             "batch_data_dict": batch_data_dict,
+            "bundle_conditional_aggregates": bundle_conditional_aggregates,
+            "materialize_domain_min_metrics": materialize_domain_min_metrics,
+            "column_metadata_cache_ttl": column_metadata_cache_ttl,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
@@ -660,6 +708,15 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                     "SqlAlchemyExecutionEngine only supports the great_expectations condition_parser."  # noqa: E501
                 )
 
+        # Domain, shared by many pending metrics, is queried from temporary table of its records.
+        materialized_domain_key: Optional[DomainRecordsCacheKey] = (
+            self._get_materialized_domain_key(domain_kwargs=domain_kwargs, data_object=data_object)
+        )
+        if materialized_domain_key is not None:
+            selectable = self._get_materialized_domain_selectable(
+                key=materialized_domain_key, selectable=selectable, data_object=data_object
+            )
+
         # Filtering by filter_conditions
         filter_conditions: List[RowCondition] = domain_kwargs.get("filter_conditions", [])
         # For SqlAlchemyExecutionEngine only one filter condition is allowed
@@ -787,6 +844,148 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
         return selectable
 
+    @override
+    def prepare_domain_records(self, metric_configurations: Iterable[MetricConfiguration]) -> None:
+        """Counts pending metrics by Domain, which may be materialized (see "materialize_domain_min_metrics")."""  # noqa: E501
+        self._pending_domain_metric_counts = {}
+        if self._materialize_domain_min_metrics is None:
+            return
+
+        metric_configuration: MetricConfiguration
+        key: Optional[DomainRecordsCacheKey]
+        for metric_configuration in metric_configurations:
+            key = self._get_materialized_domain_key(
+                domain_kwargs=metric_configuration.metric_domain_kwargs
+            )
+            if key is not None:
+                self._pending_domain_metric_counts[key] = (
+                    self._pending_domain_metric_counts.get(key, 0) + 1
+                )
+
+    @override
+    def release_domain_records(self) -> None:
+        """Drops temporary tables of materialized Domains."""
+        self._pending_domain_metric_counts = {}
+        self._unmaterializable_domains = set()
+        self._drop_materialized_domains()
+
+    @override
+    def release_batch_data(self, batch_id: str) -> None:
+        self._drop_materialized_domains(batch_id=batch_id)
+
+    def _get_materialized_domain_key(
+        self,
+        domain_kwargs: dict,
+        data_object: Optional[SqlAlchemyBatchData] = None,
+    ) -> Optional[DomainRecordsCacheKey]:
+        """Returns key of Domain records, which may be materialized, or None if materializing them is not worthwhile.
+
+        Records may be materialized if temporary tables are enabled and either "row_condition" filters Batch, or Batch
+        itself is not a table (e.g., it is defined by custom query), so that its query would be evaluated repeatedly.
+        """  # noqa: E501
+        if self._materialize_domain_min_metrics is None or not self._create_temp_table:
+            return None
+
+        batch_id: Optional[str] = (
+            domain_kwargs.get("batch_id") or self.batch_manager.active_batch_data_id
+        )
+        if data_object is None:
+            data_object = cast(
+                Optional[SqlAlchemyBatchData], self.batch_manager.batch_data_cache.get(batch_id)
+            )
+
+        if data_object is None or domain_kwargs.get("table") not in (
+            None,
+            getattr(data_object.selectable, "name", None),
+        ):
+            return None
+
+        row_condition: Optional[str] = domain_kwargs.get("row_condition")
+        if row_condition is None and isinstance(data_object.selectable, sa.Table):
+            return None
+
+        return (
+            batch_id,
+            IDDict(
+                {
+                    "row_condition": row_condition,
+                    "condition_parser": domain_kwargs.get("condition_parser"),
+                }
+            ).to_id(),
+        )
+
+    def _get_materialized_domain_selectable(
+        self,
+        key: DomainRecordsCacheKey,
+        selectable: sqlalchemy.Selectable,
+        data_object: SqlAlchemyBatchData,
+    ) -> sqlalchemy.Selectable:
+        """Returns temporary table, holding Domain records, which is created if enough pending metrics share Domain.
+
+        If Domain is not (and is not worth being) materialized, or temporary table cannot be created, "selectable" is
+        returned unchanged.
+        """  # noqa: E501
+        with self._materialize_domain_lock:
+            materialized_table: Optional[sqlalchemy.Table] = self._materialized_domains.get(key)
+            if materialized_table is not None:
+                return materialized_table
+
+            pending_metrics_count: int = self._pending_domain_metric_counts.get(key, 0)
+            if key in self._unmaterializable_domains or pending_metrics_count < cast(
+                int, self._materialize_domain_min_metrics
+            ):
+                return selectable
+
+            domain_query: sqlalchemy.Selectable = selectable
+            if not (sqlalchemy.Select and isinstance(domain_query, sqlalchemy.Select)):
+                domain_query = sa.select(sa.text("*")).select_from(domain_query)
+
+            try:
+                # Compiling with literal binds fails for some parameter types (e.g., of dialect).
+                query: str = str(
+                    domain_query.compile(
+                        dialect=self.engine.dialect, compile_kwargs={"literal_binds": True}
+                    )
+                )
+                temp_table_name: str
+                # noinspection PyProtectedMember
+                _, temp_table_name = data_object._create_temporary_table(
+                    dialect=data_object.dialect, query=query
+                )
+            except Exception as e:
+                logger.warning(
+                    f"Domain records could not be materialized into temporary table ({e})."
+                )
+                self._unmaterializable_domains.add(key)
+                return selectable
+
+            logger.debug(
+                f"Materialized Domain records, shared by {pending_metrics_count} pending metrics, into temporary table {temp_table_name}."  # noqa: E501
+            )
+            materialized_table = sa.Table(temp_table_name, sa.MetaData())
+            self._materialized_domains[key] = materialized_table
+            return materialized_table
+
+    def _drop_materialized_domains(self, batch_id: Optional[str] = None) -> None:
+        """Drops temporary tables of Domains, materialized for given Batch (or for all Batches, if "batch_id" is None)."""  # noqa: E501
+        with self._materialize_domain_lock:
+            key: DomainRecordsCacheKey
+            for key in [
+                key for key in self._materialized_domains if batch_id is None or key[0] == batch_id
+            ]:
+                temp_table_name: str = self._materialized_domains.pop(key).name
+                if self.dialect_name == GXSqlDialect.DATABRICKS:
+                    stmt = f"DROP VIEW IF EXISTS `{temp_table_name}`"
+                elif self.dialect_name == GXSqlDialect.DREMIO:
+                    stmt = f"DROP VDS {temp_table_name}"
+                else:
+                    stmt = f"DROP TABLE {temp_table_name}"
+
+                try:
+                    self.execute_query_in_transaction(sa.text(stmt))
+                except Exception as e:
+                    logger.warning(f"Temporary table {temp_table_name} could not be dropped ({e}).")
+
     @public_api
     @override
     def get_compute_domain(
@@ -946,7 +1145,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         return PartitionDomainKwargs(compute_domain_kwargs, accessor_domain_kwargs)
 
     @override
-    def resolve_metric_bundle(  # noqa: C901 - too complex
+    def resolve_metric_bundle(
         self,
         metric_fn_bundle: Iterable[MetricComputationConfiguration],
     ) -> Dict[Tuple[str, str, str], MetricValue]:
@@ -967,44 +1166,13 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
         res: List[sqlalchemy.Row]
 
-        # We need a different query for each Domain (where clause).
-        queries: Dict[Tuple[str, str, str], dict] = {}
+        # We need a different query for each Domain (where clause), unless conditions are folded into aggregates.  # noqa: E501
+        queries: Dict[Union[str, Tuple[str, str]], dict] = self._build_bundled_metric_queries(
+            metric_fn_bundle=metric_fn_bundle
+        )
 
         query: dict
 
-        domain_id: Tuple[str, str, str]
-
-        bundled_metric_configuration: MetricComputationConfiguration
-        for bundled_metric_configuration in metric_fn_bundle:
-            metric_to_resolve: MetricConfiguration = (
-                bundled_metric_configuration.metric_configuration
-            )
-            metric_fn: Any = bundled_metric_configuration.metric_fn
-            compute_domain_kwargs: dict = bundled_metric_configuration.compute_domain_kwargs or {}
-            if not isinstance(compute_domain_kwargs, IDDict):
-                compute_domain_kwargs = IDDict(compute_domain_kwargs)
-
-            domain_id = compute_domain_kwargs.to_id()
-            if domain_id not in queries:
-                queries[domain_id] = {
-                    "select": [],
-                    "metric_ids": [],
-                    "domain_kwargs": compute_domain_kwargs,
-                }
-
-            if self.engine.dialect.name == "clickhouse":
-                queries[domain_id]["select"].append(
-                    metric_fn.label(
-                        metric_to_resolve.metric_name.join(
-                            random.choices(string.ascii_lowercase, k=4)
-                        )
-                    )
-                )
-            else:
-                queries[domain_id]["select"].append(metric_fn.label(metric_to_resolve.metric_name))
-
-            queries[domain_id]["metric_ids"].append(metric_to_resolve.id)
-
         for query in queries.values():
             domain_kwargs: dict = query["domain_kwargs"]
             selectable: sqlalchemy.Selectable = self.get_domain_records(domain_kwargs=domain_kwargs)
@@ -1056,6 +1224,129 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
         return resolved_metrics
 
+    def _build_bundled_metric_queries(
+        self,
+        metric_fn_bundle: Iterable[MetricComputationConfiguration],
+    ) -> Dict[Union[str, Tuple[str, str]], dict]:
+        """Organizes bundled metrics into queries, each holding "select" expressions, metric IDs, and Domain kwargs.
+
+        By default, one query is built for each distinct compute Domain.  If "bundle_conditional_aggregates" is enabled,
+        metrics over compute Domains, which differ only in their row conditions, are gathered into one query over the
+        unfiltered Batch selectable, with each aggregate rewritten to only consider rows satisfying its own condition.
+        Metrics, whose aggregate expressions cannot be rewritten, fall back to their per-Domain queries.
+
+        Args:
+            metric_fn_bundle: "MetricComputationConfiguration" objects of bundled (aggregate) metrics
+
+        Returns:
+            Dictionary of query specifications, keyed by compute Domain ID (or by tuple holding base Domain ID).
+        """  # noqa: E501
+        metric_fn_bundle = list(metric_fn_bundle)
+
+        bundled_metric_configuration: MetricComputationConfiguration
+        compute_domain_kwargs_list: List[IDDict] = [
+            IDDict(bundled_metric_configuration.compute_domain_kwargs or {})
+            for bundled_metric_configuration in metric_fn_bundle
+        ]
+
+        base_domain_kwargs_list: List[Optional[IDDict]]
+        base_domain_kwargs_list = self._get_conditional_aggregate_base_domains(
+            compute_domain_kwargs_list=compute_domain_kwargs_list
+        )
+        conditional_aggregate_mode: ConditionalAggregateMode = get_conditional_aggregate_mode(
+            dialect_name=self.dialect_name
+        )
+
+        queries: Dict[Union[str, Tuple[str, str]], dict] = {}
+
+        query_id: Union[str, Tuple[str, str]]
+        compute_domain_kwargs: IDDict
+        base_domain_kwargs: Optional[IDDict]
+        for bundled_metric_configuration, compute_domain_kwargs, base_domain_kwargs in zip(
+            metric_fn_bundle, compute_domain_kwargs_list, base_domain_kwargs_list
+        ):
+            metric_to_resolve: MetricConfiguration = (
+                bundled_metric_configuration.metric_configuration
+            )
+            metric_fn: Any = bundled_metric_configuration.metric_fn
+            domain_kwargs: IDDict = compute_domain_kwargs
+            query_id = compute_domain_kwargs.to_id()
+
+            if base_domain_kwargs is not None:
+                condition = build_domain_condition(compute_domain_kwargs=compute_domain_kwargs)
+                try:
+                    if condition is not None:
+                        metric_fn = apply_condition_to_aggregate(
+                            metric_fn=metric_fn,
+                            condition=condition,
+                            mode=conditional_aggregate_mode,
+                        )
+                    domain_kwargs = base_domain_kwargs
+                    query_id = ("conditional", base_domain_kwargs.to_id())
+                except UnsupportedConditionalAggregateError as e:
+                    logger.debug(
+                        f'Metric "{metric_to_resolve.metric_name}" will be computed by query '
+                        f"over its own Domain: {e!s}"
+                    )
+                    metric_fn = bundled_metric_configuration.metric_fn
+
+            if query_id not in queries:
+                queries[query_id] = {
+                    "select": [],
+                    "metric_ids": [],
+                    "domain_kwargs": domain_kwargs,
+                }
+
+            if self.engine.dialect.name == "clickhouse":
+                queries[query_id]["select"].append(
+                    metric_fn.label(
+                        metric_to_resolve.metric_name.join(
+                            random.choices(string.ascii_lowercase, k=4)
+                        )
+                    )
+                )
+            else:
+                queries[query_id]["select"].append(metric_fn.label(metric_to_resolve.metric_name))
+
+            queries[query_id]["metric_ids"].append(metric_to_resolve.id)
+
+        return queries
+
+    def _get_conditional_aggregate_base_domains(
+        self, compute_domain_kwargs_list: List[IDDict]
+    ) -> List[Optional[IDDict]]:
+        """Returns, for each compute Domain, its unfiltered base Domain, if it shares that base Domain with at least one
+        other (differently conditioned) compute Domain in bundle and "bundle_conditional_aggregates" is enabled; None otherwise.
+        """  # noqa: E501
+        if not self._bundle_conditional_aggregates:
+            return [None] * len(compute_domain_kwargs_list)
+
+        candidate_base_domain_kwargs_list: List[Optional[IDDict]] = [
+            get_base_domain_kwargs(compute_domain_kwargs=compute_domain_kwargs)
+            for compute_domain_kwargs in compute_domain_kwargs_list
+        ]
+
+        domain_ids_by_base_domain_id: Dict[Union[str, tuple], set] = {}
+        compute_domain_kwargs: IDDict
+        base_domain_kwargs: Optional[IDDict]
+        for compute_domain_kwargs, base_domain_kwargs in zip(
+            compute_domain_kwargs_list, candidate_base_domain_kwargs_list
+        ):
+            if base_domain_kwargs is not None:
+                domain_ids_by_base_domain_id.setdefault(base_domain_kwargs.to_id(), set()).add(
+                    compute_domain_kwargs.to_id()
+                )
+
+        # Compute Domains, not sharing base Domain with any other, are queried as before (no
+        # rewriting needed).
+        return [
+            base_domain_kwargs
+            if base_domain_kwargs is not None
+            and len(domain_ids_by_base_domain_id[base_domain_kwargs.to_id()]) > 1
+            else None
+            for base_domain_kwargs in candidate_base_domain_kwargs_list
+        ]
+
     def close(self) -> None:
         """
         Note: Will 20210729
@@ -1074,6 +1365,7 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
         More background can be found here: https://github.com/great-expectations/great_expectations/pull/3104/
         """  # noqa: E501
+        self._drop_materialized_domains()
         if self._engine_backup:
             if self._connection:
                 self._connection.close()
@@ -1271,6 +1563,21 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
         return batch_data, batch_markers
 
+    @property
+    def column_metadata_cache(self) -> ColumnMetadataCache:
+        """Cache of reflected column metadata of tables (and custom queries), shared by metrics."""
+        return self._column_metadata_cache
+
+    def invalidate_column_metadata(
+        self, table_name: Optional[str] = None, schema_name: Optional[str] = None
+    ) -> None:
+        """Discards cached column metadata of table (or of all tables of schema, or of all tables, if neither is given).
+
+        Reflection cache of SQLAlchemy "Inspector" is discarded as well, so that columns are reflected from database.
+        """  # noqa: E501
+        self._column_metadata_cache.invalidate(table_selectable=table_name, schema_name=schema_name)
+        self._inspector = None
+
     def get_inspector(self) -> sqlalchemy.engine.reflection.Inspector:
         if self._inspector is None:
             if version.parse(sa.__version__) < version.parse("1.4"):
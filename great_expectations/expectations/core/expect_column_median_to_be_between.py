@@ -11,6 +11,7 @@ from great_expectations.expectations.expectation import (
     ColumnAggregateExpectation,
     render_evaluation_parameter_string,
 )
+from great_expectations.expectations.registry import get_metric_kwargs
 from great_expectations.render import LegacyRendererType, RenderedStringTemplateContent
 from great_expectations.render.renderer.renderer import renderer
 from great_expectations.render.renderer_configuration import (
@@ -22,6 +23,7 @@ from great_expectations.render.util import (
     parse_row_condition_string_pandas_engine,
     substitute_none_for_missing,
 )
+from great_expectations.validator.metric_configuration import MetricConfiguration
 
 if TYPE_CHECKING:
     from great_expectations.core import (
@@ -32,6 +34,9 @@ if TYPE_CHECKING:
         ExpectationConfiguration,
     )
     from great_expectations.render.renderer_configuration import AddParamArgs
+    from great_expectations.validator.validator import (
+        ValidationDependencies,
+    )
 
 
 class ExpectColumnMedianToBeBetween(ColumnAggregateExpectation):
@@ -55,6 +60,9 @@ class ExpectColumnMedianToBeBetween(ColumnAggregateExpectation):
             If True, the column median must be strictly larger than min_value, default=False
         strict_max (boolean): \
             If True, the column median must be strictly smaller than max_value, default=False
+        approximate (boolean): \
+            If True, the column median is estimated from mergeable quantile sketch (single pass over column, with \
+            bounded memory, for every backend) instead of being computed exactly, default=False
 
     Other Parameters:
         result_format (str or None): \
@@ -147,6 +155,7 @@ class ExpectColumnMedianToBeBetween(ColumnAggregateExpectation):
     max_value: Union[float, EvaluationParameterDict, datetime, None] = None
     strict_min: bool = False
     strict_max: bool = False
+    approximate: bool = False
 
     # This dictionary contains metadata for display in the public gallery
     library_metadata = {
@@ -165,6 +174,7 @@ class ExpectColumnMedianToBeBetween(ColumnAggregateExpectation):
         "strict_min",
         "max_value",
         "strict_max",
+        "approximate",
     )
 
     args_keys = (
@@ -287,6 +297,36 @@ class ExpectColumnMedianToBeBetween(ColumnAggregateExpectation):
             )
         ]
 
+    @override
+    def get_validation_dependencies(
+        self,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> ValidationDependencies:
+        validation_dependencies: ValidationDependencies = super().get_validation_dependencies(
+            execution_engine, runtime_configuration
+        )
+        if self._get_success_kwargs().get("approximate"):
+            # Sketch is also obtained, so as to report its normalized rank error.
+            validation_dependencies.remove_metric_configuration(metric_name="column.median")
+            metric_name: str
+            for metric_name in ("column.approximate_median", "column.quantile_sketch"):
+                metric_kwargs: dict = get_metric_kwargs(
+                    metric_name=metric_name,
+                    configuration=self.configuration,
+                    runtime_configuration=runtime_configuration,
+                )
+                validation_dependencies.set_metric_configuration(
+                    metric_name=metric_name,
+                    metric_configuration=MetricConfiguration(
+                        metric_name=metric_name,
+                        metric_domain_kwargs=metric_kwargs["metric_domain_kwargs"],
+                        metric_value_kwargs=metric_kwargs["metric_value_kwargs"],
+                    ),
+                )
+
+        return validation_dependencies
+
     @override
     def _validate(
         self,
@@ -294,9 +334,21 @@ class ExpectColumnMedianToBeBetween(ColumnAggregateExpectation):
         runtime_configuration: Optional[dict] = None,
         execution_engine: Optional[ExecutionEngine] = None,
     ):
-        return self._validate_metric_value_between(
-            metric_name="column.median",
+        if not self._get_success_kwargs().get("approximate"):
+            return self._validate_metric_value_between(
+                metric_name="column.median",
+                metrics=metrics,
+                runtime_configuration=runtime_configuration,
+                execution_engine=execution_engine,
+            )
+
+        validation_result: dict = self._validate_metric_value_between(
+            metric_name="column.approximate_median",
             metrics=metrics,
             runtime_configuration=runtime_configuration,
             execution_engine=execution_engine,
         )
+        validation_result["result"]["details"] = {
+            "normalized_rank_error": metrics["column.quantile_sketch"].normalized_rank_error
+        }
+        return validation_result
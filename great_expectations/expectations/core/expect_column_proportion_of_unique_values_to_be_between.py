@@ -3,6 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import TYPE_CHECKING, Dict, Optional, Union
 
+from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.evaluation_parameters import (
     EvaluationParameterDict,  # noqa: TCH001
 )
@@ -10,6 +11,7 @@ from great_expectations.expectations.expectation import (
     ColumnAggregateExpectation,
     render_evaluation_parameter_string,
 )
+from great_expectations.expectations.registry import get_metric_kwargs
 from great_expectations.render import (
     LegacyDescriptiveRendererType,
     LegacyRendererType,
@@ -25,6 +27,7 @@ from great_expectations.render.util import (
     parse_row_condition_string_pandas_engine,
     substitute_none_for_missing,
 )
+from great_expectations.validator.metric_configuration import MetricConfiguration
 
 if TYPE_CHECKING:
     from great_expectations.core import (
@@ -35,6 +38,9 @@ if TYPE_CHECKING:
         ExpectationConfiguration,
     )
     from great_expectations.render.renderer_configuration import AddParamArgs
+    from great_expectations.validator.validator import (
+        ValidationDependencies,
+    )
 
 
 class ExpectColumnProportionOfUniqueValuesToBeBetween(ColumnAggregateExpectation):
@@ -61,6 +67,9 @@ class ExpectColumnProportionOfUniqueValuesToBeBetween(ColumnAggregateExpectation
             If True, the minimum proportion of unique values must be strictly larger than min_value, default=False
         strict_max (boolean): \
             If True, the maximum proportion of unique values must be strictly smaller than max_value, default=False
+        approximate (boolean): \
+            If True, the number of unique values is estimated (HyperLogLog sketch, or native approximate distinct \
+            count of SQL dialect, if available) instead of being computed exactly, default=False
 
     Other Parameters:
         result_format (str or None): \
@@ -154,6 +163,7 @@ class ExpectColumnProportionOfUniqueValuesToBeBetween(ColumnAggregateExpectation
     max_value: Union[float, EvaluationParameterDict, datetime, None] = None
     strict_min: bool = False
     strict_max: bool = False
+    approximate: bool = False
 
     # This dictionary contains metadata for display in the public gallery
     library_metadata = {
@@ -172,6 +182,7 @@ class ExpectColumnProportionOfUniqueValuesToBeBetween(ColumnAggregateExpectation
         "strict_min",
         "max_value",
         "strict_max",
+        "approximate",
     )
 
     args_keys = (
@@ -326,14 +337,49 @@ class ExpectColumnProportionOfUniqueValuesToBeBetween(ColumnAggregateExpectation
         else:
             return [template_string_object, f"{100 * observed_value:.1f}%"]
 
+    @override
+    def get_validation_dependencies(
+        self,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> ValidationDependencies:
+        validation_dependencies: ValidationDependencies = super().get_validation_dependencies(
+            execution_engine, runtime_configuration
+        )
+        if self._get_success_kwargs().get("approximate"):
+            # Approximate metric avoids materializing distinct values (of high-cardinality columns).
+            validation_dependencies.remove_metric_configuration(
+                metric_name="column.unique_proportion"
+            )
+            metric_kwargs: dict = get_metric_kwargs(
+                metric_name="column.approximate_unique_proportion",
+                configuration=self.configuration,
+                runtime_configuration=runtime_configuration,
+            )
+            validation_dependencies.set_metric_configuration(
+                metric_name="column.approximate_unique_proportion",
+                metric_configuration=MetricConfiguration(
+                    metric_name="column.approximate_unique_proportion",
+                    metric_domain_kwargs=metric_kwargs["metric_domain_kwargs"],
+                    metric_value_kwargs=metric_kwargs["metric_value_kwargs"],
+                ),
+            )
+
+        return validation_dependencies
+
     def _validate(
         self,
         metrics: Dict,
         runtime_configuration: Optional[dict] = None,
         execution_engine: Optional[ExecutionEngine] = None,
     ):
+        metric_name: str = (
+            "column.approximate_unique_proportion"
+            if self._get_success_kwargs().get("approximate")
+            else "column.unique_proportion"
+        )
         return self._validate_metric_value_between(
-            metric_name="column.unique_proportion",
+            metric_name=metric_name,
             metrics=metrics,
             runtime_configuration=runtime_configuration,
             execution_engine=execution_engine,
@@ -12,6 +12,7 @@ from great_expectations.expectations.expectation import (
     ColumnAggregateExpectation,
     render_evaluation_parameter_string,
 )
+from great_expectations.expectations.registry import get_metric_kwargs
 from great_expectations.render import (
     AtomicDiagnosticRendererType,
     AtomicPrescriptiveRendererType,
@@ -35,6 +36,7 @@ from great_expectations.render.util import (
     substitute_none_for_missing,
 )
 from great_expectations.util import isclose
+from great_expectations.validator.metric_configuration import MetricConfiguration
 
 if TYPE_CHECKING:
     from great_expectations.core import (
@@ -76,8 +78,12 @@ class ExpectColumnQuantileValuesToBeBetween(ColumnAggregateExpectation):
             Key 'value_ranges' is a list of 2-value lists that specify a lower and upper bound (inclusive) \
             for the corresponding quantile (with [min, max] ordering). The length of the 'quantiles' list \
             and the 'value_ranges' list must be equal.
-        allow_relative_error (boolean or string): \
-            Whether to allow relative error in quantile communications on backends that support or require it.
+        allow_relative_error (boolean, string, or float): \
+            Whether to allow relative error in quantile communications on backends that support or require it; \
+            if approximate is True, float between 0 and 1 specifies normalized rank error of quantile sketch.
+        approximate (boolean): \
+            If True, quantiles are estimated from mergeable quantile sketch (single pass over column, with bounded \
+            memory, for every backend) instead of being computed exactly, default=False
 
     Other Parameters:
         result_format (str or None): \
@@ -216,7 +222,8 @@ class ExpectColumnQuantileValuesToBeBetween(ColumnAggregateExpectation):
     """  # noqa: E501
 
     quantile_ranges: QuantileRange
-    allow_relative_error: Union[bool, str] = False
+    allow_relative_error: Union[bool, str, float] = False
+    approximate: bool = False
 
     # This dictionary contains metadata for display in the public gallery
     library_metadata = {
@@ -232,6 +239,7 @@ class ExpectColumnQuantileValuesToBeBetween(ColumnAggregateExpectation):
     success_keys = (
         "quantile_ranges",
         "allow_relative_error",
+        "approximate",
     )
 
     args_keys = (
@@ -649,19 +657,46 @@ class ExpectColumnQuantileValuesToBeBetween(ColumnAggregateExpectation):
             execution_engine, runtime_configuration
         )
         configuration = self.configuration
-        # column.quantile_values expects a "quantiles" key
+        if self._get_success_kwargs().get("approximate"):
+            # Sketch is also obtained, so as to report its normalized rank error.
+            validation_dependencies.remove_metric_configuration(
+                metric_name="column.quantile_values"
+            )
+            metric_name: str
+            for metric_name in ("column.approximate_quantile_values", "column.quantile_sketch"):
+                metric_kwargs: dict = get_metric_kwargs(
+                    metric_name=metric_name,
+                    configuration=configuration,
+                    runtime_configuration=runtime_configuration,
+                )
+                validation_dependencies.set_metric_configuration(
+                    metric_name=metric_name,
+                    metric_configuration=MetricConfiguration(
+                        metric_name=metric_name,
+                        metric_domain_kwargs=metric_kwargs["metric_domain_kwargs"],
+                        metric_value_kwargs=metric_kwargs["metric_value_kwargs"],
+                    ),
+                )
+
+        # column.quantile_values (and column.approximate_quantile_values) expects a "quantiles" key
         validation_dependencies.get_metric_configuration(
-            metric_name="column.quantile_values"
+            metric_name=self._get_quantile_values_metric_name()
         ).metric_value_kwargs["quantiles"] = configuration.kwargs["quantile_ranges"]["quantiles"]
         return validation_dependencies
 
+    def _get_quantile_values_metric_name(self) -> str:
+        if self._get_success_kwargs().get("approximate"):
+            return "column.approximate_quantile_values"
+
+        return "column.quantile_values"
+
     def _validate(
         self,
         metrics: Dict,
         runtime_configuration: Optional[dict] = None,
         execution_engine: Optional[ExecutionEngine] = None,
     ):
-        quantile_vals = metrics.get("column.quantile_values")
+        quantile_vals = metrics.get(self._get_quantile_values_metric_name())
         quantile_ranges = self.configuration.kwargs.get("quantile_ranges")
         quantiles = quantile_ranges["quantiles"]
         quantile_value_ranges = quantile_ranges["value_ranges"]
@@ -689,10 +724,16 @@ class ExpectColumnQuantileValuesToBeBetween(ColumnAggregateExpectation):
             for idx, range_ in enumerate(comparison_quantile_ranges)
         ]
 
+        details: dict = {"success_details": success_details}
+        if self._get_success_kwargs().get("approximate"):
+            details["normalized_rank_error"] = metrics[
+                "column.quantile_sketch"
+            ].normalized_rank_error
+
         return {
             "success": np.all(success_details),
             "result": {
                 "observed_value": {"quantiles": quantiles, "values": quantile_vals},
-                "details": {"success_details": success_details},
+                "details": details,
             },
         }
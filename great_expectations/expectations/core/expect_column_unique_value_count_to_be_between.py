@@ -3,6 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import TYPE_CHECKING, Dict, Optional, Union
 
+from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.evaluation_parameters import (
     EvaluationParameterDict,  # noqa: TCH001
 )
@@ -10,6 +11,7 @@ from great_expectations.expectations.expectation import (
     ColumnAggregateExpectation,
     render_evaluation_parameter_string,
 )
+from great_expectations.expectations.registry import get_metric_kwargs
 from great_expectations.render import (
     LegacyDescriptiveRendererType,
     LegacyRendererType,
@@ -26,6 +28,7 @@ from great_expectations.render.util import (
     parse_row_condition_string_pandas_engine,
     substitute_none_for_missing,
 )
+from great_expectations.validator.metric_configuration import MetricConfiguration
 
 if TYPE_CHECKING:
     from great_expectations.core import (
@@ -36,6 +39,9 @@ if TYPE_CHECKING:
         ExpectationConfiguration,
     )
     from great_expectations.render.renderer_configuration import AddParamArgs
+    from great_expectations.validator.validator import (
+        ValidationDependencies,
+    )
 
 
 class ExpectColumnUniqueValueCountToBeBetween(ColumnAggregateExpectation):
@@ -55,6 +61,9 @@ class ExpectColumnUniqueValueCountToBeBetween(ColumnAggregateExpectation):
             The minimum number of unique values allowed.
         max_value (int or None): \
             The maximum number of unique values allowed.
+        approximate (boolean): \
+            If True, the number of unique values is estimated (HyperLogLog sketch, or native approximate distinct \
+            count of SQL dialect, if available) instead of being computed exactly, default=False
 
     Other Parameters:
         result_format (str or None): \
@@ -146,6 +155,7 @@ class ExpectColumnUniqueValueCountToBeBetween(ColumnAggregateExpectation):
     max_value: Union[float, EvaluationParameterDict, datetime, None] = None
     strict_min: bool = False
     strict_max: bool = False
+    approximate: bool = False
 
     # This dictionary contains metadata for display in the public gallery
     library_metadata = {
@@ -162,6 +172,7 @@ class ExpectColumnUniqueValueCountToBeBetween(ColumnAggregateExpectation):
     success_keys = (
         "min_value",
         "max_value",
+        "approximate",
     )
 
     args_keys = (
@@ -331,14 +342,49 @@ class ExpectColumnUniqueValueCountToBeBetween(ColumnAggregateExpectation):
         else:
             return [template_string_object, observed_value]
 
+    @override
+    def get_validation_dependencies(
+        self,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> ValidationDependencies:
+        validation_dependencies: ValidationDependencies = super().get_validation_dependencies(
+            execution_engine, runtime_configuration
+        )
+        if self._get_success_kwargs().get("approximate"):
+            # Approximate metric avoids materializing distinct values (of high-cardinality columns).
+            validation_dependencies.remove_metric_configuration(
+                metric_name="column.distinct_values.count"
+            )
+            metric_kwargs: dict = get_metric_kwargs(
+                metric_name="column.approximate_distinct_values.count",
+                configuration=self.configuration,
+                runtime_configuration=runtime_configuration,
+            )
+            validation_dependencies.set_metric_configuration(
+                metric_name="column.approximate_distinct_values.count",
+                metric_configuration=MetricConfiguration(
+                    metric_name="column.approximate_distinct_values.count",
+                    metric_domain_kwargs=metric_kwargs["metric_domain_kwargs"],
+                    metric_value_kwargs=metric_kwargs["metric_value_kwargs"],
+                ),
+            )
+
+        return validation_dependencies
+
     def _validate(
         self,
         metrics: Dict,
         runtime_configuration: Optional[dict] = None,
         execution_engine: Optional[ExecutionEngine] = None,
     ):
+        metric_name: str = (
+            "column.approximate_distinct_values.count"
+            if self._get_success_kwargs().get("approximate")
+            else "column.distinct_values.count"
+        )
         return self._validate_metric_value_between(
-            metric_name="column.distinct_values.count",
+            metric_name=metric_name,
             metrics=metrics,
             runtime_configuration=runtime_configuration,
             execution_engine=execution_engine,
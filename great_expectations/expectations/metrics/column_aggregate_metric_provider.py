@@ -51,7 +51,8 @@ def column_aggregate_value(
 
     Args:
         engine: The `ExecutionEngine` used to to evaluate the condition
-        **kwargs: Arguments passed to specified function
+        **kwargs: Arguments passed to specified function; "vectorized_reduction" (name of equivalent Pandas reduction,
+            e.g., "max") allows PandasExecutionEngine to compute the metric for many columns in one bundled pass.
 
     Returns:
         An annotated metric_function which will be called with a simplified signature.
@@ -95,6 +96,9 @@ def column_aggregate_value(
                     _metrics=metrics,
                 )
 
+            inner_func.vectorized_reduction = kwargs.get("vectorized_reduction")  # type: ignore[attr-defined]
+            inner_func.filter_column_isnull = kwargs.get("filter_column_isnull")  # type: ignore[attr-defined]
+
             return inner_func
 
         return wrapper
@@ -1,3 +1,7 @@
+from .column_approximate_distinct_values import (
+    ColumnApproximateDistinctValuesCount,
+    ColumnHyperLogLogSketch,
+)
 from .column_distinct_values import (
     ColumnDistinctValues,
     ColumnDistinctValuesCount,
@@ -13,7 +17,15 @@ from .column_parameterized_distribution_ks_test_p_value import (
     ColumnParameterizedDistributionKSTestPValue,
 )
 from .column_partition import ColumnPartition
-from .column_proportion_of_unique_values import ColumnUniqueProportion
+from .column_proportion_of_unique_values import (
+    ColumnApproximateUniqueProportion,
+    ColumnUniqueProportion,
+)
+from .column_quantile_sketch import (
+    ColumnApproximateMedian,
+    ColumnApproximateQuantileValues,
+    ColumnQuantileSketch,
+)
 from .column_quantile_values import ColumnQuantileValues
 from .column_standard_deviation import ColumnStandardDeviation
 from .column_sum import ColumnSum
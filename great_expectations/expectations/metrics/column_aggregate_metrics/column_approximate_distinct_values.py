@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, Iterable
+
+from great_expectations.compatibility.pyspark import functions as F
+from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
+from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.execution_engine import (
+    PandasExecutionEngine,
+    SparkDFExecutionEngine,
+    SqlAlchemyExecutionEngine,
+)
+from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
+from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
+    ColumnAggregateMetricProvider,
+    column_aggregate_partial,
+    column_aggregate_value,
+)
+from great_expectations.expectations.metrics.metric_provider import metric_value
+from great_expectations.expectations.metrics.sketches.hll import HyperLogLogSketch
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from great_expectations.compatibility import pyspark, sqlalchemy
+
+# Relative (standard) error of distinct values count estimate, unless "allow_relative_error" is
+# given.
+DEFAULT_DISTINCT_VALUES_COUNT_RELATIVE_ERROR = 0.01
+
+# Number of values added to HyperLogLog sketch at a time (bounds memory of hashing Pandas column).
+HYPERLOGLOG_SKETCH_CHUNK_SIZE = 1000000
+
+# Native (server-side) approximate distinct count functions of SQL dialects (other dialects use exact "COUNT(DISTINCT)").  # noqa: E501
+SQL_DIALECT_APPROXIMATE_COUNT_DISTINCT_FUNCTIONS: Dict[GXSqlDialect, str] = {
+    GXSqlDialect.BIGQUERY: "approx_count_distinct",
+    GXSqlDialect.DATABRICKS: "approx_count_distinct",
+    GXSqlDialect.MSSQL: "approx_count_distinct",
+    GXSqlDialect.ORACLE: "approx_count_distinct",
+    GXSqlDialect.SNOWFLAKE: "approx_count_distinct",
+    GXSqlDialect.AWSATHENA: "approx_distinct",
+    GXSqlDialect.TRINO: "approx_distinct",
+    GXSqlDialect.VERTICA: "approximate_count_distinct",
+}
+
+
+def build_hyperloglog_sketch(allow_relative_error: Any = None) -> HyperLogLogSketch:
+    """Builds empty HyperLogLog sketch, whose relative error is "allow_relative_error" (if float between 0 and 1)."""  # noqa: E501
+    if isinstance(allow_relative_error, bool) or not isinstance(allow_relative_error, float):
+        allow_relative_error = DEFAULT_DISTINCT_VALUES_COUNT_RELATIVE_ERROR
+
+    return HyperLogLogSketch.from_relative_error(relative_error=allow_relative_error)
+
+
+def build_hyperloglog_sketch_from_pandas_series(
+    column: pd.Series, allow_relative_error: Any = None
+) -> HyperLogLogSketch:
+    """Summarizes Pandas column with HyperLogLog sketch in chunks (nulls are ignored)."""
+    sketch: HyperLogLogSketch = build_hyperloglog_sketch(allow_relative_error=allow_relative_error)
+
+    start: int
+    for start in range(0, len(column), HYPERLOGLOG_SKETCH_CHUNK_SIZE):
+        sketch.update(column.iloc[start : start + HYPERLOGLOG_SKETCH_CHUNK_SIZE])
+
+    return sketch
+
+
+class ColumnHyperLogLogSketch(ColumnAggregateMetricProvider):
+    """Mergeable HyperLogLog sketch of column values, whose size does not depend on number of distinct values.
+
+    Pandas hashes column in chunks; Spark merges sketches of individual partitions (built by "mapPartitions"), so that
+    distinct values are never collected to driver.
+    """  # noqa: E501
+
+    metric_name = "column.hyperloglog_sketch"
+    value_keys = ("allow_relative_error",)
+
+    default_kwarg_values = {"allow_relative_error": DEFAULT_DISTINCT_VALUES_COUNT_RELATIVE_ERROR}
+
+    @column_aggregate_value(engine=PandasExecutionEngine)  # type: ignore[misc] # untyped-decorator
+    def _pandas(
+        cls, column: pd.Series, allow_relative_error: Any = None, **kwargs
+    ) -> HyperLogLogSketch:
+        return build_hyperloglog_sketch_from_pandas_series(
+            column=column, allow_relative_error=allow_relative_error
+        )
+
+    @metric_value(engine=SparkDFExecutionEngine)
+    def _spark(
+        cls,
+        execution_engine: SparkDFExecutionEngine,
+        metric_domain_kwargs: dict,
+        metric_value_kwargs: dict,
+        **kwargs,
+    ) -> HyperLogLogSketch:
+        df: pyspark.DataFrame
+        accessor_domain_kwargs: Dict[str, str]
+        df, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
+            domain_kwargs=metric_domain_kwargs, domain_type=MetricDomainTypes.COLUMN
+        )
+        allow_relative_error: Any = metric_value_kwargs.get("allow_relative_error")
+
+        def _build_partition_sketch(rows: Iterable) -> Iterable[HyperLogLogSketch]:
+            partition_sketch: HyperLogLogSketch = build_hyperloglog_sketch(
+                allow_relative_error=allow_relative_error
+            )
+            partition_sketch.update([row[0] for row in rows])
+            yield partition_sketch
+
+        return (
+            df.select(accessor_domain_kwargs["column"])
+            .rdd.mapPartitions(_build_partition_sketch)
+            .fold(
+                build_hyperloglog_sketch(allow_relative_error=allow_relative_error),
+                lambda left, right: left.merge(right),
+            )
+        )
+
+
+class ColumnApproximateDistinctValuesCount(ColumnAggregateMetricProvider):
+    """Approximate number of distinct (non-null) column values, computed without materializing distinct values.
+
+    Pandas estimates count using HyperLogLog sketch, Spark uses its native HyperLogLog++ ("approx_count_distinct"), and
+    SQL uses dialect-native approximate distinct count function, if available (otherwise, exact "COUNT(DISTINCT)",
+    which is also computed entirely by database).
+    """  # noqa: E501
+
+    metric_name = "column.approximate_distinct_values.count"
+    value_keys = ("allow_relative_error",)
+
+    default_kwarg_values = {"allow_relative_error": DEFAULT_DISTINCT_VALUES_COUNT_RELATIVE_ERROR}
+
+    @column_aggregate_value(engine=PandasExecutionEngine)  # type: ignore[misc] # untyped-decorator
+    def _pandas(cls, column: pd.Series, allow_relative_error: Any = None, **kwargs) -> int:
+        return build_hyperloglog_sketch_from_pandas_series(
+            column=column, allow_relative_error=allow_relative_error
+        ).estimate()
+
+    @column_aggregate_partial(engine=SqlAlchemyExecutionEngine)  # type: ignore[misc] # untyped-decorator
+    def _sqlalchemy(
+        cls,
+        column: sqlalchemy.ColumnClause,
+        _dialect,
+        **kwargs,
+    ) -> sqlalchemy.Selectable:
+        function_name: str | None = SQL_DIALECT_APPROXIMATE_COUNT_DISTINCT_FUNCTIONS.get(
+            _dialect.name.lower()
+        )
+        if function_name is None:
+            return sa.func.count(sa.distinct(column))
+
+        return getattr(sa.func, function_name)(column)
+
+    @column_aggregate_partial(engine=SparkDFExecutionEngine)  # type: ignore[misc] # untyped-decorator
+    def _spark(
+        cls,
+        column: pyspark.Column,
+        allow_relative_error: Any = None,
+        **kwargs,
+    ) -> pyspark.Column:
+        if isinstance(allow_relative_error, bool) or not isinstance(allow_relative_error, float):
+            allow_relative_error = DEFAULT_DISTINCT_VALUES_COUNT_RELATIVE_ERROR
+
+        return F.approx_count_distinct(column, rsd=allow_relative_error)
@@ -18,7 +18,7 @@ class ColumnMax(ColumnAggregateMetricProvider):
     metric_name = "column.max"
     value_keys = ()
 
-    @column_aggregate_value(engine=PandasExecutionEngine)
+    @column_aggregate_value(engine=PandasExecutionEngine, vectorized_reduction="max")
     def _pandas(cls, column, **kwargs):
         return column.max()
 
@@ -21,7 +21,7 @@ class ColumnMean(ColumnAggregateMetricProvider):
 
     metric_name = "column.mean"
 
-    @column_aggregate_value(engine=PandasExecutionEngine)
+    @column_aggregate_value(engine=PandasExecutionEngine, vectorized_reduction="mean")
     def _pandas(cls, column, **kwargs):
         """Pandas Mean Implementation"""
         convert_pandas_series_decimal_to_float_dtype(data=column, inplace=True)
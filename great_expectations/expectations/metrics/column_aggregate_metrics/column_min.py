@@ -18,7 +18,7 @@ class ColumnMin(ColumnAggregateMetricProvider):
     metric_name = "column.min"
     value_keys = ()
 
-    @column_aggregate_value(engine=PandasExecutionEngine)
+    @column_aggregate_value(engine=PandasExecutionEngine, vectorized_reduction="min")
     def _pandas(cls, column, **kwargs):
         return column.min()
 
@@ -15,6 +15,9 @@ from great_expectations.execution_engine import (
 from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
     ColumnAggregateMetricProvider,
 )
+from great_expectations.expectations.metrics.column_aggregate_metrics.column_approximate_distinct_values import (  # noqa: E501
+    DEFAULT_DISTINCT_VALUES_COUNT_RELATIVE_ERROR,
+)
 from great_expectations.expectations.metrics.metric_provider import metric_value
 from great_expectations.validator.metric_configuration import MetricConfiguration
 
@@ -24,17 +27,18 @@ if TYPE_CHECKING:
     )
 
 
-def unique_proportion(_metrics):
+def unique_proportion(_metrics, distinct_values_count_metric_name="column.distinct_values.count"):
     """Computes the proportion of unique non-null values out of all non-null values"""
     total_values = _metrics.get("table.row_count")
-    unique_values = _metrics.get("column.distinct_values.count")
+    unique_values = _metrics.get(distinct_values_count_metric_name)
     null_count = _metrics.get(
         f"column_values.nonnull.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}"
     )
 
     # Ensuring that we do not divide by 0, returning 0 if all values are nulls (we only consider non-nulls unique values)  # noqa: E501
     if total_values > 0 and total_values != null_count:
-        return unique_values / (total_values - null_count)
+        # Approximate distinct values count may slightly exceed number of non-null values.
+        return min(unique_values / (total_values - null_count), 1.0)
     else:
         return 0
 
@@ -83,3 +87,65 @@ class ColumnUniqueProportion(ColumnAggregateMetricProvider):
         )
 
         return dependencies
+
+
+class ColumnApproximateUniqueProportion(ColumnAggregateMetricProvider):
+    """Proportion of unique non-null values, based on "column.approximate_distinct_values.count" (no distinct values are materialized)."""  # noqa: E501
+
+    metric_name = "column.approximate_unique_proportion"
+    value_keys = ("allow_relative_error",)
+
+    default_kwarg_values = {"allow_relative_error": DEFAULT_DISTINCT_VALUES_COUNT_RELATIVE_ERROR}
+
+    @metric_value(engine=PandasExecutionEngine)
+    def _pandas(*args, metrics, **kwargs):
+        return unique_proportion(
+            metrics, distinct_values_count_metric_name="column.approximate_distinct_values.count"
+        )
+
+    @metric_value(engine=SqlAlchemyExecutionEngine)
+    def _sqlalchemy(*args, metrics, **kwargs):
+        return unique_proportion(
+            metrics, distinct_values_count_metric_name="column.approximate_distinct_values.count"
+        )
+
+    @metric_value(engine=SparkDFExecutionEngine)
+    def _spark(*args, metrics, **kwargs):
+        return unique_proportion(
+            metrics, distinct_values_count_metric_name="column.approximate_distinct_values.count"
+        )
+
+    @classmethod
+    @override
+    def _get_evaluation_dependencies(
+        cls,
+        metric: MetricConfiguration,
+        configuration: Optional[ExpectationConfiguration] = None,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[dict] = None,
+    ):
+        dependencies: dict = super()._get_evaluation_dependencies(
+            metric=metric,
+            configuration=configuration,
+            execution_engine=execution_engine,
+            runtime_configuration=runtime_configuration,
+        )
+
+        dependencies["column.approximate_distinct_values.count"] = MetricConfiguration(
+            metric_name="column.approximate_distinct_values.count",
+            metric_domain_kwargs=metric.metric_domain_kwargs,
+            metric_value_kwargs={
+                "allow_relative_error": metric.metric_value_kwargs.get(
+                    "allow_relative_error", DEFAULT_DISTINCT_VALUES_COUNT_RELATIVE_ERROR
+                )
+            },
+        )
+
+        dependencies[
+            f"column_values.nonnull.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}"
+        ] = MetricConfiguration(
+            metric_name=f"column_values.nonnull.{SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value}",
+            metric_domain_kwargs=metric.metric_domain_kwargs,
+        )
+
+        return dependencies
@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
+from great_expectations.compatibility.typing_extensions import override
+from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.execution_engine import (
+    ExecutionEngine,
+    PandasExecutionEngine,
+    SparkDFExecutionEngine,
+    SqlAlchemyExecutionEngine,
+)
+from great_expectations.expectations.metrics.column_aggregate_metric_provider import (
+    ColumnAggregateMetricProvider,
+)
+from great_expectations.expectations.metrics.metric_provider import metric_value
+from great_expectations.expectations.metrics.sketches.kll import KLLQuantileSketch
+from great_expectations.validator.metric_configuration import MetricConfiguration
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from great_expectations.compatibility import pyspark
+    from great_expectations.expectations.expectation_configuration import (
+        ExpectationConfiguration,
+    )
+
+# Normalized rank error of quantile sketch, unless "allow_relative_error" specifies (float) error
+# explicitly.
+DEFAULT_QUANTILE_SKETCH_RELATIVE_ERROR = 0.01
+
+# Number of values (Pandas) or rows (SQL) added to quantile sketch at a time (bounds memory of
+# single pass over column).
+QUANTILE_SKETCH_CHUNK_SIZE = 100000
+
+
+def build_quantile_sketch(allow_relative_error: Any = None) -> KLLQuantileSketch:
+    """Builds empty quantile sketch, whose normalized rank error is "allow_relative_error" (if float
+    between 0 and 1).
+
+    Non-float values (e.g., "True", "False", or "None") of "allow_relative_error" select default
+    error (1%).
+    """
+    if isinstance(allow_relative_error, bool) or not isinstance(allow_relative_error, float):
+        allow_relative_error = DEFAULT_QUANTILE_SKETCH_RELATIVE_ERROR
+
+    return KLLQuantileSketch.from_relative_error(relative_error=allow_relative_error)
+
+
+def build_quantile_sketch_from_pandas_series(
+    column: pd.Series, allow_relative_error: Any = None
+) -> KLLQuantileSketch:
+    """Summarizes Pandas column with quantile sketch in chunks (nulls are ignored)."""
+    sketch: KLLQuantileSketch = build_quantile_sketch(allow_relative_error=allow_relative_error)
+
+    start: int
+    for start in range(0, len(column), QUANTILE_SKETCH_CHUNK_SIZE):
+        sketch.update(
+            column.iloc[start : start + QUANTILE_SKETCH_CHUNK_SIZE].to_numpy(
+                dtype=np.float64, na_value=np.nan
+            )
+        )
+
+    return sketch
+
+
+class ColumnQuantileSketch(ColumnAggregateMetricProvider):
+    """Mergeable quantile sketch ("KLLQuantileSketch") of numeric column, built in single pass with
+    bounded memory.
+
+    Unlike "column.quantile_values", which sorts entire column (Pandas) or relies on
+    dialect-specific percentile functions (SQL), sketch is computed uniformly by all engines: Pandas
+    in chunks, Spark as merge of per-partition sketches ("mapPartitions"), and SQL by streaming
+    fetch of column values.  Normalized rank error of sketch is specified by float
+    "allow_relative_error" (between 0 and 1).
+    """
+
+    metric_name = "column.quantile_sketch"
+    value_keys = ("allow_relative_error",)
+
+    default_kwarg_values = {"allow_relative_error": DEFAULT_QUANTILE_SKETCH_RELATIVE_ERROR}
+
+    @metric_value(engine=PandasExecutionEngine)
+    def _pandas(
+        cls,
+        execution_engine: PandasExecutionEngine,
+        metric_domain_kwargs: dict,
+        metric_value_kwargs: dict,
+        **kwargs,
+    ) -> KLLQuantileSketch:
+        df: pd.DataFrame
+        accessor_domain_kwargs: Dict[str, str]
+        df, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
+            domain_kwargs=metric_domain_kwargs, domain_type=MetricDomainTypes.COLUMN
+        )
+        return build_quantile_sketch_from_pandas_series(
+            column=df[accessor_domain_kwargs["column"]],
+            allow_relative_error=metric_value_kwargs.get("allow_relative_error"),
+        )
+
+    @metric_value(engine=SqlAlchemyExecutionEngine)
+    def _sqlalchemy(
+        cls,
+        execution_engine: SqlAlchemyExecutionEngine,
+        metric_domain_kwargs: dict,
+        metric_value_kwargs: dict,
+        **kwargs,
+    ) -> KLLQuantileSketch:
+        selectable: sa.sql.Selectable
+        accessor_domain_kwargs: Dict[str, str]
+        selectable, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
+            domain_kwargs=metric_domain_kwargs, domain_type=MetricDomainTypes.COLUMN
+        )
+        column = sa.column(accessor_domain_kwargs["column"])
+
+        sketch: KLLQuantileSketch = build_quantile_sketch(
+            allow_relative_error=metric_value_kwargs.get("allow_relative_error")
+        )
+
+        query = (
+            sa.select(column)
+            .where(column != None)  # noqa: E711
+            .select_from(selectable)
+            .execution_options(stream_results=True)
+        )
+        with execution_engine.get_connection() as connection:
+            result = connection.execute(query)
+            rows: List[Any] = result.fetchmany(QUANTILE_SKETCH_CHUNK_SIZE)
+            while rows:
+                sketch.update([row[0] for row in rows])
+                rows = result.fetchmany(QUANTILE_SKETCH_CHUNK_SIZE)
+
+        return sketch
+
+    @metric_value(engine=SparkDFExecutionEngine)
+    def _spark(
+        cls,
+        execution_engine: SparkDFExecutionEngine,
+        metric_domain_kwargs: dict,
+        metric_value_kwargs: dict,
+        **kwargs,
+    ) -> KLLQuantileSketch:
+        df: pyspark.DataFrame
+        accessor_domain_kwargs: Dict[str, str]
+        df, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
+            domain_kwargs=metric_domain_kwargs, domain_type=MetricDomainTypes.COLUMN
+        )
+        allow_relative_error: Any = metric_value_kwargs.get("allow_relative_error")
+
+        def _build_partition_sketch(rows: Iterable) -> Iterable[KLLQuantileSketch]:
+            partition_sketch: KLLQuantileSketch = build_quantile_sketch(
+                allow_relative_error=allow_relative_error
+            )
+            partition_sketch.update([row[0] for row in rows])
+            yield partition_sketch
+
+        return (
+            df.select(accessor_domain_kwargs["column"])
+            .rdd.mapPartitions(_build_partition_sketch)
+            .fold(
+                build_quantile_sketch(allow_relative_error=allow_relative_error),
+                lambda left, right: left.merge(right),
+            )
+        )
+
+
+class ColumnApproximateQuantileValues(ColumnAggregateMetricProvider):
+    """Approximate quantiles of numeric column, obtained from "column.quantile_sketch" (for any
+    engine)."""
+
+    metric_name = "column.approximate_quantile_values"
+    value_keys = ("quantiles", "allow_relative_error")
+
+    default_kwarg_values = {"allow_relative_error": DEFAULT_QUANTILE_SKETCH_RELATIVE_ERROR}
+
+    @metric_value(engine=PandasExecutionEngine)
+    def _pandas(*args, metric_value_kwargs, metrics, **kwargs):
+        return metrics["column.quantile_sketch"].quantiles(metric_value_kwargs["quantiles"])
+
+    @metric_value(engine=SqlAlchemyExecutionEngine)
+    def _sqlalchemy(*args, metric_value_kwargs, metrics, **kwargs):
+        return metrics["column.quantile_sketch"].quantiles(metric_value_kwargs["quantiles"])
+
+    @metric_value(engine=SparkDFExecutionEngine)
+    def _spark(*args, metric_value_kwargs, metrics, **kwargs):
+        return metrics["column.quantile_sketch"].quantiles(metric_value_kwargs["quantiles"])
+
+    @classmethod
+    @override
+    def _get_evaluation_dependencies(
+        cls,
+        metric: MetricConfiguration,
+        configuration: Optional[ExpectationConfiguration] = None,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[dict] = None,
+    ):
+        dependencies: dict = super()._get_evaluation_dependencies(
+            metric=metric,
+            configuration=configuration,
+            execution_engine=execution_engine,
+            runtime_configuration=runtime_configuration,
+        )
+
+        dependencies["column.quantile_sketch"] = MetricConfiguration(
+            metric_name="column.quantile_sketch",
+            metric_domain_kwargs=metric.metric_domain_kwargs,
+            metric_value_kwargs={
+                "allow_relative_error": metric.metric_value_kwargs.get(
+                    "allow_relative_error", DEFAULT_QUANTILE_SKETCH_RELATIVE_ERROR
+                )
+            },
+        )
+
+        return dependencies
+
+
+class ColumnApproximateMedian(ColumnAggregateMetricProvider):
+    """Approximate median of numeric column, obtained from "column.quantile_sketch" (for any
+    engine)."""
+
+    metric_name = "column.approximate_median"
+    value_keys = ("allow_relative_error",)
+
+    default_kwarg_values = {"allow_relative_error": DEFAULT_QUANTILE_SKETCH_RELATIVE_ERROR}
+
+    @metric_value(engine=PandasExecutionEngine)
+    def _pandas(*args, metrics, **kwargs):
+        return metrics["column.quantile_sketch"].quantiles([0.5])[0]
+
+    @metric_value(engine=SqlAlchemyExecutionEngine)
+    def _sqlalchemy(*args, metrics, **kwargs):
+        return metrics["column.quantile_sketch"].quantiles([0.5])[0]
+
+    @metric_value(engine=SparkDFExecutionEngine)
+    def _spark(*args, metrics, **kwargs):
+        return metrics["column.quantile_sketch"].quantiles([0.5])[0]
+
+    @classmethod
+    @override
+    def _get_evaluation_dependencies(
+        cls,
+        metric: MetricConfiguration,
+        configuration: Optional[ExpectationConfiguration] = None,
+        execution_engine: Optional[ExecutionEngine] = None,
+        runtime_configuration: Optional[dict] = None,
+    ):
+        dependencies: dict = super()._get_evaluation_dependencies(
+            metric=metric,
+            configuration=configuration,
+            execution_engine=execution_engine,
+            runtime_configuration=runtime_configuration,
+        )
+
+        dependencies["column.quantile_sketch"] = MetricConfiguration(
+            metric_name="column.quantile_sketch",
+            metric_domain_kwargs=metric.metric_domain_kwargs,
+            metric_value_kwargs={
+                "allow_relative_error": metric.metric_value_kwargs.get(
+                    "allow_relative_error", DEFAULT_QUANTILE_SKETCH_RELATIVE_ERROR
+                )
+            },
+        )
+
+        return dependencies
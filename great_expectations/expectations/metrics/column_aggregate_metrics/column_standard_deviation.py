@@ -37,7 +37,7 @@ class ColumnStandardDeviation(ColumnAggregateMetricProvider):
 
     metric_name = "column.standard_deviation"
 
-    @column_aggregate_value(engine=PandasExecutionEngine)
+    @column_aggregate_value(engine=PandasExecutionEngine, vectorized_reduction="std")
     def _pandas(cls, column, **kwargs):
         """Pandas Standard Deviation implementation"""
         convert_pandas_series_decimal_to_float_dtype(data=column, inplace=True)
@@ -18,7 +18,7 @@ from great_expectations.util import convert_pandas_series_decimal_to_float_dtype
 class ColumnSum(ColumnAggregateMetricProvider):
     metric_name = "column.sum"
 
-    @column_aggregate_value(engine=PandasExecutionEngine)
+    @column_aggregate_value(engine=PandasExecutionEngine, vectorized_reduction="sum")
     def _pandas(cls, column, **kwargs):
         convert_pandas_series_decimal_to_float_dtype(data=column, inplace=True)
         return column.sum()
@@ -11,6 +11,7 @@ from typing import (
 )
 
 import numpy as np
+import pandas as pd
 
 import great_expectations.exceptions as gx_exceptions
 from great_expectations.compatibility import sqlalchemy
@@ -39,8 +40,6 @@ from great_expectations.util import (
 )
 
 if TYPE_CHECKING:
-    import pandas as pd
-
     from great_expectations.execution_engine import (
         PandasExecutionEngine,
         SparkDFExecutionEngine,
@@ -121,20 +120,47 @@ def _pandas_map_condition_index(
         domain_column_name_list = column_list
 
     result_format = metric_value_kwargs["result_format"]
-    domain_records_df = domain_records_df[boolean_mapped_unexpected_values]
+    # only first "partial_unexpected_count" unexpected rows are extracted, unless all are reported
+    domain_records_df = _pandas_get_unexpected_records(
+        domain_records_df=domain_records_df,
+        boolean_mapped_unexpected_values=boolean_mapped_unexpected_values,
+        limit=None
+        if result_format["result_format"] == "COMPLETE"
+        else result_format["partial_unexpected_count"],
+    )
 
-    unexpected_index_list: Union[List[int], List[Dict[str, Any]]] = (
-        compute_unexpected_pandas_indices(
-            domain_records_df=domain_records_df,
-            result_format=result_format,
-            execution_engine=execution_engine,
-            metrics=metrics,
-            expectation_domain_column_list=domain_column_name_list,
-        )
+    return compute_unexpected_pandas_indices(
+        domain_records_df=domain_records_df,
+        result_format=result_format,
+        execution_engine=execution_engine,
+        metrics=metrics,
+        expectation_domain_column_list=domain_column_name_list,
     )
-    if result_format["result_format"] == "COMPLETE":
-        return unexpected_index_list
-    return unexpected_index_list[: result_format["partial_unexpected_count"]]
+
+
+def _pandas_get_unexpected_records(
+    domain_records_df: pd.DataFrame,
+    boolean_mapped_unexpected_values: Union[pd.Series, np.ndarray],
+    limit: Optional[int] = None,
+) -> pd.DataFrame:
+    """Returns unexpected rows of DataFrame (only first "limit" rows, if "limit" is given).
+
+    When boolean mask is aligned with DataFrame, positions of first "limit" unexpected rows are
+    looked up in mask, so that only these rows (rather than all unexpected rows) are copied.
+    """
+    if limit is not None and (
+        not isinstance(boolean_mapped_unexpected_values, pd.Series)
+        or boolean_mapped_unexpected_values.index.equals(domain_records_df.index)
+    ):
+        mask: np.ndarray = np.asarray(boolean_mapped_unexpected_values)
+        if mask.dtype == np.bool_ and mask.shape == (len(domain_records_df),):
+            return domain_records_df.iloc[np.flatnonzero(mask)[:limit]]
+
+    domain_records_df = domain_records_df[boolean_mapped_unexpected_values]
+    if limit is None:
+        return domain_records_df
+
+    return domain_records_df.iloc[:limit]
 
 
 def _pandas_map_condition_query(
@@ -732,7 +758,9 @@ def _spark_map_condition_index(  # noqa: C901 - too complex
         filtered = filtered.limit(result_format["partial_unexpected_count"])
 
     # Prune the dataframe down only the columns we care about
-    filtered = filtered.select(columns_to_keep)
+    filtered = filtered.select(
+        unexpected_index_column_names if exclude_unexpected_values else columns_to_keep
+    )
 
     return _get_spark_customized_unexpected_index_list(
         exclude_unexpected_values=exclude_unexpected_values,
@@ -819,20 +847,15 @@ def _get_sqlalchemy_customized_unexpected_index_list(
         primary_key_dict_list: dict[str, List[Any]] = {
             idx_col: [] for idx_col in unexpected_index_column_names
         }
-        for row in query_result:
-            for index in range(len(unexpected_index_column_names)):
-                primary_key_dict_list[unexpected_index_column_names[index]].append(row[index])
+        # index columns are selected first
+        for column_name, column_values in zip(unexpected_index_column_names, zip(*query_result)):
+            primary_key_dict_list[column_name] = list(column_values)
         unexpected_index_list.append(primary_key_dict_list)
 
     else:
-        for row in query_result:
-            primary_key_dict: Dict[str, Any] = {}
-            # add the actual unexpected value
-            all_columns = unexpected_index_column_names + domain_column_name_list
-            for index in range(len(all_columns)):
-                name: str = all_columns[index]
-                primary_key_dict[name] = row[index]
-            unexpected_index_list.append(primary_key_dict)
+        # add the actual unexpected value
+        all_columns = unexpected_index_column_names + domain_column_name_list
+        unexpected_index_list = [dict(zip(all_columns, row)) for row in query_result]
 
     return unexpected_index_list
 
@@ -843,22 +866,17 @@ def _get_spark_customized_unexpected_index_list(
     filtered: pyspark.sql.dataframe.DataFrame,
     columns_to_keep: List[str],
 ) -> Union[List[Dict[str, Any]], None]:
-    unexpected_index_list: List[Dict[str, Any]] = []
+    if exclude_unexpected_values:
+        # only index columns are selected (see "_spark_map_condition_index()")
+        rows: list = filtered.collect()
+        if not rows:
+            return []
 
-    if exclude_unexpected_values and not filtered.isEmpty():
         dict_list_to_add: dict[str, List[Any]] = {
             idx_col: [] for idx_col in unexpected_index_column_names
         }
-        for row in filtered.collect():
-            for col_name in unexpected_index_column_names:
-                dict_list_to_add[col_name].append(row[col_name])
-        unexpected_index_list.append(dict_list_to_add)
-
-    else:
-        for row in filtered.collect():
-            dict_to_add: dict = {}
-            for col_name in columns_to_keep:
-                dict_to_add[col_name] = row[col_name]
-            unexpected_index_list.append(dict_to_add)
+        for col_name, column_values in zip(unexpected_index_column_names, zip(*rows)):
+            dict_list_to_add[col_name] = list(column_values)
+        return [dict_list_to_add]
 
-    return unexpected_index_list
+    return [dict(zip(columns_to_keep, row)) for row in filtered.collect()]
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import datetime
+import math
+import numbers
+from typing import Iterable, List
+
+import numpy as np
+import pandas as pd
+
+MIN_PRECISION = 4
+MAX_PRECISION = 18
+DEFAULT_PRECISION = 14
+
+_HASH_BITS = 64
+
+# Floats with integral values of smaller magnitude are hashed as (equal) integers.
+_INT64_BOUND = 2.0**63
+
+_DATETIME_SALT = np.uint64(0x9E3779B97F4A7C15)
+
+
+class HyperLogLogSketch:
+    """Mergeable cardinality sketch (Flajolet, Fusy, Gandouet, Meunier, "HyperLogLog: the analysis of a near-optimal
+    cardinality estimation algorithm"), with linear counting correction for small cardinalities.
+
+    Every (non-null) value is hashed to 64 bits (deterministically, using "pandas.util.hash_pandas_object()", so that
+    sketches built in different processes can be merged); values are normalized before hashing (integral floats and
+    booleans to integers, datetimes to UTC nanoseconds, other non-numeric objects to strings), so that equal values hash
+    equally, regardless of dtype, which Pandas inferred for part of data, where they occur.  First "precision" bits
+    select one of 2^precision registers, which retains maximum position of leftmost 1-bit among remaining bits.  Sketch
+    occupies 2^precision bytes, regardless of number of distinct values, and sketches of disjoint parts of data merge
+    by element-wise maximum.
+
+    Args:
+        precision: number of bits, addressing registers (relative standard error is approximately 1.04/2^(precision/2))
+    """  # noqa: E501
+
+    def __init__(self, precision: int = DEFAULT_PRECISION) -> None:
+        if not MIN_PRECISION <= precision <= MAX_PRECISION:
+            raise ValueError(  # noqa: TRY003
+                f"HyperLogLogSketch requires precision to be between {MIN_PRECISION} and {MAX_PRECISION}."  # noqa: E501
+            )
+
+        self._precision = precision
+        self._registers: np.ndarray = np.zeros(2**precision, dtype=np.uint8)
+
+    @classmethod
+    def from_relative_error(cls, relative_error: float) -> HyperLogLogSketch:
+        """Builds smallest sketch, whose relative standard error does not exceed "relative_error" (between 0 and 1)."""  # noqa: E501
+        if not 0.0 < relative_error < 1.0:
+            raise ValueError(  # noqa: TRY003
+                "HyperLogLogSketch requires relative error to be a float between 0 and 1."
+            )
+
+        precision: int = math.ceil(2.0 * math.log2(1.04 / relative_error))
+        return cls(precision=min(max(precision, MIN_PRECISION), MAX_PRECISION))
+
+    @property
+    def precision(self) -> int:
+        return self._precision
+
+    @property
+    def relative_error(self) -> float:
+        """Relative standard error of cardinality estimate."""
+        return 1.04 / math.sqrt(self._registers.size)
+
+    def update(self, values: Iterable) -> HyperLogLogSketch:
+        """Adds values (array-like; nulls and NaN values are ignored) to sketch."""
+        series: pd.Series = values if isinstance(values, pd.Series) else pd.Series(list(values))
+        series = series.dropna()
+        if series.empty:
+            return self
+
+        return self.update_hashes(hashes=_hash_values(series=series))
+
+    def update_hashes(self, hashes: np.ndarray) -> HyperLogLogSketch:
+        """Adds values, already hashed to (uniformly distributed) 64-bit unsigned integers."""
+        remaining_bits: int = _HASH_BITS - self._precision
+        indexes: np.ndarray = (hashes >> np.uint64(remaining_bits)).astype(np.int64)
+        remainders: np.ndarray = hashes & np.uint64((1 << remaining_bits) - 1)
+        ranks: np.ndarray = (remaining_bits - _bit_length(remainders) + 1).astype(np.uint8)
+        np.maximum.at(self._registers, indexes, ranks)
+        return self
+
+    def merge(self, other: HyperLogLogSketch) -> HyperLogLogSketch:
+        """Merges other sketch (of same precision) into this sketch (in place)."""
+        if other.precision != self._precision:
+            raise ValueError(  # noqa: TRY003
+                "Only HyperLogLogSketch objects of equal precision can be merged."
+            )
+
+        np.maximum(self._registers, other._registers, out=self._registers)
+        return self
+
+    def estimate(self) -> int:
+        """Returns estimated number of distinct values, added to sketch."""
+        m: int = self._registers.size
+        alpha: float = 0.7213 / (1.0 + 1.079 / m)
+        raw_estimate: float = (
+            alpha * m * m / float(np.sum(np.exp2(-self._registers.astype(np.float64))))
+        )
+
+        empty_registers: int = int(np.count_nonzero(self._registers == 0))
+        if raw_estimate <= 2.5 * m and empty_registers > 0:
+            return int(round(m * math.log(m / empty_registers)))
+
+        return int(round(raw_estimate))
+
+
+def _bit_length(values: np.ndarray) -> np.ndarray:
+    # Splitting into 32-bit halves keeps conversion to float (hence, exponent from "frexp") exact.
+    high: np.ndarray = (values >> np.uint64(32)).astype(np.float64)
+    low: np.ndarray = (values & np.uint64(0xFFFFFFFF)).astype(np.float64)
+    return np.where(high > 0, 32 + np.frexp(high)[1], np.frexp(low)[1])
+
+
+def _hash_values(series: pd.Series) -> np.ndarray:
+    """Hashes (non-null) values by their normalized form, independent of dtype of "series"."""
+    if pd.api.types.is_bool_dtype(series.dtype) or pd.api.types.is_integer_dtype(series.dtype):
+        return _hash_array(series.to_numpy(dtype=np.int64))
+
+    if pd.api.types.is_float_dtype(series.dtype):
+        return _hash_floats(series.to_numpy(dtype=np.float64))
+
+    if pd.api.types.is_datetime64_any_dtype(series.dtype):
+        return _hash_datetimes(series)
+
+    return _hash_object_values(series.tolist())
+
+
+def _hash_object_values(values: List[object]) -> np.ndarray:
+    """Hashes values of mixed types (of "object" dtype), grouped by their normalized type."""
+    integers: List[int] = []
+    floats: List[float] = []
+    datetimes: List[object] = []
+    strings: List[str] = []
+    value: object
+    for value in values:
+        if isinstance(value, (bool, np.bool_, numbers.Integral)) and (
+            -_INT64_BOUND <= int(value) < _INT64_BOUND
+        ):
+            integers.append(int(value))
+        elif isinstance(value, numbers.Real) and not isinstance(value, numbers.Integral):
+            floats.append(float(value))
+        elif isinstance(value, (datetime.datetime, np.datetime64)):
+            datetimes.append(value)
+        else:
+            strings.append(str(value))
+
+    hashes: List[np.ndarray] = [
+        _hash_array(np.asarray(integers, dtype=np.int64)),
+        _hash_floats(np.asarray(floats, dtype=np.float64)),
+        _hash_array(np.asarray(strings, dtype=object)),
+    ]
+    if datetimes:
+        try:
+            hashes.append(_hash_datetimes(pd.Series(pd.to_datetime(datetimes, utc=True))))
+        except (TypeError, ValueError):
+            hashes.append(
+                _hash_array(np.asarray([str(value) for value in datetimes], dtype=object))
+            )
+
+    return np.concatenate(hashes)
+
+
+def _hash_floats(values: np.ndarray) -> np.ndarray:
+    integral: np.ndarray = np.isfinite(values) & (np.floor(values) == values)
+    integral &= np.abs(values) < _INT64_BOUND
+    return np.concatenate(
+        [_hash_array(values[integral].astype(np.int64)), _hash_array(values[~integral])]
+    )
+
+
+def _hash_datetimes(series: pd.Series) -> np.ndarray:
+    if series.dt.tz is not None:
+        series = series.dt.tz_convert("UTC").dt.tz_localize(None)
+
+    # Hashes of nanoseconds since epoch are salted, so as to differ from those of equal integers.
+    return _hash_array(series.astype("datetime64[ns]").to_numpy().view(np.int64)) ^ _DATETIME_SALT
+
+
+def _hash_array(values: np.ndarray) -> np.ndarray:
+    if values.size == 0:
+        return np.empty(0, dtype=np.uint64)
+
+    return pd.util.hash_pandas_object(pd.Series(values), index=False).to_numpy(dtype=np.uint64)
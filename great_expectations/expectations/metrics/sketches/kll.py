@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import math
+from typing import Iterable, List, Optional, Sequence
+
+import numpy as np
+
+# Empirical constants of normalized rank error (99% confidence) of KLL sketch as function of "k"
+# (parameter controlling its size); see "getNormalizedRankError()" of Apache DataSketches KLL
+# implementation.
+_RANK_ERROR_COEFFICIENT = 2.296
+_RANK_ERROR_EXPONENT = 0.9723
+
+MIN_K = 8
+MAX_K = 65535
+DEFAULT_K = 200
+
+# Ratio, by which capacities of consecutive (lower) compactors decrease.
+_CAPACITY_DECAY = 2.0 / 3.0
+
+
+class KLLQuantileSketch:
+    """Mergeable streaming quantile sketch (Karnin, Lang, Liberty, "Optimal Quantile Approximation
+    in Streams").
+
+    The sketch retains O(k) numeric values, organized into levels ("compactors"); every value at
+    level "h" stands for 2^h values of stream.  When level exceeds its capacity, its sorted values
+    are halved (every other value, starting at random offset, is promoted to next level).  Sketches,
+    built over disjoint parts of data (Pandas chunks, Spark partitions, batches of SQL rows), are
+    merged into sketch of their union with same error guarantee.
+
+    Args:
+        k: parameter controlling size and accuracy of sketch (normalized rank error is approximately
+            1.65% for k=200)
+        seed: seed of random number generator, used to choose compaction offsets (for reproducible
+            results)
+    """
+
+    def __init__(self, k: int = DEFAULT_K, seed: Optional[int] = None) -> None:
+        if not MIN_K <= k <= MAX_K:
+            raise ValueError(f"KLLQuantileSketch requires k to be between {MIN_K} and {MAX_K}.")  # noqa: TRY003
+
+        self._k = k
+        self._rng = np.random.default_rng(seed)
+        self._levels: List[np.ndarray] = [np.empty(0, dtype=np.float64)]
+        self._n = 0
+        self._min_value: Optional[float] = None
+        self._max_value: Optional[float] = None
+
+    @classmethod
+    def from_relative_error(
+        cls, relative_error: float, seed: Optional[int] = None
+    ) -> KLLQuantileSketch:
+        """Builds smallest sketch, whose normalized rank error does not exceed "relative_error"
+        (between 0 and 1)."""
+        if not 0.0 < relative_error < 1.0:
+            raise ValueError(  # noqa: TRY003
+                "KLLQuantileSketch requires relative error to be a float between 0 and 1."
+            )
+
+        k: int = math.ceil(
+            (_RANK_ERROR_COEFFICIENT / relative_error) ** (1.0 / _RANK_ERROR_EXPONENT)
+        )
+        return cls(k=min(max(k, MIN_K), MAX_K), seed=seed)
+
+    @property
+    def k(self) -> int:
+        return self._k
+
+    @property
+    def n(self) -> int:
+        """Number of (non-null) values summarized by sketch."""
+        return self._n
+
+    @property
+    def normalized_rank_error(self) -> float:
+        """Upper bound (with 99% confidence) on |rank(returned quantile) - q| for any requested
+        quantile "q"."""
+        return _RANK_ERROR_COEFFICIENT / self._k**_RANK_ERROR_EXPONENT
+
+    @property
+    def num_retained(self) -> int:
+        return sum(level.size for level in self._levels)
+
+    def update(self, values: Iterable) -> KLLQuantileSketch:
+        """Adds values (array-like of numbers; nulls and NaN values are ignored) to sketch."""
+        array: np.ndarray = np.asarray(
+            values if isinstance(values, (np.ndarray, Sequence)) else list(values),
+            dtype=np.float64,
+        ).ravel()
+        array = array[~np.isnan(array)]
+        if array.size == 0:
+            return self
+
+        self._n += array.size
+        self._update_bounds(min_value=float(array.min()), max_value=float(array.max()))
+        self._levels[0] = np.concatenate((self._levels[0], array))
+        self._compress()
+        return self
+
+    def merge(self, other: KLLQuantileSketch) -> KLLQuantileSketch:
+        """Merges other sketch into this sketch (in place); returns this sketch, which summarizes
+        union of data."""
+        if other.n == 0:
+            return self
+
+        while len(self._levels) < len(other._levels):
+            self._levels.append(np.empty(0, dtype=np.float64))
+
+        level: int
+        items: np.ndarray
+        for level, items in enumerate(other._levels):
+            self._levels[level] = np.concatenate((self._levels[level], items))
+
+        self._n += other.n
+        self._update_bounds(min_value=other._min_value, max_value=other._max_value)
+        self._compress()
+        return self
+
+    def quantiles(self, quantiles: Iterable[float]) -> List[Optional[float]]:
+        """Returns approximate values (retained by sketch) at given quantiles; None if sketch is
+        empty."""
+        quantiles = list(quantiles)
+        if self._n == 0:
+            return [None for _ in quantiles]
+
+        items: np.ndarray = np.concatenate(self._levels)
+        weights: np.ndarray = np.concatenate(
+            [
+                np.full(level_items.size, 2**level, dtype=np.float64)
+                for level, level_items in enumerate(self._levels)
+            ]
+        )
+        order: np.ndarray = np.argsort(items, kind="stable")
+        items = items[order]
+        cumulative_weights: np.ndarray = np.cumsum(weights[order])
+        total_weight: float = cumulative_weights[-1]
+
+        results: List[Optional[float]] = []
+        quantile: float
+        for quantile in quantiles:
+            if not 0.0 <= quantile <= 1.0:
+                raise ValueError("Quantiles must be between 0 and 1.")  # noqa: TRY003
+
+            if quantile == 0.0:
+                results.append(self._min_value)
+            elif quantile == 1.0:
+                results.append(self._max_value)
+            else:
+                idx: int = int(
+                    np.searchsorted(cumulative_weights, quantile * total_weight, side="left")
+                )
+                results.append(float(items[min(idx, items.size - 1)]))
+
+        return results
+
+    def _update_bounds(self, min_value: Optional[float], max_value: Optional[float]) -> None:
+        if min_value is not None and (self._min_value is None or min_value < self._min_value):
+            self._min_value = min_value
+
+        if max_value is not None and (self._max_value is None or max_value > self._max_value):
+            self._max_value = max_value
+
+    def _capacity(self, level: int) -> int:
+        depth: int = len(self._levels) - level - 1
+        return max(math.ceil(self._k * _CAPACITY_DECAY**depth), 2)
+
+    def _compress(self) -> None:
+        while self.num_retained > sum(self._capacity(level) for level in range(len(self._levels))):
+            level: int
+            for level in range(len(self._levels)):
+                if self._levels[level].size >= self._capacity(level):
+                    self._compact(level=level)
+                    break
+
+    def _compact(self, level: int) -> None:
+        if level + 1 == len(self._levels):
+            self._levels.append(np.empty(0, dtype=np.float64))
+
+        items: np.ndarray = np.sort(self._levels[level])
+        kept: np.ndarray = items[:0]
+        if items.size % 2 == 1:
+            kept = items[-1:]
+            items = items[:-1]
+
+        offset: int = int(self._rng.integers(2))
+        self._levels[level] = kept
+        self._levels[level + 1] = np.concatenate((self._levels[level + 1], items[offset::2]))
@@ -32,6 +32,10 @@ from great_expectations.execution_engine import (
 from great_expectations.execution_engine.sqlalchemy_batch_data import (
     SqlAlchemyBatchData,
 )
+from great_expectations.execution_engine.sqlalchemy_column_metadata_cache import (
+    ColumnMetadataCacheKey,
+    build_column_metadata_cache_key,
+)
 from great_expectations.execution_engine.sqlalchemy_dialect import (
     GXSqlDialect,
 )
@@ -369,6 +373,18 @@ def get_sqlalchemy_column_metadata(
     try:
         columns: Sequence[Dict[str, Any]]
 
+        # Reflected columns are reused (until they expire), since reflection queries may be slow.
+        cache_key: ColumnMetadataCacheKey = build_column_metadata_cache_key(
+            table_selectable=table_selectable, schema_name=schema_name
+        )
+        cached_columns: Optional[Sequence[Any]] = execution_engine.column_metadata_cache.get(
+            cache_key
+        )
+        if cached_columns is not None:
+            return _get_dialect_column_metadata(
+                execution_engine=execution_engine, columns=cached_columns
+            )
+
         engine = execution_engine.engine
         inspector = execution_engine.get_inspector()
         try:
@@ -414,20 +430,28 @@ def get_sqlalchemy_column_metadata(
                 sqlalchemy_engine=engine,
             )
 
-        dialect_name = execution_engine.dialect.name
-        if dialect_name == GXSqlDialect.SNOWFLAKE:
-            return [
-                # TODO: SmartColumn should know the dialect and do lookups based on that
-                CaseInsensitiveNameDict(column)
-                for column in columns
-            ]
+        execution_engine.column_metadata_cache.put(cache_key, columns)
 
-        return columns
+        return _get_dialect_column_metadata(execution_engine=execution_engine, columns=columns)
     except AttributeError as e:
         logger.debug(f"Error while introspecting columns: {e!r}", exc_info=e)
         return None
 
 
+def _get_dialect_column_metadata(
+    execution_engine: SqlAlchemyExecutionEngine, columns: Sequence[Any]
+) -> Sequence[Mapping[str, Any]]:
+    dialect_name = execution_engine.dialect.name
+    if dialect_name == GXSqlDialect.SNOWFLAKE:
+        return [
+            # TODO: SmartColumn should know the dialect and do lookups based on that
+            CaseInsensitiveNameDict(column)
+            for column in columns
+        ]
+
+    return columns
+
+
 def column_reflection_fallback(  # noqa: C901, PLR0915
     selectable: sqlalchemy.Select,
     dialect: sqlalchemy.Dialect,
@@ -1201,7 +1225,7 @@ def get_sqlalchemy_source_table_and_schema(
         return engine.batch_manager.active_batch_data.selectable
 
 
-def get_unexpected_indices_for_multiple_pandas_named_indices(  # noqa: C901
+def get_unexpected_indices_for_multiple_pandas_named_indices(
     domain_records_df: pd.DataFrame,
     unexpected_index_column_names: List[str],
     expectation_domain_column_list: List[str],
@@ -1225,9 +1249,7 @@ def get_unexpected_indices_for_multiple_pandas_named_indices(  # noqa: C901
         )
 
     domain_records_df_index_names: List[str] = domain_records_df.index.names
-    unexpected_indices: List[tuple[int | str, ...]] = list(domain_records_df.index)
 
-    tuple_index: Dict[str, int] = dict()
     for column_name in unexpected_index_column_names:
         if column_name not in domain_records_df_index_names:
             raise gx_exceptions.MetricResolutionError(
@@ -1235,33 +1257,22 @@ def get_unexpected_indices_for_multiple_pandas_named_indices(  # noqa: C901
                 f"Please check your configuration.",
                 failed_metrics=["unexpected_index_list"],
             )
-        else:
-            tuple_index[column_name] = domain_records_df_index_names.index(column_name, 0)
 
-    unexpected_index_list: List[Dict[str, Any]] = list()
+    index_values: Dict[str, List[Any]] = {
+        column_name: domain_records_df.index.get_level_values(
+            domain_records_df_index_names.index(column_name, 0)
+        ).tolist()
+        for column_name in unexpected_index_column_names
+    }
 
-    if exclude_unexpected_values and len(unexpected_indices) != 0:
-        primary_key_dict_list: dict[str, List[Any]] = {
-            idx_col: [] for idx_col in unexpected_index_column_names
-        }
-        for index in unexpected_indices:
-            for column_name in unexpected_index_column_names:
-                primary_key_dict_list[column_name].append(index[tuple_index[column_name]])
-
-        unexpected_index_list.append(primary_key_dict_list)
+    if exclude_unexpected_values and len(domain_records_df) != 0:
+        return [index_values]
 
-    else:
-        for index in unexpected_indices:
-            primary_key_dict: Dict[str, Any] = dict()
-            for domain_column_name in expectation_domain_column_list:
-                primary_key_dict[domain_column_name] = domain_records_df.at[
-                    index, domain_column_name
-                ]
-                for column_name in unexpected_index_column_names:
-                    primary_key_dict[column_name] = index[tuple_index[column_name]]
-            unexpected_index_list.append(primary_key_dict)
-
-    return unexpected_index_list
+    return _build_unexpected_index_records(
+        domain_records_df=domain_records_df,
+        expectation_domain_column_list=expectation_domain_column_list,
+        index_values=index_values,
+    )
 
 
 def get_unexpected_indices_for_single_pandas_named_index(
@@ -1284,8 +1295,6 @@ def get_unexpected_indices_for_single_pandas_named_index(
     """  # noqa: E501
     if not expectation_domain_column_list:
         return []
-    unexpected_index_values_by_named_index: List[int | str] = list(domain_records_df.index)
-    unexpected_index_list: List[Dict[str, Any]] = list()
     if not (
         len(unexpected_index_column_names) == 1
         and unexpected_index_column_names[0] == domain_records_df.index.name
@@ -1295,25 +1304,55 @@ def get_unexpected_indices_for_single_pandas_named_index(
             failed_metrics=["unexpected_index_list"],
         )
 
-    if exclude_unexpected_values and len(unexpected_index_values_by_named_index) != 0:
-        primary_key_dict_list: dict[str, List[Any]] = {unexpected_index_column_names[0]: []}
-        for index in unexpected_index_values_by_named_index:
-            primary_key_dict_list[unexpected_index_column_names[0]].append(index)
-        unexpected_index_list.append(primary_key_dict_list)
+    index_values: Dict[str, List[Any]] = {
+        unexpected_index_column_names[0]: domain_records_df.index.tolist()
+    }
 
-    else:
-        for index in unexpected_index_values_by_named_index:
-            primary_key_dict: Dict[str, Any] = dict()
-            for domain_column in expectation_domain_column_list:
-                primary_key_dict[domain_column] = domain_records_df.at[index, domain_column]
-            column_name: str = unexpected_index_column_names[0]
-            primary_key_dict[column_name] = index
-            unexpected_index_list.append(primary_key_dict)
+    if exclude_unexpected_values and len(domain_records_df) != 0:
+        return [index_values]
+
+    unexpected_index_list: List[Dict[str, Any]] = _build_unexpected_index_records(
+        domain_records_df=domain_records_df,
+        expectation_domain_column_list=expectation_domain_column_list,
+        index_values={},
+    )
+    # named index value follows values of all domain columns
+    index: int | str
+    for primary_key_dict, index in zip(
+        unexpected_index_list, index_values[unexpected_index_column_names[0]]
+    ):
+        primary_key_dict[unexpected_index_column_names[0]] = index
 
     return unexpected_index_list
 
 
-def compute_unexpected_pandas_indices(  # noqa: C901
+def _build_unexpected_index_records(
+    domain_records_df: pd.DataFrame,
+    expectation_domain_column_list: List[str],
+    index_values: Dict[str, List[Any]],
+) -> List[Dict[str, Any]]:
+    """Builds dict of values of domain columns and of index columns for every row of DataFrame.
+
+    Values are extracted column by column (rather than looked up row by row); keys of every dict
+    are ordered as first domain column, index columns, and remaining domain columns.
+    """
+    if not expectation_domain_column_list:
+        return [{} for _ in range(len(domain_records_df))]
+
+    column_values: Dict[str, List[Any]] = {
+        expectation_domain_column_list[0]: domain_records_df[
+            expectation_domain_column_list[0]
+        ].tolist()
+    }
+    column_values.update(index_values)
+    for domain_column_name in expectation_domain_column_list[1:]:
+        column_values[domain_column_name] = domain_records_df[domain_column_name].tolist()
+
+    column_names: List[str] = list(column_values)
+    return [dict(zip(column_names, row)) for row in zip(*column_values.values())]
+
+
+def compute_unexpected_pandas_indices(
     domain_records_df: pd.DataFrame,
     expectation_domain_column_list: List[str],
     result_format: Dict[str, Any],
@@ -1362,48 +1401,30 @@ def compute_unexpected_pandas_indices(  # noqa: C901
         )
     # named columns
     elif result_format.get("unexpected_index_column_names"):
-        unexpected_index_column_names = result_format["unexpected_index_column_names"]
-        unexpected_index_list = []
-        unexpected_indices: List[int | str] = list(domain_records_df.index)
-
-        if (
-            exclude_unexpected_values
-            and len(unexpected_indices) != 0
-            and len(unexpected_index_column_names) != 0
-        ):
-            primary_key_dict_list: dict[str, List[Any]] = {
-                idx_col: [] for idx_col in unexpected_index_column_names
-            }
-            for index in unexpected_indices:
-                for column_name in unexpected_index_column_names:
-                    column_name = get_dbms_compatible_column_names(  # noqa: PLW2901
-                        column_names=column_name,
-                        batch_columns_list=metrics["table.columns"],
-                        error_message_template='Error: The unexpected_index_column "{column_name:s}" does not exist in Dataframe. Please check your configuration and try again.',  # noqa: E501
-                    )
-                    primary_key_dict_list[column_name].append(
-                        domain_records_df.at[index, column_name]
-                    )
-            unexpected_index_list.append(primary_key_dict_list)
+        unexpected_index_column_names = [
+            get_dbms_compatible_column_names(
+                column_names=column_name,
+                batch_columns_list=metrics["table.columns"],
+                error_message_template='Error: The unexpected_index_column "{column_name:s}" does not exist in Dataframe. Please check your configuration and try again.',  # noqa: E501
+            )
+            for column_name in result_format["unexpected_index_column_names"]
+        ]
+        index_values: Dict[str, List[Any]] = {
+            column_name: domain_records_df[column_name].tolist()
+            for column_name in unexpected_index_column_names
+        }
 
+        if exclude_unexpected_values and len(domain_records_df) != 0:
+            unexpected_index_list = [index_values]
         else:
-            for index in unexpected_indices:
-                primary_key_dict: Dict[str, Any] = dict()
-                assert (
-                    expectation_domain_column_list
-                ), "`expectation_domain_column_list` was not provided"
-                for domain_column_name in expectation_domain_column_list:
-                    primary_key_dict[domain_column_name] = domain_records_df.at[
-                        index, domain_column_name
-                    ]
-                    for column_name in unexpected_index_column_names:
-                        column_name = get_dbms_compatible_column_names(  # noqa: PLW2901
-                            column_names=column_name,
-                            batch_columns_list=metrics["table.columns"],
-                            error_message_template='Error: The unexpected_index_column "{column_name:s}" does not exist in Dataframe. Please check your configuration and try again.',  # noqa: E501
-                        )
-                        primary_key_dict[column_name] = domain_records_df.at[index, column_name]
-                unexpected_index_list.append(primary_key_dict)
+            assert (
+                expectation_domain_column_list or len(domain_records_df) == 0
+            ), "`expectation_domain_column_list` was not provided"
+            unexpected_index_list = _build_unexpected_index_records(
+                domain_records_df=domain_records_df,
+                expectation_domain_column_list=expectation_domain_column_list,
+                index_values=index_values,
+            )
 
     else:
         unexpected_index_list = list(domain_records_df.index)
@@ -1,16 +1,21 @@
 from __future__ import annotations
 
+import concurrent.futures
+import hashlib
+import json
 import logging
+import multiprocessing
 import os
 import pathlib
 import traceback
 import urllib
 from collections import OrderedDict
-from typing import Any, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
+from great_expectations import __version__ as ge_version
 from great_expectations import exceptions
 from great_expectations.core import ExpectationSuite
-from great_expectations.core.util import nested_update
+from great_expectations.core.util import convert_to_json_serializable, nested_update
 from great_expectations.data_context.cloud_constants import GXCloudRESTResource
 from great_expectations.data_context.store.html_site_store import (
     HtmlSiteStore,
@@ -37,6 +42,44 @@ FALSEY_YAML_STRINGS = [
     "NONE",
 ]
 
+RENDERED_PAGES_MANIFEST_VERSION = 1
+
+# Number of stale pages, from which on pages are rendered in parallel worker processes.
+DEFAULT_PARALLEL_RENDER_MIN_PAGES = 50
+
+# Section builder, whose pages worker processes render (inherited by forked worker processes).
+_render_worker_site_section_builder: Optional[DefaultSiteSectionBuilder] = None
+
+
+def _render_page_in_worker(resource_key, serialized_resource) -> Tuple[Any, Optional[dict]]:
+    site_section_builder = _render_worker_site_section_builder
+    assert site_section_builder is not None
+    return site_section_builder._render_page(
+        resource_key=resource_key,
+        resource=site_section_builder._deserialize_resource(
+            resource_key=resource_key, serialized_resource=serialized_resource
+        ),
+    )
+
+
+def _get_render_config_fingerprint(
+    render_config: dict, directories: Tuple[Optional[str], ...]
+) -> str:
+    """Returns digest of page rendering configuration and of contents of custom directories."""
+    fingerprint = hashlib.md5(
+        json.dumps(render_config, sort_keys=True, default=str).encode("utf-8")
+    )
+    for directory in directories:
+        if directory is None or not os.path.isdir(directory):  # noqa: PTH112
+            continue
+
+        for file_path in sorted(pathlib.Path(directory).rglob("*")):
+            if file_path.is_file():
+                fingerprint.update(str(file_path.relative_to(directory)).encode("utf-8"))
+                fingerprint.update(file_path.read_bytes())
+
+    return fingerprint.hexdigest()
+
 
 class SiteBuilder:
     """SiteBuilder builds data documentation for the project defined by a
@@ -126,12 +169,14 @@ class SiteBuilder:
         cloud_mode=False,
         # <GX_RENAME> Deprecated 0.15.37
         ge_cloud_mode=False,
+        incremental_build=True,
         **kwargs,
     ) -> None:
         self.site_name = site_name
         self.data_context = data_context
         self.store_backend = store_backend
         self.show_how_to_buttons = show_how_to_buttons
+        self.incremental_build = incremental_build
         if ge_cloud_mode:
             cloud_mode = ge_cloud_mode
         self.cloud_mode = cloud_mode
@@ -305,21 +350,49 @@ class SiteBuilder:
 
         :param build_index: a flag if False, skips building the index page
 
+        If incremental_build is enabled (default), manifest of rendered pages (fingerprints of
+        resources, from which pages were rendered) is kept in site, so that only pages of new or
+        changed resources are rendered, and index is built from manifest, rather than by reading
+        every validation result again.
+
         :return:
         """
+        rendered_pages_manifest: Optional[dict] = None
+        if self.incremental_build and not self.cloud_mode:
+            rendered_pages_manifest = self.target_store.get_rendered_pages_manifest()
+            if rendered_pages_manifest.get("version") != RENDERED_PAGES_MANIFEST_VERSION:
+                rendered_pages_manifest = {"version": RENDERED_PAGES_MANIFEST_VERSION}
 
         # copy static assets
         for site_section_builder in self.site_section_builders.values():
-            site_section_builder.build(resource_identifiers=resource_identifiers)
+            if rendered_pages_manifest is not None and isinstance(
+                site_section_builder, DefaultSiteSectionBuilder
+            ):
+                site_section_builder.build(
+                    resource_identifiers=resource_identifiers,
+                    rendered_pages_manifest=rendered_pages_manifest,
+                )
+            else:
+                site_section_builder.build(resource_identifiers=resource_identifiers)
 
         # GX Cloud supports JSON Site Data Docs
         # Skip static assets, indexing
         if self.cloud_mode:
             return
 
+        if rendered_pages_manifest is not None:
+            self.target_store.set_rendered_pages_manifest(rendered_pages_manifest)
+
         self.target_store.copy_static_assets()
 
-        _, index_links_dict = self.site_index_builder.build(build_index=build_index)
+        if rendered_pages_manifest is not None and isinstance(
+            self.site_index_builder, DefaultSiteIndexBuilder
+        ):
+            _, index_links_dict = self.site_index_builder.build(
+                build_index=build_index, rendered_pages_manifest=rendered_pages_manifest
+            )
+        else:
+            _, index_links_dict = self.site_index_builder.build(build_index=build_index)
         return (
             self.get_resource_url(only_if_exists=False),
             index_links_dict,
@@ -360,6 +433,8 @@ class DefaultSiteSectionBuilder:
         cloud_mode=False,
         # <GX_RENAME> Deprecated 0.15.37
         ge_cloud_mode=False,
+        max_render_workers=None,
+        parallel_render_min_pages=DEFAULT_PARALLEL_RENDER_MIN_PAGES,
         **kwargs,
     ) -> None:
         self.name = name
@@ -368,6 +443,10 @@ class DefaultSiteSectionBuilder:
         self.target_store = target_store
         self.run_name_filter = run_name_filter
         self.validation_results_limit = validation_results_limit
+        # Number of worker processes, rendering stale pages (pages are rendered serially, unless it
+        # is set explicitly to more than 1).
+        self.max_render_workers = max_render_workers
+        self.parallel_render_min_pages = parallel_render_min_pages
         self.data_context_id = data_context_id
         self.show_how_to_buttons = show_how_to_buttons
         if ge_cloud_mode:
@@ -413,87 +492,339 @@ class DefaultSiteSectionBuilder:
                 class_name=view["class_name"],
             )
 
-    def build(self, resource_identifiers=None) -> None:  # noqa: C901, PLR0912
+        # Pages are also rendered again, once renderer or view configuration, custom styles or
+        # views, or Great Expectations version changes (see "_get_resource_fingerprint()").
+        self._render_config_fingerprint: str = _get_render_config_fingerprint(
+            render_config={"ge_version": ge_version, "renderer": renderer, "view": view},
+            directories=(custom_styles_directory, custom_views_directory),
+        )
+
+    def build(  # noqa: C901, PLR0912
+        self, resource_identifiers=None, rendered_pages_manifest: Optional[dict] = None
+    ) -> None:
+        """Renders page for every resource in source store (or only for "resource_identifiers").
+
+        If "rendered_pages_manifest" is supplied, pages, whose resources are unchanged since they
+        were last rendered (and which are still present in site), are skipped, and manifest is
+        updated with fingerprints of rendered resources.  Once many pages are stale, they are
+        rendered in parallel worker processes.
+        """
         source_store_keys = self.source_store.list_keys()
+
+        section_manifest: Optional[Dict[str, dict]] = None
+        if rendered_pages_manifest is not None and not self.cloud_mode:
+            section_manifest = rendered_pages_manifest.setdefault("sections", {}).setdefault(
+                self.name, {}
+            )
+            if not resource_identifiers:
+                # Resources, which are no longer in source store, are dropped from manifest.
+                manifest_keys: Set[str] = {
+                    self._get_manifest_key(resource_key) for resource_key in source_store_keys
+                }
+                for manifest_key in list(section_manifest):
+                    if manifest_key not in manifest_keys:
+                        del section_manifest[manifest_key]
+
         if self.name == "validations" and self.validation_results_limit:
             source_store_keys = sorted(
                 source_store_keys, key=lambda x: x.run_id.run_time, reverse=True
             )[: self.validation_results_limit]
 
-        for resource_key in source_store_keys:
-            # if no resource_identifiers are passed, the section
-            # builder will build
-            # a page for every key in its source store.
-            # if the caller did pass resource_identifiers, the section builder
-            # will build pages only for the specified resources
-            if resource_identifiers and resource_key not in resource_identifiers:
-                continue
-
-            if self.run_name_filter and not isinstance(resource_key, GXCloudIdentifier):
-                if not resource_key_passes_run_name_filter(resource_key, self.run_name_filter):
+        rendered_page_keys: Dict[type, Set[tuple]] = {}
+        stale_resources: List[Tuple[Any, Any, Optional[str]]] = []
+        render_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+        try:
+            for resource_key in source_store_keys:
+                # if no resource_identifiers are passed, the section
+                # builder will build
+                # a page for every key in its source store.
+                # if the caller did pass resource_identifiers, the section builder
+                # will build pages only for the specified resources
+                if resource_identifiers and resource_key not in resource_identifiers:
                     continue
-            try:
-                resource = self.source_store.get(resource_key)
-                if isinstance(resource_key, ExpectationSuiteIdentifier):
-                    resource = ExpectationSuite(**resource)
-            except exceptions.InvalidKeyError:
-                logger.warning(
-                    f"Object with Key: {resource_key!s} could not be retrieved. Skipping..."
-                )
-                continue
 
-            if isinstance(resource_key, ExpectationSuiteIdentifier):
-                expectation_suite_name = resource_key.name
-                logger.debug(f"        Rendering expectation suite {expectation_suite_name}")
-            elif isinstance(resource_key, ValidationResultIdentifier):
-                run_id = resource_key.run_id
-                run_name = run_id.run_name
-                run_time = run_id.run_time
-                expectation_suite_name = resource_key.expectation_suite_identifier.name
-                if self.name == "profiling":
-                    logger.debug(
-                        f"        Rendering profiling for batch {resource_key.batch_identifier}"
+                if self.run_name_filter and not isinstance(resource_key, GXCloudIdentifier):
+                    if not resource_key_passes_run_name_filter(resource_key, self.run_name_filter):
+                        continue
+                try:
+                    serialized_resource: Any = self._get_serialized_resource(resource_key)
+                except exceptions.InvalidKeyError:
+                    logger.warning(
+                        f"Object with Key: {resource_key!s} could not be retrieved. Skipping..."
                     )
-                else:
-                    logger.debug(
-                        f"        Rendering validation: run name: {run_name}, run time: {run_time}, suite {expectation_suite_name} for batch {resource_key.batch_identifier}"  # noqa: E501
+                    continue
+
+                fingerprint: Optional[str] = None
+                if section_manifest is not None:
+                    fingerprint = self._get_resource_fingerprint(serialized_resource)
+                    if (
+                        fingerprint is not None
+                        and section_manifest.get(self._get_manifest_key(resource_key), {}).get(
+                            "fingerprint"
+                        )
+                        == fingerprint
+                        and self._is_page_rendered(
+                            resource_key=resource_key, rendered_page_keys=rendered_page_keys
+                        )
+                    ):
+                        logger.debug(f"        Page of {resource_key!s} is up to date. Skipping...")
+                        continue
+
+                stale_resources.append((resource_key, serialized_resource, fingerprint))
+                if len(stale_resources) >= self.parallel_render_min_pages:
+                    if render_pool is None:
+                        render_pool = self._create_render_pool()
+
+                    self._render_pages(
+                        stale_resources=stale_resources,
+                        section_manifest=section_manifest,
+                        render_pool=render_pool,
                     )
+                    stale_resources = []
+
+            self._render_pages(
+                stale_resources=stale_resources,
+                section_manifest=section_manifest,
+                render_pool=render_pool,
+            )
+        finally:
+            if render_pool is not None:
+                render_pool.shutdown()
+
+    def _render_pages(
+        self,
+        stale_resources: List[Tuple[Any, Any, Optional[str]]],
+        section_manifest: Optional[Dict[str, dict]],
+        render_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None,
+    ) -> None:
+        """Renders and writes pages of resources (in worker processes, if "render_pool" is set)."""
+        if not stale_resources:
+            return
+
+        results: List[Tuple[Any, Optional[dict], Optional[str]]] = []
+        if render_pool is not None:
+            results = self._render_pages_in_pool(
+                stale_resources=stale_resources, render_pool=render_pool
+            )
+
+        if not results:
+            results = self._render_pages_serially(stale_resources=stale_resources)
+
+        self._write_pages(
+            stale_resources=stale_resources, results=results, section_manifest=section_manifest
+        )
+
+    def _write_pages(
+        self,
+        stale_resources: List[Tuple[Any, Any, Optional[str]]],
+        results: List[Tuple[Any, Optional[dict], Optional[str]]],
+        section_manifest: Optional[Dict[str, dict]],
+    ) -> None:
+        """Writes rendered pages and records fingerprints of their resources in manifest."""
+        for (resource_key, _, fingerprint), (content, index_info, exception_message) in zip(
+            stale_resources, results
+        ):
+            error_message: Optional[str] = exception_message
+            if error_message is None:
+                try:
+                    self._write_page(resource_key=resource_key, content=content)
+                except Exception as e:
+                    error_message = self._format_render_exception(e)
+
+            if error_message is not None:
+                logger.error(error_message)
+                if section_manifest is not None:
+                    section_manifest.pop(self._get_manifest_key(resource_key), None)
+                continue
+
+            if section_manifest is not None and fingerprint is not None:
+                manifest_entry: dict = {"fingerprint": fingerprint}
+                if index_info is not None:
+                    manifest_entry["index_info"] = index_info
+
+                section_manifest[self._get_manifest_key(resource_key)] = manifest_entry
+
+    def _render_pages_in_pool(
+        self,
+        stale_resources: List[Tuple[Any, Any, Optional[str]]],
+        render_pool: concurrent.futures.ProcessPoolExecutor,
+    ) -> List[Tuple[Any, Optional[dict], Optional[str]]]:
+        """Returns (content, index information, exception message) of every page, rendered in
+        worker processes (empty list, if worker processes failed)."""
+        results: List[Tuple[Any, Optional[dict], Optional[str]]] = []
+        try:
+            futures = [
+                render_pool.submit(_render_page_in_worker, resource_key, serialized_resource)
+                for resource_key, serialized_resource, _ in stale_resources
+            ]
+            for future in futures:
+                try:
+                    content, index_info = future.result()
+                    results.append((content, index_info, None))
+                except concurrent.futures.process.BrokenProcessPool:
+                    raise
+                except Exception as e:
+                    results.append((None, None, self._format_render_exception(e)))
+        except concurrent.futures.process.BrokenProcessPool as e:
+            logger.warning(f"Rendering pages in worker processes failed ({e}); rendering serially.")
+            return []
+
+        return results
 
+    def _render_pages_serially(
+        self, stale_resources: List[Tuple[Any, Any, Optional[str]]]
+    ) -> List[Tuple[Any, Optional[dict], Optional[str]]]:
+        """Returns (content, index information, exception message) of every page."""
+        results: List[Tuple[Any, Optional[dict], Optional[str]]] = []
+        for resource_key, serialized_resource, _ in stale_resources:
             try:
-                rendered_content = self.renderer_class.render(resource)
-
-                if self.cloud_mode:
-                    self.target_store.set(
-                        GXCloudIdentifier(resource_type=GXCloudRESTResource.RENDERED_DATA_DOC),
-                        rendered_content,
-                        source_type=resource_key.resource_type,
-                        source_id=resource_key.id,
-                    )
-                else:
-                    viewable_content = self.view_class.render(
-                        rendered_content,
-                        data_context_id=self.data_context_id,
-                        show_how_to_buttons=self.show_how_to_buttons,
-                    )
-                    # Verify type
-                    self.target_store.set(
-                        SiteSectionIdentifier(
-                            site_section_name=self.name,
-                            resource_identifier=resource_key,
-                        ),
-                        viewable_content,
-                    )
+                content, index_info = self._render_page(
+                    resource_key=resource_key,
+                    resource=self._deserialize_resource(
+                        resource_key=resource_key, serialized_resource=serialized_resource
+                    ),
+                )
+                results.append((content, index_info, None))
             except Exception as e:
-                exception_message = """\
+                results.append((None, None, self._format_render_exception(e)))
+
+        return results
+
+    def _create_render_pool(self) -> Optional[concurrent.futures.ProcessPoolExecutor]:
+        """Returns pool of worker processes, which inherit this section builder (None if parallel rendering is unavailable)."""  # noqa: E501
+        global _render_worker_site_section_builder  # noqa: PLW0603
+
+        if (
+            self.cloud_mode
+            or self.max_render_workers is None
+            or self.max_render_workers <= 1
+            or "fork" not in multiprocessing.get_all_start_methods()
+        ):
+            return None
+
+        _render_worker_site_section_builder = self
+        return concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.max_render_workers, mp_context=multiprocessing.get_context("fork")
+        )
+
+    def _get_serialized_resource(self, resource_key) -> Any:
+        if self.cloud_mode:
+            return self.source_store.get(resource_key)
+
+        return self.source_store.store_backend.get(self.source_store.key_to_tuple(resource_key))
+
+    def _deserialize_resource(self, resource_key, serialized_resource) -> Any:
+        resource: Any = serialized_resource
+        if not self.cloud_mode:
+            resource = self.source_store.deserialize(resource) if resource else None
+
+        if isinstance(resource_key, ExpectationSuiteIdentifier):
+            resource = ExpectationSuite(**resource)
+
+        return resource
+
+    def _get_resource_fingerprint(self, serialized_resource) -> Optional[str]:
+        if isinstance(serialized_resource, str):
+            serialized_resource = serialized_resource.encode("utf-8")
+        elif not isinstance(serialized_resource, bytes):
+            try:
+                serialized_resource = json.dumps(
+                    serialized_resource, sort_keys=True, default=str
+                ).encode("utf-8")
+            except (TypeError, ValueError):
+                return None
+
+        # Options of page (e.g., how-to buttons) are also part of fingerprint.
+        fingerprint = hashlib.md5(
+            f"{self._render_config_fingerprint}:{self.show_how_to_buttons}:"
+            f"{self.data_context_id}:".encode()
+        )
+        fingerprint.update(serialized_resource)
+        return fingerprint.hexdigest()
+
+    @staticmethod
+    def _get_manifest_key(resource_key) -> str:
+        return "/".join(str(element) for element in resource_key.to_tuple())
+
+    def _is_page_rendered(self, resource_key, rendered_page_keys: Dict[type, Set[tuple]]) -> bool:
+        key_type: type = type(resource_key)
+        if key_type not in rendered_page_keys:
+            store_backend = self.target_store.store_backends.get(key_type)
+            rendered_page_keys[key_type] = (
+                set() if store_backend is None else set(store_backend.list_keys())
+            )
+
+        return resource_key.to_tuple() in rendered_page_keys[key_type]
+
+    def _render_page(self, resource_key, resource) -> Tuple[Any, Optional[dict]]:
+        """Returns rendered page of resource and information about resource, which index page shows."""  # noqa: E501
+        index_info: Optional[dict] = None
+        if isinstance(resource_key, ExpectationSuiteIdentifier):
+            expectation_suite_name = resource_key.name
+            logger.debug(f"        Rendering expectation suite {expectation_suite_name}")
+        elif isinstance(resource_key, ValidationResultIdentifier):
+            run_id = resource_key.run_id
+            run_name = run_id.run_name
+            run_time = run_id.run_time
+            expectation_suite_name = resource_key.expectation_suite_identifier.name
+            if self.name == "profiling":
+                logger.debug(
+                    f"        Rendering profiling for batch {resource_key.batch_identifier}"
+                )
+            else:
+                logger.debug(
+                    f"        Rendering validation: run name: {run_name}, run time: {run_time}, suite {expectation_suite_name} for batch {resource_key.batch_identifier}"  # noqa: E501
+                )
+
+            index_info = convert_to_json_serializable(
+                {
+                    "validation_success": resource.success,
+                    "batch_kwargs": resource.meta.get("batch_kwargs", {}),
+                    "batch_spec": resource.meta.get("batch_spec", {}),
+                }
+            )
+
+        rendered_content = self.renderer_class.render(resource)
+        if self.cloud_mode:
+            return rendered_content, index_info
+
+        viewable_content = self.view_class.render(
+            rendered_content,
+            data_context_id=self.data_context_id,
+            show_how_to_buttons=self.show_how_to_buttons,
+        )
+        return viewable_content, index_info
+
+    def _write_page(self, resource_key, content) -> None:
+        if self.cloud_mode:
+            self.target_store.set(
+                GXCloudIdentifier(resource_type=GXCloudRESTResource.RENDERED_DATA_DOC),
+                content,
+                source_type=resource_key.resource_type,
+                source_id=resource_key.id,
+            )
+        else:
+            # Verify type
+            self.target_store.set(
+                SiteSectionIdentifier(
+                    site_section_name=self.name,
+                    resource_identifier=resource_key,
+                ),
+                content,
+            )
+
+    @staticmethod
+    def _format_render_exception(e: Exception) -> str:
+        exception_message = """\
 An unexpected Exception occurred during data docs rendering.  Because of this error, certain parts of data docs will \
 not be rendered properly and/or may not appear altogether.  Please use the trace, included in this message, to \
 diagnose and repair the underlying issue.  Detailed information follows:
                 """  # noqa: E501
-                exception_traceback = traceback.format_exc()
-                exception_message += (
-                    f'{type(e).__name__}: "{e!s}".  ' f'Traceback: "{exception_traceback}".'
-                )
-                logger.error(exception_message)  # noqa: TRY400
+        exception_traceback = "".join(traceback.format_exception(type(e), e, e.__traceback__))
+        exception_message += (
+            f'{type(e).__name__}: "{e!s}".  ' f'Traceback: "{exception_traceback}".'
+        )
+        return exception_message
 
 
 class DefaultSiteIndexBuilder:
@@ -711,12 +1042,17 @@ class DefaultSiteIndexBuilder:
 
     # TODO: deprecate dual batch api support
     def build(
-        self, skip_and_clean_missing=True, build_index: bool = True
+        self,
+        skip_and_clean_missing=True,
+        build_index: bool = True,
+        rendered_pages_manifest: Optional[dict] = None,
     ) -> Tuple[Any, Optional[OrderedDict]]:
         """
         :param skip_and_clean_missing: if True, target html store keys without corresponding source store keys will
         be skipped and removed from the target store
         :param build_index: a flag if False, skips building the index page
+        :param rendered_pages_manifest: manifest of rendered pages (see "SiteBuilder.build()"), whose information
+        about validation results is used instead of reading validation results from their store
         :return: tuple(index_page_url, index_links_dict)
         """  # noqa: E501
 
@@ -737,10 +1073,10 @@ class DefaultSiteIndexBuilder:
             self._build_validation_and_profiling_result_site_keys(skip_and_clean_missing)
         )
         self._add_profiling_to_index_links(
-            index_links_dict, validation_and_profiling_result_site_keys
+            index_links_dict, validation_and_profiling_result_site_keys, rendered_pages_manifest
         )
         self._add_validations_to_index_links(
-            index_links_dict, validation_and_profiling_result_site_keys
+            index_links_dict, validation_and_profiling_result_site_keys, rendered_pages_manifest
         )
 
         viewable_content = ""
@@ -842,6 +1178,7 @@ diagnose and repair the underlying issue.  Detailed information follows:
         self,
         index_links_dict: OrderedDict,
         validation_and_profiling_result_site_keys: List[ValidationResultIdentifier],
+        rendered_pages_manifest: Optional[dict] = None,
     ) -> None:
         profiling = self.site_section_builders_config.get("profiling", "None")
         if profiling and profiling not in FALSEY_YAML_STRINGS:
@@ -857,15 +1194,23 @@ diagnose and repair the underlying issue.  Detailed information follows:
             ]
             for profiling_result_key in profiling_result_site_keys:
                 try:
-                    validation = self.data_context.get_validation_result(
-                        batch_identifier=profiling_result_key.batch_identifier,
-                        expectation_suite_name=profiling_result_key.expectation_suite_identifier.name,
-                        run_id=profiling_result_key.run_id,
-                        validations_store_name=self.source_stores.get("profiling"),
+                    index_info = self._get_index_info_from_manifest(
+                        rendered_pages_manifest, "profiling", profiling_result_key
                     )
+                    if index_info is None:
+                        validation = self.data_context.get_validation_result(
+                            batch_identifier=profiling_result_key.batch_identifier,
+                            expectation_suite_name=profiling_result_key.expectation_suite_identifier.name,
+                            run_id=profiling_result_key.run_id,
+                            validations_store_name=self.source_stores.get("profiling"),
+                        )
+                        index_info = {
+                            "batch_kwargs": validation.meta.get("batch_kwargs", {}),
+                            "batch_spec": validation.meta.get("batch_spec", {}),
+                        }
 
-                    batch_kwargs = validation.meta.get("batch_kwargs", {})
-                    batch_spec = validation.meta.get("batch_spec", {})
+                    batch_kwargs = index_info["batch_kwargs"]
+                    batch_spec = index_info["batch_spec"]
 
                     self.add_resource_info_to_index_links_dict(
                         index_links_dict=index_links_dict,
@@ -888,6 +1233,7 @@ diagnose and repair the underlying issue.  Detailed information follows:
         self,
         index_links_dict: OrderedDict,
         validation_and_profiling_result_site_keys: List[ValidationResultIdentifier],
+        rendered_pages_manifest: Optional[dict] = None,
     ) -> None:
         validations = self.site_section_builders_config.get("validations", "None")
         if validations and validations not in FALSEY_YAML_STRINGS:
@@ -912,16 +1258,25 @@ diagnose and repair the underlying issue.  Detailed information follows:
                 ]
             for validation_result_key in validation_result_site_keys:
                 try:
-                    validation = self.data_context.get_validation_result(
-                        batch_identifier=validation_result_key.batch_identifier,
-                        expectation_suite_name=validation_result_key.expectation_suite_identifier.name,
-                        run_id=validation_result_key.run_id,
-                        validations_store_name=self.source_stores.get("validations"),
+                    index_info = self._get_index_info_from_manifest(
+                        rendered_pages_manifest, "validations", validation_result_key
                     )
+                    if index_info is None:
+                        validation = self.data_context.get_validation_result(
+                            batch_identifier=validation_result_key.batch_identifier,
+                            expectation_suite_name=validation_result_key.expectation_suite_identifier.name,
+                            run_id=validation_result_key.run_id,
+                            validations_store_name=self.source_stores.get("validations"),
+                        )
+                        index_info = {
+                            "validation_success": validation.success,
+                            "batch_kwargs": validation.meta.get("batch_kwargs", {}),
+                            "batch_spec": validation.meta.get("batch_spec", {}),
+                        }
 
-                    validation_success = validation.success
-                    batch_kwargs = validation.meta.get("batch_kwargs", {})
-                    batch_spec = validation.meta.get("batch_spec", {})
+                    validation_success = index_info["validation_success"]
+                    batch_kwargs = index_info["batch_kwargs"]
+                    batch_spec = index_info["batch_spec"]
 
                     self.add_resource_info_to_index_links_dict(
                         index_links_dict=index_links_dict,
@@ -941,6 +1296,22 @@ diagnose and repair the underlying issue.  Detailed information follows:
                     error_msg = f"Validation result not found: {validation_result_key.to_tuple()!s:s} - skipping"  # noqa: E501
                     logger.warning(error_msg)
 
+    @staticmethod
+    def _get_index_info_from_manifest(
+        rendered_pages_manifest: Optional[dict],
+        section_name: str,
+        validation_result_key: ValidationResultIdentifier,
+    ) -> Optional[dict]:
+        if not rendered_pages_manifest:
+            return None
+
+        return (
+            rendered_pages_manifest.get("sections", {})
+            .get(section_name, {})
+            .get(DefaultSiteSectionBuilder._get_manifest_key(validation_result_key), {})
+            .get("index_info")
+        )
+
 
 class CallToActionButton:
     def __init__(self, title, link) -> None:
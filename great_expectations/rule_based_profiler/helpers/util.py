@@ -96,6 +96,10 @@ RECOGNIZED_QUANTILE_STATISTIC_INTERPOLATION_METHODS: set = {
 
 NP_RANDOM_GENERATOR: Final = np.random.default_rng()
 
+# Upper bound on memory (in bytes) of bootstrap resamples (and their indices), materialized at once;
+# larger number of resamples is processed in chunks of rows (results do not depend on chunk size).
+BOOTSTRAP_RESAMPLES_MEMORY_BUDGET_BYTES: Final[int] = 64 * 2**20
+
 
 def get_validator(  # noqa: PLR0913
     purpose: str,
@@ -798,20 +802,25 @@ def compute_bootstrap_quantiles_point_estimate(  # noqa: PLR0913
         method=quantile_statistic_interpolation_method,
     )
 
-    bootstraps: np.ndarray
+    random_generator: np.random.Generator
     if random_seed:
-        random_state: np.random.Generator = np.random.Generator(np.random.PCG64(random_seed))
-        bootstraps = random_state.choice(metric_values, size=(n_resamples, metric_values.size))
+        random_generator = np.random.Generator(np.random.PCG64(random_seed))
     else:
-        bootstraps = NP_RANDOM_GENERATOR.choice(
-            metric_values, size=(n_resamples, metric_values.size)
-        )
+        random_generator = NP_RANDOM_GENERATOR
+
+    # Lower and upper quantiles of every bootstrap resample (rows) are computed by single
+    # "quantile()" call.
+    bootstrap_quantiles: np.ndarray = _compute_bootstrap_quantiles(
+        metric_values=metric_values,
+        quantile_pcts=[lower_quantile_pct, upper_quantile_pct],
+        n_resamples=n_resamples,
+        quantile_statistic_interpolation_method=quantile_statistic_interpolation_method,
+        random_generator=random_generator,
+    )
 
     lower_quantile_bias_corrected_point_estimate: Union[np.float64, datetime.datetime] = (
         _determine_quantile_bias_corrected_point_estimate(
-            bootstraps=bootstraps,
-            quantile_pct=lower_quantile_pct,
-            quantile_statistic_interpolation_method=quantile_statistic_interpolation_method,
+            bootstrap_quantiles=bootstrap_quantiles[0],
             quantile_bias_correction=quantile_bias_correction,
             quantile_bias_std_error_ratio_threshold=quantile_bias_std_error_ratio_threshold,
             sample_quantile=sample_lower_quantile,
@@ -819,9 +828,7 @@ def compute_bootstrap_quantiles_point_estimate(  # noqa: PLR0913
     )
     upper_quantile_bias_corrected_point_estimate: Union[np.float64, datetime.datetime] = (
         _determine_quantile_bias_corrected_point_estimate(
-            bootstraps=bootstraps,
-            quantile_pct=upper_quantile_pct,
-            quantile_statistic_interpolation_method=quantile_statistic_interpolation_method,
+            bootstrap_quantiles=bootstrap_quantiles[1],
             quantile_bias_correction=quantile_bias_correction,
             quantile_bias_std_error_ratio_threshold=quantile_bias_std_error_ratio_threshold,
             sample_quantile=sample_upper_quantile,
@@ -884,20 +891,51 @@ def build_numeric_range_estimation_result(
     )
 
 
-def _determine_quantile_bias_corrected_point_estimate(  # noqa: PLR0913
-    bootstraps: np.ndarray,
-    quantile_pct: float,
+def _compute_bootstrap_quantiles(
+    metric_values: np.ndarray,
+    quantile_pcts: List[float],
+    n_resamples: int,
     quantile_statistic_interpolation_method: str,
+    random_generator: np.random.Generator,
+) -> np.ndarray:
+    """
+    Draws "n_resamples" bootstrap resamples (with replacement) of "metric_values" as rows of "(n_resamples, n)" index
+    matrix and returns "(len(quantile_pcts), n_resamples)" array of their quantiles.  Rows are generated (and reduced)
+    in chunks, sized to stay within "BOOTSTRAP_RESAMPLES_MEMORY_BUDGET_BYTES"; since random integers are drawn from
+    same generator in same (row-major) order, result does not depend on chunk size (and equals that of drawing entire
+    matrix by "Generator.choice()" at once, given same random seed).
+    """  # noqa: E501
+    values: np.ndarray = np.asarray(metric_values)
+    num_values: int = values.size
+    bytes_per_resample: int = num_values * (values.itemsize + np.dtype(np.int64).itemsize)
+    resamples_per_chunk: int = max(BOOTSTRAP_RESAMPLES_MEMORY_BUDGET_BYTES // bytes_per_resample, 1)
+
+    chunks: List[np.ndarray] = []
+    start: int
+    num_resamples: int
+    for start in range(0, n_resamples, resamples_per_chunk):
+        num_resamples = min(resamples_per_chunk, n_resamples - start)
+        indices: np.ndarray = random_generator.integers(
+            0, num_values, size=(num_resamples, num_values), dtype=np.int64
+        )
+        chunks.append(
+            numpy.numpy_quantile(
+                values[indices],
+                q=quantile_pcts,  # type: ignore[arg-type] # "quantile()" accepts sequence of quantiles
+                axis=1,
+                method=quantile_statistic_interpolation_method,
+            )
+        )
+
+    return np.concatenate(chunks, axis=1)
+
+
+def _determine_quantile_bias_corrected_point_estimate(
+    bootstrap_quantiles: np.ndarray,
     quantile_bias_correction: bool,
     quantile_bias_std_error_ratio_threshold: float,
     sample_quantile: np.ndarray,
 ) -> np.float64:
-    bootstrap_quantiles: Union[np.ndarray, np.float64] = numpy.numpy_quantile(
-        bootstraps,
-        q=quantile_pct,
-        axis=1,
-        method=quantile_statistic_interpolation_method,
-    )
     bootstrap_quantile_point_estimate: np.ndarray = np.mean(bootstrap_quantiles)
     bootstrap_quantile_standard_error: np.ndarray = np.std(bootstrap_quantiles)
     bootstrap_quantile_bias: float = bootstrap_quantile_point_estimate - sample_quantile
@@ -0,0 +1,576 @@
+from __future__ import annotations
+
+import ast
+import logging
+import math
+import re
+import traceback
+from abc import ABC, abstractmethod
+from functools import reduce
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+import pandas as pd
+
+import great_expectations.exceptions as gx_exceptions
+from great_expectations.compatibility.typing_extensions import override
+from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.validator.exception_info import ExceptionInfo
+from great_expectations.validator.validation_graph import ValidationGraph
+
+if TYPE_CHECKING:
+    from great_expectations.execution_engine import PandasExecutionEngine
+    from great_expectations.validator.computed_metric import MetricValue
+    from great_expectations.validator.metric_configuration import MetricConfiguration
+    from great_expectations.validator.metrics_calculator import (
+        _AbortedMetricsInfoDict,
+        _MetricKey,
+        _MetricsDict,
+    )
+
+logger = logging.getLogger(__name__)
+
+# Suffixes of intermediate metrics, whose values pertain to chunk, over which they were resolved.
+CHUNK_LOCAL_METRIC_NAME_SUFFIXES: Tuple[str, ...] = (
+    ".condition",
+    ".map",
+    ".aggregate_fn",
+)
+
+# Metrics, computed from values of their dependencies only (resolved after chunks are merged).
+DERIVED_METRIC_NAMES: Set[str] = {
+    "column.approximate_median",
+    "column.approximate_quantile_values",
+}
+
+_UNEXPECTED_INDEX_QUERY_PATTERN = re.compile(
+    r"^df\.filter\(items=(?P<items>.*), axis=0\)$", re.DOTALL
+)
+
+
+class MetricMerger(ABC):
+    """Declares, how values of metric, resolved over consecutive chunks of Batch, combine into its value over Batch.
+
+    "partial()" is called while chunk, over which "value" was resolved, is still current (so that it may inspect chunk
+    records); "merge()" is called once, with partial results of all chunks (in order).  Metrics, for which no merger is
+    registered (e.g., "column.median"), cannot be computed incrementally and are rejected in chunked mode.
+    """  # noqa: E501
+
+    def partial(
+        self,
+        value: MetricValue,
+        metric_configuration: MetricConfiguration,
+        execution_engine: PandasExecutionEngine,
+    ) -> Any:
+        return value
+
+    @abstractmethod
+    def merge(self, partials: List[Any], metric_configuration: MetricConfiguration) -> MetricValue:
+        pass
+
+
+class SumMetricMerger(MetricMerger):
+    @override
+    def merge(self, partials: List[Any], metric_configuration: MetricConfiguration) -> MetricValue:
+        return sum(partial for partial in partials if partial is not None)
+
+
+class FirstMetricMerger(MetricMerger):
+    """Keeps value of first chunk (for metrics, describing schema of data, shared by all chunks)."""
+
+    @override
+    def merge(self, partials: List[Any], metric_configuration: MetricConfiguration) -> MetricValue:
+        return partials[0] if partials else None
+
+
+class MinMetricMerger(MetricMerger):
+    @override
+    def merge(self, partials: List[Any], metric_configuration: MetricConfiguration) -> MetricValue:
+        values: List[Any] = [partial for partial in partials if not pd.isnull(partial)]
+        return min(values) if values else None
+
+
+class MaxMetricMerger(MetricMerger):
+    @override
+    def merge(self, partials: List[Any], metric_configuration: MetricConfiguration) -> MetricValue:
+        values: List[Any] = [partial for partial in partials if not pd.isnull(partial)]
+        return max(values) if values else None
+
+
+class MeanMetricMerger(MetricMerger):
+    """Averages means of chunks, weighted by their numbers of (non-null) values."""
+
+    @override
+    def partial(
+        self,
+        value: MetricValue,
+        metric_configuration: MetricConfiguration,
+        execution_engine: PandasExecutionEngine,
+    ) -> Tuple[int, float]:
+        count: int
+        mean: float
+        count, mean, _ = _get_column_moments(
+            metric_configuration=metric_configuration, execution_engine=execution_engine
+        )
+        return count, mean
+
+    @override
+    def merge(self, partials: List[Any], metric_configuration: MetricConfiguration) -> MetricValue:
+        total_count: int = sum(count for count, _ in partials)
+        if total_count == 0:
+            return float("nan")
+
+        return sum(count * mean for count, mean in partials if count > 0) / total_count
+
+
+class StandardDeviationMetricMerger(MetricMerger):
+    """Combines counts, means, and sums of squared deviations of chunks (Chan, Golub, LeVeque)."""
+
+    @override
+    def partial(
+        self,
+        value: MetricValue,
+        metric_configuration: MetricConfiguration,
+        execution_engine: PandasExecutionEngine,
+    ) -> Tuple[int, float, float]:
+        return _get_column_moments(
+            metric_configuration=metric_configuration, execution_engine=execution_engine
+        )
+
+    @override
+    def merge(self, partials: List[Any], metric_configuration: MetricConfiguration) -> MetricValue:
+        count: int = 0
+        mean: float = 0.0
+        m2: float = 0.0
+
+        partial_count: int
+        partial_mean: float
+        partial_m2: float
+        for partial_count, partial_mean, partial_m2 in partials:
+            if partial_count == 0:
+                continue
+
+            total_count: int = count + partial_count
+            delta: float = partial_mean - mean
+            mean += delta * partial_count / total_count
+            m2 += partial_m2 + delta * delta * count * partial_count / total_count
+            count = total_count
+
+        # Sample standard deviation (as "pandas.Series.std()", used by "column.standard_deviation").
+        if count < 2:  # noqa: PLR2004
+            return float("nan")
+
+        return math.sqrt(m2 / (count - 1))
+
+
+class SketchMetricMerger(MetricMerger):
+    """Merges mergeable sketches (e.g., "KLLQuantileSketch", "HyperLogLogSketch") of chunks."""
+
+    @override
+    def merge(self, partials: List[Any], metric_configuration: MetricConfiguration) -> MetricValue:
+        return reduce(lambda left, right: left.merge(right), partials) if partials else None
+
+
+class SetUnionMetricMerger(MetricMerger):
+    @override
+    def merge(self, partials: List[Any], metric_configuration: MetricConfiguration) -> MetricValue:
+        return set().union(*partials)
+
+
+class ValueCountsMetricMerger(MetricMerger):
+    @override
+    def merge(self, partials: List[Any], metric_configuration: MetricConfiguration) -> MetricValue:
+        if not partials:
+            return pd.Series(dtype="int64", name="count")
+
+        counts: pd.Series = reduce(
+            lambda left, right: left.add(right, fill_value=0), partials
+        ).astype("int64")
+        if metric_configuration.metric_value_kwargs.get("sort") in (None, "value"):
+            try:
+                counts = counts.sort_index()
+            except TypeError:
+                counts.index = counts.index.astype(str)
+                counts = counts.sort_index()
+
+        counts.name = "count"
+        counts.index.name = "value"
+        return counts
+
+
+class UnexpectedListMetricMerger(MetricMerger):
+    """Concatenates unexpected values (or indices) of chunks, truncated unless "COMPLETE"."""
+
+    @override
+    def merge(self, partials: List[Any], metric_configuration: MetricConfiguration) -> MetricValue:
+        if all(partial is None for partial in partials):
+            return None
+
+        values: List[Any] = [
+            value for partial in partials if partial is not None for value in partial
+        ]
+        return _truncate(values=values, metric_configuration=metric_configuration)
+
+
+class UnexpectedRowsMetricMerger(MetricMerger):
+    @override
+    def merge(self, partials: List[Any], metric_configuration: MetricConfiguration) -> MetricValue:
+        if not partials:
+            return pd.DataFrame()
+
+        return _truncate(values=pd.concat(partials), metric_configuration=metric_configuration)
+
+
+class UnexpectedIndexQueryMetricMerger(MetricMerger):
+    """Rebuilds Pandas unexpected index query ("df.filter(items=[...], axis=0)") of entire Batch."""
+
+    @override
+    def partial(
+        self,
+        value: MetricValue,
+        metric_configuration: MetricConfiguration,
+        execution_engine: PandasExecutionEngine,
+    ) -> Optional[List[Any]]:
+        if value is None:
+            return None
+
+        match: Optional[re.Match] = _UNEXPECTED_INDEX_QUERY_PATTERN.match(str(value))
+        if match is None:
+            raise ValueError(f'Unrecognized unexpected index query: "{value}".')  # noqa: TRY003
+
+        return ast.literal_eval(match.group("items"))
+
+    @override
+    def merge(self, partials: List[Any], metric_configuration: MetricConfiguration) -> MetricValue:
+        if all(partial is None for partial in partials):
+            return None
+
+        index_list: List[Any] = [
+            index for partial in partials if partial is not None for index in partial
+        ]
+        return f"df.filter(items={index_list}, axis=0)"
+
+
+class TableHeadMetricMerger(MetricMerger):
+    @override
+    def merge(self, partials: List[Any], metric_configuration: MetricConfiguration) -> MetricValue:
+        if not partials:
+            return pd.DataFrame()
+
+        df: pd.DataFrame = pd.concat(partials)
+        if metric_configuration.metric_value_kwargs.get("fetch_all"):
+            return df
+
+        return df.head(metric_configuration.metric_value_kwargs.get("n_rows", 5))
+
+
+_METRIC_MERGERS: Dict[str, MetricMerger] = {
+    "table.row_count": SumMetricMerger(),
+    "table.columns": FirstMetricMerger(),
+    "table.column_types": FirstMetricMerger(),
+    "table.head": TableHeadMetricMerger(),
+    "column.min": MinMetricMerger(),
+    "column.max": MaxMetricMerger(),
+    "column.sum": SumMetricMerger(),
+    "column.mean": MeanMetricMerger(),
+    "column.standard_deviation": StandardDeviationMetricMerger(),
+    "column.value_counts": ValueCountsMetricMerger(),
+    "column.distinct_values": SetUnionMetricMerger(),
+    "column.quantile_sketch": SketchMetricMerger(),
+    "column.hyperloglog_sketch": SketchMetricMerger(),
+}
+
+# Map conditions, which evaluate every row on its own (so Batch has unexpected rows of its chunks).
+# Conditions over entire column (e.g., "column_values.unique", "column_values.increasing",
+# "column_values.z_score", "compound_columns.unique") depend on rows of other chunks; their
+# metrics are not merged (and are rejected in chunked mode).
+ROW_LOCAL_MAP_CONDITION_METRIC_NAMES: Set[str] = {
+    "column_values.nonnull",
+    "column_values.null",
+    "column_values.between",
+    "column_values.in_set",
+    "column_values.not_in_set",
+    "column_values.in_type_list",
+    "column_values.of_type",
+    "column_values.match_regex",
+    "column_values.not_match_regex",
+    "column_values.match_regex_list",
+    "column_values.not_match_regex_list",
+    "column_values.match_like_pattern",
+    "column_values.not_match_like_pattern",
+    "column_values.match_like_pattern_list",
+    "column_values.not_match_like_pattern_list",
+    "column_values.match_strftime_format",
+    "column_values.dateutil_parseable",
+    "column_values.json_parseable",
+    "column_values.match_json_schema",
+    "column_values.value_length.equals",
+    "column_values.value_length.between",
+    "column_pair_values.equal",
+    "column_pair_values.a_greater_than_b",
+    "column_pair_values.in_set",
+    "multicolumn_sum.equal",
+    "select_column_values.unique.within_record",
+}
+
+_MAP_METRIC_SUFFIX_MERGERS: Dict[str, MetricMerger] = {
+    ".unexpected_count": SumMetricMerger(),
+    ".unexpected_values": UnexpectedListMetricMerger(),
+    ".unexpected_index_list": UnexpectedListMetricMerger(),
+    ".unexpected_rows": UnexpectedRowsMetricMerger(),
+    ".unexpected_index_query": UnexpectedIndexQueryMetricMerger(),
+}
+
+
+def register_metric_merger(metric_name: str, metric_merger: MetricMerger) -> None:
+    """Declares metric (e.g., custom metric) as mergeable across chunks, using "metric_merger"."""
+    _METRIC_MERGERS[metric_name] = metric_merger
+
+
+def register_row_local_map_condition(condition_metric_name: str) -> None:
+    """Declares map condition (e.g., of custom map metric) as evaluating every row on its own, so that its unexpected
+    counts, values, and indices are merged across chunks."""  # noqa: E501
+    ROW_LOCAL_MAP_CONDITION_METRIC_NAMES.add(condition_metric_name)
+
+
+def get_metric_merger(metric_name: str) -> Optional[MetricMerger]:
+    """Returns "MetricMerger" of metric (None, if metric cannot be merged across chunks)."""
+    if metric_name in _METRIC_MERGERS:
+        return _METRIC_MERGERS[metric_name]
+
+    suffix: str
+    metric_merger: MetricMerger
+    for suffix, metric_merger in _MAP_METRIC_SUFFIX_MERGERS.items():
+        if (
+            metric_name.endswith(suffix)
+            and metric_name[: -len(suffix)] in ROW_LOCAL_MAP_CONDITION_METRIC_NAMES
+        ):
+            return metric_merger
+
+    return None
+
+
+def resolve_validation_graph_in_chunks(  # noqa: C901
+    graph: ValidationGraph,
+    execution_engine: PandasExecutionEngine,
+    runtime_configuration: Optional[dict] = None,
+    min_graph_edges_pbar_enable: int = 0,
+    show_progress_bars: bool = True,
+) -> Tuple[_MetricsDict, _AbortedMetricsInfoDict]:
+    """Resolves "ValidationGraph" over active Batch, which is read in chunks (see "PandasChunkedBatchData").
+
+    Mergeable metrics (see "get_metric_merger()") and their dependencies are resolved over every chunk in turn, and their
+    partial results are merged; derived metrics (see "DERIVED_METRIC_NAMES") are then resolved from merged values.  All
+    other metrics are aborted (along with Expectations that depend on them), since they cannot be computed incrementally.
+
+    Returns:
+        Dictionary with resolved metrics and dictionary with aborted metrics information (both keyed by metric ID)
+    """  # noqa: E501
+    metric_configurations: Dict[_MetricKey, MetricConfiguration] = graph.metric_configurations
+
+    mergeable_metric_ids: Set[_MetricKey] = {
+        metric_id
+        for metric_id, metric_configuration in metric_configurations.items()
+        if get_metric_merger(metric_configuration.metric_name) is not None
+    }
+    chunk_metric_ids: Set[_MetricKey] = _get_dependency_closure(
+        metric_ids=mergeable_metric_ids, metric_configurations=metric_configurations
+    )
+    chunk_graph = ValidationGraph(
+        execution_engine=execution_engine,
+        edges=[edge for edge in graph.edges if edge.left.id in chunk_metric_ids],
+    )
+
+    partials: Dict[_MetricKey, List[Any]] = {metric_id: [] for metric_id in mergeable_metric_ids}
+    aborted_metrics_info: _AbortedMetricsInfoDict = {}
+
+    metric_id: _MetricKey
+    metric_configuration: MetricConfiguration
+    for _ in execution_engine.iter_batch_data_chunks():
+        chunk_metrics: _MetricsDict
+        chunk_aborted_metrics_info: _AbortedMetricsInfoDict
+        chunk_metrics, chunk_aborted_metrics_info = chunk_graph.resolve(
+            runtime_configuration=runtime_configuration,
+            min_graph_edges_pbar_enable=min_graph_edges_pbar_enable,
+            show_progress_bars=show_progress_bars,
+        )
+        for metric_id, metric_info in chunk_aborted_metrics_info.items():
+            aborted_metrics_info.setdefault(metric_id, metric_info)
+
+        for metric_id in mergeable_metric_ids:
+            if metric_id in aborted_metrics_info or metric_id not in chunk_metrics:
+                continue
+
+            metric_configuration = metric_configurations[metric_id]
+            try:
+                partials[metric_id].append(
+                    get_metric_merger(  # type: ignore[union-attr]
+                        metric_configuration.metric_name
+                    ).partial(
+                        value=chunk_metrics[metric_id],
+                        metric_configuration=metric_configuration,
+                        execution_engine=execution_engine,
+                    )
+                )
+            except Exception as e:
+                aborted_metrics_info[metric_id] = _build_aborted_metric_info(
+                    metric_configuration=metric_configuration, exception=e
+                )
+
+    resolved_metrics: _MetricsDict = {}
+    for metric_id in mergeable_metric_ids:
+        if metric_id in aborted_metrics_info:
+            continue
+
+        metric_configuration = metric_configurations[metric_id]
+        try:
+            resolved_metrics[metric_id] = get_metric_merger(  # type: ignore[union-attr]
+                metric_configuration.metric_name
+            ).merge(partials=partials[metric_id], metric_configuration=metric_configuration)
+        except Exception as e:
+            aborted_metrics_info[metric_id] = _build_aborted_metric_info(
+                metric_configuration=metric_configuration, exception=e
+            )
+
+    _resolve_derived_metrics(
+        metric_configurations=metric_configurations,
+        execution_engine=execution_engine,
+        resolved_metrics=resolved_metrics,
+        aborted_metrics_info=aborted_metrics_info,
+        runtime_configuration=runtime_configuration,
+    )
+
+    for metric_id, metric_configuration in metric_configurations.items():
+        if (
+            metric_id in resolved_metrics
+            or metric_id in aborted_metrics_info
+            or metric_configuration.metric_name.endswith(CHUNK_LOCAL_METRIC_NAME_SUFFIXES)
+        ):
+            continue
+
+        aborted_metrics_info[metric_id] = _build_aborted_metric_info(
+            metric_configuration=metric_configuration,
+            exception=gx_exceptions.MetricError(
+                message=f'Metric "{metric_configuration.metric_name}" cannot be merged across chunks of Batch; read Batch without "chunksize" to compute it.'  # noqa: E501
+            ),
+        )
+
+    return resolved_metrics, aborted_metrics_info
+
+
+def _resolve_derived_metrics(
+    metric_configurations: Dict[_MetricKey, MetricConfiguration],
+    execution_engine: PandasExecutionEngine,
+    resolved_metrics: _MetricsDict,
+    aborted_metrics_info: _AbortedMetricsInfoDict,
+    runtime_configuration: Optional[dict] = None,
+) -> None:
+    pending_metric_ids: Set[_MetricKey] = {
+        metric_id
+        for metric_id, metric_configuration in metric_configurations.items()
+        if metric_configuration.metric_name in DERIVED_METRIC_NAMES
+        and metric_id not in resolved_metrics
+    }
+
+    metric_id: _MetricKey
+    metric_configuration: MetricConfiguration
+    progress: bool = True
+    while pending_metric_ids and progress:
+        progress = False
+        for metric_id in list(pending_metric_ids):
+            metric_configuration = metric_configurations[metric_id]
+            dependency_ids: List[_MetricKey] = [
+                dependency.id for dependency in metric_configuration.metric_dependencies.values()
+            ]
+            if not all(dependency_id in resolved_metrics for dependency_id in dependency_ids):
+                continue
+
+            pending_metric_ids.remove(metric_id)
+            progress = True
+            try:
+                resolved_metrics.update(
+                    execution_engine.resolve_metrics(
+                        metrics_to_resolve=(metric_configuration,),
+                        metrics=resolved_metrics,
+                        runtime_configuration=runtime_configuration,
+                    )
+                )
+            except Exception as e:
+                aborted_metrics_info[metric_id] = _build_aborted_metric_info(
+                    metric_configuration=metric_configuration, exception=e
+                )
+
+
+def _get_dependency_closure(
+    metric_ids: Set[_MetricKey], metric_configurations: Dict[_MetricKey, MetricConfiguration]
+) -> Set[_MetricKey]:
+    closure: Set[_MetricKey] = set()
+    stack: List[_MetricKey] = list(metric_ids)
+    while stack:
+        metric_id: _MetricKey = stack.pop()
+        if metric_id in closure:
+            continue
+
+        closure.add(metric_id)
+        stack.extend(
+            dependency.id
+            for dependency in metric_configurations[metric_id].metric_dependencies.values()
+            if dependency.id in metric_configurations
+        )
+
+    return closure
+
+
+def _get_column_moments(
+    metric_configuration: MetricConfiguration, execution_engine: PandasExecutionEngine
+) -> Tuple[int, float, float]:
+    """Returns number, mean, and sum of squared deviations of non-null column values in chunk."""
+    df: pd.DataFrame
+    accessor_domain_kwargs: Dict[str, Any]
+    df, _, accessor_domain_kwargs = execution_engine.get_compute_domain(
+        domain_kwargs=metric_configuration.metric_domain_kwargs,
+        domain_type=MetricDomainTypes.COLUMN,
+    )
+    column: pd.Series = df[accessor_domain_kwargs["column"]].dropna()
+    count: int = int(column.count())
+    if count == 0:
+        return 0, 0.0, 0.0
+
+    mean: float = float(column.mean())
+    return count, mean, float(((column - mean) ** 2).sum())
+
+
+def _truncate(values: Any, metric_configuration: MetricConfiguration) -> Any:
+    result_format: dict = metric_configuration.metric_value_kwargs.get("result_format") or {}
+    if (
+        result_format.get("result_format") == "COMPLETE"
+        or "partial_unexpected_count" not in result_format
+    ):
+        return values
+
+    return values[: result_format["partial_unexpected_count"]]
+
+
+def _build_aborted_metric_info(
+    metric_configuration: MetricConfiguration, exception: Exception
+) -> Dict[str, Any]:
+    logger.debug(
+        f'Metric "{metric_configuration.metric_name}" was aborted in chunked mode: {exception}'
+    )
+    return {
+        "metric_configuration": metric_configuration,
+        "num_failures": 1,
+        "exception_info": ExceptionInfo(
+            exception_traceback="".join(
+                traceback.format_exception(type(exception), exception, exception.__traceback__)
+            ),
+            exception_message=str(exception),
+        ),
+    }
@@ -0,0 +1,445 @@
+from __future__ import annotations
+
+import concurrent.futures
+import enum
+import logging
+import pickle
+from abc import ABC, abstractmethod
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+import great_expectations.exceptions as gx_exceptions
+from great_expectations.compatibility.typing_extensions import override
+
+if TYPE_CHECKING:
+    from great_expectations.execution_engine import ExecutionEngine
+    from great_expectations.validator.computed_metric import MetricValue
+    from great_expectations.validator.metric_configuration import MetricConfiguration
+    from great_expectations.validator.metrics_calculator import _MetricKey
+
+logger = logging.getLogger(__name__)
+
+METRIC_RESOLUTION_SCHEDULER_RUNTIME_KEY: str = "metric_resolution_scheduler"
+
+# Domain keys, which select the data accessed within compute Domain; stripping them yields compute
+# Domain of metric.
+ACCESSOR_DOMAIN_KEYS: Tuple[str, ...] = (
+    "column",
+    "column_A",
+    "column_B",
+    "column_list",
+)
+
+
+class MetricResolutionSchedulerType(enum.Enum):
+    """Enum type, whose members signify strategy for dispatching ready metrics to
+    "ExecutionEngine.resolve_metrics()".
+
+    "SERIAL" hands entire set of ready metrics to single "ExecutionEngine.resolve_metrics()" call
+    (default behavior); "THREAD" and "PROCESS" dispatch independent Domain bundles concurrently
+    using respective "concurrent.futures" pools.
+    """
+
+    SERIAL = "serial"
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+class MetricResolutionScheduler(ABC):
+    """Dispatches set of ready "MetricConfiguration" objects of "ValidationGraph" to
+    "ExecutionEngine" for resolution.
+
+    Each metric bundle is resolved by exactly one "ExecutionEngine.resolve_metrics()" call.
+    Exceptions raised while resolving bundle are not propagated; instead, they are returned to
+    caller alongside resolved metric values so that "ValidationGraph" can apply its retry/abort
+    semantics to failed bundles only, while keeping successful results.
+    """
+
+    @abstractmethod
+    def resolve_metrics(
+        self,
+        execution_engine: ExecutionEngine,
+        metrics_to_resolve: Set[MetricConfiguration],
+        metrics: Dict[_MetricKey, MetricValue],
+        runtime_configuration: Optional[dict] = None,
+    ) -> Tuple[Dict[_MetricKey, MetricValue], List[Exception]]:
+        """
+        Resolves supplied "MetricConfiguration" objects, whose dependencies are available in
+        "metrics" dictionary.
+
+        Args:
+            execution_engine: "ExecutionEngine" used to compute metric values
+            metrics_to_resolve: ready (i.e., all dependencies resolved) "MetricConfiguration"
+                objects
+            metrics: resolved (already computed) metric values keyed by ID of "MetricConfiguration"
+                object
+            runtime_configuration: Additional run-time settings (see
+                "Validator.DEFAULT_RUNTIME_CONFIGURATION").
+
+        Returns:
+            Tuple with two elements: newly resolved metric values and exceptions raised by failed
+            metric bundles
+        """
+        pass
+
+
+class SerialMetricResolutionScheduler(MetricResolutionScheduler):
+    """Resolves entire set of ready metrics with single "ExecutionEngine.resolve_metrics()" call on
+    calling thread."""
+
+    @override
+    def resolve_metrics(
+        self,
+        execution_engine: ExecutionEngine,
+        metrics_to_resolve: Set[MetricConfiguration],
+        metrics: Dict[_MetricKey, MetricValue],
+        runtime_configuration: Optional[dict] = None,
+    ) -> Tuple[Dict[_MetricKey, MetricValue], List[Exception]]:
+        try:
+            return (
+                _resolve_metric_bundle(
+                    execution_engine=execution_engine,
+                    metrics_to_resolve=metrics_to_resolve,
+                    metrics=metrics,
+                    runtime_configuration=runtime_configuration,
+                ),
+                [],
+            )
+        except Exception as e:
+            return {}, [e]
+
+
+class _PoolMetricResolutionScheduler(MetricResolutionScheduler):
+    """Partitions ready metrics into independent Domain bundles and resolves bundles concurrently.
+
+    By default, bundles are formed per compute Domain (i.e., metric Domain without accessor keys,
+    such as "column"), so that aggregate metrics, which "ExecutionEngine.resolve_metric_bundle()"
+    combines into one query, stay together, while metrics with different "batch_id",
+    "row_condition", etc. run concurrently.  Setting "split_accessor_domains" to True partitions
+    bundles by full metric Domain (e.g., one bundle per column) for maximum parallelism.
+
+    Args:
+        max_workers: maximum number of concurrently resolved bundles (None uses "concurrent.futures"
+            default)
+        split_accessor_domains: if True, bundles are formed per full metric Domain instead of per
+            compute Domain
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        split_accessor_domains: bool = False,
+    ) -> None:
+        self._max_workers = max_workers
+        self._split_accessor_domains = split_accessor_domains
+
+    @property
+    def max_workers(self) -> Optional[int]:
+        return self._max_workers
+
+    @property
+    def split_accessor_domains(self) -> bool:
+        return self._split_accessor_domains
+
+    @abstractmethod
+    def _build_executor(self, max_workers: int) -> concurrent.futures.Executor:
+        pass
+
+    def _get_bundle_resolver(
+        self, execution_engine: ExecutionEngine
+    ) -> Tuple[Callable[..., Dict[_MetricKey, MetricValue]], Any]:
+        """Returns function, submitted to executor for every bundle, and "ExecutionEngine" argument
+        passed to it."""
+        return _resolve_metric_bundle, execution_engine
+
+    def _get_bundle_metrics(
+        self,
+        metrics_to_resolve: Set[MetricConfiguration],
+        metrics: Dict[_MetricKey, MetricValue],
+    ) -> Dict[_MetricKey, MetricValue]:
+        return metrics
+
+    @override
+    def resolve_metrics(
+        self,
+        execution_engine: ExecutionEngine,
+        metrics_to_resolve: Set[MetricConfiguration],
+        metrics: Dict[_MetricKey, MetricValue],
+        runtime_configuration: Optional[dict] = None,
+    ) -> Tuple[Dict[_MetricKey, MetricValue], List[Exception]]:
+        bundles: List[Set[MetricConfiguration]] = self._partition_into_domain_bundles(
+            metrics_to_resolve=metrics_to_resolve
+        )
+
+        resolve_bundle: Optional[Callable[..., Dict[_MetricKey, MetricValue]]] = None
+        submitted_execution_engine: Any = None
+        if len(bundles) > 1:
+            try:
+                resolve_bundle, submitted_execution_engine = self._get_bundle_resolver(
+                    execution_engine=execution_engine
+                )
+            except Exception as e:
+                logger.warning(
+                    f"ExecutionEngine cannot be used by {type(self).__name__} ({e}); resolving "
+                    "metrics serially."
+                )
+
+        if resolve_bundle is None:
+            return SerialMetricResolutionScheduler().resolve_metrics(
+                execution_engine=execution_engine,
+                metrics_to_resolve=metrics_to_resolve,
+                metrics=metrics,
+                runtime_configuration=runtime_configuration,
+            )
+
+        resolved_metrics: Dict[_MetricKey, MetricValue]
+        exceptions: List[Exception]
+        unresolved_metrics: Set[MetricConfiguration]
+        resolved_metrics, exceptions, unresolved_metrics = self._resolve_bundles_concurrently(
+            bundles=bundles,
+            bundle_resolver=(resolve_bundle, submitted_execution_engine),
+            metrics=metrics,
+            runtime_configuration=runtime_configuration,
+        )
+        if unresolved_metrics:
+            # Executor failed to run some bundles (e.g., worker process died); unlike metrics,
+            # which raised exceptions, they are resolved serially rather than reported as failed.
+            logger.warning(f"Resolving {len(unresolved_metrics)} metrics serially.")
+            serially_resolved_metrics: Dict[_MetricKey, MetricValue]
+            serial_exceptions: List[Exception]
+            serially_resolved_metrics, serial_exceptions = (
+                SerialMetricResolutionScheduler().resolve_metrics(
+                    execution_engine=execution_engine,
+                    metrics_to_resolve=unresolved_metrics,
+                    metrics=metrics,
+                    runtime_configuration=runtime_configuration,
+                )
+            )
+            resolved_metrics.update(serially_resolved_metrics)
+            exceptions.extend(serial_exceptions)
+
+        return resolved_metrics, exceptions
+
+    def _resolve_bundles_concurrently(
+        self,
+        bundles: List[Set[MetricConfiguration]],
+        bundle_resolver: Tuple[Callable[..., Dict[_MetricKey, MetricValue]], Any],
+        metrics: Dict[_MetricKey, MetricValue],
+        runtime_configuration: Optional[dict] = None,
+    ) -> Tuple[Dict[_MetricKey, MetricValue], List[Exception], Set[MetricConfiguration]]:
+        """Returns resolved metric values, exceptions raised by bundles, and metrics, which executor
+        failed to resolve."""
+        resolve_bundle: Callable[..., Dict[_MetricKey, MetricValue]]
+        submitted_execution_engine: Any
+        resolve_bundle, submitted_execution_engine = bundle_resolver
+        resolved_metrics: Dict[_MetricKey, MetricValue] = {}
+        exceptions: List[Exception] = []
+        unresolved_metrics: Set[MetricConfiguration] = set()
+
+        max_workers: int = min(self._max_workers or len(bundles), len(bundles))
+
+        bundle: Set[MetricConfiguration]
+        future: concurrent.futures.Future
+        with self._build_executor(max_workers=max_workers) as executor:
+            # Futures are collected in submission order, keeping merging of results deterministic.
+            futures: List[Tuple[Set[MetricConfiguration], concurrent.futures.Future]] = []
+            for bundle in bundles:
+                try:
+                    future = executor.submit(
+                        resolve_bundle,
+                        submitted_execution_engine,
+                        metrics_to_resolve=bundle,
+                        metrics=self._get_bundle_metrics(
+                            metrics_to_resolve=bundle, metrics=metrics
+                        ),
+                        runtime_configuration=runtime_configuration,
+                    )
+                except (concurrent.futures.BrokenExecutor, RuntimeError) as e:
+                    logger.warning(f"Submitting metrics to {type(self).__name__} failed ({e}).")
+                    unresolved_metrics.update(bundle)
+                else:
+                    futures.append((bundle, future))
+
+            for bundle, future in futures:
+                try:
+                    resolved_metrics.update(future.result())
+                except concurrent.futures.BrokenExecutor as e:
+                    logger.warning(f"Resolving metrics by {type(self).__name__} failed ({e}).")
+                    unresolved_metrics.update(bundle)
+                except Exception as e:
+                    exceptions.append(e)
+
+        return resolved_metrics, exceptions, unresolved_metrics
+
+    def _partition_into_domain_bundles(
+        self, metrics_to_resolve: Set[MetricConfiguration]
+    ) -> List[Set[MetricConfiguration]]:
+        bundles: Dict[Union[str, tuple], Set[MetricConfiguration]] = {}
+
+        metric_configuration: MetricConfiguration
+        for metric_configuration in sorted(metrics_to_resolve, key=lambda metric: metric.id):
+            bundles.setdefault(
+                self._get_bundle_key(metric_configuration=metric_configuration), set()
+            ).add(metric_configuration)
+
+        return list(bundles.values())
+
+    def _get_bundle_key(self, metric_configuration: MetricConfiguration) -> Union[str, tuple]:
+        if self._split_accessor_domains:
+            return metric_configuration.metric_domain_kwargs.to_id()
+
+        return metric_configuration.metric_domain_kwargs.to_id(id_ignore_keys=ACCESSOR_DOMAIN_KEYS)
+
+
+class ThreadPoolMetricResolutionScheduler(_PoolMetricResolutionScheduler):
+    """Resolves independent Domain bundles concurrently in "concurrent.futures.ThreadPoolExecutor"
+    worker threads.
+
+    Well suited for SQL and Spark backends, where computation happens outside of Python interpreter;
+    "ExecutionEngine" (and its database connection, if any) is shared among worker threads, and must
+    therefore be thread-safe.
+    """
+
+    @override
+    def _build_executor(self, max_workers: int) -> concurrent.futures.Executor:
+        return concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="gx-metrics"
+        )
+
+
+class ProcessPoolMetricResolutionScheduler(_PoolMetricResolutionScheduler):
+    """Resolves independent Domain bundles concurrently in "concurrent.futures.ProcessPoolExecutor"
+    worker processes.
+
+    Suitable for CPU-bound in-memory computations (e.g., Pandas).  "ExecutionEngine" (including its
+    loaded Batch data) and resolved metric dependencies of each bundle are pickled into worker
+    processes; hence, metric values computed in worker processes are not added to metric cache of
+    calling process.  If "ExecutionEngine" cannot be pickled, or worker processes fail, affected
+    metrics are resolved serially in calling process.
+    """
+
+    @override
+    def _build_executor(self, max_workers: int) -> concurrent.futures.Executor:
+        return concurrent.futures.ProcessPoolExecutor(max_workers=max_workers)
+
+    @override
+    def _get_bundle_resolver(
+        self, execution_engine: ExecutionEngine
+    ) -> Tuple[Callable[..., Dict[_MetricKey, MetricValue]], Any]:
+        # Engine is pickled once (rather than for every bundle); unpicklable engine raises here,
+        # before any work is submitted, so that metrics are resolved serially instead.
+        return _resolve_pickled_metric_bundle, pickle.dumps(execution_engine)
+
+    @override
+    def _get_bundle_metrics(
+        self,
+        metrics_to_resolve: Set[MetricConfiguration],
+        metrics: Dict[_MetricKey, MetricValue],
+    ) -> Dict[_MetricKey, MetricValue]:
+        # Only resolved dependencies of bundle are shipped to worker process (avoids pickling all
+        # computed metrics).
+        metric_configuration: MetricConfiguration
+        metric_dependency: MetricConfiguration
+        return {
+            metric_dependency.id: metrics[metric_dependency.id]
+            for metric_configuration in metrics_to_resolve
+            for metric_dependency in metric_configuration.metric_dependencies.values()
+            if metric_dependency.id in metrics
+        }
+
+
+def build_metric_resolution_scheduler(
+    runtime_configuration: Optional[dict] = None,
+) -> MetricResolutionScheduler:
+    """
+    Obtains "MetricResolutionScheduler" from "metric_resolution_scheduler" key of
+    "runtime_configuration".
+
+    The value can be "MetricResolutionScheduler" instance, "MetricResolutionSchedulerType" (or its
+    string value), or dictionary with "type" key and optional "max_workers" and
+    "split_accessor_domains" keys, e.g.:
+    {"metric_resolution_scheduler": {"type": "thread", "max_workers": 8}}.  Absent value selects
+    serial scheduler.
+
+    Args:
+        runtime_configuration: Additional run-time settings (see
+            "Validator.DEFAULT_RUNTIME_CONFIGURATION").
+
+    Returns:
+        "MetricResolutionScheduler" object
+    """
+    if runtime_configuration is None:
+        runtime_configuration = {}
+
+    scheduler_config: Union[
+        MetricResolutionScheduler, MetricResolutionSchedulerType, str, dict, None
+    ]
+    scheduler_config = runtime_configuration.get(METRIC_RESOLUTION_SCHEDULER_RUNTIME_KEY)
+    if scheduler_config is None:
+        return SerialMetricResolutionScheduler()
+
+    if isinstance(scheduler_config, MetricResolutionScheduler):
+        return scheduler_config
+
+    scheduler_kwargs: dict
+    if isinstance(scheduler_config, dict):
+        scheduler_kwargs = dict(scheduler_config)
+        scheduler_type = scheduler_kwargs.pop("type", MetricResolutionSchedulerType.SERIAL)
+    else:
+        scheduler_kwargs = {}
+        scheduler_type = scheduler_config
+
+    try:
+        scheduler_type = MetricResolutionSchedulerType(scheduler_type)
+    except ValueError as e:
+        raise gx_exceptions.InvalidConfigError(
+            message=f"""Unrecognized "{METRIC_RESOLUTION_SCHEDULER_RUNTIME_KEY}" type \
+"{scheduler_type!s}" (must be one of {[member.value for member in MetricResolutionSchedulerType]}).
+"""
+        ) from e
+
+    if scheduler_type == MetricResolutionSchedulerType.THREAD:
+        return ThreadPoolMetricResolutionScheduler(**scheduler_kwargs)
+
+    if scheduler_type == MetricResolutionSchedulerType.PROCESS:
+        return ProcessPoolMetricResolutionScheduler(**scheduler_kwargs)
+
+    return SerialMetricResolutionScheduler()
+
+
+def _resolve_pickled_metric_bundle(
+    pickled_execution_engine: bytes,
+    metrics_to_resolve: Set[MetricConfiguration],
+    metrics: Dict[_MetricKey, MetricValue],
+    runtime_configuration: Optional[dict] = None,
+) -> Dict[_MetricKey, MetricValue]:
+    return _resolve_metric_bundle(
+        pickle.loads(pickled_execution_engine),  # Pickled by calling process.
+        metrics_to_resolve=metrics_to_resolve,
+        metrics=metrics,
+        runtime_configuration=runtime_configuration,
+    )
+
+
+def _resolve_metric_bundle(
+    execution_engine: ExecutionEngine,
+    metrics_to_resolve: Set[MetricConfiguration],
+    metrics: Dict[_MetricKey, MetricValue],
+    runtime_configuration: Optional[dict] = None,
+) -> Dict[_MetricKey, MetricValue]:
+    # Module-level function (rather than bound method), so that it can be pickled for
+    # "ProcessPoolExecutor" workers.
+    return execution_engine.resolve_metrics(
+        metrics_to_resolve=metrics_to_resolve,  # type: ignore[arg-type]  # Metric typing is loose.
+        metrics=metrics,  # type: ignore[arg-type]  # Metric typing needs further refinement.
+        runtime_configuration=runtime_configuration,
+    )
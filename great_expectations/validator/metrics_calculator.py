@@ -2,9 +2,14 @@ from __future__ import annotations
 
 import logging
 from collections.abc import Hashable
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Union
 
 from great_expectations._docs_decorators import public_api
+from great_expectations.execution_engine.pandas_batch_data import PandasChunkedBatchData
+from great_expectations.validator.chunked_metrics import (
+    CHUNK_LOCAL_METRIC_NAME_SUFFIXES,
+    resolve_validation_graph_in_chunks,
+)
 from great_expectations.validator.computed_metric import MetricValue
 from great_expectations.validator.exception_info import ExceptionInfo
 from great_expectations.validator.metric_configuration import MetricConfiguration
@@ -15,6 +20,9 @@ if TYPE_CHECKING:
     from typing_extensions import TypeAlias
 
     from great_expectations.execution_engine import ExecutionEngine
+    from great_expectations.execution_engine.persistent_metric_cache import (
+        PersistentMetricCache,
+    )
 
 logger = logging.getLogger(__name__)
 logging.captureWarnings(True)
@@ -252,7 +260,9 @@ class MetricsCalculator:
         # Set to low number (e.g., 3) to suppress progress bar for small graphs.
     ) -> Tuple[_MetricsDict, _AbortedMetricsInfoDict]:
         """
-        Calls "ValidationGraph.resolve()" method with supplied arguments.
+        Calls "ValidationGraph.resolve()" method with supplied arguments (if active Batch is read in chunks, graph is
+        resolved chunk by chunk, and values of mergeable metrics are merged; see "resolve_validation_graph_in_chunks()").
+        If ExecutionEngine has persistent metric cache, cached metrics (and their dependencies) are not computed again.
 
         Args:
             graph: "ValidationGraph" object, containing "metric_edge" structures with "MetricConfiguration" objects.
@@ -263,6 +273,28 @@ class MetricsCalculator:
             Dictionary with requested metrics resolved, with unique metric ID as key and computed metric as value.
             Dictionary with aborted metrics information, with metric ID as key.
         """  # noqa: E501
+        if isinstance(
+            self._execution_engine.batch_manager.active_batch_data, PandasChunkedBatchData
+        ):
+            return resolve_validation_graph_in_chunks(
+                graph=graph,
+                execution_engine=self._execution_engine,  # type: ignore[arg-type]
+                runtime_configuration=runtime_configuration,
+                min_graph_edges_pbar_enable=min_graph_edges_pbar_enable,
+                show_progress_bars=self._show_progress_bars,
+            )
+
+        persistent_metric_cache: Optional[PersistentMetricCache] = (
+            self._execution_engine.persistent_metric_cache
+        )
+        if persistent_metric_cache is not None:
+            return self._resolve_validation_graph_with_persistent_metric_cache(
+                graph=graph,
+                persistent_metric_cache=persistent_metric_cache,
+                runtime_configuration=runtime_configuration,
+                min_graph_edges_pbar_enable=min_graph_edges_pbar_enable,
+            )
+
         resolved_metrics: _MetricsDict
         aborted_metrics_info: _AbortedMetricsInfoDict
         resolved_metrics, aborted_metrics_info = graph.resolve(
@@ -271,3 +303,156 @@ class MetricsCalculator:
             show_progress_bars=self._show_progress_bars,
         )
         return resolved_metrics, aborted_metrics_info
+
+    def _resolve_validation_graph_with_persistent_metric_cache(
+        self,
+        graph: ValidationGraph,
+        persistent_metric_cache: PersistentMetricCache,
+        runtime_configuration: Optional[dict] = None,
+        min_graph_edges_pbar_enable: int = 0,
+    ) -> Tuple[_MetricsDict, _AbortedMetricsInfoDict]:
+        """Looks up metrics of graph in persistent cache, resolves only subgraph, which cached
+        metrics do not cover, and stores newly resolved metrics in cache.
+
+        Metrics are cached under fingerprint of their Batch (metrics of Batches without fingerprint
+        are not cached); intermediate metrics, which are local to Batch data (conditions, maps,
+        aggregate functions), are never cached.
+        """
+        metric_configurations: Dict[_MetricKey, MetricConfiguration] = graph.metric_configurations
+        fingerprints: Dict[_MetricKey, str] = self._get_metric_fingerprints(
+            metric_configurations=metric_configurations
+        )
+        cached_metrics: _MetricsDict = self._get_cached_metrics(
+            persistent_metric_cache=persistent_metric_cache, fingerprints=fingerprints
+        )
+        needed_metric_ids: Set[_MetricKey] = self._get_needed_metric_ids(
+            metric_configurations=metric_configurations, cached_metrics=cached_metrics
+        )
+        if not needed_metric_ids:
+            return cached_metrics, {}
+
+        needed_graph = ValidationGraph(
+            execution_engine=self._execution_engine,
+            edges=[edge for edge in graph.edges if edge.left.id in needed_metric_ids],
+        )
+        resolved_metrics: _MetricsDict
+        aborted_metrics_info: _AbortedMetricsInfoDict
+        resolved_metrics, aborted_metrics_info = needed_graph.resolve(
+            runtime_configuration=runtime_configuration,
+            min_graph_edges_pbar_enable=min_graph_edges_pbar_enable,
+            show_progress_bars=self._show_progress_bars,
+            metrics=cached_metrics,
+        )
+
+        self._store_resolved_metrics(
+            persistent_metric_cache=persistent_metric_cache,
+            fingerprints={
+                metric_id: fingerprint
+                for metric_id, fingerprint in fingerprints.items()
+                if metric_id in resolved_metrics and metric_id not in cached_metrics
+            },
+            resolved_metrics=resolved_metrics,
+        )
+
+        return resolved_metrics, aborted_metrics_info
+
+    def _get_metric_fingerprints(
+        self, metric_configurations: Dict[_MetricKey, MetricConfiguration]
+    ) -> Dict[_MetricKey, str]:
+        """Returns Batch fingerprints of cacheable metrics (those of Batches with fingerprint)."""
+        batch_fingerprints: Dict[Optional[str], Optional[str]] = {}
+        fingerprints: Dict[_MetricKey, str] = {}
+        metric_id: _MetricKey
+        metric_configuration: MetricConfiguration
+        for metric_id, metric_configuration in metric_configurations.items():
+            if metric_configuration.metric_name.endswith(CHUNK_LOCAL_METRIC_NAME_SUFFIXES):
+                continue
+
+            batch_id: Optional[str] = metric_configuration.metric_domain_kwargs.get("batch_id")
+            if batch_id not in batch_fingerprints:
+                batch_fingerprints[batch_id] = self._execution_engine.get_batch_fingerprint(
+                    batch_id=batch_id
+                )
+
+            fingerprint: Optional[str] = batch_fingerprints[batch_id]
+            if fingerprint is not None:
+                fingerprints[metric_id] = fingerprint
+
+        return fingerprints
+
+    @staticmethod
+    def _get_cached_metrics(
+        persistent_metric_cache: PersistentMetricCache, fingerprints: Dict[_MetricKey, str]
+    ) -> _MetricsDict:
+        cached_metrics: _MetricsDict = {}
+        fingerprint: str
+        metric_ids: List[_MetricKey]
+        for fingerprint, metric_ids in _group_metric_ids_by_fingerprint(fingerprints).items():
+            cached_metrics.update(
+                persistent_metric_cache.get_many(fingerprint=fingerprint, metric_ids=metric_ids)
+            )
+
+        return cached_metrics
+
+    @staticmethod
+    def _store_resolved_metrics(
+        persistent_metric_cache: PersistentMetricCache,
+        fingerprints: Dict[_MetricKey, str],
+        resolved_metrics: _MetricsDict,
+    ) -> None:
+        fingerprint: str
+        metric_ids: List[_MetricKey]
+        for fingerprint, metric_ids in _group_metric_ids_by_fingerprint(fingerprints).items():
+            persistent_metric_cache.set_many(
+                fingerprint=fingerprint,
+                values={metric_id: resolved_metrics[metric_id] for metric_id in metric_ids},
+            )
+
+    @staticmethod
+    def _get_needed_metric_ids(
+        metric_configurations: Dict[_MetricKey, MetricConfiguration],
+        cached_metrics: _MetricsDict,
+    ) -> Set[_MetricKey]:
+        """Returns IDs of metrics, which are not cached, together with their uncached dependencies
+        (Batch-local metrics are needed only if other metrics need them)."""
+        dependent_metric_ids: Set[_MetricKey] = {
+            dependency.id
+            for metric_configuration in metric_configurations.values()
+            for dependency in metric_configuration.metric_dependencies.values()
+        }
+        needed_metric_ids: Set[_MetricKey] = set()
+        stack: List[_MetricKey] = [
+            metric_id
+            for metric_id, metric_configuration in metric_configurations.items()
+            if metric_id not in cached_metrics
+            and (
+                not metric_configuration.metric_name.endswith(CHUNK_LOCAL_METRIC_NAME_SUFFIXES)
+                or metric_id not in dependent_metric_ids
+            )
+        ]
+        metric_id: _MetricKey
+        while stack:
+            metric_id = stack.pop()
+            if metric_id in needed_metric_ids:
+                continue
+
+            needed_metric_ids.add(metric_id)
+            stack.extend(
+                dependency.id
+                for dependency in metric_configurations[metric_id].metric_dependencies.values()
+                if dependency.id in metric_configurations and dependency.id not in cached_metrics
+            )
+
+        return needed_metric_ids
+
+
+def _group_metric_ids_by_fingerprint(
+    fingerprints: Dict[_MetricKey, str],
+) -> Dict[str, List[_MetricKey]]:
+    metric_ids_by_fingerprint: Dict[str, List[_MetricKey]] = {}
+    metric_id: _MetricKey
+    fingerprint: str
+    for metric_id, fingerprint in fingerprints.items():
+        metric_ids_by_fingerprint.setdefault(fingerprint, []).append(metric_id)
+
+    return metric_ids_by_fingerprint
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 from functools import cached_property
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Optional, Set
 
 from great_expectations.core.expectation_validation_result import (
     ExpectationSuiteValidationResult,
     ExpectationValidationResult,
 )
+from great_expectations.core.metric_domain_types import MetricDomainTypes
 from great_expectations.core.result_format import ResultFormat
+from great_expectations.exceptions import ExpectationNotFoundError
 from great_expectations.validator.validator import Validator as OldValidator
 from great_expectations.validator.validator import calc_validation_statistics
 
@@ -20,6 +22,18 @@ if TYPE_CHECKING:
         ExpectationConfiguration,
     )
 
+# Table expectations, whose outcome does not depend on which columns are loaded.
+COLUMN_PROJECTION_INDEPENDENT_TABLE_EXPECTATION_TYPES = frozenset(
+    (
+        "expect_table_row_count_to_be_between",
+        "expect_table_row_count_to_equal",
+    )
+)
+
+# Expectation kwargs, naming columns of Column, ColumnPair, and Multicolumn Domains.
+_COLUMN_KWARG_NAMES = ("column", "column_A", "column_B")
+_COLUMN_LIST_KWARG_NAMES = ("column_list",)
+
 
 class Validator:
     """Validator.
@@ -36,6 +50,8 @@ class Validator:
         self._batch_definition = batch_definition
         self._batch_parameters = batch_parameters
         self.result_format = result_format
+        # Columns loaded into batch (all columns, if None); see "_update_column_projection()".
+        self._columns: Optional[Set[str]] = None
 
         from great_expectations import project_manager
 
@@ -82,19 +98,48 @@ class Validator:
     def active_batch_id(self) -> Optional[str]:
         return self._wrapped_validator.active_batch_id
 
+    def release_batches(self) -> None:
+        """Releases Batch, loaded for validation, so that its data can be freed (it is loaded again, if needed)."""  # noqa: E501
+        wrapped_validator: Optional[OldValidator] = self.__dict__.pop("_wrapped_validator", None)
+        if wrapped_validator is not None:
+            wrapped_validator.release_batches()
+
     @cached_property
     def _wrapped_validator(self) -> OldValidator:
         batch_request = self._batch_definition.build_batch_request(
             batch_parameters=self._batch_parameters
         )
+        if self._columns is not None:
+            batch_request.columns = sorted(self._columns)
         return self._get_validator(batch_request=batch_request)
 
+    def _update_column_projection(
+        self, expectation_configs: list[ExpectationConfiguration]
+    ) -> None:
+        """Restricts columns, loaded into batch, to columns referenced by expectation configurations.
+
+        Batch, already loaded with columns, which do not cover referenced columns, is discarded (and loaded again).
+        """  # noqa: E501
+        columns: Optional[Set[str]] = None
+        if self.result_format != ResultFormat.COMPLETE:
+            # Complete result format returns entire unexpected rows (hence, all their columns).
+            columns = get_referenced_columns(expectation_configs)
+
+        if "_wrapped_validator" in self.__dict__:
+            if self._columns is None or (columns is not None and columns <= self._columns):
+                return
+
+            self.release_batches()
+
+        self._columns = columns
+
     def _validate_expectation_configs(
         self,
         expectation_configs: list[ExpectationConfiguration],
         evaluation_parameters: Optional[dict[str, Any]] = None,
     ) -> list[ExpectationValidationResult]:
         """Run a list of expectation configurations against the batch definition"""
+        self._update_column_projection(expectation_configs)
         processed_expectation_configs = self._wrapped_validator.process_expectations_for_validation(
             expectation_configs, evaluation_parameters
         )
@@ -105,3 +150,81 @@ class Validator:
         )
 
         return results
+
+
+def get_referenced_columns(
+    expectation_configs: list[ExpectationConfiguration],
+) -> Optional[Set[str]]:
+    """Returns columns, referenced by expectation configurations (hence, only columns required for
+    validation).
+
+    None is returned, if expectation configurations may depend on columns, which they do not name
+    explicitly (e.g., table expectations on columns, "row_condition" filters, and custom
+    expectations, whose Domain cannot be determined).
+    """
+    referenced_columns: list[Any] = []
+
+    expectation_config: ExpectationConfiguration
+    expectation_columns: Optional[list[Any]]
+    for expectation_config in expectation_configs:
+        expectation_columns = _get_expectation_referenced_columns(expectation_config)
+        if expectation_columns is None:
+            return None
+
+        referenced_columns.extend(expectation_columns)
+
+    # Column names, given as evaluation parameters, are not known until evaluation parameters are
+    # processed.
+    if not all(isinstance(column, str) for column in referenced_columns):
+        return None
+
+    # Batch must retain at least one column, in order to retain its rows.
+    return set(referenced_columns) or None
+
+
+def _get_expectation_referenced_columns(
+    expectation_config: ExpectationConfiguration,
+) -> Optional[list[Any]]:
+    """Returns columns, referenced by single expectation configuration (None, if it may depend on
+    columns, which it does not name explicitly)."""
+    try:
+        domain_type: MetricDomainTypes = expectation_config._get_expectation_impl().domain_type
+    except ExpectationNotFoundError:
+        return None
+
+    kwargs: dict = expectation_config.kwargs
+    if kwargs.get("row_condition"):
+        return None
+
+    referenced_columns: list[Any] = []
+    if domain_type == MetricDomainTypes.TABLE:
+        if (
+            expectation_config.expectation_type
+            not in COLUMN_PROJECTION_INDEPENDENT_TABLE_EXPECTATION_TYPES
+        ):
+            return None
+    else:
+        referenced_columns.extend(_get_domain_kwargs_columns(kwargs))
+
+    result_format: Any = kwargs.get("result_format")
+    if isinstance(result_format, dict):
+        if result_format.get("result_format") == ResultFormat.COMPLETE.value:
+            return None
+
+        referenced_columns.extend(result_format.get("unexpected_index_column_names") or [])
+    elif result_format == ResultFormat.COMPLETE.value:
+        return None
+
+    return referenced_columns
+
+
+def _get_domain_kwargs_columns(kwargs: dict) -> list[Any]:
+    columns: list[Any] = [kwargs[name] for name in _COLUMN_KWARG_NAMES if kwargs.get(name)]
+    for name in _COLUMN_LIST_KWARG_NAMES:
+        column_list: Any = kwargs.get(name) or []
+        if isinstance(column_list, (list, tuple)):
+            columns.extend(column_list)
+        else:
+            columns.append(column_list)
+
+    return columns
@@ -20,6 +20,10 @@ from great_expectations.compatibility.typing_extensions import override
 from great_expectations.expectations.registry import get_metric_provider
 from great_expectations.validator.exception_info import ExceptionInfo
 from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.metric_resolution_scheduler import (
+    MetricResolutionScheduler,
+    build_metric_resolution_scheduler,
+)
 
 if TYPE_CHECKING:
     from great_expectations.core import IDDict
@@ -89,6 +93,17 @@ class ValidationGraph:
 
         self._edge_ids = {edge.id for edge in self._edges}
 
+        # Adjacency index of metric dependencies (maintained incrementally as edges are added),
+        # enabling resolution to update set of ready metrics as metrics resolve, rather than
+        # re-scanning all edges in every round.
+        self._metric_configurations: Dict[_MetricKey, MetricConfiguration] = {}
+        self._dependency_ids: Dict[_MetricKey, Set[_MetricKey]] = {}
+        self._dependent_ids: Dict[_MetricKey, Set[_MetricKey]] = {}
+
+        edge: MetricEdge
+        for edge in self._edges:
+            self._index_edge(edge=edge)
+
     @override
     def __eq__(self, other) -> bool:
         """Supports comparing two "ValidationGraph" objects."""
@@ -104,11 +119,27 @@ class ValidationGraph:
         """Returns "MetricEdge" objects, contained within this "ValidationGraph" object (as set of two-tuples)."""  # noqa: E501
         return {edge.id for edge in self._edges}
 
+    @property
+    def metric_configurations(self) -> Dict[_MetricKey, MetricConfiguration]:
+        """Returns "MetricConfiguration" objects (graph vertices), keyed by their IDs."""
+        return self._metric_configurations
+
     def add(self, edge: MetricEdge) -> None:
         """Adds supplied "MetricEdge" object to this "ValidationGraph" object (if not already present)."""  # noqa: E501
         if edge.id not in self._edge_ids:
             self._edges.append(edge)
             self._edge_ids.add(edge.id)
+            self._index_edge(edge=edge)
+
+    def _index_edge(self, edge: MetricEdge) -> None:
+        """Records "left" metric of supplied "MetricEdge" as graph vertex and its dependency on "right" metric (if any)."""  # noqa: E501
+        left_id: _MetricKey = edge.left.id
+        self._metric_configurations.setdefault(left_id, edge.left)
+        dependency_ids: Set[_MetricKey] = self._dependency_ids.setdefault(left_id, set())
+        if edge.right is not None:
+            right_id: _MetricKey = edge.right.id
+            dependency_ids.add(right_id)
+            self._dependent_ids.setdefault(right_id, set()).add(left_id)
 
     def build_metric_dependency_graph(
         self,
@@ -154,6 +185,11 @@ class ValidationGraph:
                         f"Metric {metric_configuration.id!s} has created a circular dependency"
                     )
                     continue
+                # Defaults are applied before edge is added, so that ID of dependency (used as key
+                # of edge and of dependency index) is final by the time edge is recorded.
+                self.set_metric_configuration_default_kwargs_if_absent(
+                    metric_configuration=metric_dependency
+                )
                 self.add(
                     MetricEdge(
                         left=metric_configuration,
@@ -195,19 +231,32 @@ class ValidationGraph:
         min_graph_edges_pbar_enable: int = 0,
         # Set to low number (e.g., 3) to suppress progress bar for small graphs.
         show_progress_bars: bool = True,
+        metrics: Optional[Dict[_MetricKey, MetricValue]] = None,
     ) -> Tuple[
         Dict[_MetricKey, MetricValue],
         _AbortedMetricsInfoDict,
     ]:
-        resolved_metrics: Dict[_MetricKey, MetricValue] = {}
-
-        # updates graph with aborted metrics
-        aborted_metrics_info: _AbortedMetricsInfoDict = self._resolve(
-            metrics=resolved_metrics,
-            runtime_configuration=runtime_configuration,
-            min_graph_edges_pbar_enable=min_graph_edges_pbar_enable,
-            show_progress_bars=show_progress_bars,
+        # Metrics, supplied as already resolved (e.g., from cache), are not computed again.
+        resolved_metrics: Dict[_MetricKey, MetricValue] = dict(metrics or {})
+
+        # Domains, shared by many pending metrics, may be prepared once (e.g., materialized).
+        self._execution_engine.prepare_domain_records(
+            metric_configurations=[
+                metric_configuration
+                for metric_id, metric_configuration in self._metric_configurations.items()
+                if metric_id not in resolved_metrics
+            ]
         )
+        try:
+            # updates graph with aborted metrics
+            aborted_metrics_info: _AbortedMetricsInfoDict = self._resolve(
+                metrics=resolved_metrics,
+                runtime_configuration=runtime_configuration,
+                min_graph_edges_pbar_enable=min_graph_edges_pbar_enable,
+                show_progress_bars=show_progress_bars,
+            )
+        finally:
+            self._execution_engine.release_domain_records()
 
         return resolved_metrics, aborted_metrics_info
 
@@ -233,15 +282,24 @@ class ValidationGraph:
         aborted_metrics_info: _AbortedMetricsInfoDict = {}
 
         ready_metrics: Set[MetricConfiguration]
-        needed_metrics: Set[MetricConfiguration]
+        unmet_dependency_counts: Dict[_MetricKey, int]
+        ready_metrics, unmet_dependency_counts = self._initialize_ready_queue(metrics=metrics)
+
+        ready_metrics_count: int
+        needed_metrics_count: int
 
         exception_info: ExceptionInfo
 
         progress_bar: Optional[tqdm] = None
 
+        scheduler: MetricResolutionScheduler = build_metric_resolution_scheduler(
+            runtime_configuration=runtime_configuration
+        )
+
         done: bool = False
         while not done:
-            ready_metrics, needed_metrics = self._parse(metrics=metrics)
+            ready_metrics_count = len(ready_metrics)
+            needed_metrics_count = len(unmet_dependency_counts)
 
             # Check to see if the user has disabled progress bars
             disable = not show_progress_bars
@@ -251,7 +309,7 @@ class ValidationGraph:
             if progress_bar is None:
                 # noinspection PyProtectedMember,SpellCheckingInspection
                 progress_bar = tqdm(
-                    total=len(ready_metrics) + len(needed_metrics),
+                    total=ready_metrics_count + needed_metrics_count,
                     desc="Calculating Metrics",
                     disable=disable,
                 )
@@ -270,50 +328,69 @@ class ValidationGraph:
                 else:
                     computable_metrics.add(metric)
 
-            try:
-                # Access "ExecutionEngine.resolve_metrics()" method, to resolve missing "MetricConfiguration" objects.  # noqa: E501
-                metrics.update(
-                    self._execution_engine.resolve_metrics(
-                        metrics_to_resolve=computable_metrics,  # type: ignore[arg-type]  # Metric typing needs further refinement.
-                        metrics=metrics,  # type: ignore[arg-type]  # Metric typing needs further refinement.
-                        runtime_configuration=runtime_configuration,
-                    )
-                )
-                progress_bar.update(len(computable_metrics))
-                progress_bar.refresh()
-            except gx_exceptions.MetricResolutionError as err:
-                if catch_exceptions:
-                    exception_traceback = traceback.format_exc()
-                    exception_message = str(err)
-                    exception_info = ExceptionInfo(
-                        exception_traceback=exception_traceback,
-                        exception_message=exception_message,
-                    )
-                    for failed_metric in err.failed_metrics:
-                        if failed_metric.id in failed_metric_info:
-                            failed_metric_info[failed_metric.id]["num_failures"] += 1  # type: ignore[operator]  # Incorrect flagging of 'Unsupported operand types for <= ("int" and "MetricConfiguration") and for >= ("Set[ExceptionInfo]" and "int")' in deep "Union" structure.
-                            failed_metric_info[failed_metric.id]["exception_info"] = exception_info
-                        else:
-                            failed_metric_info[failed_metric.id] = {}
-                            failed_metric_info[failed_metric.id]["metric_configuration"] = (
-                                failed_metric
-                            )
-                            failed_metric_info[failed_metric.id]["num_failures"] = 1
-                            failed_metric_info[failed_metric.id]["exception_info"] = exception_info
-
-                else:
-                    raise err  # noqa: TRY201
-            except Exception as e:
-                if catch_exceptions:
-                    logger.error(  # noqa: TRY400
-                        f"""Caught exception {e!s} while trying to resolve a set of {len(ready_metrics)} metrics; aborting graph resolution."""  # noqa: E501
-                    )
-                    done = True
-                else:
-                    raise e  # noqa: TRY201
+            resolved_metrics: Dict[_MetricKey, MetricValue]
+            exceptions: List[Exception]
+            # Dispatch "ExecutionEngine.resolve_metrics()" calls, resolving missing "MetricConfiguration" objects.  # noqa: E501
+            resolved_metrics, exceptions = scheduler.resolve_metrics(
+                execution_engine=self._execution_engine,
+                metrics_to_resolve=computable_metrics,
+                metrics=metrics,
+                runtime_configuration=runtime_configuration,
+            )
+            self._update_ready_queue(
+                resolved_metric_ids=[
+                    metric_id for metric_id in resolved_metrics if metric_id not in metrics
+                ],
+                ready_metrics=ready_metrics,
+                unmet_dependency_counts=unmet_dependency_counts,
+            )
+            metrics.update(resolved_metrics)
+            progress_bar.update(
+                len([metric for metric in computable_metrics if metric.id in resolved_metrics])
+            )
+            progress_bar.refresh()
 
-            if (len(ready_metrics) + len(needed_metrics) == 0) or (
-                len(ready_metrics) == len(aborted_metrics_info)
+            err: Exception
+            for err in exceptions:
+                if isinstance(err, gx_exceptions.MetricResolutionError):
+                    if catch_exceptions:
+                        exception_traceback = "".join(
+                            traceback.format_exception(type(err), err, err.__traceback__)
+                        )
+                        exception_message = str(err)
+                        exception_info = ExceptionInfo(
+                            exception_traceback=exception_traceback,
+                            exception_message=exception_message,
+                        )
+                        for failed_metric in err.failed_metrics:
+                            if failed_metric.id in failed_metric_info:
+                                failed_metric_info[failed_metric.id]["num_failures"] += 1  # type: ignore[operator]  # Incorrect flagging of 'Unsupported operand types for <= ("int" and "MetricConfiguration") and for >= ("Set[ExceptionInfo]" and "int")' in deep "Union" structure.
+                                failed_metric_info[failed_metric.id]["exception_info"] = (
+                                    exception_info
+                                )
+                            else:
+                                failed_metric_info[failed_metric.id] = {}
+                                failed_metric_info[failed_metric.id]["metric_configuration"] = (
+                                    failed_metric
+                                )
+                                failed_metric_info[failed_metric.id]["num_failures"] = 1
+                                failed_metric_info[failed_metric.id]["exception_info"] = (
+                                    exception_info
+                                )
+
+                    else:
+                        raise err
+                else:  # noqa: PLR5501
+                    if catch_exceptions:
+                        logger.error(
+                            f"""Caught exception {err!s} while trying to resolve a set of {ready_metrics_count} metrics; aborting graph resolution."""  # noqa: E501
+                        )
+                        done = True
+                    else:
+                        raise err
+
+            if (ready_metrics_count + needed_metrics_count == 0) or (
+                ready_metrics_count == len(aborted_metrics_info)
             ):
                 done = True
 
@@ -321,29 +398,59 @@ class ValidationGraph:
 
         return aborted_metrics_info
 
-    def _parse(
+    def _initialize_ready_queue(
         self,
         metrics: Dict[_MetricKey, MetricValue],
-    ) -> Tuple[Set[MetricConfiguration], Set[MetricConfiguration]]:
-        """Given validation graph, returns the ready and needed metrics necessary for validation using a traversal of
-        validation graph (a graph structure of metric ids) edges"""  # noqa: E501
-        unmet_dependency_ids = set()
-        unmet_dependency = set()
-        maybe_ready_ids = set()
-        maybe_ready = set()
-
-        for edge in self.edges:
-            if edge.left.id not in metrics:
-                if edge.right is None or edge.right.id in metrics:
-                    if edge.left.id not in maybe_ready_ids:
-                        maybe_ready_ids.add(edge.left.id)
-                        maybe_ready.add(edge.left)
-                else:  # noqa: PLR5501
-                    if edge.left.id not in unmet_dependency_ids:
-                        unmet_dependency_ids.add(edge.left.id)
-                        unmet_dependency.add(edge.left)
+    ) -> Tuple[Set[MetricConfiguration], Dict[_MetricKey, int]]:
+        """Given already resolved metrics, returns unresolved metrics, whose dependencies are all resolved (i.e., ready),
+        and numbers of unresolved dependencies, keyed by ID of each unresolved metric that is still needed."""  # noqa: E501
+        ready_metrics: Set[MetricConfiguration] = set()
+        unmet_dependency_counts: Dict[_MetricKey, int] = {}
+
+        metric_id: _MetricKey
+        metric_configuration: MetricConfiguration
+        unmet_dependency_count: int
+        for metric_id, metric_configuration in self._metric_configurations.items():
+            if metric_id in metrics:
+                continue
+
+            unmet_dependency_count = len(
+                [
+                    dependency_id
+                    for dependency_id in self._dependency_ids[metric_id]
+                    if dependency_id not in metrics
+                ]
+            )
+            if unmet_dependency_count == 0:
+                ready_metrics.add(metric_configuration)
+            else:
+                unmet_dependency_counts[metric_id] = unmet_dependency_count
+
+        return ready_metrics, unmet_dependency_counts
+
+    def _update_ready_queue(
+        self,
+        resolved_metric_ids: List[_MetricKey],
+        ready_metrics: Set[MetricConfiguration],
+        unmet_dependency_counts: Dict[_MetricKey, int],
+    ) -> None:
+        """Removes newly resolved metrics from "ready_metrics" and promotes their dependents, whose last unresolved
+        dependency has just been resolved, to "ready_metrics" (only dependents of newly resolved metrics are visited)."""  # noqa: E501
+        resolved_metric_id: _MetricKey
+        dependent_id: _MetricKey
+        for resolved_metric_id in resolved_metric_ids:
+            if resolved_metric_id in self._metric_configurations:
+                ready_metrics.discard(self._metric_configurations[resolved_metric_id])
+                unmet_dependency_counts.pop(resolved_metric_id, None)
+
+            for dependent_id in self._dependent_ids.get(resolved_metric_id, set()):
+                if dependent_id not in unmet_dependency_counts:
+                    continue
 
-        return maybe_ready - unmet_dependency, unmet_dependency
+                unmet_dependency_counts[dependent_id] -= 1
+                if unmet_dependency_counts[dependent_id] == 0:
+                    del unmet_dependency_counts[dependent_id]
+                    ready_metrics.add(self._metric_configurations[dependent_id])
 
     @staticmethod
     def _set_default_metric_kwargs_if_absent(
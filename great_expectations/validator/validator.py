@@ -191,6 +191,8 @@ class Validator:
         execution_engine.batch_manager.reset_batch_cache()
         self._execution_engine: ExecutionEngine = execution_engine
 
+        # IDs of Batches, which this Validator holds loaded (see "release_batches()").
+        self._acquired_batch_ids: List[str] = []
         if batches:
             self.load_batch_list(batch_list=batches)
 
@@ -304,6 +306,17 @@ class Validator:
 
     def load_batch_list(self, batch_list: Sequence[Batch | FluentBatch]) -> None:
         self._execution_engine.batch_manager.load_batch_list(batch_list=batch_list)
+        batch_ids: List[str] = [batch.id for batch in batch_list]
+        self._execution_engine.batch_manager.acquire_batches(batch_ids=batch_ids)
+        self._acquired_batch_ids.extend(batch_ids)
+
+    def release_batches(self) -> None:
+        """Releases Batches, loaded by this Validator, so that ExecutionEngine can free their data (e.g., unpersist Spark DataFrames), once no other Validator holds them.
+
+        Validator cannot compute metrics of released Batches afterwards.
+        """  # noqa: E501
+        self._execution_engine.batch_manager.release_batches(batch_ids=self._acquired_batch_ids)
+        self._acquired_batch_ids = []
 
     @public_api
     def get_metric(
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import collections
 import json
 import pathlib
+import threading
+import time
 import uuid
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict, List
 from unittest import mock
 
 import pytest
@@ -20,6 +23,7 @@ from great_expectations.checkpoint.actions import (
 from great_expectations.checkpoint.v1_checkpoint import (
     Checkpoint,
     CheckpointAction,
+    CheckpointConcurrencyConfig,
     CheckpointResult,
 )
 from great_expectations.compatibility.pydantic import ValidationError
@@ -211,6 +215,31 @@ class TestCheckpointSerialization:
         self._assert_valid_uuid(actual["validation_definitions"][0]["id"])
         self._assert_valid_uuid(actual["validation_definitions"][1]["id"])
 
+    @pytest.mark.unit
+    def test_checkpoint_serialization_with_concurrency(
+        self, validation_definitions: list[ValidationDefinition]
+    ):
+        cp = Checkpoint(
+            name="my_checkpoint",
+            validation_definitions=validation_definitions,
+            concurrency=CheckpointConcurrencyConfig(max_workers=2),
+        )
+
+        actual = json.loads(cp.json(models_as_dict=False))
+
+        assert actual["concurrency"] == {
+            "max_workers": 2,
+            "max_workers_per_data_source": 1,
+            "concurrent_actions": True,
+        }
+        assert "concurrency" not in cp.dict(exclude={"concurrency"})
+
+    @pytest.mark.unit
+    def test_checkpoint_concurrency_rejects_multiple_workers_per_data_source(self):
+        # Validation definitions of one data source share its execution engine.
+        with pytest.raises(ValidationError):
+            CheckpointConcurrencyConfig(max_workers_per_data_source=2)
+
     @pytest.mark.filesystem
     def test_checkpoint_filesystem_round_trip_adds_ids(
         self,
@@ -528,6 +557,117 @@ class TestCheckpointResult:
             result_format=ResultFormat.SUMMARY,
         )
 
+    @pytest.mark.unit
+    def test_checkpoint_run_concurrently(
+        self, mock_suite: MockerFixture, mock_batch_def: MockerFixture
+    ):
+        data_source_names = ["ds_a", "ds_b", "ds_a", "ds_b", "ds_c"]
+        validation_definitions = [
+            ValidationDefinition(
+                name=f"my_validation_def_{idx}", data=mock_batch_def, suite=mock_suite
+            )
+            for idx in range(len(data_source_names))
+        ]
+        data_source_name_by_validation_definition_name = {
+            validation_definition.name: data_source_name
+            for validation_definition, data_source_name in zip(
+                validation_definitions, data_source_names
+            )
+        }
+
+        lock = threading.Lock()
+        running_per_data_source: Dict[str, int] = collections.Counter()
+        max_running_per_data_source: Dict[str, int] = collections.Counter()
+        max_running = 0
+
+        def _run(validation_definition: ValidationDefinition, **kwargs):
+            nonlocal max_running
+            data_source_name = data_source_name_by_validation_definition_name[
+                validation_definition.name
+            ]
+            with lock:
+                running_per_data_source[data_source_name] += 1
+                max_running_per_data_source[data_source_name] = max(
+                    max_running_per_data_source[data_source_name],
+                    running_per_data_source[data_source_name],
+                )
+                max_running = max(max_running, sum(running_per_data_source.values()))
+
+            # Later validation definitions finish first.
+            time.sleep(0.05 * (len(validation_definitions) - int(validation_definition.name[-1])))
+
+            with lock:
+                running_per_data_source[data_source_name] -= 1
+
+            return ExpectationSuiteValidationResult(
+                success=True,
+                results=[],
+                suite_name=self.suite_name,
+                batch_id=validation_definition.name,
+            )
+
+        checkpoint = Checkpoint(
+            name=self.checkpoint_name,
+            validation_definitions=validation_definitions,
+            concurrency=CheckpointConcurrencyConfig(max_workers=4),
+        )
+        with mock.patch.object(
+            ValidationDefinition, "run", autospec=True, side_effect=_run
+        ), mock.patch.object(
+            Checkpoint,
+            "_get_data_source_name",
+            side_effect=lambda validation_definition: (
+                data_source_name_by_validation_definition_name[validation_definition.name]
+            ),
+        ):
+            result = checkpoint.run()
+
+        assert [key.batch_identifier for key in result.run_results] == [
+            validation_definition.name for validation_definition in validation_definitions
+        ]
+        assert max_running > 1
+        assert max(max_running_per_data_source.values()) == 1
+
+    @pytest.mark.unit
+    def test_checkpoint_run_actions_concurrently(
+        self,
+        validation_definition: ValidationDefinition,
+        mocker: MockerFixture,
+    ):
+        set_context(mocker.Mock(spec=AbstractDataContext))
+        actions = [
+            SlackNotificationAction(slack_webhook="slack_webhook_1"),
+            UpdateDataDocsAction(),
+            SlackNotificationAction(slack_webhook="slack_webhook_2"),
+            MicrosoftTeamsNotificationAction(teams_webhook="teams_webhook"),
+        ]
+        checkpoint = Checkpoint(
+            name=self.checkpoint_name,
+            validation_definitions=[validation_definition],
+            actions=actions,
+            concurrency=CheckpointConcurrencyConfig(),
+        )
+
+        assert checkpoint._group_independent_actions() == [
+            [actions[0]],
+            [actions[1]],
+            [actions[2], actions[3]],
+        ]
+
+        context_sizes: List[int] = []
+
+        def _v1_run(action: ValidationAction, checkpoint_result, action_context):
+            context_sizes.append(len(action_context.data))
+            return {"type": action.type}
+
+        with mock.patch.object(
+            ValidationAction, "v1_run", autospec=True, side_effect=_v1_run
+        ), mock.patch.object(UpdateDataDocsAction, "v1_run", autospec=True, side_effect=_v1_run):
+            _ = checkpoint.run()
+
+        # Notifications following data docs update see its result; context is updated in configured order.  # noqa: E501
+        assert sorted(context_sizes) == [0, 1, 2, 2]
+
     @pytest.mark.unit
     def test_result_init_no_run_results_raises_error(self, mocker: MockerFixture):
         with pytest.raises(ValueError) as e:
@@ -0,0 +1,92 @@
+import copy
+import hashlib
+import json
+import pickle
+
+import pytest
+
+from great_expectations.core import IDDict
+from great_expectations.core.batch_spec import PandasBatchSpec
+from great_expectations.core.util import convert_to_json_serializable
+from great_expectations.types.attributes import Attributes
+
+
+def _reference_id(id_dict: dict) -> str:
+    return hashlib.md5(
+        json.dumps(convert_to_json_serializable(data=id_dict), sort_keys=True).encode("utf-8")
+    ).hexdigest()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "id_dict",
+    [
+        pytest.param({"batch_id": "my_batch", "column": "a"}, id="strings"),
+        pytest.param({"column": "a", "mostly": 0.95, "strict": True, "n": None}, id="scalars"),
+        pytest.param({"column": "a", "value_set": [1, 2, 3]}, id="list"),
+        pytest.param({"column": "a", "nested": {"b": (1, 2)}}, id="nested"),
+    ],
+)
+def test_to_id_matches_json_digest(id_dict: dict):
+    assert IDDict(id_dict).to_id() == _reference_id(id_dict)
+
+
+@pytest.mark.unit
+def test_to_id_is_memoized_and_invalidated_by_mutation():
+    id_dict = IDDict({"batch_id": "my_batch", "column": "a"})
+    original_id = id_dict.to_id()
+    assert id_dict.__dict__["_id_cache"] == original_id
+
+    id_dict["column"] = "b"
+    assert id_dict.to_id() == _reference_id({"batch_id": "my_batch", "column": "b"})
+
+    id_dict.update({"row_condition": "b>0"})
+    assert id_dict.to_id() == _reference_id(
+        {"batch_id": "my_batch", "column": "b", "row_condition": "b>0"}
+    )
+
+    id_dict.pop("row_condition")
+    del id_dict["column"]
+    assert id_dict.to_id() == "batch_id=my_batch"
+
+    id_dict.setdefault("column", "a")
+    assert id_dict.to_id() == original_id
+
+    id_dict.clear()
+    assert id_dict.to_id() == ()
+
+
+@pytest.mark.unit
+def test_to_id_is_not_memoized_for_mutable_values():
+    id_dict = IDDict({"column": "a", "value_set": [1, 2]})
+    id_dict.to_id()
+    assert "_id_cache" not in id_dict.__dict__
+
+    id_dict["value_set"].append(3)
+    assert id_dict.to_id() == _reference_id({"column": "a", "value_set": [1, 2, 3]})
+
+
+@pytest.mark.unit
+def test_to_id_memoization_survives_copy_and_pickle():
+    id_dict = IDDict({"batch_id": "my_batch", "column": "a"})
+    original_id = id_dict.to_id()
+
+    copied = copy.deepcopy(id_dict)
+    copied["column"] = "b"
+    assert copied.to_id() != original_id
+    assert id_dict.to_id() == original_id
+
+    assert pickle.loads(pickle.dumps(id_dict)).to_id() == original_id
+    assert hash(id_dict) == hash(original_id)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("dot_dict_class", [Attributes, PandasBatchSpec])
+def test_to_id_is_not_memoized_for_dot_dict_subclasses(dot_dict_class: type):
+    id_dict = dot_dict_class({"batch_id": "my_batch", "column": "a"})
+    id_dict.to_id()
+
+    # Attribute assignment bypasses "IDDict.__setitem__()".
+    id_dict.column = "b"
+
+    assert id_dict.to_id() == _reference_id({"batch_id": "my_batch", "column": "b"})
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import json
+import pathlib
 import uuid
 from typing import TYPE_CHECKING
 from unittest import mock
 
+import pandas as pd
 import pytest
 
 import great_expectations as gx
@@ -247,6 +249,33 @@ class TestValidationRun:
         assert value.success is True
 
 
+@pytest.mark.filesystem
+def test_validation_definition_run_releases_batch_after_get_validator(
+    ephemeral_context: EphemeralDataContext, tmp_path: pathlib.Path
+):
+    csv_path = tmp_path / "data.csv"
+    pd.DataFrame({"a": [1, 2, 3]}).to_csv(csv_path, index=False)
+    batch_definition = (
+        ephemeral_context.sources.add_pandas(DATA_SOURCE_NAME)
+        .add_csv_asset(ASSET_NAME, csv_path)
+        .add_batch_definition(BATCH_DEFINITION_NAME)
+    )
+    suite = ExpectationSuite(name="my_suite")
+    suite.add_expectation(gxe.ExpectColumnMaxToBeBetween(column="a", max_value=5))
+
+    # Validator, which is never released, shares execution engine of data source with run below.
+    validator = ephemeral_context.get_validator(
+        batch_request=batch_definition.build_batch_request()
+    )
+    batch_manager = validator.execution_engine.batch_manager
+
+    result = ValidationDefinition(name="my_validation", data=batch_definition, suite=suite).run()
+
+    assert result.success
+    assert batch_manager.loaded_batch_ids == []
+    assert batch_manager._batch_references == {}
+
+
 class TestValidationDefinitionSerialization:
     ds_name = "my_ds"
     asset_name = "my_asset"
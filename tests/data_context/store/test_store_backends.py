@@ -1,3 +1,4 @@
+import copy
 import datetime
 import json
 import os
@@ -500,6 +501,78 @@ def test_TupleFilesystemStoreBackend_get_all(tmp_path_factory):
     assert sorted(all_values) == [value_a, value_b]
 
 
+@pytest.mark.filesystem
+def test_TupleFilesystemStoreBackend_key_index(tmp_path):
+    base_directory = str(tmp_path / "validations")
+    my_store = TupleFilesystemStoreBackend(
+        base_directory=base_directory,
+        filepath_suffix=".json",
+        use_key_index=True,
+    )
+    assert my_store.config["use_key_index"] is True
+
+    my_store.set(("suite_a", "run_1"), "a1")
+    my_store.set(("suite_a", "run_2"), "a2")
+    my_store.set(("suite_b", "run_1"), "b1")
+    my_store.move(("suite_b", "run_1"), ("suite_c", "run_1"))
+    my_store.remove_key(("suite_a", "run_2"))
+
+    expected_keys = {("suite_a", "run_1"), ("suite_c", "run_1")}
+    assert os.path.isfile(my_store.key_index_path)  # noqa: PTH113
+    assert set(my_store.list_keys()) == expected_keys
+    assert my_store.list_keys(prefix=("suite_a",)) == [("suite_a", "run_1")]
+    assert my_store.list_keys(prefix=("suite",)) == []
+
+    # Listing reads index, rather than walking directory tree.
+    with mock.patch(
+        "great_expectations.data_context.store.tuple_store_backend.os.walk"
+    ) as mock_walk:
+        new_store = TupleFilesystemStoreBackend(
+            base_directory=base_directory,
+            filepath_suffix=".json",
+            use_key_index=True,
+        )
+        assert set(new_store.list_keys()) == expected_keys
+
+    mock_walk.assert_not_called()
+
+    # Files written by other means are listed once index is rebuilt.
+    with open(os.path.join(base_directory, "suite_d.json"), "w") as outfile:  # noqa: PTH118
+        outfile.write("d")
+
+    assert ("suite_d",) not in new_store.list_keys()
+    new_store.rebuild_key_index()
+    assert set(new_store.list_keys()) == expected_keys | {("suite_d",)}
+    assert set(
+        TupleFilesystemStoreBackend(
+            base_directory=base_directory, filepath_suffix=".json"
+        ).list_keys()
+    ) == expected_keys | {("suite_d",)}
+
+
+@pytest.mark.filesystem
+def test_TupleFilesystemStoreBackend_key_index_shared_by_several_stores(tmp_path):
+    base_directory = str(tmp_path / "validations")
+    store_a = TupleFilesystemStoreBackend(
+        base_directory=base_directory,
+        filepath_suffix=".json",
+        use_key_index=True,
+    )
+    store_b = copy.deepcopy(store_a)
+
+    store_a.set(("suite_a", "run_1"), "a1")
+    store_b.set(("suite_b", "run_1"), "b1")
+    store_a.set(("suite_a", "run_2"), "a2")
+
+    expected_keys = {("suite_a", "run_1"), ("suite_a", "run_2"), ("suite_b", "run_1")}
+    assert set(store_a.list_keys()) == expected_keys
+    assert set(store_b.list_keys()) == expected_keys
+
+    # Journal is only appended to (one line per change).
+    with open(store_a.key_index_path) as infile:
+        assert len(infile.read().splitlines()) == 3
+
+
 @pytest.mark.filesystem
 def test_TupleFilesystemStoreBackend_ignores_jupyter_notebook_checkpoints(
     tmp_path_factory,
@@ -675,6 +748,65 @@ def test_TupleS3StoreBackend_get_all(aws_credentials):
     assert sorted(result) == [val_a, val_b]
 
 
+@mock_s3
+@pytest.mark.aws_deps
+def test_TupleS3StoreBackend_get_all_downloads_objects_concurrently(aws_credentials):
+    bucket = "leakybucket"
+
+    conn = boto3.resource("s3", region_name="us-east-1")
+    conn.create_bucket(Bucket=bucket)
+
+    my_store = TupleS3StoreBackend(
+        filepath_template="my_file_{0}", bucket=bucket, get_all_max_concurrency=4
+    )
+    assert my_store.config["get_all_max_concurrency"] == 4
+
+    values = {f"K{index:02d}": f"value_{index}" for index in range(20)}
+    for key, value in values.items():
+        my_store.set((key,), value)
+
+    with mock.patch.object(
+        TupleS3StoreBackend,
+        "_get_all_concurrently",
+        wraps=TupleS3StoreBackend._get_all_concurrently,
+    ) as get_all_concurrently:
+        result = my_store.get_all()
+
+    assert get_all_concurrently.call_args.kwargs["max_concurrency"] == 4
+    assert sorted(result) == sorted(values.values())
+
+
+@pytest.mark.unit
+def test_TupleStoreBackend_get_all_concurrently_retries_transient_failures():
+    attempts: dict = {}
+
+    def get_fn(key):
+        attempts[key] = attempts.get(key, 0) + 1
+        if key == "flaky" and attempts[key] < 3:
+            raise ConnectionError("Connection reset.")
+
+        if key == "missing":
+            raise InvalidKeyError("Unable to retrieve object.")
+
+        return key.upper()
+
+    with mock.patch(
+        "great_expectations.data_context.store.tuple_store_backend.GET_ALL_RETRY_BACKOFF_SECONDS",
+        0,
+    ):
+        assert TupleS3StoreBackend._get_all_concurrently(
+            get_fn=get_fn, keys=["a", "flaky", "b"], max_concurrency=2
+        ) == ["A", "FLAKY", "B"]
+        assert attempts["flaky"] == 3
+
+        with pytest.raises(InvalidKeyError):
+            TupleS3StoreBackend._get_all_concurrently(
+                get_fn=get_fn, keys=["a", "missing"], max_concurrency=2
+            )
+
+    assert attempts["missing"] == 1
+
+
 @mock_s3
 @pytest.mark.aws_deps
 def test_tuple_s3_store_backend_slash_conditions(aws_credentials):  # noqa: PLR0915
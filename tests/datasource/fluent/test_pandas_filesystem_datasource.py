@@ -285,8 +285,10 @@ class TestDynamicPandasAssets:
             )
             .build_batch_request({"year": "2018"})
         )
+        validator = empty_data_context.get_validator(batch_request=batch_request)
+        # Batch data is read lazily; hence, reader is called (and raises) once data is accessed.
         with pytest.raises(SpyInterrupt):
-            empty_data_context.get_validator(batch_request=batch_request)
+            _ = validator.active_batch.data.dataframe
 
         captured_args, captured_kwargs = capture_reader_fn_params
         print(f"positional args:\n{pf(captured_args[-1])}\n")
@@ -529,6 +531,22 @@ def test_get_batch_list_batch_count(
     assert len(batches) == batch_count
 
 
+@pytest.mark.unit
+def test_get_batch_list_reads_data_lazily(
+    pandas_filesystem_datasource: PandasFilesystemDatasource,
+):
+    asset = pandas_filesystem_datasource.add_csv_asset(
+        name="csv_asset",
+        batching_regex=r"yellow_tripdata_sample_(?P<year>\d{4})-(?P<month>\d{2})\.csv",
+    )
+    batches = asset.get_batch_list_from_batch_request(asset.build_batch_request({"year": "2018"}))
+    assert len(batches) == 12
+    assert not any(batch.data.is_loaded for batch in batches)
+
+    assert len(batches[0].data.dataframe) > 0
+    assert [batch.data.is_loaded for batch in batches] == [True] + [False] * 11
+
+
 @pytest.mark.unit
 def test_get_batch_list_from_partially_specified_batch_request(
     pandas_filesystem_datasource: PandasFilesystemDatasource,
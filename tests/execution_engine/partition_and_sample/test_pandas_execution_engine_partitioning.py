@@ -538,3 +538,119 @@ def test_get_batch_with_partition_on_hashed_column(test_df):
         )
     )
     assert partitioned_df.dataframe.shape == (8, 10)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "partitioner_method_name,partitioner_kwargs,expected_filters",
+    [
+        pytest.param(
+            "_partition_on_column_value",
+            {"column_name": "a", "batch_identifiers": {"a": 3}},
+            [("a", "==", 3)],
+            id="column_value",
+        ),
+        pytest.param(
+            "partition_on_multi_column_values",
+            {"column_names": ["a", "b"], "batch_identifiers": {"a": 3, "b": "x"}},
+            [("a", "==", 3), ("b", "==", "x")],
+            id="multi_column_values",
+        ),
+        pytest.param(
+            "partition_on_multi_column_values",
+            {"column_names": ["a", "b"], "batch_identifiers": {"a": 3}},
+            None,
+            id="multi_column_values missing batch identifier",
+        ),
+        pytest.param(
+            "partition_on_year",
+            {"column_name": "d", "batch_identifiers": {"d": "2020-06-15"}},
+            [("d", ">=", datetime.datetime(2020, 1, 1)), ("d", "<", datetime.datetime(2021, 1, 1))],
+            id="year",
+        ),
+        pytest.param(
+            "partition_on_year_and_month",
+            {"column_name": "d", "batch_identifiers": {"d": {"year": 2020, "month": 12}}},
+            [
+                ("d", ">=", datetime.datetime(2020, 12, 1)),
+                ("d", "<", datetime.datetime(2021, 1, 1)),
+            ],
+            id="year_and_month",
+        ),
+        pytest.param(
+            "partition_on_year_and_month_and_day",
+            {"column_name": "d", "batch_identifiers": {"d": datetime.datetime(2020, 2, 29)}},
+            [
+                ("d", ">=", datetime.datetime(2020, 2, 29)),
+                ("d", "<", datetime.datetime(2020, 3, 1)),
+            ],
+            id="year_and_month_and_day",
+        ),
+        pytest.param(
+            "partition_on_year_and_month_and_day",
+            {
+                "column_name": "d",
+                "batch_identifiers": {
+                    "d": datetime.datetime(2020, 2, 29, tzinfo=datetime.timezone.utc)
+                },
+            },
+            [
+                ("d", ">=", datetime.datetime(2020, 2, 29, tzinfo=datetime.timezone.utc)),
+                ("d", "<", datetime.datetime(2020, 3, 1, tzinfo=datetime.timezone.utc)),
+            ],
+            id="year_and_month_and_day time zone aware",
+        ),
+        pytest.param(
+            "partition_on_year_and_month",
+            {"column_name": "d", "batch_identifiers": {"d": {"month": 12}}},
+            None,
+            id="year_and_month missing year",
+        ),
+        pytest.param(
+            "partition_on_mod_integer",
+            {"column_name": "a", "mod": 3, "batch_identifiers": {"a": 1}},
+            None,
+            id="mod_integer",
+        ),
+    ],
+)
+def test_get_parquet_filters(partitioner_method_name, partitioner_kwargs, expected_filters):
+    assert (
+        PandasDataPartitioner().get_parquet_filters(
+            partitioner_method_name=partitioner_method_name,
+            partitioner_kwargs=partitioner_kwargs,
+        )
+        == expected_filters
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "supports_filters",
+    [pytest.param(True, id="supported"), pytest.param(False, id="rejected")],
+)
+def test_parquet_filters_pushed_down_into_reader(tmp_path, supports_filters):
+    path = tmp_path / "data.parquet"
+    path.touch()
+    batch_spec = PathBatchSpec(
+        path=str(path),
+        reader_method="read_parquet",
+        partitioner_method="partition_on_column_value",
+        partitioner_kwargs={"column_name": "a", "batch_identifiers": {"a": 2}},
+    )
+    reader_calls: List[dict] = []
+
+    def read_parquet(path, **kwargs) -> pd.DataFrame:
+        reader_calls.append(kwargs)
+        if "filters" in kwargs and not supports_filters:
+            raise ValueError("filters are not supported")
+
+        return pd.DataFrame({"a": [1, 2, 3, 2]})
+
+    with mock.patch("pandas.read_parquet", new=read_parquet):
+        partitioned_df = PandasExecutionEngine().get_batch_data(batch_spec).dataframe
+
+    assert reader_calls[0]["filters"] == [("a", "==", 2)]
+    assert len(reader_calls) == (1 if supports_filters else 2)
+    # Data read is partitioned, whether or not reader has applied filters.
+    assert partitioned_df["a"].tolist() == [2, 2]
@@ -1,12 +1,16 @@
 import datetime
 import random
+from unittest import mock
 
 import pandas as pd
 import pytest
 
 import great_expectations.exceptions as gx_exceptions
-from great_expectations.core.batch_spec import RuntimeDataBatchSpec
+from great_expectations.core.batch_spec import PathBatchSpec, RuntimeDataBatchSpec
 from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.execution_engine.partition_and_sample.pandas_data_sampler import (
+    PandasDataSampler,
+)
 
 
 @pytest.mark.unit
@@ -124,3 +128,180 @@ def test_sample_using_md5(test_df):
             datetime.date(2020, 1, 29),
         ]
     ).all()
+
+
+@pytest.fixture
+def csv_path(tmp_path) -> str:
+    path = tmp_path / "data.csv"
+    pd.DataFrame({"a": range(1000), "b": [f"value_{i}" for i in range(1000)]}).to_csv(
+        path, index=False
+    )
+    return str(path)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "batch_spec_kwargs,num_sampled_rows",
+    [
+        pytest.param({}, 5, id="not partitioned"),
+        pytest.param(
+            {"partitioner_method": "partition_on_whole_table"}, 5, id="partition_on_whole_table"
+        ),
+        pytest.param(
+            {
+                "partitioner_method": "partition_on_column_value",
+                "partitioner_kwargs": {"column_name": "a", "batch_identifiers": {"a": 500}},
+            },
+            1,
+            id="partition_on_column_value",
+        ),
+    ],
+)
+def test_sample_using_limit_pushed_down_into_csv_reader(
+    csv_path, batch_spec_kwargs, num_sampled_rows
+):
+    with mock.patch.object(
+        PandasDataSampler, "sample_using_limit", wraps=PandasDataSampler().sample_using_limit
+    ) as sample_using_limit:
+        sampled_df = (
+            PandasExecutionEngine()
+            .get_batch_data(
+                PathBatchSpec(
+                    path=csv_path,
+                    reader_method="read_csv",
+                    sampling_method="sample_using_limit",
+                    sampling_kwargs={"n": 5},
+                    **batch_spec_kwargs,
+                )
+            )
+            .dataframe
+        )
+
+    assert len(sampled_df) == num_sampled_rows
+    # Rows are limited by reader itself, unless limit applies to partition.
+    assert sample_using_limit.called is ("partition_on_column_value" in str(batch_spec_kwargs))
+
+
+@pytest.mark.unit
+def test_sample_using_random_pushed_down_into_csv_reader(csv_path):
+    random.seed(1)
+    with mock.patch.object(PandasDataSampler, "sample_using_random") as sample_using_random:
+        sampled_df = (
+            PandasExecutionEngine()
+            .get_batch_data(
+                PathBatchSpec(
+                    path=csv_path,
+                    reader_method="read_csv",
+                    sampling_method="sample_using_random",
+                    sampling_kwargs={"p": 0.1},
+                )
+            )
+            .dataframe
+        )
+
+    sample_using_random.assert_not_called()
+    assert list(sampled_df.columns) == ["a", "b"]
+    assert 50 < len(sampled_df) < 150
+    assert (sampled_df["b"] == "value_" + sampled_df["a"].astype(str)).all()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "reader_method_name,reader_options,batch_spec,expected_reader_options",
+    [
+        pytest.param(
+            "read_csv",
+            {"sep": ";"},
+            {"sampling_method": "_sample_using_limit", "sampling_kwargs": {"n": 3}},
+            {"sep": ";", "nrows": 3},
+            id="limit",
+        ),
+        pytest.param(
+            "read_csv",
+            {"nrows": 10},
+            {"sampling_method": "sample_using_limit", "sampling_kwargs": {"n": 3}},
+            None,
+            id="limit with nrows reader option",
+        ),
+        pytest.param(
+            "read_json",
+            {},
+            {"sampling_method": "sample_using_limit", "sampling_kwargs": {"n": 3}},
+            None,
+            id="limit with reader without row limit",
+        ),
+        pytest.param(
+            "read_csv",
+            {"skiprows": 2},
+            {"sampling_method": "sample_using_random", "sampling_kwargs": {"p": 0.5}},
+            None,
+            id="random with skiprows reader option",
+        ),
+        pytest.param(
+            "read_csv",
+            {"header": 1},
+            {"sampling_method": "sample_using_random", "sampling_kwargs": {"p": 0.5}},
+            None,
+            id="random with header below first row",
+        ),
+        pytest.param(
+            "read_csv",
+            {},
+            {
+                "sampling_method": "sample_using_a_list",
+                "sampling_kwargs": {"column_name": "a", "value_list": [1]},
+            },
+            None,
+            id="a_list",
+        ),
+    ],
+)
+def test_get_sampling_reader_options(
+    reader_method_name, reader_options, batch_spec, expected_reader_options
+):
+    assert (
+        PandasDataSampler().get_sampling_reader_options(
+            reader_method_name=reader_method_name,
+            reader_options=reader_options,
+            batch_spec=batch_spec,
+        )
+        == expected_reader_options
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "reader_options,expected_skipped_rows",
+    [
+        pytest.param({}, [1, 2], id="header row"),
+        pytest.param({"names": ["x", "y"]}, [0, 1, 2], id="names without header row"),
+        pytest.param({"header": None}, [0, 1, 2], id="no header row"),
+    ],
+)
+def test_get_sampling_reader_options_random_skips_rows(reader_options, expected_skipped_rows):
+    sampling_reader_options = PandasDataSampler().get_sampling_reader_options(
+        reader_method_name="read_csv",
+        reader_options=reader_options,
+        batch_spec={"sampling_method": "sample_using_random", "sampling_kwargs": {"p": 0.0}},
+    )
+
+    skiprows = sampling_reader_options["skiprows"]
+    assert [row for row in range(3) if skiprows(row)] == expected_skipped_rows
+
+
+@pytest.mark.unit
+def test_get_parquet_filters_for_a_list_sampling():
+    sampler = PandasDataSampler()
+
+    assert sampler.get_parquet_filters(
+        {
+            "sampling_method": "sample_using_a_list",
+            "sampling_kwargs": {"column_name": "a", "value_list": [3, 5]},
+        }
+    ) == [("a", "in", [3, 5])]
+    assert (
+        sampler.get_parquet_filters(
+            {"sampling_method": "sample_using_random", "sampling_kwargs": {"p": 0.5}}
+        )
+        is None
+    )
@@ -0,0 +1,88 @@
+import os
+
+import pandas as pd
+import pytest
+
+from great_expectations.core.batch_spec import PathBatchSpec
+from great_expectations.execution_engine.data_fingerprint import (
+    fingerprint_pandas_dataframe,
+    fingerprint_source,
+    get_local_file_metadata,
+)
+
+
+@pytest.fixture
+def df() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "a": range(100),
+            "b": [f"value_{i}" for i in range(100)],
+            "c": [{"key": i % 3} for i in range(100)],
+        }
+    )
+
+
+@pytest.mark.unit
+def test_fingerprint_pandas_dataframe_is_stable(df):
+    fingerprint = fingerprint_pandas_dataframe(df)
+
+    assert fingerprint_pandas_dataframe(df.copy()) == fingerprint
+    # Fingerprint does not depend on how (in how many blocks, by how many workers) it is computed.
+    assert fingerprint_pandas_dataframe(df, block_rows=7, max_workers=1) == fingerprint
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "modify",
+    [
+        pytest.param(lambda df: df.assign(a=df["a"].where(df["a"] != 42, -1)), id="value"),
+        pytest.param(lambda df: df.assign(a=df["a"].astype("float64")), id="dtype"),
+        pytest.param(lambda df: df.rename(columns={"b": "d"}), id="column_name"),
+        pytest.param(lambda df: df[["b", "a", "c"]], id="column_order"),
+        pytest.param(lambda df: df.iloc[:-1], id="row_count"),
+        pytest.param(lambda df: df.set_index(df.index + 1), id="index"),
+        pytest.param(
+            lambda df: df.assign(c=[{"key": i % 4} for i in range(100)]), id="unhashable_value"
+        ),
+    ],
+)
+def test_fingerprint_pandas_dataframe_detects_changes(df, modify):
+    assert fingerprint_pandas_dataframe(modify(df)) != fingerprint_pandas_dataframe(df)
+
+
+@pytest.mark.unit
+def test_get_local_file_metadata(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("a\n1\n")
+    metadata = get_local_file_metadata(str(path))
+
+    assert metadata["size"] == 4
+    assert get_local_file_metadata(str(path)) == metadata
+
+    path.write_text("a\n1\n2\n")
+    os.utime(path, ns=(metadata["mtime_ns"] + 1_000_000_000,) * 2)
+    assert get_local_file_metadata(str(path)) != metadata
+
+    assert get_local_file_metadata(str(tmp_path / "missing.csv")) is None
+
+
+@pytest.mark.unit
+def test_fingerprint_source_depends_on_batch_spec():
+    source_metadata = {"path": "data.csv", "size": 4, "mtime_ns": 1}
+    batch_spec = PathBatchSpec(path="data.csv", reader_method="read_csv")
+    fingerprint = fingerprint_source(source_metadata, batch_spec)
+
+    assert fingerprint_source(dict(source_metadata), PathBatchSpec(batch_spec)) == fingerprint
+    assert (
+        fingerprint_source(
+            source_metadata,
+            PathBatchSpec(
+                path="data.csv",
+                reader_method="read_csv",
+                sampling_method="sample_using_limit",
+                sampling_kwargs={"n": 1},
+            ),
+        )
+        != fingerprint
+    )
+    assert fingerprint_source({**source_metadata, "mtime_ns": 2}, batch_spec) != fingerprint
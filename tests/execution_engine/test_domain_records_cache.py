@@ -0,0 +1,140 @@
+import concurrent.futures
+import pickle
+
+import pytest
+
+from great_expectations.execution_engine.domain_records_cache import (
+    DomainRecordsCache,
+    build_domain_records_cache_key,
+)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "domain_kwargs,is_filtered",
+    [
+        pytest.param({"column": "a"}, False, id="column_without_condition"),
+        pytest.param(
+            {"column": "a", "row_condition": "b>0", "condition_parser": "pandas"},
+            True,
+            id="column_with_condition",
+        ),
+        pytest.param(
+            {"column_A": "a", "column_B": "b", "ignore_row_if": "both_values_are_missing"},
+            True,
+            id="column_pair_ignore_row_if",
+        ),
+        pytest.param(
+            {"column": "a", "ignore_row_if": "both_values_are_missing"},
+            False,
+            id="column_ignores_ignore_row_if",
+        ),
+    ],
+)
+def test_build_domain_records_cache_key(domain_kwargs: dict, is_filtered: bool):
+    cache_key = build_domain_records_cache_key(domain_kwargs=domain_kwargs, batch_id="my_batch")
+
+    assert (cache_key is not None) is is_filtered
+
+
+@pytest.mark.unit
+def test_build_domain_records_cache_key_ignores_column_accessor():
+    row_condition_kwargs = {"row_condition": "b>0", "condition_parser": "pandas"}
+
+    assert build_domain_records_cache_key(
+        domain_kwargs={"column": "a", **row_condition_kwargs}, batch_id="my_batch"
+    ) == build_domain_records_cache_key(
+        domain_kwargs={"column": "b", **row_condition_kwargs}, batch_id="my_batch"
+    )
+    assert build_domain_records_cache_key(
+        domain_kwargs={"column": "a", **row_condition_kwargs}, batch_id="my_batch"
+    ) != build_domain_records_cache_key(
+        domain_kwargs={"column": "a", **row_condition_kwargs}, batch_id="other_batch"
+    )
+
+
+@pytest.mark.unit
+def test_domain_records_cache_evicts_least_recently_used_within_byte_budget():
+    cache = DomainRecordsCache(max_bytes=10, size_fn=len)
+
+    cache.put(("batch", "x"), "xxxx")
+    cache.put(("batch", "y"), "yyyy")
+    assert cache.get(("batch", "x")) == "xxxx"
+
+    cache.put(("batch", "z"), "zzzz")
+
+    assert ("batch", "y") not in cache
+    assert ("batch", "x") in cache
+    assert ("batch", "z") in cache
+    assert cache.current_bytes == 8
+    assert cache.info()["hits"] == 1
+    assert cache.get(("batch", "y")) is None
+    assert cache.misses == 1
+
+
+@pytest.mark.unit
+def test_domain_records_cache_does_not_store_records_exceeding_budget():
+    cache = DomainRecordsCache(max_bytes=3, size_fn=len)
+
+    cache.put(("batch", "x"), "xxxx")
+
+    assert len(cache) == 0
+    assert cache.current_bytes == 0
+
+
+@pytest.mark.unit
+def test_domain_records_cache_max_entries_and_invalidate():
+    cache = DomainRecordsCache(max_entries=2)
+
+    cache.put(("batch_1", "x"), "x")
+    cache.put(("batch_2", "y"), "y")
+    cache.put(("batch_2", "z"), "z")
+
+    assert ("batch_1", "x") not in cache
+    assert len(cache) == 2
+
+    cache.invalidate(batch_id="batch_2")
+
+    assert len(cache) == 0
+
+
+@pytest.mark.unit
+def test_domain_records_cache_disabled():
+    cache = DomainRecordsCache(max_bytes=0)
+
+    cache.put(("batch", "x"), "x")
+
+    assert not cache.enabled
+    assert len(cache) == 0
+
+
+@pytest.mark.unit
+def test_domain_records_cache_is_consistent_under_concurrent_access():
+    cache = DomainRecordsCache(max_bytes=64, max_entries=8, size_fn=len)
+
+    def _use_cache(worker: int) -> None:
+        for idx in range(500):
+            key = (f"batch_{worker % 3}", idx % 16)
+            if cache.get(key) is None:
+                cache.put(key, "x" * (idx % 7 + 1))
+            if idx % 50 == 0:
+                cache.invalidate(batch_id=f"batch_{idx % 3}")
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(_use_cache, range(8)))
+
+    assert len(cache) <= 8
+    assert cache.current_bytes == sum(len(cache.get(key)) for key in list(cache._entries))
+    assert cache.current_bytes <= 64
+
+
+@pytest.mark.unit
+def test_domain_records_cache_can_be_pickled():
+    cache = DomainRecordsCache(max_entries=2)
+    cache.put(("batch", "x"), "x")
+
+    unpickled_cache: DomainRecordsCache = pickle.loads(pickle.dumps(cache))
+
+    assert unpickled_cache.get(("batch", "x")) == "x"
+    unpickled_cache.put(("batch", "y"), "y")
+    assert len(unpickled_cache) == 2
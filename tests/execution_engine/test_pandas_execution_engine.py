@@ -1,4 +1,6 @@
+import gzip
 import os
+from decimal import Decimal
 from typing import Dict, Tuple
 from unittest import mock
 
@@ -7,12 +9,25 @@ import pytest
 
 import great_expectations.exceptions as gx_exceptions
 from great_expectations.compatibility import aws, azure, google
-from great_expectations.core.batch_spec import RuntimeDataBatchSpec, S3BatchSpec
+from great_expectations.core.batch_spec import (
+    PathBatchSpec,
+    RuntimeDataBatchSpec,
+    S3BatchSpec,
+)
 
 # noinspection PyBroadException
 from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.execution_engine import (
+    pandas_execution_engine as pandas_execution_engine_module,
+)
+from great_expectations.execution_engine.data_fingerprint import fingerprint_pandas_dataframe
+from great_expectations.execution_engine.pandas_batch_data import (
+    PandasChunkedBatchData,
+    PandasLazyBatchData,
+)
 from great_expectations.execution_engine.pandas_execution_engine import (
     PandasExecutionEngine,
+    hash_pandas_dataframe,
 )
 from great_expectations.util import is_library_loadable
 from great_expectations.validator.computed_metric import MetricValue
@@ -332,6 +347,51 @@ def test_get_compute_domain_with_row_condition():
     assert accessor_kwargs == {}, "Accessor kwargs have been modified"
 
 
+@pytest.mark.unit
+def test_get_domain_records_reuses_cached_filtered_records():
+    engine = PandasExecutionEngine()
+    df = pd.DataFrame({"a": [1, 2, 3, 4], "b": [2, 3, 4, None]})
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+
+    row_condition_kwargs = {"row_condition": "b > 2", "condition_parser": "pandas"}
+    data_a = engine.get_domain_records(domain_kwargs={"column": "a", **row_condition_kwargs})
+    data_b = engine.get_domain_records(domain_kwargs={"column": "b", **row_condition_kwargs})
+
+    assert data_b.equals(data_a)
+    assert engine.domain_records_cache.misses == 1
+    assert engine.domain_records_cache.hits == 1
+
+    # Every caller obtains its own copy of cached records.
+    data_a["a"] = 0
+    data_a = engine.get_domain_records(domain_kwargs={"column": "a", **row_condition_kwargs})
+    assert data_a["a"].tolist() == [2, 3]
+
+    # Unfiltered records are never cached.
+    engine.get_domain_records(domain_kwargs={"column": "a"})
+    assert len(engine.domain_records_cache) == 1
+
+    # Reloading Batch invalidates its cached records.
+    engine.load_batch_data(batch_data=df[df["a"] > 1], batch_id="1234")
+    data_a = engine.get_domain_records(domain_kwargs={"column": "a", **row_condition_kwargs})
+    assert data_a["a"].tolist() == [2, 3]
+    assert engine.domain_records_cache.misses == 2
+
+
+@pytest.mark.unit
+def test_get_domain_records_cache_disabled():
+    engine = PandasExecutionEngine(domain_records_cache_max_bytes=0)
+    df = pd.DataFrame({"a": [1, 2, 3, 4], "b": [2, 3, 4, None]})
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+
+    row_condition_kwargs = {"row_condition": "b > 2", "condition_parser": "pandas"}
+    data_a = engine.get_domain_records(domain_kwargs={"column": "a", **row_condition_kwargs})
+    data_b = engine.get_domain_records(domain_kwargs={"column": "b", **row_condition_kwargs})
+
+    assert data_b is not data_a
+    assert data_b.equals(data_a)
+    assert len(engine.domain_records_cache) == 0
+
+
 # What happens when we filter such that no value meets the condition?
 @pytest.mark.unit
 def test_get_compute_domain_with_unmeetable_row_condition():
@@ -403,6 +463,117 @@ def test_resolve_metric_bundle():
     )
 
 
+@pytest.mark.unit
+def test_resolve_metric_bundle_vectorized_reductions_match_direct_computation():
+    df = pd.DataFrame(
+        {
+            "a": [1, 2, 3, None],
+            "b": [4, 5, 6, 7],
+            "c": [0.5, 1.5, 2.5, 3.5],
+            "d": [Decimal("1.5"), Decimal("2.5"), Decimal("3.5"), Decimal("4.5")],
+        }
+    )
+    engine = PandasExecutionEngine(batch_data_dict={"made-up-id": df})
+
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
+
+    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
+    metrics.update(results)
+
+    desired_metrics = []
+    for metric_name in (
+        "column.max",
+        "column.min",
+        "column.mean",
+        "column.sum",
+        "column.standard_deviation",
+    ):
+        for column in ("a", "b", "c", "d"):
+            for row_condition in (None, "b<7"):
+                metric_domain_kwargs: dict = {"column": column}
+                if row_condition:
+                    metric_domain_kwargs["row_condition"] = row_condition
+                    metric_domain_kwargs["condition_parser"] = "pandas"
+                metric = MetricConfiguration(
+                    metric_name=metric_name,
+                    metric_domain_kwargs=metric_domain_kwargs,
+                    metric_value_kwargs=None,
+                )
+                metric.metric_dependencies = {
+                    "table.columns": table_columns_metric,
+                }
+                desired_metrics.append(metric)
+
+    (
+        metric_fn_direct_configurations,
+        metric_fn_bundle_configurations,
+    ) = engine._build_direct_and_bundled_metric_computation_configurations(
+        metrics_to_resolve=desired_metrics, metrics=metrics
+    )
+    assert metric_fn_direct_configurations == []
+    assert len(metric_fn_bundle_configurations) == len(desired_metrics)
+
+    with mock.patch.object(
+        PandasExecutionEngine, "get_domain_records", wraps=engine.get_domain_records
+    ) as mock_get_domain_records:
+        results = engine.resolve_metrics(metrics_to_resolve=desired_metrics, metrics=metrics)
+
+    # One pass per compute Domain (with and without "row_condition"), plus one per "Decimal" column metric (fallback).  # noqa: E501
+    assert mock_get_domain_records.call_count == 2 + 5 * 2
+
+    for metric in desired_metrics:
+        filtered_df = df.query(metric.metric_domain_kwargs.get("row_condition") or "index == index")
+        column = filtered_df[metric.metric_domain_kwargs["column"]].astype(float)
+        expected = {
+            "column.max": column.max(),
+            "column.min": column.min(),
+            "column.mean": column.mean(),
+            "column.sum": column.sum(),
+            "column.standard_deviation": column.std(),
+        }[metric.metric_name]
+        assert results[metric.id] == pytest.approx(expected)
+
+
+@pytest.mark.unit
+def test_resolve_metric_bundle_keeps_missing_column_metric_direct():
+    df = pd.DataFrame({"a": [1, 2, 3, None]})
+    engine = PandasExecutionEngine(batch_data_dict={"made-up-id": df})
+
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
+
+    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
+    metrics.update(results)
+
+    missing = MetricConfiguration(
+        metric_name="column.max",
+        metric_domain_kwargs={"column": "not_in_table"},
+        metric_value_kwargs=None,
+    )
+    missing.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+
+    (
+        metric_fn_direct_configurations,
+        metric_fn_bundle_configurations,
+    ) = engine._build_direct_and_bundled_metric_computation_configurations(
+        metrics_to_resolve=(missing,), metrics=metrics
+    )
+    assert len(metric_fn_direct_configurations) == 1
+    assert metric_fn_bundle_configurations == []
+
+    with pytest.raises(gx_exceptions.MetricResolutionError) as e:
+        engine.resolve_metrics(metrics_to_resolve=(missing,), metrics=metrics)
+
+    assert 'The column "not_in_table" in BatchData does not exist.' in str(e.value)
+
+
 # Ensuring that we can properly inform user when metric doesn't exist - should get a metric provider error  # noqa: E501
 @pytest.mark.unit
 def test_resolve_metric_bundle_with_nonexistent_metric():
@@ -455,6 +626,175 @@ def test_get_batch_data(test_df):
         PandasExecutionEngine().get_batch_data(RuntimeDataBatchSpec())
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "columns,expected_columns",
+    [
+        pytest.param(None, ["a", "b", "c"], id="all_columns"),
+        pytest.param(["c", "a"], ["a", "c"], id="projected_columns_in_file_order"),
+        pytest.param(["a", "missing"], ["a"], id="missing_column_is_ignored"),
+    ],
+)
+def test_get_batch_data_with_column_projection(tmp_path, columns, expected_columns):
+    path = tmp_path / "data.csv"
+    pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"], "c": [1.5, 2.5, None]}).to_csv(
+        path, index=False
+    )
+
+    batch_spec = PathBatchSpec(path=str(path), reader_method="read_csv")
+    if columns is not None:
+        batch_spec["columns"] = columns
+
+    df = PandasExecutionEngine().get_batch_data(batch_spec=batch_spec).dataframe
+
+    assert list(df.columns) == expected_columns
+    assert len(df) == 3
+
+
+@pytest.mark.unit
+def test_get_batch_data_column_projection_not_applied_without_header(tmp_path):
+    path = tmp_path / "data.csv"
+    pd.DataFrame({"a": [1, 2], "b": [3, 4]}).to_csv(path, index=False, header=False)
+
+    batch_spec = PathBatchSpec(
+        path=str(path), reader_method="read_csv", reader_options={"header": None}
+    )
+    batch_spec["columns"] = ["a"]
+
+    df = PandasExecutionEngine().get_batch_data(batch_spec=batch_spec).dataframe
+
+    assert df.shape == (2, 2)
+
+
+@pytest.mark.unit
+def test_get_batch_data_in_chunks(tmp_path):
+    path = tmp_path / "data.csv"
+    df = pd.DataFrame({"a": range(10), "b": [i % 3 for i in range(10)]})
+    df.to_csv(path, index=False)
+
+    execution_engine = PandasExecutionEngine()
+    batch_spec = PathBatchSpec(
+        path=str(path), reader_method="read_csv", reader_options={"chunksize": 4}
+    )
+    batch_data = execution_engine.get_batch_data(batch_spec=batch_spec)
+    assert isinstance(batch_data, PandasChunkedBatchData)
+
+    execution_engine.load_batch_data(batch_id="my_id", batch_data=batch_data)
+
+    # Outside of pass over chunks, first chunk is exposed (e.g., for inspecting columns).
+    assert execution_engine.dataframe.equals(df.iloc[:4])
+
+    # Every pass re-reads data from beginning; chunks retain their positions in file as index.
+    for _ in range(2):
+        chunks = []
+        for chunk in execution_engine.iter_batch_data_chunks():
+            assert execution_engine.dataframe is chunk
+            chunks.append(chunk)
+
+        assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+        assert pd.concat(chunks).equals(df)
+
+
+@pytest.mark.unit
+def test_get_batch_data_in_chunks_rejects_limit_sampling(tmp_path):
+    path = tmp_path / "data.csv"
+    pd.DataFrame({"a": range(10)}).to_csv(path, index=False)
+
+    batch_spec = PathBatchSpec(
+        path=str(path),
+        reader_method="read_csv",
+        reader_options={"chunksize": 4},
+        sampling_method="sample_using_limit",
+        sampling_kwargs={"n": 5},
+    )
+
+    with pytest.raises(gx_exceptions.ExecutionEngineError):
+        PandasExecutionEngine().get_batch_data(batch_spec=batch_spec)
+
+
+@pytest.mark.unit
+def test_get_lazy_batch_data_reads_data_when_needed(tmp_path):
+    path = tmp_path / "data.csv"
+    df = pd.DataFrame({"a": range(10)})
+    df.to_csv(path, index=False)
+
+    execution_engine = PandasExecutionEngine()
+    with mock.patch("pandas.read_csv", wraps=pd.read_csv) as read_csv:
+        batch_data, batch_markers = execution_engine.get_lazy_batch_data_and_markers(
+            batch_spec=PathBatchSpec(path=str(path), reader_method="read_csv")
+        )
+        execution_engine.load_batch_data(batch_id="my_id", batch_data=batch_data)
+
+        assert isinstance(batch_data, PandasLazyBatchData)
+        assert not batch_data.is_loaded
+        assert read_csv.call_count == 0
+        assert "pandas_data_fingerprint" not in batch_markers
+
+        assert execution_engine.dataframe.equals(df)
+        assert execution_engine.dataframe.equals(df)
+        assert read_csv.call_count == 1
+
+    # Batch markers are completed, once data is loaded.
+    assert batch_markers["pandas_data_fingerprint"] == hash_pandas_dataframe(df)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "reader_options",
+    [pytest.param({}, id="dataframe"), pytest.param({"chunksize": 4}, id="chunks")],
+)
+def test_get_batch_data_and_markers_fingerprints_source(tmp_path, reader_options):
+    path = tmp_path / "data.csv"
+    pd.DataFrame({"a": range(10)}).to_csv(path, index=False)
+    batch_spec = PathBatchSpec(
+        path=str(path), reader_method="read_csv", reader_options=reader_options
+    )
+
+    execution_engine = PandasExecutionEngine()
+    _, batch_markers = execution_engine.get_batch_data_and_markers(batch_spec=batch_spec)
+    _, lazy_batch_markers = execution_engine.get_lazy_batch_data_and_markers(batch_spec=batch_spec)
+
+    # File is identified by its metadata, so that even data, which is not read yet, has fingerprint.
+    assert batch_markers["source_fingerprint"] == lazy_batch_markers["source_fingerprint"]
+
+    pd.DataFrame({"a": range(11)}).to_csv(path, index=False)
+    _, modified_batch_markers = execution_engine.get_batch_data_and_markers(batch_spec=batch_spec)
+    assert modified_batch_markers["source_fingerprint"] != batch_markers["source_fingerprint"]
+
+
+@pytest.mark.unit
+def test_get_batch_data_and_markers_fingerprints_large_dataframe():
+    df = pd.DataFrame({"a": range(10)})
+
+    with mock.patch.object(pandas_execution_engine_module, "HASH_THRESHOLD", 0):
+        _, batch_markers = PandasExecutionEngine().get_batch_data_and_markers(
+            batch_spec=RuntimeDataBatchSpec(batch_data=df)
+        )
+
+    assert batch_markers["pandas_data_fingerprint"] == fingerprint_pandas_dataframe(df)
+
+
+@pytest.mark.unit
+def test_get_lazy_batch_data_releases_least_recently_loaded_batches(tmp_path):
+    execution_engine = PandasExecutionEngine(lazy_batch_data_max_bytes=0)
+    batch_data_list = []
+    for idx in range(3):
+        path = tmp_path / f"data_{idx}.csv"
+        pd.DataFrame({"a": [idx] * 10}).to_csv(path, index=False)
+        batch_data, _ = execution_engine.get_lazy_batch_data_and_markers(
+            batch_spec=PathBatchSpec(path=str(path), reader_method="read_csv")
+        )
+        batch_data_list.append(batch_data)
+
+    assert batch_data_list[0].dataframe["a"].tolist() == [0] * 10
+    assert batch_data_list[1].dataframe["a"].tolist() == [1] * 10
+
+    # Only most recently loaded Batch is held in memory; released Batch is read again, when needed.
+    assert [batch_data.is_loaded for batch_data in batch_data_list] == [False, True, False]
+    assert batch_data_list[0].dataframe["a"].tolist() == [0] * 10
+    assert [batch_data.is_loaded for batch_data in batch_data_list] == [True, False, False]
+
+
 @pytest.mark.skipif(
     not aws.boto3,
     reason="Unable to load AWS connection object. Please install boto3 and botocore.",
@@ -470,6 +810,47 @@ def test_get_batch_s3_compressed_files(test_s3_files_compressed, test_df_small):
     assert df.dataframe.shape == test_df_small.shape
 
 
+@pytest.mark.skipif(
+    not aws.boto3,
+    reason="Unable to load AWS connection object. Please install boto3 and botocore.",
+)
+@pytest.mark.big
+@pytest.mark.parametrize(
+    "key,reader_options",
+    [
+        pytest.param("data.csv", {}, id="csv"),
+        pytest.param("data.csv.gz", {}, id="compressed_csv"),
+        pytest.param("data.csv", {"chunksize": 2}, id="csv_in_chunks"),
+    ],
+)
+def test_get_batch_s3_object_by_ranged_requests(s3, s3_bucket, test_df_small, key, reader_options):
+    s3.put_object(
+        Bucket=s3_bucket,
+        Key=key,
+        Body=test_df_small.to_csv(index=False).encode()
+        if key.endswith(".csv")
+        else gzip.compress(test_df_small.to_csv(index=False).encode()),
+    )
+
+    batch_spec = S3BatchSpec(
+        path=f"s3a://{s3_bucket}/{key}",
+        reader_method="read_csv",
+        reader_options=reader_options,
+    )
+    execution_engine = PandasExecutionEngine(object_storage_buffer_max_bytes=0)
+    with mock.patch.object(
+        pandas_execution_engine_module,
+        "_read_s3_object_range",
+        wraps=pandas_execution_engine_module._read_s3_object_range,
+    ) as mock_read_s3_object_range:
+        batch_data = execution_engine.get_batch_data(batch_spec=batch_spec)
+        execution_engine.load_batch_data(batch_id="my_id", batch_data=batch_data)
+        df = pd.concat(list(execution_engine.iter_batch_data_chunks()))
+
+    assert mock_read_s3_object_range.called
+    assert df.equals(test_df_small)
+
+
 @pytest.mark.skipif(
     not aws.boto3
     or (
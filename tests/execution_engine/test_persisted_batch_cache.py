@@ -0,0 +1,83 @@
+from unittest import mock
+
+import pandas as pd
+import pytest
+from pytest_mock import MockerFixture
+
+from great_expectations.core.batch import Batch
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.execution_engine.persisted_batch_cache import PersistedBatchCache
+
+
+@pytest.mark.unit
+def test_persisted_batch_cache_unpersists_least_recently_used_batches(mocker: MockerFixture):
+    cache = PersistedBatchCache(max_entries=2)
+    dataframes = {
+        batch_id: mocker.Mock(spec=["persist", "unpersist"]) for batch_id in ("a", "b", "c")
+    }
+
+    cache.persist(batch_id="a", dataframe=dataframes["a"])
+    cache.persist(batch_id="b", dataframe=dataframes["b"])
+    cache.touch("a")
+    cache.persist(batch_id="c", dataframe=dataframes["c"])
+
+    assert cache.persisted_batch_ids == ["a", "c"]
+    dataframes["b"].unpersist.assert_called_once()
+    for batch_id in ("a", "c"):
+        dataframes[batch_id].persist.assert_called_once_with()
+        dataframes[batch_id].unpersist.assert_not_called()
+
+    # Loading same DataFrame again does not persist it twice.
+    cache.persist(batch_id="a", dataframe=dataframes["a"])
+    dataframes["a"].persist.assert_called_once_with()
+
+    cache.unpersist()
+
+    assert len(cache) == 0
+    dataframes["a"].unpersist.assert_called_once()
+    assert cache.info() == {
+        "entries": 0,
+        "max_entries": 2,
+        "storage_level": None,
+        "evictions": 1,
+        "persisted_batch_ids": [],
+        "cached_bytes": None,
+    }
+
+
+@pytest.mark.unit
+def test_batch_manager_releases_batches_once_no_holder_remains():
+    execution_engine = PandasExecutionEngine()
+    batch = Batch(data=pd.DataFrame({"a": [1, 2, 3]}))
+    batch_manager = execution_engine.batch_manager
+    batch_manager.load_batch_list(batch_list=[batch])
+    batch_manager.acquire_batches(batch_ids=[batch.id, batch.id])
+
+    with mock.patch.object(execution_engine, "release_batch_data") as release_batch_data:
+        batch_manager.release_batches(batch_ids=[batch.id])
+        assert batch.id in batch_manager.batch_data_cache
+        release_batch_data.assert_not_called()
+
+        batch_manager.release_batches(batch_ids=[batch.id])
+        release_batch_data.assert_called_once_with(batch_id=batch.id)
+
+    assert batch.id not in batch_manager.batch_data_cache
+    assert batch.id not in batch_manager.batch_cache
+    assert batch_manager.active_batch_data is None
+
+
+@pytest.mark.unit
+def test_batch_manager_ignores_release_of_batches_not_acquired():
+    execution_engine = PandasExecutionEngine()
+    batch = Batch(data=pd.DataFrame({"a": [1, 2, 3]}))
+    batch_manager = execution_engine.batch_manager
+    batch_manager.load_batch_list(batch_list=[batch])
+
+    with mock.patch.object(execution_engine, "release_batch_data") as release_batch_data:
+        batch_manager.release_batches(batch_ids=[batch.id])
+
+        batch_manager.acquire_batches(batch_ids=[batch.id])
+        batch_manager.release_batches(batch_ids=[batch.id])
+        batch_manager.release_batches(batch_ids=[batch.id])
+
+    release_batch_data.assert_called_once_with(batch_id=batch.id)
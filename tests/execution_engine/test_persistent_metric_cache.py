@@ -0,0 +1,109 @@
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+from great_expectations.core.batch import Batch
+from great_expectations.core.batch_spec import PathBatchSpec
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.execution_engine.persistent_metric_cache import (
+    PERSISTENT_METRIC_CACHE_FILE_PATH,
+    PersistentMetricCache,
+)
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.metrics_calculator import MetricsCalculator
+
+
+@pytest.fixture
+def csv_path(tmp_path) -> str:
+    path = tmp_path / "data.csv"
+    pd.DataFrame({"a": [1, 2, 3, 4], "b": [1.0, None, 3.0, None]}).to_csv(path, index=False)
+    return str(path)
+
+
+def _build_metrics_calculator(csv_path: str, cache_path: str) -> MetricsCalculator:
+    execution_engine = PandasExecutionEngine(persistent_metric_cache_path=cache_path)
+    batch_spec = PathBatchSpec(path=csv_path, reader_method="read_csv")
+    batch_data, batch_markers = execution_engine.get_batch_data_and_markers(batch_spec=batch_spec)
+    execution_engine.batch_manager.load_batch_list(
+        batch_list=[Batch(data=batch_data, batch_spec=batch_spec, batch_markers=batch_markers)]
+    )
+    return MetricsCalculator(execution_engine=execution_engine)
+
+
+def _build_metric_configurations():
+    return [
+        MetricConfiguration("table.row_count", metric_domain_kwargs={}),
+        MetricConfiguration("column.mean", metric_domain_kwargs={"column": "a"}),
+        MetricConfiguration(
+            "column_values.nonnull.unexpected_count", metric_domain_kwargs={"column": "b"}
+        ),
+    ]
+
+
+@pytest.mark.filesystem
+def test_persistent_metric_cache_reuses_metrics_across_runs(csv_path, tmp_path):
+    cache_path = str(tmp_path / "metric_cache.sqlite")
+
+    expected_metrics, _ = _build_metrics_calculator(
+        csv_path=csv_path, cache_path=cache_path
+    ).compute_metrics(metric_configurations=_build_metric_configurations())
+
+    metrics_calculator = _build_metrics_calculator(csv_path=csv_path, cache_path=cache_path)
+    with mock.patch.object(PandasExecutionEngine, "resolve_metrics") as resolve_metrics:
+        cached_metrics, aborted_metrics_info = metrics_calculator.compute_metrics(
+            metric_configurations=_build_metric_configurations()
+        )
+
+    resolve_metrics.assert_not_called()
+    assert aborted_metrics_info == {}
+    metric_configuration: MetricConfiguration
+    for metric_configuration in _build_metric_configurations():
+        assert cached_metrics[metric_configuration.id] == expected_metrics[metric_configuration.id]
+
+    assert cached_metrics[_build_metric_configurations()[2].id] == 2
+
+
+@pytest.mark.filesystem
+def test_persistent_metric_cache_misses_when_file_changes(csv_path, tmp_path):
+    cache_path = str(tmp_path / "metric_cache.sqlite")
+    row_count = MetricConfiguration("table.row_count", metric_domain_kwargs={})
+
+    assert (
+        _build_metrics_calculator(csv_path=csv_path, cache_path=cache_path).get_metric(row_count)
+        == 4
+    )
+
+    pd.DataFrame({"a": range(10), "b": range(10)}).to_csv(csv_path, index=False)
+
+    assert (
+        _build_metrics_calculator(csv_path=csv_path, cache_path=cache_path).get_metric(
+            MetricConfiguration("table.row_count", metric_domain_kwargs={})
+        )
+        == 10
+    )
+
+
+@pytest.mark.unit
+def test_persistent_metric_cache_evicts_least_recently_used_entries(tmp_path):
+    cache = PersistentMetricCache.for_project(project_root_dir=str(tmp_path), max_bytes=2500)
+    assert cache.path == str(tmp_path / PERSISTENT_METRIC_CACHE_FILE_PATH)
+
+    first = ("column.max", "column=a", "")
+    second = ("column.max", "column=b", "")
+    third = ("column.max", "column=c", "")
+    cache.set_many(fingerprint="fingerprint", values={first: b"1" * 1000})
+    cache.set_many(fingerprint="fingerprint", values={second: b"2" * 1000})
+    assert cache.get_many(fingerprint="fingerprint", metric_ids=[first]) == {first: b"1" * 1000}
+    cache.set_many(fingerprint="fingerprint", values={third: b"3" * 1000})
+
+    assert set(cache.get_many(fingerprint="fingerprint", metric_ids=[first, second, third])) == {
+        first,
+        third,
+    }
+    assert cache.get_many(fingerprint="other_fingerprint", metric_ids=[first]) == {}
+    assert cache.info()["entries"] == 2
+
+    cache.clear()
+
+    assert cache.info() == {"entries": 0, "bytes": 0}
@@ -19,6 +19,7 @@ from great_expectations.data_context.types.base import (
     FilesystemStoreBackendDefaults,
 )
 from great_expectations.execution_engine import SparkDFExecutionEngine
+from great_expectations.execution_engine.execution_engine import MetricComputationConfiguration
 from great_expectations.expectations.row_conditions import (
     RowCondition,
     RowConditionParserType,
@@ -118,6 +119,26 @@ def test_get_domain_records_with_column_domain(
     ), "Data does not match after getting full access compute domain"
 
 
+def test_get_domain_records_reuses_cached_filtered_records(
+    spark_session, basic_spark_df_execution_engine, spark_df_from_pandas_df
+):
+    pd_df = pd.DataFrame({"a": [1, 2, 3, 4, 5], "b": [2, 3, 4, 5, None], "c": [1, 2, 3, 4, None]})
+    df = spark_df_from_pandas_df(spark_session, pd_df)
+    engine = basic_spark_df_execution_engine
+    engine.load_batch_data(batch_id="1234", batch_data=df)
+
+    hits: int = engine.domain_records_cache.hits
+    row_condition_kwargs = {
+        "row_condition": 'col("b")<5',
+        "condition_parser": "great_expectations__experimental__",
+    }
+    data_a = engine.get_domain_records(domain_kwargs={"column": "a", **row_condition_kwargs})
+    data_c = engine.get_domain_records(domain_kwargs={"column": "c", **row_condition_kwargs})
+
+    assert data_c is data_a
+    assert engine.domain_records_cache.hits == hits + 1
+
+
 def test_get_domain_records_with_column_domain_and_filter_conditions(
     spark_session, basic_spark_df_execution_engine, spark_df_from_pandas_df
 ):
@@ -755,6 +776,59 @@ def test_sparkdf_batch_aggregate_metrics(caplog, spark_session):
     assert found_message
 
 
+def test_resolve_metric_bundle_with_conditional_aggregates(caplog, spark_session):
+    engine: SparkDFExecutionEngine = build_spark_engine(
+        spark=spark_session,
+        df=pd.DataFrame(
+            {"a": [1, 2, 1, 2, 3, 3], "b": [4, 4, 4, 4, None, None]},
+        ),
+        batch_id="1234",
+    )
+    engine._bundle_conditional_aggregates = True
+
+    domain_kwargs_list = [
+        {"batch_id": "1234"},
+        {"batch_id": "1234", "row_condition": "a > 1", "condition_parser": "spark"},
+        {
+            "batch_id": "1234",
+            "column_A": "a",
+            "column_B": "b",
+            "ignore_row_if": "either_value_is_missing",
+        },
+        # No rows satisfy this condition (aggregated separately).
+        {"batch_id": "1234", "row_condition": "a > 10", "condition_parser": "spark"},
+    ]
+    metric_fn_bundle = []
+    for idx, domain_kwargs in enumerate(domain_kwargs_list):
+        for metric_name, metric_fn in (
+            ("table.row_count", F.count(F.lit(1))),
+            ("column.max", F.max(F.col("a"))),
+        ):
+            metric_fn_bundle.append(
+                MetricComputationConfiguration(
+                    metric_configuration=MetricConfiguration(
+                        metric_name=metric_name,
+                        metric_domain_kwargs={"domain_index": idx},
+                    ),
+                    metric_fn=metric_fn,
+                    metric_provider_kwargs={},
+                    compute_domain_kwargs=domain_kwargs,
+                )
+            )
+
+    caplog.set_level(logging.DEBUG, logger="great_expectations")
+    results = engine.resolve_metric_bundle(metric_fn_bundle=metric_fn_bundle)
+
+    assert [
+        results[metric_computation_configuration.metric_configuration.id]
+        for metric_computation_configuration in metric_fn_bundle
+    ] == [6, 3, 4, 3, 4, 2, 0, None]
+    assert any(
+        record.message == "SparkDFExecutionEngine computed 8 metrics on 4 domains in one Spark job"
+        for record in caplog.records
+    )
+
+
 # Ensuring functionality of compute_domain when no domain kwargs are given
 def test_get_compute_domain_with_no_domain_kwargs_alt(spark_session):
     engine: SparkDFExecutionEngine = build_spark_engine(
@@ -0,0 +1,60 @@
+from unittest import mock
+
+import pytest
+
+from great_expectations.execution_engine.sqlalchemy_column_metadata_cache import (
+    ColumnMetadataCache,
+    build_column_metadata_cache_key,
+)
+
+
+@pytest.mark.unit
+def test_column_metadata_cache_expires_entries_after_ttl():
+    cache = ColumnMetadataCache(ttl_seconds=60)
+    key = build_column_metadata_cache_key(table_selectable="my_table", schema_name="my_schema")
+
+    with mock.patch("time.monotonic", return_value=1000.0):
+        cache.put(key, [{"name": "a"}])
+    with mock.patch("time.monotonic", return_value=1059.0):
+        assert cache.get(key) == [{"name": "a"}]
+    with mock.patch("time.monotonic", return_value=1061.0):
+        assert cache.get(key) is None
+
+    assert cache.info() == {
+        "hits": 1,
+        "misses": 1,
+        "entries": 0,
+        "ttl_seconds": 60,
+        "max_entries": 1024,
+    }
+
+
+@pytest.mark.unit
+def test_column_metadata_cache_invalidates_table_and_schema():
+    cache = ColumnMetadataCache(ttl_seconds=None)
+    first = build_column_metadata_cache_key(table_selectable="first", schema_name="my_schema")
+    second = build_column_metadata_cache_key(table_selectable="second", schema_name="my_schema")
+    other = build_column_metadata_cache_key(table_selectable="first", schema_name="other_schema")
+    for key in (first, second, other):
+        cache.put(key, [{"name": "a"}])
+
+    cache.invalidate(table_selectable="first", schema_name="my_schema")
+    assert first not in cache
+    assert second in cache
+
+    cache.invalidate(schema_name="my_schema")
+    assert second not in cache
+    assert other in cache
+
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+@pytest.mark.unit
+def test_column_metadata_cache_disabled_with_zero_ttl():
+    cache = ColumnMetadataCache(ttl_seconds=0)
+    key = build_column_metadata_cache_key(table_selectable="my_table")
+
+    cache.put(key, [{"name": "a"}])
+
+    assert cache.get(key) is None
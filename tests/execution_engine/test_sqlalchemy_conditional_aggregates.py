@@ -0,0 +1,150 @@
+import pytest
+
+from great_expectations.execution_engine.sqlalchemy_conditional_aggregates import (
+    ConditionalAggregateMode,
+    UnsupportedConditionalAggregateError,
+    apply_condition_to_aggregate,
+    build_domain_condition,
+    get_base_domain_kwargs,
+    get_conditional_aggregate_mode,
+)
+from great_expectations.expectations.row_conditions import (
+    RowCondition,
+    RowConditionParserType,
+)
+
+try:
+    sqlalchemy = pytest.importorskip("sqlalchemy")
+except ImportError:
+    sqlalchemy = None
+
+
+def _compile(expression) -> str:
+    return str(
+        expression.compile(
+            dialect=sqlalchemy.dialects.postgresql.dialect(),
+            compile_kwargs={"literal_binds": True},
+        )
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "dialect_name,expected_mode",
+    [
+        pytest.param("postgresql", ConditionalAggregateMode.FILTER, id="postgresql"),
+        pytest.param("sqlite", ConditionalAggregateMode.CASE, id="sqlite"),
+        pytest.param("snowflake", ConditionalAggregateMode.CASE, id="snowflake"),
+        pytest.param("not_a_dialect", ConditionalAggregateMode.CASE, id="unknown"),
+    ],
+)
+def test_get_conditional_aggregate_mode(dialect_name: str, expected_mode: ConditionalAggregateMode):
+    assert get_conditional_aggregate_mode(dialect_name=dialect_name) == expected_mode
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "compute_domain_kwargs,expected_base_domain_kwargs",
+    [
+        pytest.param({"batch_id": "my_batch"}, {"batch_id": "my_batch"}, id="no_condition"),
+        pytest.param(
+            {
+                "batch_id": "my_batch",
+                "row_condition": 'col("b")>0',
+                "condition_parser": "great_expectations__experimental__",
+            },
+            {"batch_id": "my_batch"},
+            id="row_condition",
+        ),
+        pytest.param(
+            {
+                "batch_id": "my_batch",
+                "row_condition": "b > 0",
+                "condition_parser": "pandas",
+            },
+            None,
+            id="unsupported_condition_parser",
+        ),
+        pytest.param(
+            {"batch_id": "my_batch", "ignore_row_if": "both_values_are_missing"},
+            None,
+            id="structurally_different_domain",
+        ),
+    ],
+)
+def test_get_base_domain_kwargs(compute_domain_kwargs: dict, expected_base_domain_kwargs):
+    assert (
+        get_base_domain_kwargs(compute_domain_kwargs=compute_domain_kwargs)
+        == expected_base_domain_kwargs
+    )
+
+
+@pytest.mark.unit
+def test_build_domain_condition_combines_row_condition_and_filter_conditions():
+    condition = build_domain_condition(
+        compute_domain_kwargs={
+            "row_condition": 'col("b")>0',
+            "condition_parser": "great_expectations__experimental__",
+            "filter_conditions": [
+                RowCondition(
+                    condition='col("a").notnull()',
+                    condition_type=RowConditionParserType.GE,
+                )
+            ],
+        }
+    )
+
+    assert _compile(condition) == "b > 0 AND a IS NOT NULL"
+    assert build_domain_condition(compute_domain_kwargs={"batch_id": "my_batch"}) is None
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "mode,expected_sql",
+    [
+        pytest.param(
+            ConditionalAggregateMode.FILTER,
+            "sqrt(sum(a) FILTER (WHERE b > 0)) + count(*) FILTER (WHERE b > 0)",
+            id="filter",
+        ),
+        pytest.param(
+            ConditionalAggregateMode.CASE,
+            "sqrt(sum(CASE WHEN (b > 0) THEN a END)) + count(CASE WHEN (b > 0) THEN 1 END)",
+            id="case",
+        ),
+    ],
+)
+def test_apply_condition_to_aggregate(mode: ConditionalAggregateMode, expected_sql: str):
+    sa = sqlalchemy
+    metric_fn = sa.func.sqrt(sa.func.sum(sa.column("a"))) + sa.func.count()
+
+    conditional_metric_fn = apply_condition_to_aggregate(
+        metric_fn=metric_fn,
+        condition=sa.column("b") > 0,
+        mode=mode,
+    )
+
+    assert _compile(conditional_metric_fn) == expected_sql
+
+
+@pytest.mark.unit
+def test_apply_condition_to_aggregate_keeps_distinct_outermost():
+    sa = sqlalchemy
+    conditional_metric_fn = apply_condition_to_aggregate(
+        metric_fn=sa.func.count(sa.distinct(sa.column("a"))),
+        condition=sa.column("b") > 0,
+        mode=ConditionalAggregateMode.CASE,
+    )
+
+    assert _compile(conditional_metric_fn) == "count(DISTINCT CASE WHEN (b > 0) THEN a END)"
+
+
+@pytest.mark.unit
+def test_apply_condition_to_aggregate_unsupported_function_raises():
+    sa = sqlalchemy
+    with pytest.raises(UnsupportedConditionalAggregateError):
+        apply_condition_to_aggregate(
+            metric_fn=sa.func.approx_count_distinct(sa.column("a")),
+            condition=sa.column("b") > 0,
+            mode=ConditionalAggregateMode.CASE,
+        )
@@ -438,6 +438,203 @@ def test_sa_batch_aggregate_metrics(caplog, sa):
     assert found_message
 
 
+@pytest.mark.sqlite
+@pytest.mark.parametrize(
+    "bundle_conditional_aggregates,expected_number_of_queries",
+    [
+        pytest.param(False, 3, id="per_domain_queries"),
+        pytest.param(True, 1, id="conditional_aggregates"),
+    ],
+)
+def test_sa_batch_aggregate_metrics_with_row_conditions(
+    caplog, sa, bundle_conditional_aggregates: bool, expected_number_of_queries: int
+):
+    execution_engine = build_sa_execution_engine(
+        pd.DataFrame({"a": [1, 2, 1, 2, 3, 3], "b": [4, 4, 4, 5, 5, 5]}), sa
+    )
+    execution_engine._bundle_conditional_aggregates = bundle_conditional_aggregates
+
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
+
+    table_columns_metric, results = get_table_columns_metric(execution_engine=execution_engine)
+    metrics.update(results)
+
+    metric_domain_kwargs_list = [
+        {"column": "a"},
+        {
+            "column": "a",
+            "row_condition": 'col("b")==4',
+            "condition_parser": "great_expectations__experimental__",
+        },
+        {
+            "column": "a",
+            "row_condition": 'col("b")==5',
+            "condition_parser": "great_expectations__experimental__",
+        },
+    ]
+
+    aggregate_fn_metrics = []
+    desired_metrics = []
+    for metric_domain_kwargs in metric_domain_kwargs_list:
+        for metric_name in ("column.max", "column.min", "column.sum"):
+            aggregate_fn_metric = MetricConfiguration(
+                metric_name=f"{metric_name}.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+                metric_domain_kwargs=metric_domain_kwargs,
+                metric_value_kwargs=None,
+            )
+            aggregate_fn_metric.metric_dependencies = {
+                "table.columns": table_columns_metric,
+            }
+            desired_metric = MetricConfiguration(
+                metric_name=metric_name,
+                metric_domain_kwargs=metric_domain_kwargs,
+                metric_value_kwargs=None,
+            )
+            desired_metric.metric_dependencies = {
+                "metric_partial_fn": aggregate_fn_metric,
+                "table.columns": table_columns_metric,
+            }
+            aggregate_fn_metrics.append(aggregate_fn_metric)
+            desired_metrics.append(desired_metric)
+
+    results = execution_engine.resolve_metrics(
+        metrics_to_resolve=aggregate_fn_metrics,
+        metrics=metrics,
+    )
+    metrics.update(results)
+
+    caplog.clear()
+    caplog.set_level(logging.DEBUG, logger="great_expectations")
+    results = execution_engine.resolve_metrics(
+        metrics_to_resolve=desired_metrics,
+        metrics=metrics,
+    )
+
+    assert [results[desired_metric.id] for desired_metric in desired_metrics] == [
+        3,
+        1,
+        12,
+        2,
+        1,
+        4,
+        3,
+        2,
+        8,
+    ]
+
+    query_messages = [
+        record.message
+        for record in caplog.records
+        if record.message.startswith("SqlAlchemyExecutionEngine computed")
+    ]
+    assert len(query_messages) == expected_number_of_queries
+
+
+@pytest.mark.sqlite
+def test_get_domain_records_materializes_domain_shared_by_pending_metrics(sa):
+    execution_engine = build_sa_execution_engine(
+        pd.DataFrame({"a": [1, 2, 3, 4, 5], "b": [2, 3, 4, 5, None]}), sa
+    )
+    execution_engine._materialize_domain_min_metrics = 2
+
+    filtered_domain_kwargs = {
+        "row_condition": 'col("b")<5',
+        "condition_parser": "great_expectations__experimental__",
+    }
+    execution_engine.prepare_domain_records(
+        metric_configurations=[
+            MetricConfiguration(
+                metric_name=metric_name,
+                metric_domain_kwargs={"column": "a", **filtered_domain_kwargs},
+                metric_value_kwargs=None,
+            )
+            for metric_name in ("column.max", "column.min")
+        ]
+        + [
+            MetricConfiguration(
+                metric_name="column.max",
+                metric_domain_kwargs={
+                    "column": "a",
+                    "row_condition": 'col("b")<4',
+                    "condition_parser": "great_expectations__experimental__",
+                },
+                metric_value_kwargs=None,
+            )
+        ]
+    )
+
+    selectable = execution_engine.get_domain_records(
+        domain_kwargs={"column": "a", **filtered_domain_kwargs}
+    )
+    assert isinstance(selectable, sa.Table)
+    assert execution_engine.get_domain_records(domain_kwargs=filtered_domain_kwargs) is selectable
+    assert (
+        execution_engine.execute_query(
+            sa.select(sa.func.max(sa.column("a"))).select_from(selectable)
+        ).scalar()
+        == 3
+    )
+
+    # Domain, shared by fewer pending metrics than threshold, is not materialized.
+    assert not isinstance(
+        execution_engine.get_domain_records(
+            domain_kwargs={
+                "column": "a",
+                "row_condition": 'col("b")<4',
+                "condition_parser": "great_expectations__experimental__",
+            }
+        ),
+        sa.Table,
+    )
+
+    execution_engine.release_domain_records()
+
+    with pytest.raises(sa.exc.OperationalError):
+        execution_engine.execute_query(sa.select(sa.text("*")).select_from(selectable)).fetchall()
+    assert not isinstance(
+        execution_engine.get_domain_records(domain_kwargs=filtered_domain_kwargs), sa.Table
+    )
+
+
+@pytest.mark.sqlite
+def test_get_domain_records_falls_back_if_domain_query_cannot_be_compiled(sa):
+    execution_engine = build_sa_execution_engine(
+        pd.DataFrame({"a": [1, 2, 3, 4, 5], "b": [2, 3, 4, 5, None]}), sa
+    )
+    execution_engine._materialize_domain_min_metrics = 1
+
+    filtered_domain_kwargs = {
+        "row_condition": 'col("b")<5',
+        "condition_parser": "great_expectations__experimental__",
+    }
+    execution_engine.prepare_domain_records(
+        metric_configurations=[
+            MetricConfiguration(
+                metric_name="column.max",
+                metric_domain_kwargs={"column": "a", **filtered_domain_kwargs},
+                metric_value_kwargs=None,
+            )
+        ]
+    )
+
+    with mock.patch.object(
+        sa.sql.Select, "compile", side_effect=sa.exc.CompileError("No literal value renderer")
+    ):
+        selectable = execution_engine.get_domain_records(domain_kwargs=filtered_domain_kwargs)
+
+    assert isinstance(selectable, sa.sql.Select)
+    assert (
+        execution_engine.execute_query(
+            sa.select(sa.func.max(sa.column("a"))).select_from(selectable.subquery())
+        ).scalar()
+        == 3
+    )
+    assert len(execution_engine._unmaterializable_domains) == 1
+
+
 @pytest.mark.sqlite
 def test_get_domain_records_with_column_domain(sa):
     df = pd.DataFrame({"a": [1, 2, 3, 4, 5], "b": [2, 3, 4, 5, None], "c": [1, 2, 3, 4, None]})
@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.expectations.metrics.sketches.hll import HyperLogLogSketch
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("cardinality", [1, 10, 1000, 100000])
+def test_hll_sketch_estimate_is_within_error_bound(cardinality: int):
+    values = pd.Series(
+        np.random.default_rng(seed=0).permutation(np.repeat(np.arange(cardinality), 3))
+    )
+    sketch = HyperLogLogSketch.from_relative_error(relative_error=0.01)
+
+    sketch.update(values)
+
+    assert sketch.precision == 14
+    assert abs(sketch.estimate() - cardinality) <= 3 * sketch.relative_error * cardinality
+
+
+@pytest.mark.unit
+def test_hll_sketch_merge_summarizes_union():
+    left = HyperLogLogSketch().update(pd.Series([f"id_{idx}" for idx in range(60000)]))
+    right = HyperLogLogSketch().update(pd.Series([f"id_{idx}" for idx in range(40000, 100000)]))
+
+    estimate = left.merge(right).estimate()
+
+    assert abs(estimate - 100000) <= 3 * left.relative_error * 100000
+
+
+@pytest.mark.unit
+def test_hll_sketch_ignores_nulls():
+    sketch = HyperLogLogSketch()
+    assert sketch.estimate() == 0
+
+    sketch.update(["a", "b", None, "a", np.nan])
+
+    assert sketch.estimate() == 2
+
+
+@pytest.mark.unit
+def test_hll_sketch_rejects_merge_of_different_precision():
+    with pytest.raises(ValueError):
+        HyperLogLogSketch(precision=10).merge(HyperLogLogSketch(precision=12))
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "left_values,right_values",
+    [
+        pytest.param(range(1000), [*range(1000), None], id="int64_and_float64_with_null"),
+        pytest.param(range(1000), [float(idx) for idx in range(1000)], id="int64_and_float64"),
+        pytest.param(
+            range(1000), [*range(500), *(str(idx) for idx in range(500, 1000))], id="int_and_str"
+        ),
+        pytest.param(
+            pd.date_range("2024-01-01", periods=1000, freq="h"),
+            [*pd.date_range("2024-01-01", periods=1000, freq="h").to_pydatetime(), None],
+            id="datetime64_and_object",
+        ),
+    ],
+)
+def test_hll_sketch_merges_partitions_with_different_dtypes(left_values, right_values):
+    left = HyperLogLogSketch().update(pd.Series(left_values))
+    right = HyperLogLogSketch().update(right_values)
+
+    expected = len(
+        set(pd.Series(left_values).tolist())
+        | {value for value in pd.Series(right_values, dtype=object).tolist() if value is not None}
+    )
+
+    assert abs(left.merge(right).estimate() - expected) <= 3 * left.relative_error * expected
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from great_expectations.expectations.metrics.sketches.kll import KLLQuantileSketch
+
+QUANTILES = [0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99]
+
+
+def _rank_errors(sketch: KLLQuantileSketch, sorted_values: np.ndarray) -> np.ndarray:
+    estimates = np.asarray(sketch.quantiles(QUANTILES))
+    ranks = np.searchsorted(sorted_values, estimates, side="right") / sorted_values.size
+    return np.abs(ranks - np.asarray(QUANTILES))
+
+
+@pytest.mark.unit
+def test_kll_sketch_rank_error_is_within_bound():
+    values = np.random.default_rng(seed=0).normal(size=200000)
+    sketch = KLLQuantileSketch.from_relative_error(relative_error=0.01, seed=0)
+
+    for chunk in np.array_split(values, 7):
+        sketch.update(chunk)
+
+    assert sketch.n == values.size
+    assert sketch.num_retained < values.size // 100
+    assert sketch.normalized_rank_error <= 0.01
+    assert np.all(_rank_errors(sketch, np.sort(values)) <= sketch.normalized_rank_error)
+    assert sketch.quantiles([0.0, 1.0]) == [values.min(), values.max()]
+
+
+@pytest.mark.unit
+def test_kll_sketch_merge_summarizes_union():
+    values = np.random.default_rng(seed=1).exponential(size=100000)
+    sketches = [
+        KLLQuantileSketch(seed=idx).update(partition)
+        for idx, partition in enumerate(np.array_split(values, 4))
+    ]
+
+    merged = KLLQuantileSketch(seed=0)
+    for sketch in sketches:
+        merged.merge(sketch)
+
+    assert merged.n == values.size
+    assert np.all(_rank_errors(merged, np.sort(values)) <= merged.normalized_rank_error)
+
+
+@pytest.mark.unit
+def test_kll_sketch_ignores_nulls_and_handles_empty_input():
+    sketch = KLLQuantileSketch()
+    assert sketch.quantiles([0.5]) == [None]
+
+    sketch.update([None, np.nan, 3, 1, 2])
+
+    assert sketch.n == 3
+    assert sketch.quantiles([0.0, 0.5, 1.0]) == [1.0, 2.0, 3.0]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("relative_error", [0.0, 1.0, -0.5])
+def test_kll_sketch_rejects_invalid_relative_error(relative_error: float):
+    with pytest.raises(ValueError):
+        KLLQuantileSketch.from_relative_error(relative_error=relative_error)
@@ -819,6 +819,197 @@ def test_quantiles_metric_spark(spark_session):
     assert results == {desired_metric.id: [1.0, 2.0, 3.0]}
 
 
+@pytest.mark.unit
+def test_approximate_quantiles_metric_pd():
+    engine = build_pandas_engine(
+        pd.DataFrame({"a": [float(idx) for idx in range(1, 1001)] + [None]})
+    )
+
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
+
+    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
+    metrics.update(results)
+
+    sketch_metric = MetricConfiguration(
+        metric_name="column.quantile_sketch",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"allow_relative_error": 0.01},
+    )
+    sketch_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(metrics_to_resolve=(sketch_metric,), metrics=metrics)
+    metrics.update(results)
+    assert results[sketch_metric.id].n == 1000
+
+    desired_metric = MetricConfiguration(
+        metric_name="column.approximate_quantile_values",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={
+            "quantiles": [0.0, 2.5e-1, 5.0e-1, 7.5e-1, 1.0],
+            "allow_relative_error": 0.01,
+        },
+    )
+    desired_metric.metric_dependencies = {
+        "column.quantile_sketch": sketch_metric,
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
+    metrics.update(results)
+
+    quantiles = results[desired_metric.id]
+    assert quantiles[0] == 1.0
+    assert quantiles[-1] == 1000.0
+    assert quantiles[1:-1] == pytest.approx([250.0, 500.0, 750.0], abs=10)
+
+
+@pytest.mark.sqlite
+def test_approximate_median_metric_sa(sa):
+    engine = build_sa_execution_engine(
+        pd.DataFrame({"a": [float(idx) for idx in range(1, 1002)] + [None]}), sa
+    )
+
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
+
+    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
+    metrics.update(results)
+
+    sketch_metric = MetricConfiguration(
+        metric_name="column.quantile_sketch",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"allow_relative_error": 0.01},
+    )
+    sketch_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(metrics_to_resolve=(sketch_metric,), metrics=metrics)
+    metrics.update(results)
+    assert results[sketch_metric.id].n == 1001
+
+    desired_metric = MetricConfiguration(
+        metric_name="column.approximate_median",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"allow_relative_error": 0.01},
+    )
+    desired_metric.metric_dependencies = {
+        "column.quantile_sketch": sketch_metric,
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
+    metrics.update(results)
+    assert results[desired_metric.id] == pytest.approx(501.0, abs=10)
+
+
+@pytest.mark.spark
+def test_approximate_median_metric_spark(spark_session):
+    engine: SparkDFExecutionEngine = build_spark_engine(
+        spark=spark_session,
+        df=pd.DataFrame({"a": [float(idx) for idx in range(1, 1002)]}),
+        batch_id="my_id",
+    )
+
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
+
+    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
+    metrics.update(results)
+
+    sketch_metric = MetricConfiguration(
+        metric_name="column.quantile_sketch",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"allow_relative_error": 0.01},
+    )
+    sketch_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(metrics_to_resolve=(sketch_metric,), metrics=metrics)
+    metrics.update(results)
+
+    desired_metric = MetricConfiguration(
+        metric_name="column.approximate_median",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"allow_relative_error": 0.01},
+    )
+    desired_metric.metric_dependencies = {
+        "column.quantile_sketch": sketch_metric,
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
+    metrics.update(results)
+    assert results[desired_metric.id] == pytest.approx(501.0, abs=10)
+
+
+@pytest.mark.unit
+def test_approximate_distinct_values_count_metric_pd():
+    engine = build_pandas_engine(pd.DataFrame({"a": [idx % 5000 for idx in range(20000)] + [None]}))
+
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
+
+    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
+    metrics.update(results)
+
+    desired_metric = MetricConfiguration(
+        metric_name="column.approximate_distinct_values.count",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"allow_relative_error": 0.01},
+    )
+    desired_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
+    metrics.update(results)
+    assert results[desired_metric.id] == pytest.approx(5000, rel=0.03)
+
+
+@pytest.mark.sqlite
+def test_approximate_distinct_values_count_metric_sa(sa):
+    engine = build_sa_execution_engine(pd.DataFrame({"a": [1, 2, 2, 3, None]}), sa)
+
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    table_columns_metric: MetricConfiguration
+    results: Dict[Tuple[str, str, str], MetricValue]
+
+    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
+    metrics.update(results)
+
+    partial_metric = MetricConfiguration(
+        metric_name=f"column.approximate_distinct_values.count.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"allow_relative_error": 0.01},
+    )
+    partial_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(metrics_to_resolve=(partial_metric,), metrics=metrics)
+    metrics.update(results)
+
+    desired_metric = MetricConfiguration(
+        metric_name="column.approximate_distinct_values.count",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"allow_relative_error": 0.01},
+    )
+    desired_metric.metric_dependencies = {
+        "metric_partial_fn": partial_metric,
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
+
+    # SQLite has no approximate distinct count function; exact "COUNT(DISTINCT)" is used instead.
+    assert results == {desired_metric.id: 3}
+
+
 @pytest.mark.unit
 def test_column_histogram_metric_pd():
     engine = build_pandas_engine(
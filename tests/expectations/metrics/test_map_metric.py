@@ -683,6 +683,37 @@ def test_pandas_unexpected_rows_complete_result_format_with_id_pk(
     }
 
 
+@pytest.mark.unit
+def test_pandas_unexpected_rows_summary_result_format_with_id_pk_is_limited(
+    in_memory_runtime_context,
+    pandas_animals_dataframe_for_unexpected_rows_and_index: pd.DataFrame,
+):
+    expectation_configuration = ExpectationConfiguration(
+        expectation_type="expect_column_values_to_be_in_set",
+        kwargs={
+            "column": "animals",
+            "value_set": ["cat", "fish", "dog"],
+            "result_format": {
+                "result_format": "SUMMARY",
+                "unexpected_index_column_names": ["pk_1", "pk_2"],
+                "partial_unexpected_count": 2,
+            },
+        },
+    )
+    # result_format configuration at ExpectationConfiguration-level will emit warning
+    with pytest.warns(UserWarning):
+        result: ExpectationValidationResult = _expecation_configuration_to_validation_result_pandas(
+            expectation_configuration=expectation_configuration,
+            dataframe=pandas_animals_dataframe_for_unexpected_rows_and_index,
+            context=in_memory_runtime_context,
+        )
+    assert result.result["unexpected_count"] == 3
+    assert convert_to_json_serializable(result.result["partial_unexpected_index_list"]) == [
+        {"animals": "giraffe", "pk_1": 3, "pk_2": "three"},
+        {"animals": "lion", "pk_1": 4, "pk_2": "four"},
+    ]
+
+
 @pytest.mark.unit
 def test_pandas_default_to_not_include_unexpected_rows(
     in_memory_runtime_context,
@@ -163,3 +163,39 @@ def test_table_column_types__sqlalchemy_table_not_found(sa):
     assert "(sqlite3.OperationalError) no such table: table_partitioned_by_date_column__B" in str(
         exc.value
     )
+
+
+@pytest.mark.sqlite
+def test_table_column_types__sqlalchemy_reuses_cached_column_metadata(sa):
+    db_file = file_relative_path(
+        __file__,
+        "../../test_sets/test_cases_for_sql_data_connector.db",
+    )
+    eng = sa.create_engine(f"sqlite:///{db_file}")
+    engine = SqlAlchemyExecutionEngine(engine=eng)
+    batch_data = SqlAlchemyBatchData(
+        execution_engine=engine, table_name="table_partitioned_by_date_column__A"
+    )
+    engine.load_batch_data("__", batch_data)
+
+    get_columns = sa.engine.reflection.Inspector.get_columns
+    with mock.patch.object(
+        sa.engine.reflection.Inspector, "get_columns", autospec=True, side_effect=get_columns
+    ) as mock_get_columns:
+        for _ in range(3):
+            _table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
+            assert results[("table.columns", (), ())] == [
+                "index",
+                "id",
+                "date",
+                "event_type",
+                "favorite_color",
+            ]
+
+        assert mock_get_columns.call_count == 1
+        assert engine.column_metadata_cache.info()["hits"] == 2
+
+        engine.invalidate_column_metadata(table_name="table_partitioned_by_date_column__A")
+        _table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
+
+        assert mock_get_columns.call_count == 2
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+
+"""
+Micro-benchmarks of metric dependency graph construction and resolution (dominated by "MetricConfiguration.id" and
+"IDDict.to_id()" computations, performed for every dictionary and set lookup of metric in "ValidationGraph").
+"""  # noqa: E501
+
+import sys
+from typing import List
+
+import _pytest.config
+import numpy as np
+import pandas as pd
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from great_expectations.core import IDDict
+from great_expectations.core.batch import Batch
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.expectations.expectation_configuration import (
+    ExpectationConfiguration,
+)
+from great_expectations.validator.validation_graph import ValidationGraph
+from great_expectations.validator.validator import Validator
+
+pytestmark = pytest.mark.performance
+
+NUMBER_OF_COLUMNS = 100
+NUMBER_OF_ROWS = 1000
+
+# Ten Expectations per column (1,000 Expectations for 100 columns), sharing many metric
+# dependencies.
+EXPECTATION_TEMPLATES: List[dict] = [
+    {"expectation_type": "expect_column_max_to_be_between", "kwargs": {"min_value": 0}},
+    {"expectation_type": "expect_column_min_to_be_between", "kwargs": {"max_value": 1}},
+    {"expectation_type": "expect_column_mean_to_be_between", "kwargs": {"min_value": 0}},
+    {"expectation_type": "expect_column_sum_to_be_between", "kwargs": {"min_value": 0}},
+    {"expectation_type": "expect_column_stdev_to_be_between", "kwargs": {"min_value": 0}},
+    {"expectation_type": "expect_column_values_to_not_be_null", "kwargs": {}},
+    {
+        "expectation_type": "expect_column_values_to_be_between",
+        "kwargs": {"min_value": 0, "max_value": 1},
+    },
+    {
+        "expectation_type": "expect_column_values_to_be_between",
+        "kwargs": {
+            "min_value": 0,
+            "max_value": 1,
+            "row_condition": "c_0 > 0.5",
+            "condition_parser": "pandas",
+        },
+    },
+    {
+        "expectation_type": "expect_column_values_to_be_in_type_list",
+        "kwargs": {"type_list": ["float64"]},
+    },
+    {"expectation_type": "expect_column_to_exist", "kwargs": {}},
+]
+
+
+@pytest.fixture
+def validator(in_memory_runtime_context) -> Validator:
+    rng = np.random.default_rng(seed=0)
+    df = pd.DataFrame(
+        rng.random(size=(NUMBER_OF_ROWS, NUMBER_OF_COLUMNS)),
+        columns=[f"c_{idx}" for idx in range(NUMBER_OF_COLUMNS)],
+    )
+    batch = Batch(data=df)
+    return Validator(
+        execution_engine=PandasExecutionEngine(),
+        data_context=in_memory_runtime_context,
+        batches=[batch],
+    )
+
+
+@pytest.fixture
+def expectation_configurations() -> List[ExpectationConfiguration]:
+    return [
+        ExpectationConfiguration(
+            expectation_type=template["expectation_type"],
+            kwargs={"column": f"c_{idx}", **template["kwargs"]},
+        )
+        for idx in range(NUMBER_OF_COLUMNS)
+        for template in EXPECTATION_TEMPLATES
+    ]
+
+
+def test_metric_dependency_graph_build_benchmark(
+    benchmark: BenchmarkFixture,
+    pytestconfig: _pytest.config.Config,
+    validator: Validator,
+    expectation_configurations: List[ExpectationConfiguration],
+):
+    """Benchmark building suite-level "ValidationGraph" for 1,000 Expectations."""
+    _skip_if_performance_tests_not_enabled(pytestconfig)
+
+    def _build_graph() -> ValidationGraph:
+        expectation_validation_graphs, _, _ = (
+            validator._generate_metric_dependency_subgraphs_for_each_expectation_configuration(
+                expectation_configurations=expectation_configurations,
+                processed_configurations=[],
+                catch_exceptions=False,
+                runtime_configuration={},
+            )
+        )
+        return validator._generate_suite_level_graph_from_expectation_level_sub_graphs(
+            expectation_validation_graphs=expectation_validation_graphs
+        )
+
+    graph: ValidationGraph = benchmark.pedantic(_build_graph, iterations=1, rounds=5)
+
+    assert len(graph.edges) > len(expectation_configurations)
+
+
+def test_metric_dependency_graph_resolve_benchmark(
+    benchmark: BenchmarkFixture,
+    pytestconfig: _pytest.config.Config,
+    validator: Validator,
+    expectation_configurations: List[ExpectationConfiguration],
+):
+    """Benchmark building and resolving metrics (end-to-end "graph_validate()") for 1,000
+    Expectations."""
+    _skip_if_performance_tests_not_enabled(pytestconfig)
+
+    def _validate():
+        # Clearing metric cache, so that every round resolves all metrics.
+        validator.execution_engine._metric_cache.clear()
+        return validator.graph_validate(
+            configurations=expectation_configurations,
+            runtime_configuration={"catch_exceptions": False},
+        )
+
+    results = benchmark.pedantic(_validate, iterations=1, rounds=3)
+
+    assert len(results) == len(expectation_configurations)
+    assert all(result.exception_info["raised_exception"] is False for result in results)
+
+
+def test_id_dict_to_id_benchmark(
+    benchmark: BenchmarkFixture,
+    pytestconfig: _pytest.config.Config,
+):
+    """Benchmark repeated "IDDict.to_id()" of typical metric Domain kwargs (memoized after first
+    computation)."""
+    _skip_if_performance_tests_not_enabled(pytestconfig)
+
+    domain_kwargs = IDDict(
+        {
+            "batch_id": "my_batch",
+            "column": "c_0",
+            "row_condition": "c_0 > 0.5",
+            "condition_parser": "pandas",
+        }
+    )
+
+    def _to_ids() -> int:
+        return len({domain_kwargs.to_id() for _ in range(10000)})
+
+    assert benchmark(_to_ids) == 1
+
+
+def _skip_if_performance_tests_not_enabled(
+    pytestconfig: _pytest.config.Config,
+):
+    if not pytestconfig.getoption("performance_tests"):
+        pytest.skip("This test requires --performance-tests flag to run.")
+
+
+if __name__ == "__main__":
+    # For profiling, it can be useful to support running this script directly instead of using pytest to run.  # noqa: E501
+    sys.exit(pytest.main(sys.argv))
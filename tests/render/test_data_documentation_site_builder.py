@@ -1,6 +1,8 @@
 import os
+import pathlib
 import shutil
 from typing import Dict
+from unittest import mock
 
 import pytest
 
@@ -125,3 +127,99 @@ def test_site_builder_with_custom_site_section_builders_config(tmp_path_factory)
     profiling_site_section_builder = site_section_builders["profiling"]
     assert isinstance(validations_site_section_builder.source_store, ExpectationsStore)
     assert profiling_site_section_builder.run_name_filter == {"equals": "custom_profiling_filter"}
+
+
+def test_site_builder_renders_only_new_or_changed_pages(tmp_path):
+    context = get_context(project_root_dir=str(tmp_path))
+    context.add_expectation_suite("first_suite")
+    context.add_expectation_suite("second_suite")
+
+    site_builder = context._init_site_builder_for_data_docs_site_creation(
+        site_name="local_site", site_config=context.variables.data_docs_sites["local_site"]
+    )
+    expectations_site_section_builder = site_builder.site_section_builders["expectations"]
+    with mock.patch.object(
+        expectations_site_section_builder.renderer_class,
+        "render",
+        wraps=expectations_site_section_builder.renderer_class.render,
+    ) as render:
+        site_builder.build()
+        assert render.call_count == 2
+
+        render.reset_mock()
+        site_builder.build()
+        render.assert_not_called()
+
+        suite = context.get_expectation_suite("second_suite")
+        suite.meta["notes"] = "changed"
+        context.update_expectation_suite(suite)
+        site_builder.build()
+        assert [call.args[0].name for call in render.call_args_list] == ["second_suite"]
+
+        # Pages are rendered again, once options of page change.
+        render.reset_mock()
+        expectations_site_section_builder.show_how_to_buttons = (
+            not expectations_site_section_builder.show_how_to_buttons
+        )
+        site_builder.build()
+        assert render.call_count == 2
+
+    _, index_links_dict = site_builder.site_index_builder.build()
+    assert sorted(
+        link["expectation_suite_name"] for link in index_links_dict["expectations_links"]
+    ) == ["first_suite", "second_suite"]
+
+
+@pytest.mark.parametrize(
+    "max_render_workers,expected_pool",
+    [
+        pytest.param(None, False, id="serial_by_default"),
+        pytest.param(1, False, id="serial"),
+        pytest.param(2, True, id="parallel"),
+    ],
+)
+def test_site_section_builder_renders_in_parallel_only_if_configured(
+    tmp_path, max_render_workers, expected_pool
+):
+    context = get_context(project_root_dir=str(tmp_path))
+    site_builder = context._init_site_builder_for_data_docs_site_creation(
+        site_name="local_site", site_config=context.variables.data_docs_sites["local_site"]
+    )
+    expectations_site_section_builder = site_builder.site_section_builders["expectations"]
+    expectations_site_section_builder.max_render_workers = max_render_workers
+
+    render_pool = expectations_site_section_builder._create_render_pool()
+    try:
+        assert (render_pool is not None) == expected_pool
+    finally:
+        if render_pool is not None:
+            render_pool.shutdown()
+
+
+def test_site_builder_renders_pages_again_once_custom_styles_change(tmp_path):
+    context = get_context(project_root_dir=str(tmp_path))
+    context.add_expectation_suite("my_suite")
+    custom_styles_directory = pathlib.Path(context.plugins_directory, "custom_data_docs", "styles")
+    custom_styles_directory.mkdir(parents=True, exist_ok=True)
+    custom_style_path = custom_styles_directory / "data_docs_custom_styles.css"
+    custom_style_path.write_text("body { color: black; }")
+
+    def _build_site() -> int:
+        # Site builder (and its section builders) is created anew by every data docs build.
+        site_builder = context._init_site_builder_for_data_docs_site_creation(
+            site_name="local_site", site_config=context.variables.data_docs_sites["local_site"]
+        )
+        expectations_site_section_builder = site_builder.site_section_builders["expectations"]
+        with mock.patch.object(
+            expectations_site_section_builder.renderer_class,
+            "render",
+            wraps=expectations_site_section_builder.renderer_class.render,
+        ) as render:
+            site_builder.build()
+            return render.call_count
+
+    assert _build_site() == 1
+    assert _build_site() == 0
+
+    custom_style_path.write_text("body { color: red; }")
+    assert _build_site() == 1
@@ -95,6 +95,45 @@ def test_bootstrap_point_estimate_efficacy(
         )
 
 
+@pytest.mark.unit
+def test_bootstrap_point_estimate_does_not_depend_on_resamples_chunk_size(monkeypatch):
+    metric_values: np.ndarray = np.random.default_rng(seed=0).normal(size=100)
+
+    def _estimate() -> NumericRangeEstimationResult:
+        return compute_bootstrap_quantiles_point_estimate(
+            metric_values=metric_values,
+            false_positive_rate=np.float64(5.0e-2),
+            n_resamples=999,
+            quantile_statistic_interpolation_method="linear",
+            quantile_bias_correction=False,
+            quantile_bias_std_error_ratio_threshold=np.inf,
+            random_seed=42,
+        )
+
+    unchunked_value_range = _estimate().value_range
+
+    # Budget of 7 resamples (of 100 values and their int64 indices) per chunk.
+    monkeypatch.setattr(
+        "great_expectations.rule_based_profiler.helpers.util.BOOTSTRAP_RESAMPLES_MEMORY_BUDGET_BYTES",
+        7 * 100 * 16,
+    )
+    chunked_value_range = _estimate().value_range
+
+    np.testing.assert_array_equal(chunked_value_range, unchunked_value_range)
+
+    # Resamples match those drawn as single matrix by "Generator.choice()", given same random seed.
+    bootstraps: np.ndarray = np.random.Generator(np.random.PCG64(42)).choice(
+        metric_values, size=(999, metric_values.size)
+    )
+    np.testing.assert_allclose(
+        chunked_value_range,
+        [
+            np.mean(np.quantile(bootstraps, 2.5e-2, axis=1)),
+            np.mean(np.quantile(bootstraps, 9.75e-1, axis=1)),
+        ],
+    )
+
+
 @pytest.mark.unit
 def test_sanitize_parameter_name(
     table_row_count_metric_config,
@@ -0,0 +1,197 @@
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.core.batch_spec import PathBatchSpec
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.validator.chunked_metrics import (
+    StandardDeviationMetricMerger,
+    UnexpectedIndexQueryMetricMerger,
+    get_metric_merger,
+)
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.metrics_calculator import MetricsCalculator
+
+RESULT_FORMAT = {"result_format": "SUMMARY", "partial_unexpected_count": 3}
+
+
+@pytest.fixture
+def csv_path(tmp_path) -> str:
+    path = tmp_path / "data.csv"
+    pd.DataFrame(
+        {
+            "a": range(1, 31),
+            "b": [None if i % 4 == 0 else float(i) for i in range(30)],
+        }
+    ).to_csv(path, index=False)
+    return str(path)
+
+
+def _build_metrics_calculator(csv_path: str, reader_options: dict) -> MetricsCalculator:
+    execution_engine = PandasExecutionEngine()
+    batch_data = execution_engine.get_batch_data(
+        batch_spec=PathBatchSpec(
+            path=csv_path, reader_method="read_csv", reader_options=reader_options
+        )
+    )
+    execution_engine.load_batch_data(batch_id="my_id", batch_data=batch_data)
+    return MetricsCalculator(execution_engine=execution_engine)
+
+
+def _build_metric_configurations():
+    return [
+        MetricConfiguration("table.row_count", metric_domain_kwargs={}),
+        MetricConfiguration("table.columns", metric_domain_kwargs={}),
+        MetricConfiguration("column.min", metric_domain_kwargs={"column": "a"}),
+        MetricConfiguration("column.max", metric_domain_kwargs={"column": "b"}),
+        MetricConfiguration("column.sum", metric_domain_kwargs={"column": "a"}),
+        MetricConfiguration("column.mean", metric_domain_kwargs={"column": "b"}),
+        MetricConfiguration("column.standard_deviation", metric_domain_kwargs={"column": "b"}),
+        MetricConfiguration(
+            "column_values.nonnull.unexpected_count", metric_domain_kwargs={"column": "b"}
+        ),
+        MetricConfiguration(
+            "column_values.nonnull.unexpected_index_list",
+            metric_domain_kwargs={"column": "b"},
+            metric_value_kwargs={"result_format": RESULT_FORMAT},
+        ),
+        MetricConfiguration(
+            "column_values.between.unexpected_values",
+            metric_domain_kwargs={"column": "a"},
+            metric_value_kwargs={
+                "min_value": 5,
+                "max_value": 20,
+                "strict_min": False,
+                "strict_max": False,
+                "parse_strings_as_datetimes": False,
+                "allow_cross_type_comparisons": None,
+                "result_format": RESULT_FORMAT,
+            },
+        ),
+    ]
+
+
+@pytest.mark.unit
+def test_chunked_metrics_equal_metrics_of_entire_batch(csv_path):
+    metric_configurations = _build_metric_configurations()
+
+    expected_metrics, _ = _build_metrics_calculator(
+        csv_path=csv_path, reader_options={}
+    ).compute_metrics(metric_configurations=metric_configurations)
+    chunked_metrics, aborted_metrics_info = _build_metrics_calculator(
+        csv_path=csv_path, reader_options={"chunksize": 7}
+    ).compute_metrics(metric_configurations=_build_metric_configurations())
+
+    assert aborted_metrics_info == {}
+    metric_configuration: MetricConfiguration
+    for metric_configuration in metric_configurations:
+        expected = expected_metrics[metric_configuration.id]
+        actual = chunked_metrics[metric_configuration.id]
+        if isinstance(expected, float):
+            assert math.isclose(actual, expected), metric_configuration.metric_name
+        else:
+            assert actual == expected, metric_configuration.metric_name
+
+
+@pytest.mark.unit
+def test_chunked_metrics_reject_metrics_that_cannot_be_merged(csv_path):
+    row_count = MetricConfiguration("table.row_count", metric_domain_kwargs={})
+    median = MetricConfiguration("column.median", metric_domain_kwargs={"column": "a"})
+
+    resolved_metrics, aborted_metrics_info = _build_metrics_calculator(
+        csv_path=csv_path, reader_options={"chunksize": 7}
+    ).compute_metrics(metric_configurations=[row_count, median])
+
+    assert resolved_metrics[row_count.id] == 30
+    assert median.id not in resolved_metrics
+    assert "cannot be merged" in (
+        aborted_metrics_info[median.id]["exception_info"].exception_message
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "metric_name,mergeable",
+    [
+        pytest.param("table.row_count", True, id="table_row_count"),
+        pytest.param("column.mean", True, id="column_mean"),
+        pytest.param("column_values.in_set.unexpected_count", True, id="map_metric_count"),
+        pytest.param("column_values.unique.unexpected_count", False, id="unique_map_metric"),
+        pytest.param("column_values.z_score.under_threshold.unexpected_count", False, id="z_score"),
+        pytest.param("column.median", False, id="column_median"),
+        pytest.param("column.quantile_values", False, id="column_quantile_values"),
+    ],
+)
+def test_get_metric_merger(metric_name, mergeable):
+    assert (get_metric_merger(metric_name) is not None) is mergeable
+
+
+@pytest.mark.unit
+def test_standard_deviation_metric_merger():
+    values = np.array([1.0, 4.0, 4.5, 10.0, -3.0, 7.25, 0.5])
+    partials = [
+        (len(chunk), float(chunk.mean()), float(((chunk - chunk.mean()) ** 2).sum()))
+        for chunk in (values[:3], values[3:4], values[4:])
+    ]
+
+    merged = StandardDeviationMetricMerger().merge(
+        partials=partials,
+        metric_configuration=MetricConfiguration(
+            "column.standard_deviation", metric_domain_kwargs={"column": "a"}
+        ),
+    )
+
+    assert math.isclose(merged, float(values.std(ddof=1)))
+
+
+@pytest.mark.unit
+def test_unexpected_index_query_metric_merger():
+    merger = UnexpectedIndexQueryMetricMerger()
+    metric_configuration = MetricConfiguration(
+        "column_values.nonnull.unexpected_index_query", metric_domain_kwargs={"column": "a"}
+    )
+
+    partials = [
+        merger.partial(
+            value=value, metric_configuration=metric_configuration, execution_engine=None
+        )
+        for value in ("df.filter(items=[0, 3], axis=0)", "df.filter(items=[], axis=0)", None)
+    ]
+
+    assert (
+        merger.merge(partials=partials, metric_configuration=metric_configuration)
+        == "df.filter(items=[0, 3], axis=0)"
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "metric_name",
+    [
+        pytest.param("column_values.unique.unexpected_count", id="unique"),
+        pytest.param("column_values.increasing.unexpected_count", id="increasing"),
+    ],
+)
+def test_chunked_metrics_reject_map_metrics_over_entire_column(tmp_path, metric_name):
+    csv_path = str(tmp_path / "data.csv")
+    pd.DataFrame({"a": [1, 2, 3, 4, 1, 6, 7, 8]}).to_csv(csv_path, index=False)
+    unexpected_count = MetricConfiguration(metric_name, metric_domain_kwargs={"column": "a"})
+
+    expected_metrics, _ = _build_metrics_calculator(
+        csv_path=csv_path, reader_options={}
+    ).compute_metrics(metric_configurations=[unexpected_count])
+    resolved_metrics, aborted_metrics_info = _build_metrics_calculator(
+        csv_path=csv_path, reader_options={"chunksize": 4}
+    ).compute_metrics(
+        metric_configurations=[
+            MetricConfiguration(metric_name, metric_domain_kwargs={"column": "a"})
+        ]
+    )
+
+    assert expected_metrics[unexpected_count.id] > 0
+    assert unexpected_count.id not in resolved_metrics
+    assert "cannot be merged" in (
+        aborted_metrics_info[unexpected_count.id]["exception_info"].exception_message
+    )
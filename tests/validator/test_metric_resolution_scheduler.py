@@ -0,0 +1,274 @@
+import pathlib
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple, cast
+
+import pandas as pd
+import pytest
+
+import great_expectations.exceptions as gx_exceptions
+from great_expectations.core.batch_spec import PathBatchSpec
+from great_expectations.execution_engine import ExecutionEngine, PandasExecutionEngine
+from great_expectations.validator.computed_metric import MetricValue
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.metric_resolution_scheduler import (
+    MetricResolutionSchedulerType,
+    ProcessPoolMetricResolutionScheduler,
+    SerialMetricResolutionScheduler,
+    ThreadPoolMetricResolutionScheduler,
+    build_metric_resolution_scheduler,
+)
+from great_expectations.validator.validation_graph import ValidationGraph
+
+
+class RecordingExecutionEngineFake:
+    """Resolves every metric to its "metric_name"; records each "resolve_metrics()" call and raises
+    for bad column."""
+
+    def __init__(self) -> None:
+        self.calls: List[Tuple[str, ...]] = []
+        self.thread_names: List[str] = []
+        self._lock = threading.Lock()
+
+    # noinspection PyUnusedLocal
+    def resolve_metrics(
+        self,
+        metrics_to_resolve: Iterable[MetricConfiguration],
+        metrics: Optional[Dict[Tuple[str, str, str], MetricValue]] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        metrics_to_resolve = list(metrics_to_resolve)
+        with self._lock:
+            self.calls.append(
+                tuple(sorted(str(metric.metric_domain_kwargs) for metric in metrics_to_resolve))
+            )
+            self.thread_names.append(threading.current_thread().name)
+
+        failed_metrics = [
+            metric
+            for metric in metrics_to_resolve
+            if metric.metric_domain_kwargs.get("column") == "not_in_table"
+        ]
+        if failed_metrics:
+            raise gx_exceptions.MetricResolutionError(
+                message='Error: The column "not_in_table" in BatchData does not exist.',
+                failed_metrics=failed_metrics,
+            )
+
+        return {metric.id: metric.metric_name for metric in metrics_to_resolve}
+
+
+def _column_metric(column: str, row_condition: Optional[str] = None) -> MetricConfiguration:
+    metric_domain_kwargs: dict = {"batch_id": "my_batch", "column": column}
+    if row_condition:
+        metric_domain_kwargs["row_condition"] = row_condition
+        metric_domain_kwargs["condition_parser"] = "great_expectations__experimental__"
+
+    return MetricConfiguration(
+        metric_name="column.max",
+        metric_domain_kwargs=metric_domain_kwargs,
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "runtime_configuration,expected_scheduler_class,expected_max_workers",
+    [
+        pytest.param(None, SerialMetricResolutionScheduler, None, id="absent"),
+        pytest.param(
+            {"metric_resolution_scheduler": "serial"},
+            SerialMetricResolutionScheduler,
+            None,
+            id="serial_string",
+        ),
+        pytest.param(
+            {"metric_resolution_scheduler": MetricResolutionSchedulerType.THREAD},
+            ThreadPoolMetricResolutionScheduler,
+            None,
+            id="thread_enum",
+        ),
+        pytest.param(
+            {"metric_resolution_scheduler": {"type": "thread", "max_workers": 4}},
+            ThreadPoolMetricResolutionScheduler,
+            4,
+            id="thread_dict",
+        ),
+        pytest.param(
+            {"metric_resolution_scheduler": {"type": "process", "max_workers": 2}},
+            ProcessPoolMetricResolutionScheduler,
+            2,
+            id="process_dict",
+        ),
+    ],
+)
+def test_build_metric_resolution_scheduler(
+    runtime_configuration: Optional[dict],
+    expected_scheduler_class: type,
+    expected_max_workers: Optional[int],
+) -> None:
+    scheduler = build_metric_resolution_scheduler(runtime_configuration=runtime_configuration)
+
+    assert isinstance(scheduler, expected_scheduler_class)
+    if expected_max_workers is not None:
+        assert scheduler.max_workers == expected_max_workers  # type: ignore[attr-defined]
+
+
+@pytest.mark.unit
+def test_build_metric_resolution_scheduler_passes_instance_through() -> None:
+    scheduler = ThreadPoolMetricResolutionScheduler(max_workers=3)
+
+    assert (
+        build_metric_resolution_scheduler(
+            runtime_configuration={"metric_resolution_scheduler": scheduler}
+        )
+        is scheduler
+    )
+
+
+@pytest.mark.unit
+def test_build_metric_resolution_scheduler_unrecognized_type_raises() -> None:
+    with pytest.raises(gx_exceptions.InvalidConfigError) as e:
+        build_metric_resolution_scheduler(
+            runtime_configuration={"metric_resolution_scheduler": "greenlet"}
+        )
+
+    assert 'Unrecognized "metric_resolution_scheduler" type "greenlet"' in e.value.message
+
+
+@pytest.mark.unit
+def test_serial_scheduler_resolves_all_metrics_in_single_call() -> None:
+    execution_engine = RecordingExecutionEngineFake()
+    metrics_to_resolve = {_column_metric("a"), _column_metric("b", row_condition='col("b")>0')}
+
+    resolved_metrics, exceptions = SerialMetricResolutionScheduler().resolve_metrics(
+        execution_engine=cast(ExecutionEngine, execution_engine),
+        metrics_to_resolve=metrics_to_resolve,
+        metrics={},
+    )
+
+    assert exceptions == []
+    assert set(resolved_metrics) == {metric.id for metric in metrics_to_resolve}
+    assert len(execution_engine.calls) == 1
+
+
+@pytest.mark.unit
+def test_thread_pool_scheduler_bundles_by_compute_domain() -> None:
+    execution_engine = RecordingExecutionEngineFake()
+    metrics_to_resolve = {
+        _column_metric("a"),
+        _column_metric("b"),
+        _column_metric("a", row_condition='col("b")>0'),
+        _column_metric("c", row_condition='col("b")>0'),
+    }
+
+    resolved_metrics, exceptions = ThreadPoolMetricResolutionScheduler(
+        max_workers=2
+    ).resolve_metrics(
+        execution_engine=cast(ExecutionEngine, execution_engine),
+        metrics_to_resolve=metrics_to_resolve,
+        metrics={},
+    )
+
+    assert exceptions == []
+    assert set(resolved_metrics) == {metric.id for metric in metrics_to_resolve}
+    # Columns sharing compute Domain (same "row_condition") are kept in one bundle.
+    assert len(execution_engine.calls) == 2
+    assert all(len(call) == 2 for call in execution_engine.calls)
+    assert all(name.startswith("gx-metrics") for name in execution_engine.thread_names)
+
+
+@pytest.mark.unit
+def test_thread_pool_scheduler_split_accessor_domains() -> None:
+    execution_engine = RecordingExecutionEngineFake()
+    metrics_to_resolve = {_column_metric("a"), _column_metric("b"), _column_metric("c")}
+
+    _resolved_metrics, exceptions = ThreadPoolMetricResolutionScheduler(
+        split_accessor_domains=True
+    ).resolve_metrics(
+        execution_engine=cast(ExecutionEngine, execution_engine),
+        metrics_to_resolve=metrics_to_resolve,
+        metrics={},
+    )
+
+    assert exceptions == []
+    assert len(execution_engine.calls) == 3
+
+
+@pytest.mark.unit
+def test_thread_pool_scheduler_keeps_results_of_successful_bundles() -> None:
+    execution_engine = RecordingExecutionEngineFake()
+    good_metric = _column_metric("a")
+    bad_metric = _column_metric("not_in_table", row_condition='col("b")>0')
+
+    resolved_metrics, exceptions = ThreadPoolMetricResolutionScheduler().resolve_metrics(
+        execution_engine=cast(ExecutionEngine, execution_engine),
+        metrics_to_resolve={good_metric, bad_metric},
+        metrics={},
+    )
+
+    assert set(resolved_metrics) == {good_metric.id}
+    assert len(exceptions) == 1
+    assert isinstance(exceptions[0], gx_exceptions.MetricResolutionError)
+    assert [metric.id for metric in exceptions[0].failed_metrics] == [bad_metric.id]
+
+
+@pytest.mark.unit
+def test_process_pool_scheduler_resolves_serially_if_execution_engine_cannot_be_pickled() -> None:
+    # Fake holds "threading.Lock", which cannot be pickled into worker processes.
+    execution_engine = RecordingExecutionEngineFake()
+    metrics_to_resolve = {_column_metric("a"), _column_metric("b", row_condition='col("b")>0')}
+
+    resolved_metrics, exceptions = ProcessPoolMetricResolutionScheduler(
+        max_workers=2
+    ).resolve_metrics(
+        execution_engine=cast(ExecutionEngine, execution_engine),
+        metrics_to_resolve=metrics_to_resolve,
+        metrics={},
+    )
+
+    assert exceptions == []
+    assert set(resolved_metrics) == {metric.id for metric in metrics_to_resolve}
+    assert execution_engine.thread_names == [threading.current_thread().name]
+
+
+@pytest.mark.filesystem
+def test_process_pool_scheduler_resolves_metrics_of_pandas_execution_engine(
+    tmp_path: pathlib.Path,
+) -> None:
+    csv_path = tmp_path / "data.csv"
+    pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]}).to_csv(csv_path, index=False)
+
+    execution_engine = PandasExecutionEngine()
+    # Lazily read Batch data (and its loader) is pickled into worker processes along with engine.
+    batch_data, _ = execution_engine.get_lazy_batch_data_and_markers(
+        batch_spec=PathBatchSpec(path=str(csv_path), reader_method="read_csv")
+    )
+    execution_engine.load_batch_data(batch_id="my_batch", batch_data=batch_data)
+
+    metric_configurations = [
+        _column_metric("a"),
+        _column_metric("b"),
+        MetricConfiguration(
+            metric_name="column.max",
+            metric_domain_kwargs={
+                "batch_id": "my_batch",
+                "column": "b",
+                "row_condition": "a<3",
+                "condition_parser": "pandas",
+            },
+        ),
+    ]
+    graph = ValidationGraph(execution_engine=execution_engine)
+    for metric_configuration in metric_configurations:
+        graph.build_metric_dependency_graph(metric_configuration=metric_configuration)
+
+    resolved_metrics, aborted_metrics_info = graph.resolve(
+        runtime_configuration={
+            "metric_resolution_scheduler": ProcessPoolMetricResolutionScheduler(max_workers=2)
+        },
+        show_progress_bars=False,
+    )
+
+    assert aborted_metrics_info == {}
+    assert [
+        resolved_metrics[metric_configuration.id] for metric_configuration in metric_configurations
+    ] == [3, 6, 5]
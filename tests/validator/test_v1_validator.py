@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import pathlib
 from pprint import pformat as pf
 
+import pandas as pd
 import pytest
 
 import great_expectations.expectations as gxe
@@ -14,7 +16,10 @@ from great_expectations.data_context.data_context.abstract_data_context import (
 )
 from great_expectations.datasource.fluent.interfaces import DataAsset, Datasource
 from great_expectations.expectations.expectation import Expectation
-from great_expectations.validator.v1_validator import Validator
+from great_expectations.expectations.expectation_configuration import (
+    ExpectationConfiguration,
+)
+from great_expectations.validator.v1_validator import Validator, get_referenced_columns
 
 
 @pytest.fixture
@@ -211,3 +216,95 @@ def test_validate_expectation_suite_evaluation_parameters(
     result = validator.validate_expectation_suite(suite, {"my_parameter": parameter})
 
     assert result.success == expected
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "expectations,expected_columns",
+    [
+        pytest.param(
+            [
+                gxe.ExpectColumnValuesToNotBeNull(column="a"),
+                gxe.ExpectColumnPairValuesToBeEqual(column_A="b", column_B="c"),
+                gxe.ExpectCompoundColumnsToBeUnique(column_list=["c", "d"]),
+                gxe.ExpectTableRowCountToBeBetween(min_value=1),
+            ],
+            {"a", "b", "c", "d"},
+            id="column_domains",
+        ),
+        pytest.param(
+            [
+                gxe.ExpectColumnValuesToNotBeNull(column="a"),
+                gxe.ExpectTableColumnsToMatchSet(column_set=["a", "b"]),
+            ],
+            None,
+            id="table_expectation_on_columns",
+        ),
+        pytest.param(
+            [
+                gxe.ExpectColumnValuesToNotBeNull(
+                    column="a", row_condition='b=="x"', condition_parser="pandas"
+                ),
+            ],
+            None,
+            id="row_condition",
+        ),
+        pytest.param(
+            [gxe.ExpectTableRowCountToBeBetween(min_value=1)],
+            None,
+            id="no_columns",
+        ),
+    ],
+)
+def test_get_referenced_columns(expectations: list[Expectation], expected_columns):
+    assert (
+        get_referenced_columns([expectation.configuration for expectation in expectations])
+        == expected_columns
+    )
+
+
+@pytest.mark.unit
+def test_get_referenced_columns_unknown_expectation():
+    expectation_config = ExpectationConfiguration(
+        expectation_type="expect_column_values_to_be_unknown_to_registry",
+        kwargs={"column": "a"},
+    )
+
+    assert get_referenced_columns([expectation_config]) is None
+
+
+@pytest.mark.filesystem
+def test_validate_loads_only_referenced_columns(
+    empty_data_context: AbstractDataContext, tmp_path: pathlib.Path
+):
+    base_directory = tmp_path / "data"
+    base_directory.mkdir()
+    pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", None], "c": [1.5, 2.5, 3.5]}).to_csv(
+        base_directory / "data.csv", index=False
+    )
+    asset = empty_data_context.sources.add_pandas_filesystem(
+        name="my_datasource", base_directory=base_directory
+    ).add_csv_asset(name="my_asset")
+    batch_definition = asset.add_batch_definition(name="my_batch_definition")
+    validator = Validator(batch_definition=batch_definition)
+
+    result = validator.validate_expectation(gxe.ExpectColumnValuesToNotBeNull(column="a"))
+
+    assert result.success
+    assert list(validator._wrapped_validator.active_batch.data.dataframe.columns) == ["a"]
+
+    # Batch is reloaded, once referenced columns are not loaded.
+    result = validator.validate_expectation(gxe.ExpectColumnValuesToNotBeNull(column="b"))
+
+    assert not result.success
+    assert list(validator._wrapped_validator.active_batch.data.dataframe.columns) == ["b"]
+
+    validator.result_format = ResultFormat.COMPLETE
+    result = validator.validate_expectation(gxe.ExpectColumnValuesToNotBeNull(column="b"))
+
+    assert not result.success
+    assert list(validator._wrapped_validator.active_batch.data.dataframe.columns) == [
+        "a",
+        "b",
+        "c",
+    ]
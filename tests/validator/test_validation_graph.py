@@ -54,6 +54,15 @@ def pandas_execution_engine_fake(
                 metric_configuration.id: "my_value" for metric_configuration in metrics_to_resolve
             }
 
+        # noinspection PyUnusedLocal
+        @staticmethod
+        def prepare_domain_records(metric_configurations: Iterable[MetricConfiguration]) -> None:
+            pass
+
+        @staticmethod
+        def release_domain_records() -> None:
+            pass
+
     PandasExecutionEngineFake.__name__ = "PandasExecutionEngine"
     return cast(ExecutionEngine, PandasExecutionEngineFake())
 
@@ -291,30 +300,84 @@ def test_ExpectationValidationGraph_get_exception_info(
 
 
 @pytest.mark.unit
-def test_parse_validation_graph(
+def test_initialize_ready_queue(
     expect_column_value_z_scores_to_be_less_than_expectation_validation_graph: ValidationGraph,
 ):
+    graph = expect_column_value_z_scores_to_be_less_than_expectation_validation_graph
+
     available_metrics: Dict[Tuple[str, str, str], MetricValue]
 
-    # Parse input "ValidationGraph" object and confirm the numbers of ready and still needed metrics.  # noqa: E501
+    # Initialize ready queue of input "ValidationGraph" object and confirm the numbers of ready and still needed metrics.  # noqa: E501
     available_metrics = {}
-    (
-        ready_metrics,
-        needed_metrics,
-    ) = expect_column_value_z_scores_to_be_less_than_expectation_validation_graph._parse(
+    ready_metrics, unmet_dependency_counts = graph._initialize_ready_queue(
         metrics=available_metrics
     )
-    assert len(ready_metrics) == 2 and len(needed_metrics) == 9
+    assert len(ready_metrics) == 2 and len(unmet_dependency_counts) == 9
 
     # Show that including "nonexistent" metric in dictionary of resolved metrics does not increase ready_metrics count.  # noqa: E501
     available_metrics = {("nonexistent", "nonexistent", "nonexistent"): "NONE"}
-    (
-        ready_metrics,
-        needed_metrics,
-    ) = expect_column_value_z_scores_to_be_less_than_expectation_validation_graph._parse(
+    ready_metrics, unmet_dependency_counts = graph._initialize_ready_queue(
         metrics=available_metrics
     )
-    assert len(ready_metrics) == 2 and len(needed_metrics) == 9
+    assert len(ready_metrics) == 2 and len(unmet_dependency_counts) == 9
+
+
+@pytest.mark.unit
+def test_update_ready_queue_matches_initialize_ready_queue(
+    expect_column_value_z_scores_to_be_less_than_expectation_validation_graph: ValidationGraph,
+):
+    graph = expect_column_value_z_scores_to_be_less_than_expectation_validation_graph
+
+    available_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+    ready_metrics, unmet_dependency_counts = graph._initialize_ready_queue(
+        metrics=available_metrics
+    )
+
+    # Resolve graph one level at a time, confirming that incrementally maintained ready queue agrees with queue initialized from scratch.  # noqa: E501
+    while ready_metrics:
+        initialized_ready_metrics, initialized_unmet_dependency_counts = (
+            graph._initialize_ready_queue(metrics=available_metrics)
+        )
+        assert {metric.id for metric in ready_metrics} == {
+            metric.id for metric in initialized_ready_metrics
+        }
+        assert unmet_dependency_counts == initialized_unmet_dependency_counts
+
+        resolved_metric_ids = [metric.id for metric in ready_metrics]
+        graph._update_ready_queue(
+            resolved_metric_ids=resolved_metric_ids,
+            ready_metrics=ready_metrics,
+            unmet_dependency_counts=unmet_dependency_counts,
+        )
+        available_metrics.update({metric_id: "my_value" for metric_id in resolved_metric_ids})
+
+    assert unmet_dependency_counts == {}
+    assert graph._initialize_ready_queue(metrics=available_metrics) == (set(), {})
+
+
+@pytest.mark.unit
+def test_ready_queue_with_partially_resolved_metrics(
+    table_head_metric_config: MetricConfiguration,
+    column_histogram_metric_config: MetricConfiguration,
+) -> None:
+    class DummyExecutionEngine:
+        pass
+
+    execution_engine = cast(ExecutionEngine, DummyExecutionEngine)
+
+    graph = ValidationGraph(execution_engine=execution_engine)
+    graph.add(MetricEdge(left=table_head_metric_config, right=column_histogram_metric_config))
+    graph.add(MetricEdge(left=column_histogram_metric_config))
+
+    ready_metrics, unmet_dependency_counts = graph._initialize_ready_queue(metrics={})
+    assert ready_metrics == {column_histogram_metric_config}
+    assert unmet_dependency_counts == {table_head_metric_config.id: 1}
+
+    ready_metrics, unmet_dependency_counts = graph._initialize_ready_queue(
+        metrics={column_histogram_metric_config.id: "my_value"}
+    )
+    assert ready_metrics == {table_head_metric_config}
+    assert unmet_dependency_counts == {}
 
 
 @pytest.mark.unit
@@ -365,8 +428,16 @@ def test_populate_dependencies_with_incorrect_metric_name():
         ),
     ],
 )
+@pytest.mark.parametrize(
+    "metric_resolution_scheduler",
+    [
+        pytest.param(None, id="default"),
+        pytest.param({"type": "thread", "max_workers": 2}, id="thread"),
+        pytest.param({"type": "thread", "split_accessor_domains": True}, id="thread_split"),
+    ],
+)
 def test_resolve_validation_graph_with_bad_config_catch_exceptions_true(
-    pandas_execution_engine_fake, failed_metric_config
+    pandas_execution_engine_fake, failed_metric_config, metric_resolution_scheduler
 ):
     execution_engine = pandas_execution_engine_fake
 
@@ -376,6 +447,8 @@ def test_resolve_validation_graph_with_bad_config_catch_exceptions_true(
         "catch_exceptions": True,
         "result_format": {"result_format": "BASIC"},
     }
+    if metric_resolution_scheduler is not None:
+        runtime_configuration["metric_resolution_scheduler"] = metric_resolution_scheduler
 
     graph.build_metric_dependency_graph(
         metric_configuration=failed_metric_config,
@@ -433,16 +506,23 @@ def test_progress_bar_config(
         pass
 
     class DummyExecutionEngine:
-        pass
+        # noinspection PyUnusedLocal
+        @staticmethod
+        def prepare_domain_records(metric_configurations: Iterable[MetricConfiguration]) -> None:
+            pass
+
+        @staticmethod
+        def release_domain_records() -> None:
+            pass
 
     metric_configuration = cast(MetricConfiguration, DummyMetricConfiguration)
     execution_engine = cast(ExecutionEngine, DummyExecutionEngine)
 
     # ValidationGraph is a complex object that requires len > 3 to not trigger tqdm
     with mock.patch(
-        "great_expectations.validator.validation_graph.ValidationGraph._parse",
+        "great_expectations.validator.validation_graph.ValidationGraph._initialize_ready_queue",
         return_value=(
-            {},
+            set(),
             {},
         ),
     ), mock.patch(